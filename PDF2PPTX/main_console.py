@@ -17,6 +17,7 @@ Date: 2025-09-20
 import sys
 import os
 import argparse
+import multiprocessing
 from pathlib import Path
 
 # Add src directory to Python path for imports
@@ -172,4 +173,6 @@ Examples:
 
 
 if __name__ == "__main__":
+    # Required for rendering worker processes in frozen (PyInstaller) builds
+    multiprocessing.freeze_support()
     main()
\ No newline at end of file
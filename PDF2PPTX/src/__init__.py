@@ -71,19 +71,41 @@ __title__ = "PDF2PPTX Converter"
 __description__ = "Professional PDF to PNG/PowerPoint conversion tool"
 __url__ = "https://github.com/example/pdf2pptx"
 
-# Public API exports
-from .core.pdf_processor import PDFProcessor, ConversionConfig
-from .core.image_converter import ImageConversionService
-from .core.powerpoint_converter import PowerPointConversionService
-from .utils.error_handling import (
-    UserFriendlyError,
-    ErrorSeverity,
-    PDFConversionError,
-    FileSystemError,
-    ValidationError
-)
-from .utils.path_utils import PathManager
-from .config import get_app_config, ApplicationConfig
+# Public API exports, loaded on first access (PEP 562) so that importing the
+# package (e.g. for the CLI's config or --version commands) does not import
+# PyMuPDF, python-pptx, lxml or Pillow
+from importlib import import_module
+from typing import TYPE_CHECKING, Any, List
+
+# Public name -> module defining it
+_EXPORTS = {
+    "PDFProcessor": ".core.pdf_processor",
+    "ConversionConfig": ".core.pdf_processor",
+    "ImageConversionService": ".core.image_converter",
+    "PowerPointConversionService": ".core.powerpoint_converter",
+    "UserFriendlyError": ".utils.error_handling",
+    "ErrorSeverity": ".utils.error_handling",
+    "PDFConversionError": ".utils.error_handling",
+    "FileSystemError": ".utils.error_handling",
+    "ValidationError": ".utils.error_handling",
+    "PathManager": ".utils.path_utils",
+    "get_app_config": ".config",
+    "ApplicationConfig": ".config"
+}
+
+if TYPE_CHECKING:
+    from .core.pdf_processor import PDFProcessor, ConversionConfig
+    from .core.image_converter import ImageConversionService
+    from .core.powerpoint_converter import PowerPointConversionService
+    from .utils.error_handling import (
+        UserFriendlyError,
+        ErrorSeverity,
+        PDFConversionError,
+        FileSystemError,
+        ValidationError
+    )
+    from .utils.path_utils import PathManager
+    from .config import get_app_config, ApplicationConfig
 
 __all__ = [
     # Version info
@@ -115,8 +137,21 @@ __all__ = [
 ]
 
 
+def __getattr__(name: str) -> Any:
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value  # later lookups bypass __getattr__
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
+
+
 # Module level functions for convenience
-def create_pdf_processor(config: ConversionConfig = None) -> PDFProcessor:
+def create_pdf_processor(config: "ConversionConfig" = None) -> "PDFProcessor":
     """
     Create a PDFProcessor instance with optional configuration.
 
@@ -126,10 +161,11 @@ def create_pdf_processor(config: ConversionConfig = None) -> PDFProcessor:
     Returns:
         Configured PDFProcessor instance
     """
+    from .core.pdf_processor import PDFProcessor
     return PDFProcessor(config)
 
 
-def create_image_converter(config: ConversionConfig = None) -> ImageConversionService:
+def create_image_converter(config: "ConversionConfig" = None) -> "ImageConversionService":
     """
     Create an ImageConversionService instance.
 
@@ -139,12 +175,14 @@ def create_image_converter(config: ConversionConfig = None) -> ImageConversionSe
     Returns:
         Configured ImageConversionService instance
     """
+    from .core.image_converter import ImageConversionService
+    from .core.pdf_processor import ConversionConfig
     if config is None:
         config = ConversionConfig()
     return ImageConversionService(config)
 
 
-def create_powerpoint_converter(config: ConversionConfig = None) -> PowerPointConversionService:
+def create_powerpoint_converter(config: "ConversionConfig" = None) -> "PowerPointConversionService":
     """
     Create a PowerPointConversionService instance.
 
@@ -154,6 +192,8 @@ def create_powerpoint_converter(config: ConversionConfig = None) -> PowerPointCo
     Returns:
         Configured PowerPointConversionService instance
     """
+    from .core.pdf_processor import ConversionConfig
+    from .core.powerpoint_converter import PowerPointConversionService
     if config is None:
         config = ConversionConfig()
     return PowerPointConversionService(config)
@@ -164,4 +204,4 @@ __all__.extend([
     "create_pdf_processor",
     "create_image_converter",
     "create_powerpoint_converter"
-])
\ No newline at end of file
+])
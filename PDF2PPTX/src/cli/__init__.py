@@ -4,14 +4,13 @@ Provides comprehensive CLI functionality with modular design.
 """
 
 from .main import main
-from .commands import ImageCommand, PowerPointCommand, ResetCommand
+from .commands import ConvertCommand, ResetCommand
 from .parsers import create_main_parser
 from .utils import CLIProgressTracker, CLIFormatter
 
 __all__ = [
     'main',
-    'ImageCommand',
-    'PowerPointCommand',
+    'ConvertCommand',
     'ResetCommand',
     'create_main_parser',
     'CLIProgressTracker',
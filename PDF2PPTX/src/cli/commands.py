@@ -6,20 +6,32 @@ Provides modular command structure with comprehensive functionality.
 from __future__ import annotations
 
 import logging
-import asyncio
+import json
+import os
+import sqlite3
+import tempfile
+from dataclasses import replace
 from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import Dict, List, Optional, Any, Type
+from typing import TYPE_CHECKING, Dict, List, Optional, Any, Type
 import argparse
 
-from ..core.pdf_processor import ConversionConfig, PDFProcessor
-from ..core.image_converter import ImageConversionService
-from ..core.powerpoint_converter import PowerPointConversionService
+# Conversion modules import PyMuPDF, python-pptx, lxml and Pillow; each
+# command imports what it needs when it runs so the CLI starts quickly
+from ..core import tracing
 from ..utils.path_utils import PathManager
 from ..utils.error_handling import UserFriendlyError
-from ..config import get_app_config, save_app_config
+from ..config import get_app_config, get_config_manager, save_app_config
 from .utils import CLIFormatter, CLIProgressTracker
 
+if TYPE_CHECKING:
+    from ..core.benchmark import BenchmarkCase, BenchmarkResult
+    from ..core.pdf_processor import ConversionConfig
+    from ..core.render_pipeline import PipelineStats
+
+# Metadata index location when the config enables the index without naming a file
+DEFAULT_METADATA_INDEX = Path.home() / ".pdf2pptx" / "metadata_index.sqlite"
+
 
 class BaseCommand(ABC):
     """
@@ -62,14 +74,85 @@ class BaseCommand(ABC):
             valid_files.append(file_path)
         return valid_files
 
+    def _metadata_index_path(self, args: argparse.Namespace) -> Optional[Path]:
+        """
+        Resolve the metadata index file: command line, then config.
+
+        The index is opt-in: without --metadata-index, a configured file or
+        metadata_index_enabled, no index is used.
+        """
+        if getattr(args, 'no_index', False):
+            return None
+        if getattr(args, 'index', None) is not None:
+            return args.index
+
+        app_config = get_app_config()
+        if app_config.metadata_index_file:
+            return Path(app_config.metadata_index_file)
+        if app_config.metadata_index_enabled:
+            return DEFAULT_METADATA_INDEX
+        return None
+
+    def _check_metadata_index(self, args: argparse.Namespace, formatter: CLIFormatter) -> None:
+        """Open the requested metadata index once; if it cannot be written, warn and use none."""
+        from ..core.metadata_index import MetadataIndex
+
+        index_path = self._metadata_index_path(args)
+        if index_path is None:
+            return
+        try:
+            MetadataIndex(index_path).close()
+        except (OSError, sqlite3.Error) as e:
+            formatter.warning(f"Metadata index {index_path} is not usable ({e}); reading every file instead")
+            args.no_index = True
+
     def _create_conversion_config(self, args: argparse.Namespace) -> ConversionConfig:
         """Create conversion configuration from arguments."""
+        from ..core.pdf_processor import ConversionConfig
+
+        app_config = get_app_config()
+
+        # Render cache: command line overrides the configured directory
+        cache_dir = getattr(args, 'cache_dir', None)
+        if cache_dir is None and app_config.render_cache_dir:
+            cache_dir = Path(app_config.render_cache_dir)
+        if getattr(args, 'no_cache', False):
+            cache_dir = None
+
+        memory_budget_mb = getattr(args, 'memory_budget', None)
+        if memory_budget_mb is None:
+            memory_budget_mb = app_config.max_memory_mb
+
         return ConversionConfig(
             scale_factor=getattr(args, 'scale', 1.5),
             auto_rotate=getattr(args, 'auto_rotate', True),
             target_dpi=getattr(args, 'dpi', 150),
-            slide_width_mm=getattr(args, 'slide_width', 420.0),
-            slide_height_mm=getattr(args, 'slide_height', 297.0)
+            slide_width_mm=getattr(args, 'slide_width', None) or 420.0,
+            slide_height_mm=getattr(args, 'slide_height', None) or 297.0,
+            max_workers=max(1, getattr(args, 'threads', 1)),
+            cache_dir=cache_dir,
+            cache_max_mb=app_config.render_cache_max_mb,
+            metadata_index=self._metadata_index_path(args),
+            image_encoding=getattr(args, 'image_encoding', 'png'),
+            jpeg_quality=getattr(args, 'jpeg_quality', 85),
+            render_mode=getattr(args, 'render_mode', 'scale'),
+            streaming_output=getattr(args, 'streaming', False),
+            deduplicate_pages=not getattr(args, 'no_dedupe', False),
+            scan_passthrough=not getattr(args, 'no_passthrough', False),
+            svg_pages=getattr(args, 'svg', False),
+            checkpoint=getattr(args, 'checkpoint', False),
+            resume=getattr(args, 'resume', False),
+            page_timeout=getattr(args, 'page_timeout', 0.0),
+            page_memory_mb=getattr(args, 'page_memory', 0),
+            memory_budget_mb=memory_budget_mb,
+            tile_megapixels=getattr(args, 'tile_megapixels', 64),
+            output_writers=getattr(args, 'writers', 2),
+            durable_writes=getattr(args, 'durable', False),
+            png_profile=getattr(args, 'png_profile', 'balanced'),
+            png_reoptimize=getattr(args, 'reoptimize', False),
+            trim_margins=getattr(args, 'trim', False),
+            trim_margin_pt=getattr(args, 'trim_margin', 12.0),
+            blank_pages=getattr(args, 'blank_pages', 'keep')
         )
 
 
@@ -102,16 +185,29 @@ class ConvertCommand(BaseCommand):
             output_dir = self._prepare_output_directory(args)
 
             # Create conversion configuration
+            self._check_metadata_index(args, formatter)
             config = self._create_conversion_config(args)
 
-            # Execute conversion based on format
-            if args.format == 'png':
-                return self._convert_to_images(valid_files, config, output_dir, args, formatter, logger)
-            elif args.format == 'pptx':
-                return self._convert_to_pptx(valid_files, config, output_dir, args, formatter, logger)
-            else:
-                formatter.error(f"Unsupported format: {args.format}")
-                return 1
+            trace_path = getattr(args, 'trace', None)
+            if trace_path:
+                tracing.enable_tracing()
+            try:
+                # Execute conversion based on format
+                if args.format == 'png':
+                    return self._convert_to_images(valid_files, config, output_dir, args, formatter, logger)
+                elif args.format == 'pptx':
+                    return self._convert_to_pptx(valid_files, config, output_dir, args, formatter, logger)
+                elif args.format == 'png,pptx':
+                    # One render per page feeds both the PNG files and the slides
+                    return self._convert_to_pptx(
+                        valid_files, config, output_dir, args, formatter, logger, image_dir=output_dir
+                    )
+                else:
+                    formatter.error(f"Unsupported format: {args.format}")
+                    return 1
+            finally:
+                if trace_path:
+                    self._write_trace(trace_path, formatter)
 
         except UserFriendlyError as e:
             formatter.error(str(e))
@@ -148,6 +244,52 @@ class ConvertCommand(BaseCommand):
         output_dir.mkdir(parents=True, exist_ok=True)
         return output_dir
 
+    def _write_trace(self, trace_path: Path, formatter: CLIFormatter) -> None:
+        """Stop tracing and export the recorded spans."""
+        tracer = tracing.disable_tracing()
+        if tracer is None:
+            return
+        try:
+            tracer.write_chrome_trace(trace_path)
+            formatter.info(f"Trace written: {trace_path} ({len(tracer.events)} spans)")
+        except OSError as e:
+            formatter.warning(f"Failed to write trace {trace_path}: {e}")
+
+    def _create_progress_tracker(
+        self,
+        files: List[Path],
+        args: argparse.Namespace,
+        formatter: CLIFormatter
+    ) -> CLIProgressTracker:
+        """Create a page-based progress tracker, totalling pages with a quick prescan."""
+        from ..core.metadata_index import MetadataIndex
+        from ..core.pdf_processor import PDFProcessor
+
+        total_pages = None
+        index_path = self._metadata_index_path(args)
+        if index_path is not None:
+            try:
+                with MetadataIndex(index_path) as index:
+                    total_pages = sum(index.page_counts(files, max(1, getattr(args, 'threads', 1))))
+            except Exception:
+                pass  # count pages without the index
+
+        if total_pages is None:
+            processor = PDFProcessor()
+            total_pages = 0
+            for file_path in files:
+                try:
+                    total_pages += processor.count_pages(file_path)
+                except Exception:
+                    pass  # reported when the file is converted
+
+        return CLIProgressTracker(formatter, total_pages, getattr(args, 'progress', 'bar'))
+
+    def _show_incidents(self, stats: PipelineStats, formatter: CLIFormatter) -> None:
+        """List pages that were degraded or replaced by placeholders."""
+        for incident in stats.incidents:
+            formatter.warning(f"Page incident: {incident.describe()}")
+
     def _show_dry_run(
         self,
         args: argparse.Namespace,
@@ -173,6 +315,11 @@ class ConvertCommand(BaseCommand):
             formatter.info(f"Target DPI: {config.target_dpi}")
         else:
             formatter.info(f"Slide size: {config.slide_width_mm}x{config.slide_height_mm}mm")
+            formatter.info(f"Render mode: {config.render_mode}")
+            if config.render_mode == 'fitted':
+                formatter.info(f"Target DPI: {config.target_dpi}")
+            if config.streaming_output:
+                formatter.info("Streaming PPTX writer: enabled")
 
         formatter.success("Dry run completed - no files were processed")
         return 0
@@ -187,45 +334,53 @@ class ConvertCommand(BaseCommand):
         logger: logging.Logger
     ) -> int:
         """Convert PDFs to images."""
+        from ..core.image_converter import ImageConversionService
+
         formatter.header("Converting PDFs to PNG Images")
 
         # Create progress tracker
         total_files = len(files)
-        progress_tracker = CLIProgressTracker(formatter, total_files)
+        progress_tracker = self._create_progress_tracker(files, args, formatter)
 
         # Initialize image converter
         converter = ImageConversionService(config)
         converter.set_progress_callback(progress_tracker.update)
 
-        successful_conversions = 0
-        all_output_files = []
-
-        for i, file_path in enumerate(files):
-            try:
-                formatter.info(f"Processing {file_path.name}... ({i+1}/{total_files})")
-
-                # Convert single file
-                output_files = converter.convert_pdf_to_images(file_path, output_dir)
-                all_output_files.extend(output_files)
-                successful_conversions += 1
+        def report_file(result) -> None:
+            progress_tracker.file_done(
+                result.pdf_path.name, result.succeeded, result.page_count, result.error
+            )
+            if result.succeeded:
+                formatter.success(f"✓ {result.pdf_path.name} → {len(result.output_files)} images")
+            else:
+                logger.error(f"Failed to convert {result.pdf_path}: {result.error}")
+                formatter.error(f"✗ {result.pdf_path.name}: {result.error}")
 
-                formatter.success(f"✓ {file_path.name} → {len(output_files)} images")
+        # All files are split into page ranges scheduled on one worker pool
+        formatter.info(f"Processing {total_files} files with {config.max_workers} worker(s)...")
+        progress_tracker.start(files=total_files, format="png", workers=config.max_workers)
+        batch = converter.convert_batch(files, output_dir, report_file)
+        progress_tracker.complete()
 
-            except Exception as e:
-                logger.error(f"Failed to convert {file_path}: {e}")
-                formatter.error(f"✗ {file_path.name}: {e}")
-                continue
+        successful_conversions = sum(1 for result in batch.files if result.succeeded)
+        all_output_files = [
+            path for result in batch.files if result.succeeded for path in result.output_files
+        ]
 
         # Show summary
         formatter.header("Conversion Summary")
         formatter.info(f"Files processed: {successful_conversions}/{total_files}")
         formatter.info(f"Images generated: {len(all_output_files)}")
         formatter.info(f"Output directory: {output_dir}")
+        formatter.info(f"Rendering: {batch.stats.summary()}")
+        self._show_incidents(batch.stats, formatter)
 
         if successful_conversions == total_files:
             formatter.success("All conversions completed successfully!")
             return 0
-        elif successful_conversions > 0:
+        if config.checkpoint or config.resume:
+            formatter.info("Finished pages are checkpointed; run again with --resume to retry the rest")
+        if successful_conversions > 0:
             formatter.warning("Some conversions failed - check logs for details")
             return 2
         else:
@@ -239,10 +394,24 @@ class ConvertCommand(BaseCommand):
         output_dir: Path,
         args: argparse.Namespace,
         formatter: CLIFormatter,
-        logger: logging.Logger
+        logger: logging.Logger,
+        image_dir: Optional[Path] = None
     ) -> int:
-        """Convert PDFs to PowerPoint."""
-        formatter.header("Converting PDFs to PowerPoint Presentation")
+        """Convert PDFs to PowerPoint, also writing the slide images as PNG files into image_dir if set."""
+        from ..core.image_encoding import PNG_ENCODINGS
+        from ..core.powerpoint_converter import PowerPointConversionService
+
+        if image_dir is not None:
+            if config.image_encoding not in PNG_ENCODINGS:
+                raise UserFriendlyError(
+                    f"Image encoding '{config.image_encoding}' cannot produce PNG files",
+                    suggestion="Use --image-encoding png, palette or grayscale with png,pptx output"
+                )
+            if config.svg_pages:
+                formatter.warning("--svg is ignored: every page is rendered as a PNG image")
+            formatter.header("Converting PDFs to PNG Images and PowerPoint Presentation")
+        else:
+            formatter.header("Converting PDFs to PowerPoint Presentation")
 
         # Determine output file
         if hasattr(args, 'output') and args.output:
@@ -253,7 +422,7 @@ class ConvertCommand(BaseCommand):
             output_file = output_dir / f"{base_name}.pptx"
 
         # Create progress tracker
-        progress_tracker = CLIProgressTracker(formatter, len(files))
+        progress_tracker = self._create_progress_tracker(files, args, formatter)
 
         # Initialize PowerPoint converter
         converter = PowerPointConversionService(config)
@@ -264,14 +433,24 @@ class ConvertCommand(BaseCommand):
             formatter.info(f"Output file: {output_file}")
 
             # Convert all files to single presentation
+            progress_tracker.start(
+                files=len(files), format="pptx" if image_dir is None else "png,pptx", workers=config.max_workers
+            )
             result_file = converter.convert_multiple_pdfs_to_single_presentation(
-                files, output_file
+                files, output_file, image_dir
             )
+            progress_tracker.complete()
 
             # Show summary
             formatter.header("Conversion Summary")
             formatter.info(f"Files processed: {len(files)}")
             formatter.info(f"PowerPoint file: {result_file}")
+            if image_dir is not None:
+                formatter.info(f"Images generated: {len(converter.last_image_files)}")
+            if converter.last_pipeline_stats:
+                formatter.info(f"Rendering: {converter.last_pipeline_stats.summary()}")
+                formatter.info(f"Encoding: {converter.last_pipeline_stats.encoding_summary()}")
+                self._show_incidents(converter.last_pipeline_stats, formatter)
             formatter.success("PowerPoint conversion completed successfully!")
 
             return 0
@@ -279,6 +458,8 @@ class ConvertCommand(BaseCommand):
         except Exception as e:
             logger.error(f"PowerPoint conversion failed: {e}")
             formatter.error(f"PowerPoint conversion failed: {e}")
+            if config.checkpoint or config.resume:
+                formatter.info("Finished pages are checkpointed; run again with --resume to continue")
             return 1
 
 
@@ -346,18 +527,37 @@ class InfoCommand(BaseCommand):
         logger: logging.Logger
     ) -> int:
         """Execute info command."""
+        from ..core.metadata_index import MetadataIndex, scan_metadata
+
         try:
-            files = self._validate_files(args.files)
-            processor = PDFProcessor()
+            files = self._validate_files(self._expand_directories(args.files))
+            workers = max(1, getattr(args, 'threads', 1))
+
+            self._check_metadata_index(args, formatter)
+            index_path = self._metadata_index_path(args)
+            if index_path is not None:
+                with MetadataIndex(index_path) as index:
+                    entries = index.get_metadata(files, workers)
+                stats = index.stats
+            else:
+                entries = scan_metadata(files, workers)
+                stats = None
 
             formatter.header("PDF File Information")
 
-            for file_path in files:
-                try:
-                    info = processor.get_pdf_info(file_path)
-                    self._show_file_info(file_path, info, formatter, args)
-                except Exception as e:
-                    formatter.error(f"Failed to analyze {file_path.name}: {e}")
+            for entry in entries:
+                if entry.error:
+                    formatter.error(f"Failed to analyze {entry.pdf_path.name}: {entry.error}")
+                else:
+                    self._show_file_info(entry.pdf_path, entry.metadata, formatter, args)
+
+            if len(entries) > 1:
+                total_pages = sum(entry.page_count for entry in entries)
+                formatter.section(f"Total: {len(entries)} files, {total_pages} pages")
+            if stats is not None:
+                formatter.info(
+                    f"Index: {stats.hits + stats.revalidated} cached, {stats.scanned} scanned ({index_path})"
+                )
 
             return 0
 
@@ -366,6 +566,19 @@ class InfoCommand(BaseCommand):
             formatter.error(f"Info command failed: {e}")
             return 1
 
+    def _expand_directories(self, paths: List[Path]) -> List[Path]:
+        """Replace directories by the PDF files they contain."""
+        expanded = []
+        for path in paths:
+            if path.is_dir():
+                expanded.extend(sorted(
+                    child for child in path.iterdir()
+                    if child.is_file() and child.suffix.lower() == '.pdf'
+                ))
+            else:
+                expanded.append(path)
+        return expanded
+
     def _show_file_info(
         self,
         file_path: Path,
@@ -376,7 +589,7 @@ class InfoCommand(BaseCommand):
         """Show information for a single file."""
         formatter.section(f"File: {file_path.name}")
         formatter.info(f"  Path: {file_path}")
-        formatter.info(f"  Size: {file_path.stat().st_size / 1024:.1f} KB")
+        formatter.info(f"  Size: {info['file_size'] / 1024:.1f} KB")
         formatter.info(f"  Pages: {info['page_count']}")
 
         if info.get('title'):
@@ -385,14 +598,19 @@ class InfoCommand(BaseCommand):
             formatter.info(f"  Author: {info['author']}")
 
         if getattr(args, 'detailed', False):
+            pages = info['pages']
+            text_pages = sum(1 for page in pages if page['has_text'])
+            image_pages = sum(1 for page in pages if page['has_images'])
+            formatter.info(f"  Content: {text_pages} pages with text, {image_pages} with images")
+
             formatter.info("  Page Details:")
-            for page_info in info['pages'][:5]:  # Show first 5 pages
-                size = f"{page_info.original_size[0]:.0f}x{page_info.original_size[1]:.0f}"
-                orientation = "Portrait" if page_info.is_portrait else "Landscape"
-                formatter.info(f"    Page {page_info.page_number}: {size} pts ({orientation})")
+            for page in pages[:5]:  # Show first 5 pages
+                size = f"{page['width']:.0f}x{page['height']:.0f}"
+                orientation = "Portrait" if page['width'] < page['height'] else "Landscape"
+                formatter.info(f"    Page {page['page_number']}: {size} pts ({orientation})")
 
-            if len(info['pages']) > 5:
-                formatter.info(f"    ... and {len(info['pages']) - 5} more pages")
+            if len(pages) > 5:
+                formatter.info(f"    ... and {len(pages) - 5} more pages")
 
 
 class ConfigCommand(BaseCommand):
@@ -462,11 +680,215 @@ class ConfigCommand(BaseCommand):
         return 0
 
 
+class BenchCommand(BaseCommand):
+    """Command for benchmarking conversion settings on sample pages."""
+
+    def execute(
+        self,
+        args: argparse.Namespace,
+        formatter: CLIFormatter,
+        logger: logging.Logger
+    ) -> int:
+        """Execute benchmark."""
+        from ..core.benchmark import recommend, run_benchmark
+
+        try:
+            files = self._validate_files(args.files)
+            cases = self._build_cases(args)
+
+            formatter.header("Conversion Benchmark")
+            formatter.info(
+                f"{len(cases)} configuration(s) x up to {args.pages} pages "
+                f"sampled from {len(files)} file(s), {args.format.upper()} output"
+            )
+
+            def report_case(result: BenchmarkResult) -> None:
+                if result.succeeded:
+                    formatter.success(
+                        f"✓ {result.case.name}: {result.pages_per_second:.1f} pages/s, "
+                        f"{result.bytes_per_page / 1024:.0f} KB/page"
+                    )
+                else:
+                    formatter.error(f"✗ {result.case.name}: {result.error}")
+
+            with tempfile.TemporaryDirectory(prefix="pdf2pptx-bench-") as work_dir:
+                results = run_benchmark(cases, files, Path(work_dir), args.pages, report_case)
+
+            self._show_results(results, formatter)
+
+            max_bytes = args.max_kb_per_page * 1024 if args.max_kb_per_page else None
+            best = recommend(results, max_bytes, args.min_dpi)
+            if best is None:
+                formatter.warning("No configuration meets the size and quality targets")
+            else:
+                formatter.success(f"Recommended: {best.case.name}")
+
+            if args.report:
+                self._write_report(args.report, results, best)
+                formatter.info(f"Report written: {args.report}")
+
+            return 0 if best is not None else 2
+
+        except UserFriendlyError as e:
+            formatter.error(str(e))
+            if e.suggestion:
+                formatter.info(f"Suggestion: {e.suggestion}")
+            return 1
+        except KeyboardInterrupt:
+            formatter.warning("Benchmark cancelled by user")
+            return 130
+        except Exception as e:
+            logger.error(f"Benchmark failed: {e}", exc_info=True)
+            formatter.error(f"Benchmark failed: {e}")
+            return 1
+
+    def _build_cases(self, args: argparse.Namespace) -> List[BenchmarkCase]:
+        """Expand presets, scales, encoders and job counts into benchmark cases."""
+        from ..core.benchmark import BenchmarkCase
+
+        base = replace(self._create_conversion_config(args), cache_dir=None)
+        jobs = args.jobs or sorted({1, min(os.cpu_count() or 1, 4)})
+        # PNG output is always encoded losslessly
+        encoders = args.encoders if args.format == 'pptx' else ['png']
+
+        variants = []
+        for preset in args.presets:
+            settings = get_config_manager().get_preset_config(preset)
+            if args.format == 'png':
+                settings = dict(settings, image_encoding='png')
+            variants.append((f"preset={preset}", settings))
+        for profile in args.png_profiles:
+            variants.append((f"png_profile={profile}", {"png_profile": profile, "image_encoding": "png"}))
+        for scale in args.scales:
+            for encoder in encoders:
+                variants.append((
+                    f"scale={scale:g} encoding={encoder}",
+                    {"scale_factor": scale, "image_encoding": encoder}
+                ))
+
+        cases = []
+        for name, settings in variants:
+            for workers in jobs:
+                config = replace(base, max_workers=max(1, workers), **settings)
+                cases.append(BenchmarkCase(f"{name} jobs={workers}", config, args.format))
+
+        if not cases:
+            raise UserFriendlyError("No benchmark configurations selected")
+        return cases
+
+    def _show_results(self, results: List[BenchmarkResult], formatter: CLIFormatter) -> None:
+        """Show the result table."""
+        rows = []
+        for result in results:
+            if not result.succeeded:
+                rows.append([result.case.name, "failed", "", "", "", "", ""])
+                continue
+            rss = f"{result.peak_rss_mb:.0f}" if result.peak_rss_mb is not None else "n/a"
+            rows.append([
+                result.case.name,
+                f"{result.pages_per_second:.1f}",
+                f"{result.render_pages_per_second:.1f}",
+                f"{result.encode_pages_per_second:.1f}",
+                f"{result.assemble_pages_per_second:.1f}",
+                f"{result.bytes_per_page / 1024:.0f}",
+                rss
+            ])
+
+        formatter.table(
+            ["Configuration", "pages/s", "render/s", "encode/s", "assemble/s", "KB/page", "peak RSS MB"],
+            rows,
+            title="Results (stage rates are per worker)"
+        )
+
+    def _write_report(
+        self,
+        report_path: Path,
+        results: List[BenchmarkResult],
+        best: Optional[BenchmarkResult]
+    ) -> None:
+        """Write results as JSON."""
+        report = {
+            "recommended": best.case.name if best else None,
+            "results": [
+                {
+                    "name": result.case.name,
+                    "format": result.case.output_format,
+                    "scale_factor": result.case.config.scale_factor,
+                    "image_encoding": result.case.config.image_encoding,
+                    "jpeg_quality": result.case.config.jpeg_quality,
+                    "max_workers": result.case.config.max_workers,
+                    "effective_dpi": result.case.effective_dpi,
+                    "pages": result.pages,
+                    "wall_seconds": result.wall_seconds,
+                    "pages_per_second": result.pages_per_second,
+                    "render_pages_per_second": result.render_pages_per_second,
+                    "encode_pages_per_second": result.encode_pages_per_second,
+                    "assemble_pages_per_second": result.assemble_pages_per_second,
+                    "output_bytes": result.output_bytes,
+                    "bytes_per_page": result.bytes_per_page,
+                    "peak_rss_mb": result.peak_rss_mb,
+                    "error": result.error
+                }
+                for result in results
+            ]
+        }
+        report_path.parent.mkdir(parents=True, exist_ok=True)
+        report_path.write_text(json.dumps(report, indent=2), encoding="utf-8")
+
+
+class ServeCommand(BaseCommand):
+    """Command for running the conversion service on a warm worker pool."""
+
+    def execute(
+        self,
+        args: argparse.Namespace,
+        formatter: CLIFormatter,
+        logger: logging.Logger
+    ) -> int:
+        """Execute serve command."""
+        from ..core.job_service import ConversionJobService
+        from .server import JobServer
+
+        try:
+            if args.jobs < 1:
+                raise UserFriendlyError("--jobs must be at least 1")
+            self._check_metadata_index(args, formatter)
+            config = self._create_conversion_config(args)
+            output_root = args.output_dir or Path.cwd() / "output" / "jobs"
+
+            formatter.info(f"Starting {config.max_workers} worker(s)...")
+            with ConversionJobService(config, output_root, job_slots=args.jobs) as service:
+                server = JobServer(service, args.port)
+                try:
+                    formatter.success(f"Listening on {server.url}")
+                    formatter.info(f"Job output directory: {output_root}")
+                    formatter.info("Press Ctrl+C to stop")
+                    server.serve_forever()
+                finally:
+                    server.server_close()
+            return 0
+
+        except UserFriendlyError as e:
+            formatter.error(str(e))
+            if e.suggestion:
+                formatter.info(f"Suggestion: {e.suggestion}")
+            return 1
+        except KeyboardInterrupt:
+            formatter.warning("Service stopped; running jobs were cancelled")
+            return 0
+        except OSError as e:
+            logger.error(f"Serve failed: {e}")
+            formatter.error(f"Failed to start service on port {args.port}: {e}")
+            return 1
+
+
 def create_command_registry() -> Dict[str, Type[BaseCommand]]:
     """Create registry of available commands."""
     return {
         'convert': ConvertCommand,
         'reset': ResetCommand,
         'info': InfoCommand,
-        'config': ConfigCommand
+        'config': ConfigCommand,
+        'bench': BenchCommand,
+        'serve': ServeCommand
     }
\ No newline at end of file
@@ -43,6 +43,10 @@ class CLIApplication:
             parser = create_main_parser()
             parsed_args = parser.parse_args(args)
 
+            # JSON progress events own stdout; everything else goes to stderr
+            if getattr(parsed_args, 'progress', None) == 'json':
+                self.formatter = CLIFormatter(output=sys.stderr)
+
             # Set up logging
             self.logger = setup_cli_logging(parsed_args.log_level, parsed_args.verbose)
 
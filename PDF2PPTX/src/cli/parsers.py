@@ -91,6 +91,12 @@ For more information, visit: https://github.com/your-repo/pdf2pptx
     # Config command
     _add_config_parser(subparsers)
 
+    # Bench command
+    _add_bench_parser(subparsers)
+
+    # Serve command
+    _add_serve_parser(subparsers)
+
     return parser
 
 
@@ -111,6 +117,9 @@ Examples:
 
   # Batch convert all PDFs in directory
   pdf2pptx convert png --input-dir ./pdfs --output-dir ./images
+
+  # PNG images and PowerPoint from a single render of each page
+  pdf2pptx convert png,pptx --output-dir ./output *.pdf
         """
     )
 
@@ -140,6 +149,16 @@ Examples:
     _add_common_convert_options(pptx_parser)
     _add_pptx_specific_options(pptx_parser)
 
+    # PNG and PPTX conversion sharing one render per page
+    both_parser = format_subparsers.add_parser(
+        "png,pptx",
+        help="Convert to PNG images and a PowerPoint presentation at once",
+        description="Render each page once and write it both as a PNG image and as a slide"
+    )
+    _add_common_convert_options(both_parser)
+    _add_pptx_specific_options(both_parser)
+    _add_image_writer_options(both_parser)
+
     # Set command function
     from .commands import ConvertCommand
     convert_parser.set_defaults(func=ConvertCommand().execute)
@@ -153,6 +172,7 @@ def _add_common_convert_options(parser: argparse.ArgumentParser) -> None:
         "files",
         nargs="*",
         type=Path,
+        default=[],
         help="PDF files to convert"
     )
     input_group.add_argument(
@@ -190,14 +210,92 @@ def _add_common_convert_options(parser: argparse.ArgumentParser) -> None:
         help="Disable auto-rotation"
     )
 
+    parser.add_argument(
+        "--png-profile",
+        choices=["fastest", "balanced", "smallest"],
+        default="balanced",
+        help="PNG encoder: fastest (larger files), balanced or smallest (slower) (default: balanced)"
+    )
+
+    parser.add_argument(
+        "--trim",
+        action="store_true",
+        help="Render only the content area of each page, without its empty margins; slides enlarge it to fill the slide"
+    )
+
+    parser.add_argument(
+        "--trim-margin",
+        type=float,
+        default=12.0,
+        metavar="PT",
+        help="Margin kept around trimmed content in points (default: 12)"
+    )
+
+    parser.add_argument(
+        "--blank-pages",
+        choices=["keep", "collapse", "skip"],
+        default="keep",
+        help="Pages that draw nothing: keep them, collapse them to a tiny image or skip them (default: keep)"
+    )
+
     # Processing options
     parser.add_argument(
         "--threads",
         type=int,
         default=2,
-        help="Number of processing threads (default: 2)"
+        help="Number of rendering worker processes (default: 2)"
     )
 
+    _add_memory_options(parser)
+
+    parser.add_argument(
+        "--cache-dir",
+        type=Path,
+        help="Reuse rendered pages from this cache directory (default: from config)"
+    )
+
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Disable the render cache"
+    )
+
+    _add_index_options(parser)
+
+    parser.add_argument(
+        "--no-dedupe",
+        action="store_true",
+        help="Render every page even when it is identical to an earlier page"
+    )
+
+    parser.add_argument(
+        "--progress",
+        choices=["bar", "json", "none"],
+        default="bar",
+        help="Progress output: bar, newline-delimited JSON events on stdout, or none (default: bar)"
+    )
+
+    parser.add_argument(
+        "--trace",
+        type=Path,
+        metavar="FILE",
+        help="Write per-stage timing spans as Chrome Trace Event JSON (chrome://tracing, Perfetto)"
+    )
+
+    parser.add_argument(
+        "--checkpoint",
+        action="store_true",
+        help="Journal finished pages in the output directory so an interrupted run can be resumed"
+    )
+
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Skip pages finished by an interrupted --checkpoint run of the same job (implies --checkpoint)"
+    )
+
+    _add_isolation_options(parser)
+
     parser.add_argument(
         "--dry-run",
         action="store_true",
@@ -211,6 +309,61 @@ def _add_common_convert_options(parser: argparse.ArgumentParser) -> None:
     )
 
 
+def _add_memory_options(parser: argparse.ArgumentParser) -> None:
+    """Add memory budget options."""
+    parser.add_argument(
+        "--memory-budget",
+        type=int,
+        metavar="MB",
+        help="Render only as many pages at once as fit this estimated memory (default: max_memory_mb from config, 0 = unlimited)"
+    )
+
+    parser.add_argument(
+        "--tile-megapixels",
+        type=int,
+        default=64,
+        metavar="MP",
+        help="Render PNG pages larger than this in bands to bound memory (default: 64, 0 = never)"
+    )
+
+
+def _add_isolation_options(parser: argparse.ArgumentParser) -> None:
+    """Add fault isolation options."""
+    parser.add_argument(
+        "--page-timeout",
+        type=float,
+        default=0.0,
+        metavar="SECONDS",
+        help="Render pages in isolated workers and retry pages taking longer at lower resolution (default: no limit)"
+    )
+
+    parser.add_argument(
+        "--page-memory",
+        type=int,
+        default=0,
+        metavar="MB",
+        help="Render pages in isolated workers allowed this much extra memory each (default: no limit)"
+    )
+
+
+def _add_index_options(parser: argparse.ArgumentParser) -> None:
+    """Add metadata index options."""
+    parser.add_argument(
+        "--metadata-index",
+        "--index",
+        dest="index",
+        type=Path,
+        metavar="FILE",
+        help="Keep page counts and batch planning data in this SQLite index (default: none, unless enabled in config)"
+    )
+
+    parser.add_argument(
+        "--no-index",
+        action="store_true",
+        help="Read every file instead of using a configured metadata index"
+    )
+
+
 def _add_image_specific_options(parser: argparse.ArgumentParser) -> None:
     """Add image-specific conversion options."""
     parser.add_argument(
@@ -234,6 +387,31 @@ def _add_image_specific_options(parser: argparse.ArgumentParser) -> None:
         help="JPEG quality (1-100, default: 95)"
     )
 
+    _add_image_writer_options(parser)
+
+
+def _add_image_writer_options(parser: argparse.ArgumentParser) -> None:
+    """Add image file writing options."""
+    parser.add_argument(
+        "--writers",
+        type=int,
+        default=2,
+        metavar="N",
+        help="Threads writing image files while the next pages render (default: 2, 0 = write inline)"
+    )
+
+    parser.add_argument(
+        "--durable",
+        action="store_true",
+        help="fsync every image file and rename it into place, so a crash never leaves a partial file"
+    )
+
+    parser.add_argument(
+        "--reoptimize",
+        action="store_true",
+        help="Losslessly recompress each PNG file on the writer threads before writing it"
+    )
+
 
 def _add_pptx_specific_options(parser: argparse.ArgumentParser) -> None:
     """Add PowerPoint-specific conversion options."""
@@ -243,6 +421,52 @@ def _add_pptx_specific_options(parser: argparse.ArgumentParser) -> None:
         help="Output PowerPoint file name"
     )
 
+    parser.add_argument(
+        "--render-mode",
+        choices=["scale", "fitted"],
+        default="scale",
+        help="'fitted' renders each page at --dpi for its size on the slide instead of at --scale (default: scale)"
+    )
+
+    parser.add_argument(
+        "--dpi",
+        type=int,
+        default=150,
+        help="Target DPI of slide images in fitted render mode (default: 150)"
+    )
+
+    parser.add_argument(
+        "--image-encoding",
+        choices=["png", "auto", "jpeg", "palette", "grayscale"],
+        default="png",
+        help="Slide image encoding; 'auto' picks JPEG, palette, grayscale or PNG per page (default: png)"
+    )
+
+    parser.add_argument(
+        "--jpeg-quality",
+        type=int,
+        default=85,
+        help="JPEG quality when JPEG encoding is used (1-100, default: 85)"
+    )
+
+    parser.add_argument(
+        "--svg",
+        action="store_true",
+        help="Embed vector pages as SVG with a PNG fallback; pages where SVG is larger or slower stay raster"
+    )
+
+    parser.add_argument(
+        "--no-passthrough",
+        action="store_true",
+        help="Rasterize scanned pages instead of embedding their original images"
+    )
+
+    parser.add_argument(
+        "--streaming",
+        action="store_true",
+        help="Write slides to the output file as they are rendered (bounded memory for very large decks)"
+    )
+
     parser.add_argument(
         "--slide-size",
         choices=["A3", "A4", "16:9", "4:3", "custom"],
@@ -334,7 +558,7 @@ def _add_info_parser(subparsers) -> None:
         "files",
         nargs="+",
         type=Path,
-        help="PDF files to analyze"
+        help="PDF files or directories of PDF files to analyze"
     )
 
     info_parser.add_argument(
@@ -343,6 +567,15 @@ def _add_info_parser(subparsers) -> None:
         help="Show detailed page information"
     )
 
+    info_parser.add_argument(
+        "--threads",
+        type=int,
+        default=2,
+        help="Number of processes scanning files missing from the index (default: 2)"
+    )
+
+    _add_index_options(info_parser)
+
     # Set command function
     from .commands import InfoCommand
     info_parser.set_defaults(func=InfoCommand().execute)
@@ -385,4 +618,181 @@ def _add_config_parser(subparsers) -> None:
 
     # Set command function
     from .commands import ConfigCommand
-    config_parser.set_defaults(func=ConfigCommand().execute)
\ No newline at end of file
+    config_parser.set_defaults(func=ConfigCommand().execute)
+
+
+def _comma_list(item_type):
+    """Argument type parsing a comma-separated list of values."""
+    def parse(text: str) -> list:
+        try:
+            return [item_type(item.strip()) for item in text.split(",") if item.strip()]
+        except ValueError:
+            raise argparse.ArgumentTypeError(f"invalid list: {text}")
+    return parse
+
+
+def _add_bench_parser(subparsers) -> None:
+    """Add bench command parser."""
+    bench_parser = subparsers.add_parser(
+        "bench",
+        help="Benchmark conversion settings on your documents",
+        description="Run a matrix of conversion settings over sample pages and recommend one",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  # Compare scales, encoders and worker counts for PowerPoint output
+  pdf2pptx bench --scales 1.0,1.5,2.0 --encoders png,auto --jobs 1,4 *.pdf
+
+  # Compare presets, keeping slides under 300 KB per page at 150 DPI or more
+  pdf2pptx bench --presets fast,balanced,high_quality --max-kb-per-page 300 --min-dpi 150 *.pdf
+
+  # Compare the speed and size of the PNG encoder profiles
+  pdf2pptx bench --format png --scales "" --png-profiles fastest,balanced,smallest *.pdf
+        """
+    )
+
+    bench_parser.add_argument(
+        "files",
+        nargs="+",
+        type=Path,
+        help="PDF files to sample pages from"
+    )
+
+    bench_parser.add_argument(
+        "--format",
+        choices=["pptx", "png"],
+        default="pptx",
+        help="Output format to benchmark (default: pptx)"
+    )
+
+    bench_parser.add_argument(
+        "--pages",
+        type=int,
+        default=20,
+        help="Number of pages sampled evenly from the files (default: 20)"
+    )
+
+    bench_parser.add_argument(
+        "--presets",
+        type=_comma_list(str),
+        default=[],
+        help="Comma-separated presets to include (high_quality, balanced, fast, presentation, compact)"
+    )
+
+    bench_parser.add_argument(
+        "--scales",
+        type=_comma_list(float),
+        default=[1.0, 1.5, 2.0],
+        help="Comma-separated scale factors (default: 1.0,1.5,2.0)"
+    )
+
+    bench_parser.add_argument(
+        "--encoders",
+        type=_comma_list(str),
+        default=["png", "auto"],
+        help="Comma-separated slide image encodings for pptx (default: png,auto)"
+    )
+
+    bench_parser.add_argument(
+        "--png-profiles",
+        type=_comma_list(str),
+        default=[],
+        help="Comma-separated PNG encoder profiles to compare (fastest, balanced, smallest)"
+    )
+
+    bench_parser.add_argument(
+        "--jobs",
+        type=_comma_list(int),
+        default=None,
+        help="Comma-separated worker counts (default: 1 and the CPU count, up to 4)"
+    )
+
+    bench_parser.add_argument(
+        "--max-kb-per-page",
+        type=float,
+        help="Size target: largest acceptable average output per page in KB"
+    )
+
+    bench_parser.add_argument(
+        "--min-dpi",
+        type=float,
+        help="Quality target: lowest acceptable render resolution"
+    )
+
+    bench_parser.add_argument(
+        "--report",
+        type=Path,
+        metavar="FILE",
+        help="Also write the results as JSON"
+    )
+
+    # Set command function
+    from .commands import BenchCommand
+    bench_parser.set_defaults(func=BenchCommand().execute)
+
+
+def _add_serve_parser(subparsers) -> None:
+    """Add serve command parser."""
+    serve_parser = subparsers.add_parser(
+        "serve",
+        help="Run a local conversion service with a warm worker pool",
+        description="Accept conversion jobs over HTTP on 127.0.0.1, rendering on a pre-started worker pool",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  # Serve on port 8765 with 4 rendering workers
+  pdf2pptx serve --port 8765 --threads 4
+
+  # Queue a job and follow its progress
+  curl -d '{"format": "pptx", "files": ["/data/a.pdf"]}' http://127.0.0.1:8765/jobs
+  curl http://127.0.0.1:8765/jobs/<id>/events
+        """
+    )
+
+    serve_parser.add_argument(
+        "--port",
+        type=int,
+        default=8765,
+        help="TCP port on 127.0.0.1 (0 picks a free port, default: 8765)"
+    )
+
+    serve_parser.add_argument(
+        "--threads",
+        type=int,
+        default=2,
+        help="Number of rendering worker processes shared by all jobs (default: 2)"
+    )
+
+    _add_memory_options(serve_parser)
+
+    serve_parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="Number of jobs running at the same time (default: 1)"
+    )
+
+    serve_parser.add_argument(
+        "--output-dir",
+        type=Path,
+        help="Parent directory of job outputs for jobs without an output_dir (default: ./output/jobs)"
+    )
+
+    serve_parser.add_argument(
+        "--cache-dir",
+        type=Path,
+        help="Reuse rendered pages from this cache directory (default: from config)"
+    )
+
+    serve_parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Disable the render cache"
+    )
+
+    _add_index_options(serve_parser)
+    _add_isolation_options(serve_parser)
+
+    # Set command function
+    from .commands import ServeCommand
+    serve_parser.set_defaults(func=ServeCommand().execute)
@@ -0,0 +1,186 @@
+"""
+Local HTTP API for the conversion job service (pdf2pptx serve).
+
+Endpoints (JSON unless noted):
+  POST   /jobs                   queue a job: {"format", "files", "output_dir", "output", "options"}
+  GET    /jobs                   status of all known jobs
+  GET    /jobs/{id}              status of one job
+  GET    /jobs/{id}/events       newline-delimited JSON events, streamed until the job ends
+  GET    /jobs/{id}/files/{name} download an output file of the job
+  DELETE /jobs/{id}              cancel a job
+  GET    /metrics                queue and throughput counters
+  GET    /health                 liveness check
+
+The server only binds to the loopback interface.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import shutil
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import TYPE_CHECKING, Any, Optional
+from urllib.parse import unquote, urlsplit
+
+if TYPE_CHECKING:
+    from ..core.job_service import ConversionJobService, Job
+
+LOCALHOST = "127.0.0.1"
+
+# Largest accepted job request body
+MAX_REQUEST_BYTES = 1024 * 1024
+
+# Seconds an event stream waits for news before checking the connection again
+EVENT_POLL_SECONDS = 1.0
+
+logger = logging.getLogger(__name__)
+
+
+class JobRequestHandler(BaseHTTPRequestHandler):
+    """Routes requests to the job service of the server."""
+
+    server: "JobServer"
+    server_version = "pdf2pptx-serve"
+
+    def log_message(self, format: str, *args: Any) -> None:
+        logger.debug("%s - %s", self.address_string(), format % args)
+
+    def _send_json(self, status: HTTPStatus, document: Any) -> None:
+        body = json.dumps(document).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _send_error(self, status: HTTPStatus, message: str) -> None:
+        self._send_json(status, {"error": message})
+
+    def _route(self):
+        """Split the path into its segments."""
+        return [unquote(part) for part in urlsplit(self.path).path.strip("/").split("/") if part]
+
+    def _find_job(self, job_id: str) -> Optional["Job"]:
+        job = self.server.service.get(job_id)
+        if job is None:
+            self._send_error(HTTPStatus.NOT_FOUND, f"Unknown job: {job_id}")
+        return job
+
+    def do_GET(self) -> None:
+        parts = self._route()
+        service = self.server.service
+        if parts == ["health"]:
+            self._send_json(HTTPStatus.OK, {"status": "ok"})
+        elif parts == ["metrics"]:
+            self._send_json(HTTPStatus.OK, service.metrics())
+        elif parts == ["jobs"]:
+            self._send_json(HTTPStatus.OK, {"jobs": [job.to_dict() for job in service.jobs()]})
+        elif len(parts) == 2 and parts[0] == "jobs":
+            job = self._find_job(parts[1])
+            if job is not None:
+                self._send_json(HTTPStatus.OK, job.to_dict())
+        elif len(parts) == 3 and parts[0] == "jobs" and parts[2] == "events":
+            job = self._find_job(parts[1])
+            if job is not None:
+                self._stream_events(job)
+        elif len(parts) == 4 and parts[0] == "jobs" and parts[2] == "files":
+            job = self._find_job(parts[1])
+            if job is not None:
+                self._send_output(job, parts[3])
+        else:
+            self._send_error(HTTPStatus.NOT_FOUND, f"Not found: {self.path}")
+
+    def do_POST(self) -> None:
+        from ..core.job_service import JobSpec
+
+        if self._route() != ["jobs"]:
+            self._send_error(HTTPStatus.NOT_FOUND, f"Not found: {self.path}")
+            return
+        length = int(self.headers.get("Content-Length") or 0)
+        if length > MAX_REQUEST_BYTES:
+            self._send_error(HTTPStatus.REQUEST_ENTITY_TOO_LARGE, "Request body too large")
+            return
+        try:
+            spec = JobSpec.from_dict(json.loads(self.rfile.read(length) or b"null"))
+            job = self.server.service.submit(spec)
+        except ValueError as e:  # includes malformed JSON
+            self._send_error(HTTPStatus.BAD_REQUEST, str(e))
+            return
+        except RuntimeError as e:
+            self._send_error(HTTPStatus.SERVICE_UNAVAILABLE, str(e))
+            return
+        self._send_json(HTTPStatus.ACCEPTED, job.to_dict())
+
+    def do_DELETE(self) -> None:
+        parts = self._route()
+        if len(parts) != 2 or parts[0] != "jobs":
+            self._send_error(HTTPStatus.NOT_FOUND, f"Not found: {self.path}")
+            return
+        job = self.server.service.cancel(parts[1])
+        if job is None:
+            self._send_error(HTTPStatus.NOT_FOUND, f"Unknown job: {parts[1]}")
+        else:
+            self._send_json(HTTPStatus.OK, job.to_dict())
+
+    def _stream_events(self, job: "Job") -> None:
+        """Send job events as they happen; the response ends with the job."""
+        self.send_response(HTTPStatus.OK)
+        self.send_header("Content-Type", "application/x-ndjson")
+        self.send_header("Cache-Control", "no-cache")
+        self.end_headers()
+        seen = 0
+        try:
+            while True:
+                events, finished = job.wait_events(seen, EVENT_POLL_SECONDS)
+                for event in events:
+                    self.wfile.write(json.dumps(event).encode("utf-8") + b"\n")
+                self.wfile.flush()
+                seen += len(events)
+                if finished and not events:
+                    break
+        except (BrokenPipeError, ConnectionResetError):
+            pass  # client went away; the job carries on
+        self.close_connection = True
+
+    def _send_output(self, job: "Job", name: str) -> None:
+        """Stream one output file of a job."""
+        # Only files the job produced are served, never arbitrary paths
+        output_path = next((path for path in list(job.outputs) if path.name == name), None)
+        if output_path is None:
+            self._send_error(HTTPStatus.NOT_FOUND, f"Job {job.job_id} has no output {name}")
+            return
+        try:
+            with open(output_path, "rb") as f:
+                size = output_path.stat().st_size
+                self.send_response(HTTPStatus.OK)
+                self.send_header("Content-Type", "application/octet-stream")
+                self.send_header("Content-Length", str(size))
+                self.end_headers()
+                shutil.copyfileobj(f, self.wfile, 1024 * 1024)
+        except OSError as e:
+            self._send_error(HTTPStatus.GONE, f"Output unavailable: {e}")
+
+
+class JobServer(ThreadingHTTPServer):
+    """HTTP server bound to localhost, serving one job service."""
+
+    daemon_threads = True
+
+    def __init__(self, service: "ConversionJobService", port: int = 0):
+        """
+        Bind the server.
+
+        Args:
+            service: Started job service to expose
+            port: TCP port on 127.0.0.1 (0 picks a free port)
+        """
+        super().__init__((LOCALHOST, port), JobRequestHandler)
+        self.service = service
+
+    @property
+    def url(self) -> str:
+        """Base URL of the API."""
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
@@ -6,9 +6,10 @@ Provides comprehensive CLI support with professional formatting and progress tra
 from __future__ import annotations
 
 import sys
+import json
 import logging
 import time
-from typing import Optional, TextIO
+from typing import Optional, TextIO, Tuple
 from pathlib import Path
 
 
@@ -175,49 +176,139 @@ class CLIFormatter:
 
 class CLIProgressTracker:
     """
-    Progress tracker for CLI operations with time estimation.
+    Progress tracker for CLI operations with throughput and time estimation.
+
+    Progress is counted in pages across the whole batch. The "bar" mode
+    draws a progress bar with pages/s, MB/s written and ETA; the "json" mode
+    writes one JSON object per event (newline-delimited JSON) for
+    orchestration tools; "none" disables progress output.
     """
 
-    def __init__(self, formatter: CLIFormatter, total_items: int):
+    MODES = ("bar", "json", "none")
+
+    def __init__(
+        self,
+        formatter: CLIFormatter,
+        total_items: int,
+        mode: str = "bar",
+        output: Optional[TextIO] = None,
+        interval: float = 1.0
+    ):
+        """
+        Initialize tracker.
+
+        Args:
+            formatter: Formatter used to draw the progress bar
+            total_items: Total pages of the batch
+            mode: Output mode ("bar", "json" or "none")
+            output: Stream for JSON events (defaults to stdout)
+            interval: Minimum seconds between progress updates
+        """
+        if mode not in self.MODES:
+            raise ValueError(f"Unknown progress mode: {mode}")
         self.formatter = formatter
         self.total_items = total_items
+        self.mode = mode
+        self.output = output or sys.stdout
+        self.interval = interval
         self.current_item = 0
+        self.bytes_written = 0
         self.start_time = time.time()
         self.last_update_time = self.start_time
 
-    def update(self, increment: int = 1, message: str = "") -> None:
-        """Update progress."""
+    def start(self, **fields) -> None:
+        """Announce the start of the batch (JSON mode only)."""
+        self._emit("start", total_pages=self.total_items, **fields)
+
+    def update(self, increment: int = 1, bytes_written: int = 0, message: str = "") -> None:
+        """
+        Update progress.
+
+        Matches the converters' progress callback signature.
+
+        Args:
+            increment: Pages finished since the last update
+            bytes_written: Output bytes written since the last update
+            message: Optional status message
+        """
         self.current_item = min(self.current_item + increment, self.total_items)
+        self.bytes_written += bytes_written
         current_time = time.time()
 
-        # Update at most once per second, or on completion
-        if (current_time - self.last_update_time >= 1.0 or
+        # Update at most once per interval, or on completion
+        if (current_time - self.last_update_time >= self.interval or
             self.current_item >= self.total_items):
 
             self.last_update_time = current_time
             self._show_progress(message)
 
-    def _show_progress(self, message: str = "") -> None:
-        """Show current progress."""
+    def file_done(self, name: str, succeeded: bool, pages: int, error: Optional[str] = None) -> None:
+        """Report a finished input file (JSON mode only)."""
+        fields = {"file": name, "succeeded": succeeded, "file_pages": pages}
+        if error:
+            fields["error"] = error
+        self._emit("file_done", **fields)
+
+    def rates(self) -> Tuple[float, float, Optional[float]]:
+        """
+        Current throughput and time estimate.
+
+        Returns:
+            Tuple of (pages per second, MB written per second, ETA in seconds
+            or None while unknown)
+        """
         elapsed_time = time.time() - self.start_time
+        if elapsed_time <= 0:
+            return 0.0, 0.0, None
 
-        # Calculate ETA
-        if self.current_item > 0 and self.current_item < self.total_items:
-            avg_time_per_item = elapsed_time / self.current_item
-            remaining_items = self.total_items - self.current_item
-            eta_seconds = remaining_items * avg_time_per_item
-            eta_text = f" ETA: {self._format_time(eta_seconds)}"
+        pages_per_second = self.current_item / elapsed_time
+        mb_per_second = self.bytes_written / (1024 * 1024) / elapsed_time
+
+        if pages_per_second > 0 and self.current_item < self.total_items:
+            eta_seconds = (self.total_items - self.current_item) / pages_per_second
         else:
-            eta_text = ""
+            eta_seconds = None
+        return pages_per_second, mb_per_second, eta_seconds
+
+    def _show_progress(self, message: str = "") -> None:
+        """Show current progress."""
+        pages_per_second, mb_per_second, eta_seconds = self.rates()
+
+        if self.mode == "json":
+            self._emit(
+                "progress",
+                pages=self.current_item,
+                total_pages=self.total_items,
+                bytes_written=self.bytes_written,
+                pages_per_second=round(pages_per_second, 2),
+                mb_per_second=round(mb_per_second, 2),
+                eta_seconds=None if eta_seconds is None else round(eta_seconds, 1)
+            )
+            return
+        if self.mode != "bar":
+            return
+
+        rate_text = f"{pages_per_second:.1f} pages/s, {mb_per_second:.1f} MB/s"
+        if eta_seconds is not None:
+            rate_text += f", ETA: {self._format_time(eta_seconds)}"
 
         # Format message
         if message:
-            full_message = f"{message}{eta_text}"
+            full_message = f"{message} ({rate_text})"
         else:
-            full_message = f"Processing{eta_text}"
+            full_message = rate_text
 
         self.formatter.progress(self.current_item, self.total_items, full_message)
 
+    def _emit(self, event: str, **fields) -> None:
+        """Write one newline-delimited JSON event."""
+        if self.mode != "json":
+            return
+        record = {"event": event, "time": round(time.time(), 3)}
+        record.update(fields)
+        self.output.write(json.dumps(record, ensure_ascii=False) + "\n")
+        self.output.flush()
+
     def _format_time(self, seconds: float) -> str:
         """Format time duration."""
         if seconds < 60:
@@ -231,8 +322,20 @@ class CLIProgressTracker:
 
     def complete(self, message: str = "Completed") -> None:
         """Mark as completed."""
-        self.current_item = self.total_items
         elapsed_time = time.time() - self.start_time
+        if self.mode == "json":
+            self._emit(
+                "end",
+                pages=self.current_item,
+                total_pages=self.total_items,
+                bytes_written=self.bytes_written,
+                elapsed_seconds=round(elapsed_time, 3)
+            )
+            return
+        if self.mode != "bar":
+            return
+
+        self.current_item = self.total_items
         final_message = f"{message} in {self._format_time(elapsed_time)}"
         self.formatter.progress(self.total_items, self.total_items, final_message)
 
@@ -113,6 +113,15 @@ class ApplicationConfig:
     target_dpi: int = 150
     max_memory_mb: int = 512
 
+    # Render cache settings (empty directory disables the cache)
+    render_cache_dir: str = ""
+    render_cache_max_mb: int = 1024
+
+    # Metadata index settings: opt-in by naming a file or enabling it (empty file
+    # then uses ~/.pdf2pptx/metadata_index.sqlite)
+    metadata_index_enabled: bool = False
+    metadata_index_file: str = ""
+
     # UI settings
     window_title: str = "PDF2PPTX Converter"
     progress_update_interval_ms: int = 100
@@ -172,6 +181,13 @@ class ApplicationConfig:
                 suggestion="64MBから4096MBの間で設定してください"
             )
 
+        # Validate render cache size
+        if not (16 <= self.render_cache_max_mb <= 102400):
+            raise UserFriendlyError(
+                message="レンダーキャッシュサイズが無効です",
+                suggestion="16MBから102400MBの間で設定してください"
+            )
+
         # Validate log level
         valid_log_levels = ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]
         if self.log_level.upper() not in valid_log_levels:
@@ -195,7 +211,9 @@ class ConversionPresets:
         return {
             "scale_factor": 3.0,
             "target_dpi": 300,
-            "auto_rotate": True
+            "auto_rotate": True,
+            "image_encoding": "png",
+            "png_profile": "balanced"
         }
 
     @staticmethod
@@ -204,7 +222,10 @@ class ConversionPresets:
         return {
             "scale_factor": 1.5,
             "target_dpi": 150,
-            "auto_rotate": True
+            "auto_rotate": True,
+            "image_encoding": "auto",
+            "jpeg_quality": 85,
+            "png_profile": "balanced"
         }
 
     @staticmethod
@@ -213,7 +234,10 @@ class ConversionPresets:
         return {
             "scale_factor": 1.0,
             "target_dpi": 96,
-            "auto_rotate": True
+            "auto_rotate": True,
+            "image_encoding": "jpeg",
+            "jpeg_quality": 75,
+            "png_profile": "fastest"
         }
 
     @staticmethod
@@ -222,7 +246,22 @@ class ConversionPresets:
         return {
             "scale_factor": 2.0,
             "target_dpi": 200,
-            "auto_rotate": True
+            "auto_rotate": True,
+            "image_encoding": "auto",
+            "jpeg_quality": 90,
+            "png_profile": "balanced"
+        }
+
+    @staticmethod
+    def compact() -> Dict[str, Any]:
+        """Smallest decks: per-page adaptive encoding with aggressive JPEG."""
+        return {
+            "scale_factor": 1.5,
+            "target_dpi": 150,
+            "auto_rotate": True,
+            "image_encoding": "auto",
+            "jpeg_quality": 70,
+            "png_profile": "smallest"
         }
 
 
@@ -359,7 +398,7 @@ class ConfigManager:
         Get predefined configuration preset.
 
         Args:
-            preset_name: Name of the preset ("high_quality", "balanced", "fast", "presentation")
+            preset_name: Name of the preset ("high_quality", "balanced", "fast", "presentation", "compact")
 
         Returns:
             Preset configuration dictionary
@@ -371,7 +410,8 @@ class ConfigManager:
             "high_quality": ConversionPresets.high_quality,
             "balanced": ConversionPresets.balanced,
             "fast": ConversionPresets.fast,
-            "presentation": ConversionPresets.presentation
+            "presentation": ConversionPresets.presentation,
+            "compact": ConversionPresets.compact
         }
 
         if preset_name not in presets:
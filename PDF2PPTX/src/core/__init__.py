@@ -1,25 +1,67 @@
-"""Core PDF processing functionality."""
-
-from .pdf_processor import (
-    ConversionConfig,
-    PDFProcessingError,
-    PageInfo,
-    open_pdf_document,
-    process_page_to_pixmap,
-    process_page_to_bytes,
-    count_total_pages,
-    mm_to_emu,
-    points_to_emu
-)
-
-__all__ = [
-    "ConversionConfig",
-    "PDFProcessingError",
-    "PageInfo",
-    "open_pdf_document",
-    "process_page_to_pixmap",
-    "process_page_to_bytes",
-    "count_total_pages",
-    "mm_to_emu",
-    "points_to_emu"
-]
\ No newline at end of file
+"""Core PDF processing functionality.
+
+Exports are loaded on first access (PEP 562), so importing the package does
+not pull in PyMuPDF, python-pptx, lxml or Pillow until they are needed.
+"""
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any, List
+
+# Public name -> submodule defining it
+_EXPORTS = {
+    "ConversionConfig": "pdf_processor",
+    "PDFProcessingError": "pdf_processor",
+    "PageInfo": "pdf_processor",
+    "open_pdf_document": "pdf_processor",
+    "process_page_to_pixmap": "pdf_processor",
+    "process_page_to_bytes": "pdf_processor",
+    "count_total_pages": "pdf_processor",
+    "mm_to_emu": "pdf_processor",
+    "points_to_emu": "pdf_processor",
+    "RenderCache": "render_cache",
+    "MetadataIndex": "metadata_index",
+    "MemoryBudget": "memory_budget",
+    "ConversionJobService": "job_service",
+    "PageRenderPipeline": "render_pipeline",
+    "PipelineStats": "render_pipeline",
+    "RenderedPage": "render_pipeline",
+    "Tracer": "tracing",
+    "enable_tracing": "tracing",
+    "disable_tracing": "tracing",
+    "StreamingPresentationWriter": "pptx_stream_writer"
+}
+
+__all__ = list(_EXPORTS)
+
+if TYPE_CHECKING:
+    from .pdf_processor import (
+        ConversionConfig,
+        PDFProcessingError,
+        PageInfo,
+        open_pdf_document,
+        process_page_to_pixmap,
+        process_page_to_bytes,
+        count_total_pages,
+        mm_to_emu,
+        points_to_emu
+    )
+    from .job_service import ConversionJobService
+    from .memory_budget import MemoryBudget
+    from .metadata_index import MetadataIndex
+    from .pptx_stream_writer import StreamingPresentationWriter
+    from .render_cache import RenderCache
+    from .render_pipeline import PageRenderPipeline, PipelineStats, RenderedPage
+    from .tracing import Tracer, disable_tracing, enable_tracing
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(f".{module_name}", __name__), name)
+    globals()[name] = value  # later lookups bypass __getattr__
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
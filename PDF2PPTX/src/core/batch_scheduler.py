@@ -0,0 +1,573 @@
+"""
+Cross-file work scheduler for batch PNG conversion.
+Splits every input PDF into page-range tasks, orders them longest first and
+runs them on one shared worker pool, so a batch mixing one huge document and
+many small ones keeps every worker busy until the end.
+"""
+
+from __future__ import annotations
+
+import time
+from collections import deque
+from itertools import groupby
+from concurrent.futures import FIRST_COMPLETED, Executor, Future, ProcessPoolExecutor, wait
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+from . import tracing
+from .checkpoint import ConversionJournal
+from .fault_isolation import (
+    IsolatedRenderer,
+    IsolatedTask,
+    PageIncident,
+    PageRenderError,
+    RenderWorkerPool,
+    classify_failure,
+    degraded_config,
+    isolation_enabled
+)
+from .image_encoding import reoptimize_png
+from .memory_budget import MemoryBudget, estimate_document_pages, estimate_pages
+from .metadata_index import MetadataIndex
+from .output_writer import write_output_file
+from .pdf_processor import ConversionConfig, PDFProcessingError, open_pdf_document
+from .render_cache import CacheStats, RenderCache, hash_pdf_file
+from .render_pipeline import (
+    ENCODING_PLACEHOLDER,
+    DuplicatePages,
+    PipelineStats,
+    close_worker_documents,
+    placeholder_page,
+    render_page,
+    skip_page,
+    worker_document
+)
+
+# Pages per task; small enough to balance the tail of a batch, large enough
+# to amortize task overhead
+DEFAULT_CHUNK_PAGES = 16
+
+# Bytes of PDF per page that count as much as rendering one page
+_COST_BYTES_PER_PAGE = 256 * 1024
+
+
+@dataclass
+class PageRangeTask:
+    """A contiguous range of pages of one input file."""
+    file_index: int
+    pdf_path: Path
+    start: int  # first zero-based page index
+    stop: int   # one past the last page index
+    cost: float
+    pdf_hash: Optional[str] = None
+    footprint: int = 0  # estimated render memory of its largest page
+
+
+@dataclass
+class RangeResult:
+    """Outcome of a page-range task."""
+    file_index: int
+    start: int
+    output_files: List[Path]
+    stats: PipelineStats
+    error: Optional[str] = None
+    trace_events: Optional[list] = None  # spans recorded by a worker process
+    cache_stats: Optional[CacheStats] = None  # render cache use of a worker process
+    resumed: bool = False  # pages finished by an earlier run of the job
+
+
+@dataclass
+class FileResult:
+    """Per-file outcome of a batch conversion."""
+    pdf_path: Path
+    page_count: int = 0
+    output_files: List[Path] = field(default_factory=list)
+    error: Optional[str] = None
+
+    @property
+    def succeeded(self) -> bool:
+        """Whether every page of the file was converted."""
+        return self.error is None
+
+
+@dataclass
+class BatchResult:
+    """Outcome of a batch conversion, with files in input order."""
+    files: List[FileResult]
+    stats: PipelineStats
+
+
+def estimate_cost(page_count: int, file_size: int) -> float:
+    """
+    Estimate the relative rendering cost of a document per page.
+
+    Render time grows with page count and with content density, for which
+    the file size per page is a cheap proxy.
+
+    Args:
+        page_count: Pages in the document
+        file_size: File size in bytes
+
+    Returns:
+        Estimated cost of one page
+    """
+    if page_count <= 0:
+        return 0.0
+    return 1.0 + file_size / page_count / _COST_BYTES_PER_PAGE
+
+
+def _prescan_file(
+    pdf_path: Path,
+    caching: bool,
+    config: Optional[ConversionConfig] = None
+) -> Tuple[int, Optional[str], int, Optional[List[int]]]:
+    """
+    Open a file for its page count, hash and size (without a metadata index),
+    plus per-page render memory estimates when a config is given.
+    """
+    with open_pdf_document(pdf_path) as doc:
+        page_count = len(doc)
+        footprints = estimate_document_pages(doc, config) if config is not None else None
+    pdf_hash = hash_pdf_file(pdf_path) if caching else None
+    return page_count, pdf_hash, pdf_path.stat().st_size, footprints
+
+
+def plan_batch(
+    pdf_files: List[Path],
+    config: ConversionConfig,
+    chunk_pages: int = DEFAULT_CHUNK_PAGES
+) -> Tuple[List[PageRangeTask], List[FileResult]]:
+    """
+    Split a batch into page-range tasks, longest estimated cost first.
+
+    Files that cannot be opened are returned as failed results without tasks.
+    With a metadata index configured, page counts and content hashes of
+    unchanged files come from the index instead of reopening every file.
+    With a memory budget configured, tasks carry the render memory estimate
+    of their largest page.
+
+    Args:
+        pdf_files: Input PDF files
+        config: Conversion configuration
+        chunk_pages: Maximum pages per task
+
+    Returns:
+        Tuple of (tasks in scheduling order, per-file results in input order)
+    """
+    tasks = []
+    results = [FileResult(pdf_path=pdf_path) for pdf_path in pdf_files]
+    caching = bool(config.cache_dir)
+    budgeted = config.memory_budget_mb > 0
+
+    candidates = []
+    for file_index, result in enumerate(results):
+        if not result.pdf_path.exists() or not result.pdf_path.suffix.lower() == '.pdf':
+            result.error = f"Invalid PDF file: {result.pdf_path}"
+        else:
+            candidates.append((file_index, result))
+
+    indexed = None
+    try:
+        index = MetadataIndex.from_config(config)
+    except Exception:
+        index = None  # an unusable index only costs the prescan
+    if index is not None:
+        with index:
+            indexed = index.get_metadata([result.pdf_path for _, result in candidates], config.max_workers)
+
+    for position, (file_index, result) in enumerate(candidates):
+        pdf_path = result.pdf_path
+        try:
+            if indexed is None:
+                result.page_count, pdf_hash, file_size, footprints = _prescan_file(
+                    pdf_path, caching, config if budgeted else None
+                )
+            else:
+                entry = indexed[position]
+                if entry.error:
+                    raise PDFProcessingError(entry.error)
+                result.page_count = entry.page_count
+                pdf_hash = entry.content_hash if caching else None
+                file_size = entry.metadata['file_size']
+                footprints = None
+                if budgeted:
+                    footprints = estimate_pages(
+                        ((page['width'], page['height']) for page in entry.metadata['pages']), config
+                    )
+            page_cost = estimate_cost(result.page_count, file_size)
+        except Exception as e:
+            result.error = f"Failed to convert {pdf_path} to images: {e}"
+            continue
+
+        for start in range(0, result.page_count, chunk_pages):
+            stop = min(start + chunk_pages, result.page_count)
+            tasks.append(PageRangeTask(
+                file_index, pdf_path, start, stop, (stop - start) * page_cost, pdf_hash,
+                max(footprints[start:stop]) if footprints else 0
+            ))
+
+    # Longest processing time first; ties keep input order
+    tasks.sort(key=lambda task: -task.cost)
+    return tasks, results
+
+
+def skip_finished_pages(
+    tasks: List[PageRangeTask],
+    journal: ConversionJournal
+) -> Tuple[List[PageRangeTask], List[RangeResult]]:
+    """
+    Remove pages whose output a checkpoint journal records as intact.
+
+    Args:
+        tasks: Planned page-range tasks
+        journal: Checkpoint journal of an earlier run of the job
+
+    Returns:
+        Tuple of (tasks for the remaining pages, results for the finished pages)
+    """
+    remaining = []
+    finished = []
+    for task in tasks:
+        page_cost = task.cost / (task.stop - task.start)
+        outputs = [journal.finished_output(task.pdf_path, index) for index in range(task.start, task.stop)]
+        start = task.start
+        for is_finished, run in groupby(outputs, key=lambda output: output is not None):
+            run = list(run)
+            stop = start + len(run)
+            if is_finished:
+                stats = PipelineStats(pages=len(run), resumed_pages=len(run))
+                finished.append(RangeResult(task.file_index, start, run, stats, resumed=True))
+            else:
+                remaining.append(PageRangeTask(
+                    task.file_index, task.pdf_path, start, stop, len(run) * page_cost, task.pdf_hash,
+                    task.footprint
+                ))
+            start = stop
+
+    remaining.sort(key=lambda task: -task.cost)
+    return remaining, finished
+
+
+def _output_path(output_dir: Path, pdf_path: Path, page_number: int) -> Path:
+    return output_dir / f"{pdf_path.stem}_page_{page_number:03d}.png"
+
+
+def _render_range_task(
+    task: PageRangeTask,
+    output_dir: Path,
+    config: ConversionConfig,
+    cache: Optional[RenderCache],
+    trace: bool = False,
+    isolated: bool = False
+) -> RangeResult:
+    """
+    Render a page range to PNG files (runs in a worker process or inline).
+
+    Failures end up in the result's error, except that an isolated task
+    raises PageRenderError for a page that fails to render, so it can be
+    retried.
+    """
+    tracing.begin_worker_task(trace)
+    stats = PipelineStats()
+    output_files = []
+    start_time = time.perf_counter()
+    failure = None
+
+    try:
+        doc = worker_document(str(task.pdf_path))
+        duplicates = DuplicatePages(doc, config.deduplicate_pages, range(task.start, task.stop))
+
+        for page_index in range(task.start, task.stop):
+            page_start = time.perf_counter()
+            if duplicates.source_of(page_index) is not None:
+                rendered = duplicates.reuse(page_index)
+            else:
+                try:
+                    rendered = render_page(doc[page_index], config, "png", cache, task.pdf_hash)
+                except Exception as e:
+                    if not isolated:
+                        raise
+                    failure = PageRenderError(
+                        f"Failed to render page {page_index + 1} of {task.pdf_path}: {e}",
+                        classify_failure(e)
+                    )
+                    break
+                duplicates.keep(page_index, rendered)
+            stats.record(rendered, 0)
+            if skip_page(rendered, config):
+                stats.skipped_pages += 1
+                continue
+
+            output_path = _output_path(output_dir, task.pdf_path, rendered.page_number)
+            write_start = time.perf_counter()
+            with tracing.span("save", file=str(task.pdf_path), page=rendered.page_number):
+                image_bytes = rendered.image_bytes
+                if config.png_reoptimize:
+                    image_bytes = reoptimize_png(image_bytes)
+                write_output_file(output_path, image_bytes, config.durable_writes)
+            output_files.append(output_path)
+            stats.record_write(write_start - page_start, time.perf_counter() - write_start)
+
+    except Exception as e:
+        return RangeResult(
+            task.file_index, task.start, output_files, stats,
+            error=f"Failed to convert {task.pdf_path} to images: {e}",
+            trace_events=tracing.drain_worker_events(trace),
+            cache_stats=cache.drain_stats() if cache is not None else None
+        )
+    finally:
+        stats.elapsed_seconds = time.perf_counter() - start_time
+
+    if failure is not None:
+        # Raised outside the handler so no traceback pins the page's buffers
+        # in the worker; the caller retries the page
+        raise failure
+    return RangeResult(
+        task.file_index, task.start, output_files, stats,
+        trace_events=tracing.drain_worker_events(trace),
+        cache_stats=cache.drain_stats() if cache is not None else None
+    )
+
+
+class BatchImageScheduler:
+    """
+    Runs a batch of PDF to PNG conversions as page-range tasks.
+
+    With more than one worker, all tasks of the batch share one process pool
+    and are submitted longest first; with one worker they run inline in
+    input order. A file counts as converted only when all of its ranges
+    succeed.
+    """
+
+    def __init__(
+        self,
+        config: ConversionConfig,
+        chunk_pages: int = DEFAULT_CHUNK_PAGES,
+        executor: Optional[Executor] = None
+    ):
+        """
+        Initialize the scheduler.
+
+        Args:
+            config: Conversion configuration (max_workers, cache settings)
+            chunk_pages: Maximum pages per task
+            executor: Optional externally managed process pool to run tasks on
+        """
+        self.config = config
+        self.chunk_pages = chunk_pages
+        self.cache = RenderCache.from_config(config)
+        self.executor = executor
+
+    def run(
+        self,
+        pdf_files: List[Path],
+        output_dir: Path,
+        on_pages_done: Optional[Callable[[FileResult, int, int], None]] = None,
+        on_file_done: Optional[Callable[[FileResult], None]] = None
+    ) -> BatchResult:
+        """
+        Convert a batch of PDF files to PNG images.
+
+        Args:
+            pdf_files: Input PDF files
+            output_dir: Directory to save PNG files
+            on_pages_done: Called with the file, page count and bytes written as ranges finish
+            on_file_done: Called once per file when its outcome is known
+
+        Returns:
+            Per-file results in input order and aggregated statistics
+        """
+        start_time = time.perf_counter()
+        output_dir.mkdir(parents=True, exist_ok=True)
+        # Isolated rendering limits and retries single pages
+        isolated = isolation_enabled(self.config)
+        tasks, results = plan_batch(pdf_files, self.config, 1 if isolated else self.chunk_pages)
+        stats = PipelineStats()
+
+        try:
+            journal = ConversionJournal.from_config(self.config, output_dir, "png", pdf_files, "png")
+        except OSError as e:
+            raise PDFProcessingError(f"Failed to open checkpoint journal in {output_dir}: {e}")
+        finished_ranges: List[RangeResult] = []
+        if journal is not None:
+            tasks, finished_ranges = skip_finished_pages(tasks, journal)
+
+        outstanding: Dict[int, int] = {}
+        ranges: Dict[int, List[RangeResult]] = {}
+        for task in [*tasks, *finished_ranges]:
+            outstanding[task.file_index] = outstanding.get(task.file_index, 0) + 1
+
+        # Files failing the prescan (or without pages) are already decided
+        if on_file_done:
+            for file_index, result in enumerate(results):
+                if file_index not in outstanding:
+                    on_file_done(result)
+
+        def finish(range_result: RangeResult) -> None:
+            result = results[range_result.file_index]
+            stats.merge(range_result.stats)
+            tracing.merge_events(range_result.trace_events)
+            if self.cache is not None:
+                self.cache.merge_stats(range_result.cache_stats)
+            ranges.setdefault(range_result.file_index, []).append(range_result)
+            if range_result.error and result.error is None:
+                result.error = range_result.error
+            if (
+                journal is not None and range_result.output_files and not range_result.resumed
+                and not range_result.stats.encoding_counts.get(ENCODING_PLACEHOLDER)
+                and not range_result.stats.skipped_pages  # journal records pages by position
+            ):
+                with tracing.span("checkpoint", file=str(result.pdf_path), page=range_result.start + 1):
+                    journal.record_outputs(result.pdf_path, range_result.start, range_result.output_files)
+            if on_pages_done and range_result.output_files:
+                on_pages_done(
+                    result, len(range_result.output_files), range_result.stats.encoded_bytes
+                )
+
+            outstanding[range_result.file_index] -= 1
+            if outstanding[range_result.file_index] == 0:
+                for done in sorted(ranges.pop(range_result.file_index), key=lambda r: r.start):
+                    result.output_files.extend(done.output_files)
+                if journal is not None and result.succeeded:
+                    journal.record_file(result.pdf_path)
+                if on_file_done:
+                    on_file_done(result)
+
+        budget = MemoryBudget.from_config(self.config)
+        all_ran = False
+        try:
+            for range_result in finished_ranges:
+                finish(range_result)
+
+            if tasks and (self.executor is not None or self.config.max_workers > 1 or isolated):
+                self._run_parallel(tasks, output_dir, finish, budget)
+            else:
+                try:
+                    for task in sorted(tasks, key=lambda t: (t.file_index, t.start)):
+                        if budget is not None:
+                            budget.try_reserve(task.footprint)  # only records the peak inline
+                        finish(_render_range_task(task, output_dir, self.config, self.cache))
+                        if budget is not None:
+                            budget.release(task.footprint)
+                finally:
+                    close_worker_documents()
+            all_ran = True
+        finally:
+            if budget is not None:
+                stats.record_memory(budget)
+            if self.cache is not None:
+                # Workers write without size accounting; apply the limit once per batch
+                self.cache.enforce_limit()
+            if journal is not None:
+                # Keep the journal while any file still needs another run
+                if all_ran and all(result.succeeded for result in results):
+                    journal.complete()
+                else:
+                    journal.close()
+
+        stats.elapsed_seconds = time.perf_counter() - start_time
+        return BatchResult(results, stats)
+
+    def _run_parallel(
+        self,
+        tasks: List[PageRangeTask],
+        output_dir: Path,
+        finish: Callable[[RangeResult], None],
+        budget: Optional[MemoryBudget] = None
+    ) -> None:
+        """Run tasks on a shared process pool, handing results over as they complete."""
+        if self.executor is not None:
+            self._run_on(self.executor, tasks, output_dir, finish, budget)
+        elif isolation_enabled(self.config):
+            with RenderWorkerPool(self.config.max_workers, self.config.page_memory_mb) as executor:
+                self._run_on(executor, tasks, output_dir, finish, budget)
+        else:
+            with ProcessPoolExecutor(max_workers=self.config.max_workers) as executor:
+                self._run_on(executor, tasks, output_dir, finish, budget)
+
+    def _run_on(
+        self,
+        executor: Executor,
+        tasks: List[PageRangeTask],
+        output_dir: Path,
+        finish: Callable[[RangeResult], None],
+        budget: Optional[MemoryBudget] = None
+    ) -> None:
+        """
+        Submit tasks in order and finish them as they complete.
+
+        Without a memory budget every task is queued on the pool at once;
+        with one, a task is only submitted once its largest page fits.
+        """
+        trace = tracing.active_tracer() is not None
+        isolated = None
+        if isolation_enabled(self.config) and isinstance(executor, RenderWorkerPool):
+            isolated = IsolatedRenderer(executor, self.config.page_timeout)
+
+        def submit(task: PageRangeTask) -> Future:
+            if isolated is not None:
+                return isolated.submit(self._isolated_task(task, output_dir, trace))
+            return executor.submit(_render_range_task, task, output_dir, self.config, self.cache, trace)
+
+        queued = deque(tasks)
+        futures: Dict[Future, PageRangeTask] = {}
+        pending = set()
+
+        def fill() -> None:
+            while queued:
+                if budget is not None and not budget.try_reserve(queued[0].footprint):
+                    return
+                task = queued.popleft()
+                future = submit(task)
+                futures[future] = task
+                pending.add(future)
+
+        try:
+            fill()
+            while pending:
+                if isolated is not None:
+                    done, pending = isolated.wait(pending)
+                else:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    task = futures.pop(future)
+                    if budget is not None:
+                        budget.release(task.footprint)
+                    try:
+                        range_result = future.result()
+                    except Exception as e:
+                        # The worker died; the range is lost
+                        range_result = RangeResult(
+                            task.file_index, task.start, [], PipelineStats(),
+                            error=f"Failed to convert {task.pdf_path} to images: {e}"
+                        )
+                    finish(range_result)
+                fill()
+        finally:
+            # Stop queued ranges when the caller gives up (e.g. a shared pool outlives us)
+            for future in pending:
+                future.cancel()
+            if isolated is not None:
+                isolated.cancel_pending()
+
+    def _isolated_task(self, task: PageRangeTask, output_dir: Path, trace: bool) -> IsolatedTask:
+        """Single-page task retried at lower resolution, then written as a placeholder."""
+        def call(level: int) -> tuple:
+            config = self.config if level == 0 else degraded_config(self.config)
+            return (_render_range_task, task, output_dir, config, self.cache, trace, True)
+
+        def annotate(range_result: RangeResult, incident: PageIncident) -> RangeResult:
+            range_result.stats.incidents.append(incident)
+            return range_result
+
+        def fallback(incident: PageIncident) -> RangeResult:
+            rendered = placeholder_page(task.pdf_path, task.start, self.config, incident)
+            output_path = _output_path(output_dir, task.pdf_path, rendered.page_number)
+            write_output_file(output_path, rendered.image_bytes, self.config.durable_writes)
+            stats = PipelineStats()
+            stats.record(rendered, 0)
+            return RangeResult(task.file_index, task.start, [output_path], stats)
+
+        return IsolatedTask(str(task.pdf_path), task.start + 1, call, annotate, fallback)
+
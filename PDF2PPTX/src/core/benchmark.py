@@ -0,0 +1,328 @@
+"""
+Conversion benchmarking.
+Runs a matrix of conversion configurations over a sample of pages taken from
+real documents and measures per-stage throughput, output size and peak
+memory, so settings can be tuned against the actual workload.
+"""
+
+from __future__ import annotations
+
+import multiprocessing
+import shutil
+import sys
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+import fitz
+
+from . import tracing
+from .pdf_processor import ConversionConfig, PDFProcessingError, open_pdf_document
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+BENCH_FORMATS = ("pptx", "png")
+
+# Spans that make up assembling the output (label spans nest inside slide)
+_ASSEMBLE_SPANS = ("slide", "save")
+
+
+@dataclass
+class BenchmarkCase:
+    """One configuration of the benchmark matrix."""
+    name: str
+    config: ConversionConfig
+    output_format: str = "pptx"
+
+    @property
+    def effective_dpi(self) -> float:
+        """Resolution pages are rendered at, used as the quality measure."""
+        if self.config.render_mode == "fitted":
+            return float(self.config.target_dpi)
+        return self.config.scale_factor * 72.0
+
+
+@dataclass
+class BenchmarkResult:
+    """Measurements of one benchmark case."""
+    case: BenchmarkCase
+    pages: int = 0
+    wall_seconds: float = 0.0
+    render_seconds: float = 0.0
+    encode_seconds: float = 0.0
+    assemble_seconds: float = 0.0
+    output_bytes: int = 0
+    peak_rss_mb: Optional[float] = None
+    error: Optional[str] = None
+
+    @property
+    def succeeded(self) -> bool:
+        """Whether the case ran to completion."""
+        return self.error is None
+
+    @property
+    def pages_per_second(self) -> float:
+        """End-to-end pages per wall-clock second."""
+        return _rate(self.pages, self.wall_seconds)
+
+    @property
+    def render_pages_per_second(self) -> float:
+        """Pages rasterized per second of render time (per worker)."""
+        return _rate(self.pages, self.render_seconds)
+
+    @property
+    def encode_pages_per_second(self) -> float:
+        """Pages encoded per second of encode time (per worker)."""
+        return _rate(self.pages, self.encode_seconds)
+
+    @property
+    def assemble_pages_per_second(self) -> float:
+        """Pages placed on slides or written out per second of assembly time."""
+        return _rate(self.pages, self.assemble_seconds)
+
+    @property
+    def bytes_per_page(self) -> float:
+        """Average output size per page."""
+        if self.pages == 0:
+            return 0.0
+        return self.output_bytes / self.pages
+
+
+def _rate(pages: int, seconds: float) -> float:
+    if seconds <= 0:
+        return 0.0
+    return pages / seconds
+
+
+def build_page_sample(pdf_files: List[Path], output_path: Path, max_pages: int) -> int:
+    """
+    Copy an evenly spaced sample of pages from several PDFs into one PDF.
+
+    Args:
+        pdf_files: Source PDF files
+        output_path: Path of the sample PDF to write
+        max_pages: Maximum number of pages in the sample
+
+    Returns:
+        Number of pages in the sample
+
+    Raises:
+        PDFProcessingError: If no pages could be sampled
+    """
+    page_refs = []
+    for pdf_path in pdf_files:
+        with open_pdf_document(pdf_path) as doc:
+            page_refs.extend((pdf_path, index) for index in range(len(doc)))
+
+    if not page_refs or max_pages <= 0:
+        raise PDFProcessingError("No pages to benchmark")
+
+    step = max(1, len(page_refs) / max_pages)
+    chosen = [page_refs[int(i * step)] for i in range(min(max_pages, len(page_refs)))]
+
+    sample = fitz.open()
+    try:
+        sources: Dict[Path, fitz.Document] = {}
+        try:
+            for pdf_path, index in chosen:
+                if pdf_path not in sources:
+                    sources[pdf_path] = fitz.open(str(pdf_path))
+                sample.insert_pdf(sources[pdf_path], from_page=index, to_page=index)
+        finally:
+            for doc in sources.values():
+                doc.close()
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        sample.save(str(output_path), garbage=3, deflate=True)
+        return len(sample)
+    finally:
+        sample.close()
+
+
+def peak_rss_mb() -> Optional[float]:
+    """
+    Peak resident set size of this process and its finished child processes.
+
+    Returns:
+        Peak RSS in MB, or None where the platform does not report it
+    """
+    if resource is None:
+        return None
+    peak = max(
+        resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+        resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss
+    )
+    # Linux reports kilobytes, macOS bytes
+    if sys.platform == "darwin":
+        return peak / (1024 * 1024)
+    return peak / 1024
+
+
+def run_case(case: BenchmarkCase, sample_pdf: Path, work_dir: Path) -> BenchmarkResult:
+    """
+    Convert the page sample with one configuration and measure it.
+
+    Args:
+        case: Configuration to run
+        sample_pdf: Sample PDF built by build_page_sample()
+        work_dir: Scratch directory for the output (removed afterwards)
+
+    Returns:
+        Benchmark measurements (error set if the conversion failed)
+    """
+    from .image_converter import ImageConversionService
+    from .powerpoint_converter import PowerPointConversionService
+
+    result = BenchmarkResult(case=case)
+    output_dir = work_dir / "output"
+
+    owns_tracer = tracing.active_tracer() is None
+    tracer = tracing.enable_tracing()
+    first_event = len(tracer.events)
+    start = time.perf_counter()
+
+    try:
+        if case.output_format == "pptx":
+            service = PowerPointConversionService(case.config)
+            output = service.convert_multiple_pdfs_to_single_presentation(
+                [sample_pdf], output_dir / "bench.pptx"
+            )
+            result.output_bytes = output.stat().st_size
+        else:
+            service = ImageConversionService(case.config)
+            batch = service.convert_batch([sample_pdf], output_dir)
+            failed = [file.error for file in batch.files if not file.succeeded]
+            if failed:
+                raise PDFProcessingError(failed[0])
+            result.output_bytes = sum(
+                path.stat().st_size for file in batch.files for path in file.output_files
+            )
+        result.wall_seconds = time.perf_counter() - start
+
+        stats = service.last_pipeline_stats
+        result.pages = stats.pages
+        result.render_seconds = stats.render_seconds
+        result.encode_seconds = stats.encode_seconds
+        result.assemble_seconds = sum(
+            event[2] for event in tracer.events[first_event:] if event[0] in _ASSEMBLE_SPANS
+        ) / 1e9
+
+    except Exception as e:
+        result.error = str(e)
+    finally:
+        if owns_tracer:
+            tracing.disable_tracing()
+        shutil.rmtree(output_dir, ignore_errors=True)
+
+    return result
+
+
+def _case_process(case: BenchmarkCase, sample_pdf: Path, work_dir: Path, connection) -> None:
+    """Child process entry point of run_case_isolated()."""
+    result = run_case(case, sample_pdf, work_dir)
+    result.peak_rss_mb = peak_rss_mb()
+    connection.send(result)
+    connection.close()
+
+
+def run_case_isolated(case: BenchmarkCase, sample_pdf: Path, work_dir: Path) -> BenchmarkResult:
+    """
+    Run a case in a fresh child process.
+
+    Isolating cases keeps caches and memory of one configuration from
+    skewing the next and makes the peak RSS belong to this case alone.
+
+    Args:
+        case: Configuration to run
+        sample_pdf: Sample PDF built by build_page_sample()
+        work_dir: Scratch directory for the output
+
+    Returns:
+        Benchmark measurements including peak RSS
+    """
+    receiver, sender = multiprocessing.Pipe(duplex=False)
+    process = multiprocessing.Process(
+        target=_case_process, args=(case, sample_pdf, work_dir, sender)
+    )
+    process.start()
+    sender.close()
+
+    try:
+        result = receiver.recv()
+    except EOFError:
+        result = None
+    finally:
+        receiver.close()
+        process.join()
+
+    if result is None:
+        return BenchmarkResult(
+            case=case, error=f"Benchmark process exited with code {process.exitcode}"
+        )
+    return result
+
+
+def run_benchmark(
+    cases: List[BenchmarkCase],
+    pdf_files: List[Path],
+    work_dir: Path,
+    sample_pages: int = 20,
+    on_result: Optional[Callable[[BenchmarkResult], None]] = None
+) -> List[BenchmarkResult]:
+    """
+    Run every case over the same page sample, one isolated process per case.
+
+    Args:
+        cases: Configurations to compare
+        pdf_files: Documents to sample pages from
+        work_dir: Scratch directory
+        sample_pages: Maximum number of pages in the sample
+        on_result: Called with each result as soon as its case finishes
+
+    Returns:
+        Results in case order
+
+    Raises:
+        PDFProcessingError: If no page sample can be built
+    """
+    sample_pdf = work_dir / "sample.pdf"
+    build_page_sample(pdf_files, sample_pdf, sample_pages)
+
+    results = []
+    for index, case in enumerate(cases):
+        result = run_case_isolated(case, sample_pdf, work_dir / f"case_{index:02d}")
+        results.append(result)
+        if on_result:
+            on_result(result)
+    return results
+
+
+def recommend(
+    results: List[BenchmarkResult],
+    max_bytes_per_page: Optional[float] = None,
+    min_dpi: Optional[float] = None
+) -> Optional[BenchmarkResult]:
+    """
+    Pick the fastest configuration that meets the size and quality targets.
+
+    Args:
+        results: Benchmark results
+        max_bytes_per_page: Largest acceptable average output per page
+        min_dpi: Lowest acceptable render resolution
+
+    Returns:
+        The result with the highest end-to-end throughput among those that
+        succeeded and meet both targets, or None if none does
+    """
+    candidates = [
+        result for result in results
+        if result.succeeded
+        and (max_bytes_per_page is None or result.bytes_per_page <= max_bytes_per_page)
+        and (min_dpi is None or result.case.effective_dpi >= min_dpi)
+    ]
+    if not candidates:
+        return None
+    return max(candidates, key=lambda result: result.pages_per_second)
@@ -0,0 +1,372 @@
+"""
+Crash-safe checkpoint journal for long conversions.
+Records finished pages (and, for PPTX output, their rendered images) in the
+output directory, so a conversion interrupted by a crash, reboot or Ctrl-C
+can resume where it stopped instead of starting from zero.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import shutil
+import time
+import zlib
+from dataclasses import asdict
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, List, Optional, Set
+
+from .pdf_processor import ConversionConfig, PageInfo
+from .render_pipeline import ENCODING_RESUMED, RenderedPage
+
+# Bump when the record layout changes; older journals are discarded
+JOURNAL_FORMAT_VERSION = 1
+
+CHECKPOINT_DIRNAME = ".pdf2pptx-checkpoint"
+
+_JOURNAL_FILENAME = "journal.jsonl"
+
+# Settings that change how a job runs but not what it produces
+_RUNTIME_FIELDS = frozenset({
+    "max_workers", "prefetch_pages", "cache_dir", "cache_max_mb",
+    "metadata_index", "streaming_output", "checkpoint", "resume",
+    "page_timeout", "page_memory_mb", "memory_budget_mb", "output_writers", "durable_writes",
+    "png_reoptimize"
+})
+
+# Seconds between fsyncs of the journal; a crash loses at most this much work
+DEFAULT_SYNC_INTERVAL = 1.0
+
+
+@lru_cache(maxsize=256)
+def _resolved(pdf_path: str) -> str:
+    return str(Path(pdf_path).resolve())
+
+
+def checkpoint_dir(output_dir: Path, output_name: str) -> Path:
+    """
+    Journal directory for one output of a conversion.
+
+    Args:
+        output_dir: Conversion output directory
+        output_name: Output file name (PPTX) or output kind ("png")
+
+    Returns:
+        Directory holding the journal and its artifacts
+    """
+    return Path(output_dir) / CHECKPOINT_DIRNAME / output_name
+
+
+def job_key(pdf_files: List[Path], config: ConversionConfig, output_kind: str) -> str:
+    """
+    Identify a conversion job by its inputs and output-affecting settings.
+
+    A journal is only resumed by the same job: same input files (path, size
+    and modification time), same output kind and same rendering settings.
+
+    Args:
+        pdf_files: Input PDF files in order
+        config: Conversion configuration
+        output_kind: "png" or "pptx"
+
+    Returns:
+        Hex job key
+    """
+    inputs = []
+    for pdf_path in pdf_files:
+        try:
+            stat = Path(pdf_path).stat()
+            inputs.append([_resolved(str(pdf_path)), stat.st_size, stat.st_mtime_ns])
+        except OSError:
+            inputs.append([str(pdf_path), None, None])  # fails again when converted
+    settings = {
+        name: value for name, value in asdict(config).items() if name not in _RUNTIME_FIELDS
+    }
+    material = json.dumps(
+        [JOURNAL_FORMAT_VERSION, output_kind, inputs, settings], sort_keys=True, default=str
+    )
+    return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+
+def _page_key(pdf_path: Path, page_index: int) -> str:
+    return f"{_resolved(str(pdf_path))}#{page_index}"
+
+
+class ConversionJournal:
+    """
+    Append-only journal of finished work, with artifacts alongside.
+
+    Each record is one JSON line. Lines are flushed as they are written and
+    fsynced at most every ``sync_interval`` seconds, which keeps the cost per
+    page to a buffered write; a crash loses at most the last interval. A torn
+    last line is cut off when the journal is reopened. Artifacts are written
+    to a temporary file and renamed into place before their record is
+    appended, and their size and CRC are checked again on resume, so a page
+    is only skipped when its data is intact.
+    """
+
+    def __init__(
+        self,
+        journal_dir: Path,
+        key: str,
+        resume: bool = False,
+        sync_interval: float = DEFAULT_SYNC_INTERVAL
+    ):
+        """
+        Open a journal, resuming it or starting a new one.
+
+        Args:
+            journal_dir: Directory for the journal and its artifacts
+            key: Job key from job_key(); a journal of another job is discarded
+            resume: Keep the records of an existing journal of the same job
+            sync_interval: Seconds between fsyncs of the journal file
+        """
+        self.journal_dir = Path(journal_dir)
+        self.key = key
+        self.sync_interval = sync_interval
+        self.resumed = False
+        self._pages: Dict[str, dict] = {}
+        self._outputs: Dict[str, dict] = {}
+        self._files: Set[str] = set()
+        self._last_sync = time.monotonic()
+
+        journal_path = self.journal_dir / _JOURNAL_FILENAME
+        if resume and journal_path.exists():
+            self.resumed = self._load(journal_path)
+        if not self.resumed:
+            shutil.rmtree(self.journal_dir, ignore_errors=True)
+
+        self.journal_dir.mkdir(parents=True, exist_ok=True)
+        self._file = open(journal_path, "ab")
+        if not self.resumed:
+            self._append({"type": "job", "key": key, "version": JOURNAL_FORMAT_VERSION}, sync=True)
+
+    @classmethod
+    def from_config(
+        cls,
+        config: ConversionConfig,
+        output_dir: Path,
+        output_name: str,
+        pdf_files: List[Path],
+        output_kind: str
+    ) -> Optional["ConversionJournal"]:
+        """Open the journal requested by a ConversionConfig, if any."""
+        if not (config.checkpoint or config.resume):
+            return None
+        return cls(
+            checkpoint_dir(output_dir, output_name),
+            job_key(pdf_files, config, output_kind),
+            resume=config.resume
+        )
+
+    def _load(self, journal_path: Path) -> bool:
+        """Read the records of an existing journal; False if it belongs to another job."""
+        data = journal_path.read_bytes()
+        valid_length = 0
+        records = []
+        for line in data.splitlines(keepends=True):
+            if not line.endswith(b"\n"):
+                break
+            try:
+                records.append(json.loads(line))
+            except ValueError:
+                break
+            valid_length += len(line)
+
+        if not records or records[0].get("type") != "job" or records[0].get("key") != self.key:
+            return False
+
+        for record in records[1:]:
+            if record["type"] == "page":
+                self._pages[record["key"]] = record
+            elif record["type"] == "output":
+                self._outputs[record["key"]] = record
+            elif record["type"] == "file":
+                self._files.add(record["file"])
+
+        if valid_length < len(data):
+            # Drop a torn last line so new records start on a line boundary
+            with open(journal_path, "r+b") as f:
+                f.truncate(valid_length)
+        return True
+
+    def _append(self, record: dict, sync: bool = False) -> None:
+        self._file.write(json.dumps(record, separators=(",", ":")).encode("utf-8") + b"\n")
+        self._file.flush()
+        now = time.monotonic()
+        if sync or now - self._last_sync >= self.sync_interval:
+            os.fsync(self._file.fileno())
+            self._last_sync = now
+
+    def _write_artifact(self, name: str, data: bytes) -> None:
+        path = self.journal_dir / name
+        temp_path = path.with_name(f"{name}.tmp")
+        temp_path.write_bytes(data)
+        os.replace(temp_path, path)
+
+    def _read_artifact(self, name: str, size: int, crc: int) -> Optional[bytes]:
+        try:
+            data = (self.journal_dir / name).read_bytes()
+        except OSError:
+            return None
+        if len(data) != size or zlib.crc32(data) != crc:
+            return None
+        return data
+
+    # Rendered pages (PPTX output): the journal keeps the encoded images
+
+    def record_page(self, pdf_path: Path, page_index: int, rendered: RenderedPage) -> None:
+        """
+        Record a rendered page together with its encoded image.
+
+        Args:
+            pdf_path: Source PDF file
+            page_index: Zero-based page index
+            rendered: RenderedPage to store
+        """
+        key = _page_key(pdf_path, page_index)
+        artifact = hashlib.sha1(key.encode("utf-8")).hexdigest()
+        info = rendered.page_info
+        record = {
+            "type": "page",
+            "key": key,
+            "artifact": artifact,
+            "size": len(rendered.image_bytes),
+            "crc": zlib.crc32(rendered.image_bytes),
+            "format": rendered.image_format,
+            "encoding": rendered.encoding,
+            "info": [
+                info.page_number, list(info.original_size), info.is_portrait,
+                info.was_rotated, list(info.final_size)
+            ],
+            "clip": list(info.clip) if info.clip else None,
+            "rect": list(rendered.image_rect) if rendered.image_rect else None,
+            "rotation": rendered.image_rotation
+        }
+        self._write_artifact(f"{artifact}.img", rendered.image_bytes)
+        if rendered.svg_bytes:
+            record["svg_size"] = len(rendered.svg_bytes)
+            record["svg_crc"] = zlib.crc32(rendered.svg_bytes)
+            self._write_artifact(f"{artifact}.svg", rendered.svg_bytes)
+        self._pages[key] = record
+        self._append(record)
+
+    def restore_page(self, pdf_path: Path, page_index: int) -> Optional[RenderedPage]:
+        """
+        Load a recorded page if its artifacts are intact.
+
+        Args:
+            pdf_path: Source PDF file
+            page_index: Zero-based page index
+
+        Returns:
+            The rendered page as recorded, or None if it must be rendered again
+        """
+        record = self._pages.get(_page_key(pdf_path, page_index))
+        if record is None:
+            return None
+        image_bytes = self._read_artifact(f"{record['artifact']}.img", record["size"], record["crc"])
+        if image_bytes is None:
+            return None
+        svg_bytes = None
+        if "svg_size" in record:
+            svg_bytes = self._read_artifact(
+                f"{record['artifact']}.svg", record["svg_size"], record["svg_crc"]
+            )
+            if svg_bytes is None:
+                return None
+
+        page_number, original_size, is_portrait, was_rotated, final_size = record["info"]
+        return RenderedPage(
+            page_number=page_number,
+            image_bytes=image_bytes,
+            image_format=record["format"],
+            page_info=PageInfo(
+                page_number, tuple(original_size), is_portrait, was_rotated, tuple(final_size),
+                clip=tuple(record["clip"]) if record.get("clip") else None
+            ),
+            from_cache=True,
+            encoding=ENCODING_RESUMED,
+            image_rect=tuple(record["rect"]) if record["rect"] else None,
+            image_rotation=record["rotation"],
+            svg_bytes=svg_bytes
+        )
+
+    # Written outputs (PNG output): the output files are the artifacts
+
+    def record_outputs(self, pdf_path: Path, start: int, output_files: List[Path]) -> None:
+        """
+        Record output files written for consecutive pages.
+
+        Args:
+            pdf_path: Source PDF file
+            start: Zero-based index of the page of the first output file
+            output_files: Output files in page order
+        """
+        for offset, output_path in enumerate(output_files):
+            key = _page_key(pdf_path, start + offset)
+            record = {
+                "type": "output",
+                "key": key,
+                "output": str(output_path),
+                "size": output_path.stat().st_size
+            }
+            self._outputs[key] = record
+            self._append(record)
+
+    def finished_output(self, pdf_path: Path, page_index: int) -> Optional[Path]:
+        """
+        Get the recorded output file of a page if it is still intact.
+
+        Args:
+            pdf_path: Source PDF file
+            page_index: Zero-based page index
+
+        Returns:
+            Output file path, or None if the page must be converted again
+        """
+        record = self._outputs.get(_page_key(pdf_path, page_index))
+        if record is None:
+            return None
+        output_path = Path(record["output"])
+        try:
+            if output_path.stat().st_size != record["size"]:
+                return None
+        except OSError:
+            return None
+        return output_path
+
+    # Files
+
+    def record_file(self, pdf_path: Path) -> None:
+        """Record that every page of a file is finished."""
+        self._files.add(_resolved(str(pdf_path)))
+        self._append({"type": "file", "file": _resolved(str(pdf_path))})
+
+    @property
+    def finished_files(self) -> int:
+        """Number of files recorded as finished."""
+        return len(self._files)
+
+    @property
+    def finished_pages(self) -> int:
+        """Number of pages recorded as finished."""
+        return len(self._pages) + len(self._outputs)
+
+    def close(self) -> None:
+        """Sync and close the journal, keeping it for a later resume."""
+        if self._file is not None and not self._file.closed:
+            self._file.flush()
+            os.fsync(self._file.fileno())
+            self._file.close()
+
+    def complete(self) -> None:
+        """Remove the journal and its artifacts once the job has succeeded."""
+        self.close()
+        shutil.rmtree(self.journal_dir, ignore_errors=True)
+        try:
+            self.journal_dir.parent.rmdir()  # only succeeds when no other journal remains
+        except OSError:
+            pass
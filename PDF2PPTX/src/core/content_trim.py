@@ -0,0 +1,121 @@
+"""
+Content-based page trimming.
+Finds the part of a page that draws anything from its bounding-box log (a
+pass through the page's display list without rasterizing), so pages can be
+rendered without their empty margins and blank pages are recognised before
+any pixels are produced.
+
+Only what is drawn counts, not what it looks like: a page painting a white
+rectangle over its whole area is not blank and is not trimmed.
+"""
+
+from __future__ import annotations
+
+from dataclasses import replace
+from typing import Optional
+
+import fitz
+
+from .pdf_processor import ConversionConfig, PageInfo, describe_page
+
+# Policies accepted by ConversionConfig.blank_pages
+BLANK_KEEP = "keep"          # render blank pages like any other page
+BLANK_COLLAPSE = "collapse"  # replace them with a tiny white image of the page's shape
+BLANK_SKIP = "skip"          # leave them out of the output
+
+BLANK_POLICIES = (BLANK_KEEP, BLANK_COLLAPSE, BLANK_SKIP)
+
+# Bounding-box log entries that draw nothing visible (invisible OCR text)
+_INVISIBLE_KINDS = frozenset({"ignore-text"})
+
+# Trimming that keeps more than this fraction of the page area is not worth
+# a clipped render
+_MAX_TRIMMED_AREA = 0.95
+
+# Longest edge in pixels of the image standing in for a collapsed blank page
+_BLANK_EDGE = 16
+
+
+def content_rect(page: fitz.Page) -> Optional[fitz.Rect]:
+    """
+    Bounding box of everything a page draws, annotations included.
+
+    Args:
+        page: PyMuPDF page
+
+    Returns:
+        Content area in page coordinates (as page.rect, i.e. after the
+        page's own rotation), or None if the page draws nothing
+    """
+    area = fitz.Rect()
+    for kind, bbox in page.get_bboxlog():
+        if kind not in _INVISIBLE_KINDS:
+            area |= fitz.Rect(bbox)
+    if area.is_empty:
+        return None
+    area = (area * page.rotation_matrix) & page.rect
+    return None if area.is_empty else area
+
+
+def describe_content(page: fitz.Page, config: ConversionConfig) -> PageInfo:
+    """
+    Describe how a page will be rendered, trimmed to its content if configured.
+
+    Without trim_margins or a blank page policy this is describe_page(). A
+    trimmed page is described by its clip: sizes and auto-rotation follow
+    the content area plus trim_margin_pt, so fitted rendering and slide
+    placement treat it like a page of that size.
+
+    Args:
+        page: PyMuPDF page
+        config: Conversion configuration
+
+    Returns:
+        Page info with ``clip`` set for a trimmed page and ``blank`` set for
+        a page that draws nothing
+    """
+    page_info = describe_page(page, config)
+    if not config.trim_margins and config.blank_pages == BLANK_KEEP:
+        return page_info
+
+    area = content_rect(page)
+    if area is None:
+        return replace(page_info, blank=config.blank_pages != BLANK_KEEP)
+    if not config.trim_margins:
+        return page_info
+
+    margin = config.trim_margin_pt
+    clip = (area + (-margin, -margin, margin, margin)) & page.rect
+    page_rect = page.rect
+    if clip.width * clip.height > _MAX_TRIMMED_AREA * page_rect.width * page_rect.height:
+        return page_info
+
+    is_portrait = clip.width < clip.height
+    was_rotated = config.auto_rotate and is_portrait
+    return replace(
+        page_info,
+        original_size=(clip.width, clip.height),
+        is_portrait=is_portrait,
+        was_rotated=was_rotated,
+        final_size=(clip.height, clip.width) if was_rotated else (clip.width, clip.height),
+        clip=tuple(clip)
+    )
+
+
+def blank_image(page_info: PageInfo) -> bytes:
+    """
+    Tiny white PNG with the shape of a blank page (after auto-rotation).
+
+    Args:
+        page_info: Description of the blank page
+
+    Returns:
+        PNG bytes
+    """
+    width, height = page_info.final_size
+    scale = _BLANK_EDGE / max(width, height, 1)
+    pixmap = fitz.Pixmap(
+        fitz.csRGB, fitz.IRect(0, 0, max(1, round(width * scale)), max(1, round(height * scale))), False
+    )
+    pixmap.clear_with(255)
+    return pixmap.tobytes("png")
@@ -0,0 +1,493 @@
+"""
+Fault isolation for page rendering.
+Renders pages in worker processes under a per-page time limit and a
+per-worker memory limit. A page that fails, hangs or crashes its worker is
+retried at a lower resolution and, failing that, replaced by a placeholder,
+so one pathological page cannot stall or abort a whole conversion.
+"""
+
+from __future__ import annotations
+
+import os
+import logging
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Executor, Future, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, replace
+from pathlib import Path
+from typing import Any, Callable, Deque, Dict, Iterable, List, Optional, Set, Tuple
+
+from .pdf_processor import ConversionConfig, PDFProcessingError
+
+# Incident reasons
+REASON_ERROR = "error"
+REASON_MEMORY = "memory"
+REASON_TIMEOUT = "timeout"
+REASON_CRASH = "crash"
+
+# Incident actions
+ACTION_DEGRADED = "degraded"
+ACTION_PLACEHOLDER = "placeholder"
+
+# Render scale (and DPI) factor of the retry after a failed page
+DEGRADE_FACTOR = 0.5
+
+# Seconds between timeout checks while waiting for isolated pages
+_POLL_SECONDS = 0.1
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class PageIncident:
+    """A page that could not be rendered as configured, and what was done instead."""
+    pdf_path: str
+    page_number: int
+    reason: str  # error, memory, timeout or crash
+    action: str  # degraded (lower resolution) or placeholder
+    detail: str = ""
+
+    def describe(self) -> str:
+        """Human-readable one line description."""
+        outcome = "rendered at lower resolution" if self.action == ACTION_DEGRADED else "replaced by a placeholder"
+        text = f"{Path(self.pdf_path).name} page {self.page_number}: {self.reason}, {outcome}"
+        if self.detail:
+            text += f" ({self.detail})"
+        return text
+
+
+class PageRenderError(PDFProcessingError):
+    """Raised by a worker when rendering one page fails (the document itself is fine)."""
+
+    def __init__(self, message: str, reason: str = REASON_ERROR):
+        # Both values are in args so the error survives pickling between processes
+        super().__init__(message, reason)
+        self.reason = reason
+
+    def __str__(self) -> str:
+        return self.args[0]
+
+
+def classify_failure(error: BaseException) -> str:
+    """Incident reason for an exception raised while rendering a page."""
+    if isinstance(error, MemoryError):
+        return REASON_MEMORY
+    message = str(error).lower()
+    if "malloc" in message or "out of memory" in message:
+        return REASON_MEMORY
+    return REASON_ERROR
+
+
+def isolation_enabled(config: ConversionConfig) -> bool:
+    """Whether a configuration asks for isolated rendering with limits."""
+    return config.page_timeout > 0 or config.page_memory_mb > 0
+
+
+def degraded_config(config: ConversionConfig) -> ConversionConfig:
+    """Settings for the lower resolution retry of a failed page."""
+    return replace(
+        config,
+        scale_factor=config.scale_factor * DEGRADE_FACTOR,
+        target_dpi=max(72, int(config.target_dpi * DEGRADE_FACTOR))
+    )
+
+
+def _address_space_bytes() -> int:
+    """Current address space of this process (0 where /proc is unavailable)."""
+    try:
+        with open("/proc/self/statm") as statm:
+            return int(statm.read().split()[0]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, AttributeError):
+        return 0
+
+
+def apply_memory_limit(limit_mb: int) -> bool:
+    """
+    Cap the address space of the current process.
+
+    The limit is headroom on top of what the process already maps, so
+    interpreter and library overhead (which varies a lot between
+    platforms) does not count against it. Allocations beyond it fail
+    (MuPDF raises, Python raises MemoryError) instead of exhausting the
+    machine.
+
+    Args:
+        limit_mb: Headroom in MB (0 = no limit)
+
+    Returns:
+        Whether a limit is in effect (False where unsupported, e.g. Windows)
+    """
+    if limit_mb <= 0:
+        return False
+    try:
+        import resource
+    except ImportError:
+        return False
+    _, hard = resource.getrlimit(resource.RLIMIT_AS)
+    limit = _address_space_bytes() + limit_mb * 1024 * 1024
+    if hard != resource.RLIM_INFINITY:
+        limit = min(limit, hard)
+    resource.setrlimit(resource.RLIMIT_AS, (limit, hard))
+    return True
+
+
+def _init_worker(memory_limit_mb: int, initializer: Optional[Callable[[], None]]) -> None:
+    """Worker process initializer of RenderWorkerPool."""
+    if initializer is not None:
+        initializer()  # warm-up imports belong to the baseline, not the page budget
+    apply_memory_limit(memory_limit_mb)
+
+
+class RenderWorkerPool(Executor):
+    """
+    Process pool whose workers can be replaced when one hangs or dies.
+
+    Each restart starts a new generation of workers; futures of an earlier
+    generation fail with BrokenProcessPool. The pool remembers why each
+    generation ended, so owners of such futures can tell a deliberate
+    restart (after a timeout) from a crash.
+    """
+
+    def __init__(
+        self,
+        max_workers: int,
+        memory_limit_mb: int = 0,
+        initializer: Optional[Callable[[], None]] = None
+    ):
+        """
+        Start the pool.
+
+        Args:
+            max_workers: Worker processes
+            memory_limit_mb: Address space headroom per worker in MB (0 = no limit)
+            initializer: Extra worker initializer (module level function)
+        """
+        self.max_workers = max_workers
+        self.memory_limit_mb = memory_limit_mb
+        self._initializer = initializer
+        self._lock = threading.Lock()
+        self._generation = 0
+        self._end_reasons: Dict[int, str] = {}
+        self._pool = self._start()
+
+    def _start(self) -> ProcessPoolExecutor:
+        return ProcessPoolExecutor(
+            max_workers=self.max_workers,
+            initializer=_init_worker,
+            initargs=(self.memory_limit_mb, self._initializer)
+        )
+
+    @property
+    def generation(self) -> int:
+        """Number of restarts so far."""
+        return self._generation
+
+    def submit(self, fn, *args, **kwargs) -> Future:
+        """Schedule a call on the current workers."""
+        return self.submit_tracked(fn, *args, **kwargs)[0]
+
+    def submit_tracked(self, fn, *args, **kwargs) -> Tuple[Future, int]:
+        """Schedule a call, also returning the worker generation it runs on."""
+        with self._lock:
+            if self._pool is None:
+                raise RuntimeError("Render worker pool is shut down")
+            return self._pool.submit(fn, *args, **kwargs), self._generation
+
+    def restart(self, generation: int, reason: str) -> None:
+        """
+        Replace the workers of a generation by fresh ones.
+
+        Does nothing if that generation has already been replaced (another
+        user of a shared pool got there first).
+
+        Args:
+            generation: Generation observed failing or hanging
+            reason: Why it ends (REASON_TIMEOUT or REASON_CRASH)
+        """
+        with self._lock:
+            if generation != self._generation or self._pool is None:
+                return
+            logger.warning("Restarting render workers after a page %s", reason)
+            old_pool = self._pool
+            self._end_reasons[generation] = reason
+            self._generation += 1
+            self._pool = self._start()
+        # Processes stuck inside native code only stop when killed; the pool
+        # itself has no public API for that
+        for process in list((getattr(old_pool, "_processes", None) or {}).values()):
+            process.kill()
+        old_pool.shutdown(wait=False)
+
+    def end_reason(self, generation: int) -> Optional[str]:
+        """Why a generation was replaced (None while it is current)."""
+        with self._lock:
+            return self._end_reasons.get(generation)
+
+    def shutdown(self, wait: bool = True, **kwargs) -> None:
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=wait)
+
+
+@dataclass
+class IsolatedTask:
+    """
+    One page of work for an IsolatedRenderer.
+
+    ``call(level)`` gives the function and arguments to run in a worker at a
+    degradation level (0 = as configured, 1 = lower resolution);
+    ``annotate(result, incident)`` attaches an incident to the result of a
+    degraded run and ``fallback(incident)`` builds the placeholder result in
+    the calling process.
+    """
+    pdf_path: str
+    page_number: int
+    call: Callable[[int], Tuple[Any, ...]]
+    annotate: Callable[[Any, PageIncident], Any]
+    fallback: Callable[[PageIncident], Any]
+    level: int = 0
+    incident: Optional[PageIncident] = None
+
+
+class _Attempt:
+    """A task dispatched to the pool."""
+
+    def __init__(self, task: IsolatedTask, outer: Future, inner: Future, generation: int):
+        self.task = task
+        self.outer = outer
+        self.inner = inner
+        self.generation = generation
+        self.started: Optional[float] = None
+
+
+class IsolatedRenderer:
+    """
+    Runs page tasks on a RenderWorkerPool with time limits and degrade-retry.
+
+    At most one task per worker is in flight, so a task's time limit counts
+    from when it starts running. Callers drive the renderer through result()
+    or wait(), which check time limits and handle failures:
+
+    - a page raising PageRenderError or MemoryError, or exceeding
+      ``page_timeout`` (the pool is restarted), is retried at lower
+      resolution, then replaced by a placeholder;
+    - when a worker dies, the pages that were in flight are rerun one at a
+      time, so the page crashing it again is identified and degraded while
+      the others finish normally;
+    - any other exception is passed on to the caller unchanged.
+    """
+
+    def __init__(self, pool: RenderWorkerPool, page_timeout: float = 0.0):
+        """
+        Initialize the renderer.
+
+        Args:
+            pool: Worker pool (possibly shared with other renderers)
+            page_timeout: Seconds a page may run (0 = no limit)
+        """
+        self.pool = pool
+        self.page_timeout = page_timeout
+        self._lock = threading.RLock()
+        self._queue: Deque[Tuple[IsolatedTask, Future]] = deque()
+        self._suspects: Deque[Tuple[IsolatedTask, Future]] = deque()
+        self._in_flight: Dict[Future, _Attempt] = {}
+
+    def submit(self, task: IsolatedTask) -> Future:
+        """
+        Queue a page task.
+
+        Args:
+            task: Page task
+
+        Returns:
+            Future resolved with the (possibly degraded or placeholder) result
+        """
+        outer: Future = Future()
+        with self._lock:
+            self._queue.append((task, outer))
+            self._dispatch()
+        return outer
+
+    def result(self, future: Future) -> Any:
+        """Wait for a future returned by submit() and return its result."""
+        while not future.done():
+            self._pump()
+        return future.result()
+
+    def wait(self, futures: Iterable[Future]) -> Tuple[Set[Future], Set[Future]]:
+        """Wait until at least one of the futures is done (like wait(FIRST_COMPLETED))."""
+        futures = set(futures)
+        while True:
+            done = {future for future in futures if future.done()}
+            if done or not futures:
+                return done, futures - done
+            self._pump()
+
+    def cancel_pending(self) -> None:
+        """Drop queued tasks and cancel in-flight ones whose results are no longer wanted."""
+        with self._lock:
+            for _, outer in [*self._queue, *self._suspects]:
+                outer.cancel()
+            self._queue.clear()
+            self._suspects.clear()
+            for attempt in self._in_flight.values():
+                attempt.outer.cancel()
+                attempt.inner.cancel()
+
+    # Scheduling
+
+    def _dispatch(self) -> None:
+        """Fill free worker slots (lock held)."""
+        while True:
+            if self._suspects:
+                # Suspects of a crash run alone to find the page causing it
+                if self._in_flight:
+                    return
+                source = self._suspects
+            elif self._queue and len(self._in_flight) < self.pool.max_workers:
+                source = self._queue
+            else:
+                return
+            task, outer = source[0]
+            if outer.cancelled():
+                source.popleft()
+                continue
+            function, *args = task.call(task.level)
+            try:
+                inner, generation = self.pool.submit_tracked(function, *args)
+            except BrokenProcessPool:
+                # Workers died while idle; start new ones and try again
+                self.pool.restart(self.pool.generation, REASON_CRASH)
+                continue
+            except RuntimeError as e:
+                source.popleft()
+                outer.set_exception(e)  # pool shut down
+                continue
+            source.popleft()
+            self._in_flight[inner] = _Attempt(task, outer, inner, generation)
+            inner.add_done_callback(self._slot_freed)
+
+    def _slot_freed(self, inner: Future) -> None:
+        with self._lock:
+            attempt = self._in_flight.get(inner)
+            if attempt is not None and not inner.cancelled() and inner.exception() is None:
+                # Hand over successful results right away and reuse the slot
+                self._finish(attempt, inner.result())
+                self._dispatch()
+
+    def _pump(self) -> None:
+        """Wait briefly for in-flight tasks and handle results, failures and timeouts."""
+        with self._lock:
+            self._dispatch()
+            inner_futures = list(self._in_flight)
+        if inner_futures:
+            timeout = _POLL_SECONDS if self.page_timeout > 0 else None
+            wait(inner_futures, timeout=timeout, return_when=FIRST_COMPLETED)
+        else:
+            time.sleep(_POLL_SECONDS / 10)
+
+        with self._lock:
+            for inner in [future for future in self._in_flight if future.done()]:
+                attempt = self._in_flight.get(inner)
+                if attempt is not None:
+                    self._handle_done(attempt)
+            self._check_timeouts()
+            self._dispatch()
+
+    def _handle_done(self, attempt: _Attempt) -> None:
+        inner = attempt.inner
+        if inner.cancelled():
+            del self._in_flight[inner]
+            return
+        error = inner.exception()
+        if error is None:
+            self._finish(attempt, inner.result())
+        elif isinstance(error, BrokenProcessPool):
+            self._handle_broken_pool(attempt.generation)
+        elif isinstance(error, (PageRenderError, MemoryError)):
+            del self._in_flight[inner]
+            reason = error.reason if isinstance(error, PageRenderError) else REASON_MEMORY
+            self._failed(attempt.task, attempt.outer, reason, str(error))
+        else:
+            del self._in_flight[inner]
+            if not attempt.outer.cancelled():
+                attempt.outer.set_exception(error)
+
+    def _finish(self, attempt: _Attempt, result: Any) -> None:
+        del self._in_flight[attempt.inner]
+        if attempt.outer.cancelled():
+            return
+        if attempt.task.incident is not None:
+            result = attempt.task.annotate(result, attempt.task.incident)
+        attempt.outer.set_result(result)
+
+    def _handle_broken_pool(self, generation: int) -> None:
+        """All tasks of a worker generation have been lost."""
+        lost = [attempt for attempt in self._in_flight.values() if attempt.generation == generation]
+        for attempt in lost:
+            del self._in_flight[attempt.inner]
+
+        if self.pool.end_reason(generation) == REASON_TIMEOUT:
+            # Workers were replaced because of another page's timeout
+            for attempt in reversed(lost):
+                self._queue.appendleft((attempt.task, attempt.outer))
+            return
+
+        self.pool.restart(generation, REASON_CRASH)
+        if len(lost) == 1:
+            attempt = lost[0]
+            self._failed(attempt.task, attempt.outer, REASON_CRASH, "worker process died")
+        else:
+            self._suspects.extend((attempt.task, attempt.outer) for attempt in lost)
+
+    def _check_timeouts(self) -> None:
+        if self.page_timeout <= 0:
+            return
+        now = time.monotonic()
+        expired = None
+        for attempt in self._in_flight.values():
+            if attempt.started is None and attempt.inner.running():
+                attempt.started = now
+            if attempt.started is not None and now - attempt.started > self.page_timeout:
+                if expired is None or attempt.started < expired.started:
+                    expired = attempt
+        if expired is None:
+            return
+
+        # The worker cannot be interrupted; replace all workers of its generation
+        self.pool.restart(expired.generation, REASON_TIMEOUT)
+        lost = [attempt for attempt in self._in_flight.values() if attempt.generation == expired.generation]
+        for attempt in lost:
+            del self._in_flight[attempt.inner]
+        for attempt in reversed(lost):
+            if attempt is not expired:
+                self._queue.appendleft((attempt.task, attempt.outer))
+        self._failed(
+            expired.task, expired.outer, REASON_TIMEOUT, f"over {self.page_timeout:g}s"
+        )
+
+    def _failed(self, task: IsolatedTask, outer: Future, reason: str, detail: str) -> None:
+        """Retry a failed page at lower resolution, or give it a placeholder."""
+        if outer.cancelled():
+            return
+        if task.level == 0:
+            task.level = 1
+            task.incident = PageIncident(task.pdf_path, task.page_number, reason, ACTION_DEGRADED, detail)
+            logger.warning("Retrying at lower resolution: %s", task.incident.describe())
+            self._queue.appendleft((task, outer))
+            return
+
+        incident = PageIncident(task.pdf_path, task.page_number, reason, ACTION_PLACEHOLDER, detail)
+        logger.warning("Using a placeholder: %s", incident.describe())
+        try:
+            outer.set_result(task.fallback(incident))
+        except Exception as e:
+            outer.set_exception(e)
+
+
+def incidents_of(results: List[Any]) -> List[PageIncident]:
+    """Collect the incidents attached to rendered pages."""
+    return [result.incident for result in results if getattr(result, "incident", None) is not None]
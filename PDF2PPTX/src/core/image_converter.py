@@ -6,16 +6,21 @@ Provides modular, reusable image conversion functionality.
 from __future__ import annotations
 
 from pathlib import Path
+from concurrent.futures import Executor
 from typing import List, Optional, Callable
 from io import BytesIO
 
 from .pdf_processor import (
     ConversionConfig,
     ConversionService,
+    adapt_progress_callback,
     open_pdf_document,
-    process_page_to_pixmap,
     PDFProcessingError
 )
+from . import tracing
+from .batch_scheduler import BatchImageScheduler, BatchResult, FileResult
+from .output_writer import OutputWriterPool
+from .render_pipeline import PageRenderPipeline, PipelineStats
 
 
 class ImageConversionService(ConversionService):
@@ -24,21 +29,40 @@ class ImageConversionService(ConversionService):
     Provides high-quality image generation with configurable scaling and rotation.
     """
 
-    def __init__(self, config: ConversionConfig):
+    def __init__(self, config: ConversionConfig, executor: Optional[Executor] = None):
+        """
+        Initialize the service.
+
+        Args:
+            config: Conversion configuration
+            executor: Optional externally managed process pool to render on
+        """
         super().__init__(config)
-        self.progress_callback: Optional[Callable[[int], None]] = None
+        self.executor = executor
+        self.progress_callback: Optional[Callable[[int, int], None]] = None
+        self.last_pipeline_stats: Optional[PipelineStats] = None
 
-    def set_progress_callback(self, callback: Callable[[int], None]) -> None:
-        """Set callback function for progress updates."""
-        self.progress_callback = callback
+    def set_progress_callback(self, callback: Callable[..., None]) -> None:
+        """
+        Set callback called with the pages finished and bytes written since the last call.
 
-    def convert_pdf_to_images(self, pdf_path: Path, output_dir: Path) -> List[Path]:
+        A one-argument callback (the older form) receives just the pages finished.
+        """
+        self.progress_callback = adapt_progress_callback(callback)
+
+    def convert_pdf_to_images(
+        self,
+        pdf_path: Path,
+        output_dir: Path,
+        pipeline: Optional[PageRenderPipeline] = None
+    ) -> List[Path]:
         """
         Convert a single PDF file to PNG images.
 
         Args:
             pdf_path: Path to PDF file
             output_dir: Directory to save PNG files
+            pipeline: Rendering pipeline to share across files (created if omitted)
 
         Returns:
             List of generated PNG file paths
@@ -53,36 +77,73 @@ class ImageConversionService(ConversionService):
         output_files = []
         base_name = pdf_path.stem
 
-        try:
-            with open_pdf_document(pdf_path) as doc:
-                total_pages = len(doc)
+        owns_pipeline = pipeline is None
+        if owns_pipeline:
+            pipeline = PageRenderPipeline(self.config, "png", executor=self.executor)
+        # Files are written behind rendering; the writer's bounded queue
+        # holds rendering back when storage cannot keep up
+        writer = OutputWriterPool.from_config(self.config)
 
-                for page_num, page in enumerate(doc, start=1):
-                    # Process page to pixmap
-                    pixmap, page_info = process_page_to_pixmap(page, self.config)
+        try:
+            # Pages come from the render cache when available
+            for rendered in pipeline.iter_pages(pdf_path):
+                page_num = rendered.page_number
 
-                    try:
-                        # Generate output filename
-                        output_filename = f"{base_name}_page_{page_num:03d}.png"
-                        output_path = output_dir / output_filename
+                # Generate output filename
+                output_filename = f"{base_name}_page_{page_num:03d}.png"
+                output_path = output_dir / output_filename
 
-                        # Save image with high quality
-                        pixmap.save(str(output_path))
-                        output_files.append(output_path)
+                with tracing.span("save", file=str(pdf_path), page=page_num):
+                    writer.submit(output_path, rendered.image_bytes)
+                output_files.append(output_path)
 
-                        # Update progress if callback is set
-                        if self.progress_callback:
-                            self.progress_callback(page_num)
+                # Update progress if callback is set
+                if self.progress_callback:
+                    self.progress_callback(1, len(rendered.image_bytes))
 
-                    finally:
-                        # Clean up pixmap memory immediately
-                        pixmap = None
+            writer.flush()
 
         except Exception as e:
             raise PDFProcessingError(f"Failed to convert {pdf_path} to images: {e}")
+        finally:
+            writer.close()
+            pipeline.stats.record_writes(writer)
+            if owns_pipeline:
+                pipeline.close()
+                self.last_pipeline_stats = pipeline.stats
 
         return output_files
 
+    def convert_batch(
+        self,
+        pdf_files: List[Path],
+        output_dir: Path,
+        on_file_done: Optional[Callable[[FileResult], None]] = None
+    ) -> BatchResult:
+        """
+        Convert a batch of PDF files to PNG images on one shared worker pool.
+
+        Files are split into page-range tasks scheduled longest first across
+        the whole batch. A failing file does not stop the others.
+
+        Args:
+            pdf_files: List of PDF file paths
+            output_dir: Directory to save PNG files
+            on_file_done: Called once per file when its outcome is known
+
+        Returns:
+            Per-file results in input order and aggregated statistics
+        """
+        def pages_done(result: FileResult, count: int, bytes_written: int) -> None:
+            if self.progress_callback:
+                self.progress_callback(count, bytes_written)
+
+        batch = BatchImageScheduler(self.config, executor=self.executor).run(
+            pdf_files, output_dir, pages_done, on_file_done
+        )
+        self.last_pipeline_stats = batch.stats
+        return batch
+
     def convert_multiple_pdfs(self, pdf_files: List[Path], output_dir: Path) -> List[Path]:
         """
         Convert multiple PDF files to PNG images.
@@ -97,15 +158,14 @@ class ImageConversionService(ConversionService):
         Raises:
             PDFProcessingError: If any conversion fails
         """
-        all_output_files = []
+        batch = self.convert_batch(pdf_files, output_dir)
 
-        for pdf_file in pdf_files:
-            try:
-                output_files = self.convert_pdf_to_images(pdf_file, output_dir)
-                all_output_files.extend(output_files)
-            except PDFProcessingError as e:
+        all_output_files = []
+        for result in batch.files:
+            if not result.succeeded:
                 # Re-raise with context about which file failed
-                raise PDFProcessingError(f"Failed processing {pdf_file.name}: {e}")
+                raise PDFProcessingError(f"Failed processing {result.pdf_path.name}: {result.error}")
+            all_output_files.extend(result.output_files)
 
         return all_output_files
 
@@ -0,0 +1,349 @@
+"""
+Adaptive per-page image encoding.
+Picks the cheapest adequate encoding for each rendered page: JPEG for
+photographic content, palette or grayscale PNG for flat text/line art and
+full RGB PNG otherwise.
+"""
+
+from __future__ import annotations
+
+import struct
+import zlib
+from dataclasses import dataclass
+from io import BytesIO
+from typing import BinaryIO, Dict, Tuple
+
+import fitz
+from PIL import Image, ImageChops
+
+# Encoding policies accepted by ConversionConfig.image_encoding
+ENCODING_PNG = "png"              # lossless RGB PNG (previous behaviour)
+ENCODING_AUTO = "auto"            # choose per page from the pixmap analysis
+ENCODING_JPEG = "jpeg"            # always JPEG at jpeg_quality
+ENCODING_PALETTE = "palette"      # 8-bit palette PNG
+ENCODING_GRAYSCALE = "grayscale"  # 8-bit grayscale PNG
+
+ENCODING_POLICIES = (
+    ENCODING_PNG,
+    ENCODING_AUTO,
+    ENCODING_JPEG,
+    ENCODING_PALETTE,
+    ENCODING_GRAYSCALE,
+)
+
+# Policies whose every page is a PNG, whatever its content
+PNG_ENCODINGS = (ENCODING_PNG, ENCODING_PALETTE, ENCODING_GRAYSCALE)
+
+# PNG encoder profiles accepted by ConversionConfig.png_profile. Rows are
+# stored unfiltered, as MuPDF does: rendered pages are mostly long runs of
+# identical pixels, which deflate well as they are and which row filters
+# break up
+PNG_PROFILE_FASTEST = "fastest"    # zlib level 1
+PNG_PROFILE_BALANCED = "balanced"  # MuPDF's encoder, zlib level 6 (previous behaviour)
+PNG_PROFILE_SMALLEST = "smallest"  # zlib level 9
+
+PNG_PROFILES = (
+    PNG_PROFILE_FASTEST,
+    PNG_PROFILE_BALANCED,
+    PNG_PROFILE_SMALLEST,
+)
+
+
+_PNG_LEVELS: Dict[str, int] = {
+    PNG_PROFILE_FASTEST: 1,
+    PNG_PROFILE_BALANCED: 6,
+    PNG_PROFILE_SMALLEST: 9,
+}
+
+_PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+_FILTER_NONE = b"\x00"
+_FILTER_UP = b"\x02"  # PNG row filter: difference to the row above
+
+# Analysis thresholds
+_SAMPLE_EDGE = 256          # longest edge of the analysis thumbnail
+_PALETTE_MAX_COLORS = 256
+_FLAT_MAX_ENTROPY = 3.0     # bits; below this the page is flat text/line art
+_PHOTO_MIN_ENTROPY = 6.0    # bits; above this the page looks photographic
+
+
+@dataclass
+class PixmapAnalysis:
+    """Cheap statistics gathered from a rendered pixmap."""
+    color_count: int  # distinct colors, capped at 257
+    is_grayscale: bool
+    entropy: float    # luminance entropy in bits
+
+
+def _to_image(pixmap: fitz.Pixmap) -> Image.Image:
+    """Wrap pixmap samples in a Pillow image (RGB pixmaps only)."""
+    return Image.frombytes("RGB", (pixmap.width, pixmap.height), pixmap.samples)
+
+
+def analyze_pixmap(pixmap: fitz.Pixmap) -> PixmapAnalysis:
+    """
+    Analyze a rendered RGB pixmap.
+
+    Color count and grayscale detection run over every pixel (both are single
+    C-level passes and must be exact for the lossless encodings); entropy is
+    estimated on a small nearest-neighbour thumbnail.
+
+    Args:
+        pixmap: Rendered page pixmap
+
+    Returns:
+        Color count, grayscale flag and entropy
+    """
+    image = _to_image(pixmap)
+
+    colors = image.getcolors(maxcolors=_PALETTE_MAX_COLORS)
+    color_count = len(colors) if colors is not None else _PALETTE_MAX_COLORS + 1
+
+    red, green, blue = image.split()
+    is_grayscale = (
+        ImageChops.difference(red, green).getbbox() is None
+        and ImageChops.difference(green, blue).getbbox() is None
+    )
+
+    scale = max(image.width, image.height) / _SAMPLE_EDGE
+    if scale > 1:
+        size = (max(1, int(image.width / scale)), max(1, int(image.height / scale)))
+        image = image.resize(size, Image.NEAREST)
+
+    return PixmapAnalysis(
+        color_count=color_count,
+        is_grayscale=is_grayscale,
+        entropy=image.convert("L").entropy()
+    )
+
+
+def choose_encoding(analysis: PixmapAnalysis) -> str:
+    """
+    Choose a concrete encoding for an analyzed page.
+
+    Args:
+        analysis: Result of analyze_pixmap()
+
+    Returns:
+        One of png, jpeg, palette or grayscale
+    """
+    if analysis.is_grayscale:
+        return ENCODING_GRAYSCALE
+    if analysis.color_count <= _PALETTE_MAX_COLORS:
+        return ENCODING_PALETTE  # exact
+    if analysis.entropy < _FLAT_MAX_ENTROPY:
+        return ENCODING_PALETTE  # anti-aliasing shades quantize invisibly
+    if analysis.entropy >= _PHOTO_MIN_ENTROPY:
+        return ENCODING_JPEG
+    return ENCODING_PNG
+
+
+def encode_pixmap(
+    pixmap: fitz.Pixmap,
+    policy: str = ENCODING_PNG,
+    jpeg_quality: int = 85,
+    png_profile: str = PNG_PROFILE_BALANCED
+) -> Tuple[bytes, str, str]:
+    """
+    Encode a pixmap according to an encoding policy.
+
+    Args:
+        pixmap: Rendered page pixmap
+        policy: One of ENCODING_POLICIES
+        jpeg_quality: JPEG quality (1-100) used when JPEG is chosen
+        png_profile: PNG encoder profile (one of PNG_PROFILES)
+
+    Returns:
+        Tuple of (image bytes, image format, concrete encoding used)
+    """
+    encoding = policy
+    if pixmap.n != 3 or pixmap.alpha:
+        # Analysis and the Pillow encoders assume plain RGB
+        encoding = ENCODING_JPEG if policy == ENCODING_JPEG else ENCODING_PNG
+    elif policy == ENCODING_AUTO:
+        encoding = choose_encoding(analyze_pixmap(pixmap))
+
+    if encoding == ENCODING_JPEG:
+        return pixmap.tobytes("jpeg", jpg_quality=jpeg_quality), "jpeg", encoding
+
+    if encoding == ENCODING_GRAYSCALE:
+        gray = fitz.Pixmap(fitz.csGRAY, pixmap)
+        return encode_png(gray, png_profile), "png", encoding
+
+    if encoding == ENCODING_PALETTE:
+        image = _to_image(pixmap).quantize(colors=256, method=Image.Quantize.FASTOCTREE)
+        return _save_png(image, png_level(png_profile)), "png", encoding
+
+    return encode_png(pixmap, png_profile), "png", ENCODING_PNG
+
+
+def png_level(profile: str) -> int:
+    """zlib compression level of a PNG profile (see PNG_PROFILES)."""
+    return _PNG_LEVELS[profile]
+
+
+class StreamingPNGWriter:
+    """
+    Writes an 8-bit RGB or grayscale PNG row band by row band.
+
+    Rows are stored unfiltered or Up-filtered (computed with Pillow, in C),
+    and deflated incrementally; each band's compressed output becomes its
+    own IDAT chunk.
+    """
+
+    def __init__(
+        self,
+        stream: BinaryIO,
+        width: int,
+        height: int,
+        level: int = 6,
+        filtered: bool = False,
+        grayscale: bool = False
+    ):
+        """
+        Start the image.
+
+        Args:
+            stream: Binary stream to write to
+            width: Image width in pixels
+            height: Image height in pixels
+            level: zlib compression level
+            filtered: Whether to Up-filter rows (pays off on photographic content)
+            grayscale: Whether samples are 8-bit gray instead of RGB
+        """
+        self.stream = stream
+        self.width = width
+        self.height = height
+        self.filtered = filtered
+        self.rows_written = 0
+        self._mode = "L" if grayscale else "RGB"
+        self._stride = width * (1 if grayscale else 3)
+        self._previous_row = bytes(self._stride)  # Up filter treats the row above the image as zeros
+        self._compressor = zlib.compressobj(level)
+        stream.write(_PNG_SIGNATURE)
+        self._chunk(b"IHDR", struct.pack(">IIBBBBB", width, height, 8, 0 if grayscale else 2, 0, 0, 0))
+
+    def _chunk(self, kind: bytes, data: bytes) -> None:
+        self.stream.write(struct.pack(">I", len(data)))
+        self.stream.write(kind)
+        self.stream.write(data)
+        self.stream.write(struct.pack(">I", zlib.crc32(data, zlib.crc32(kind))))
+
+    def write_rows(self, samples: bytes) -> None:
+        """
+        Append rows of samples (a whole number of rows).
+
+        Args:
+            samples: Row-major samples without padding
+        """
+        rows = len(samples) // self._stride
+        if rows == 0:
+            return
+        if rows * self._stride != len(samples) or self.rows_written + rows > self.height:
+            raise ValueError("Band does not fit the image")
+
+        if self.filtered:
+            above = self._previous_row + samples[:-self._stride]
+            data = ImageChops.subtract_modulo(
+                Image.frombytes(self._mode, (self.width, rows), samples),
+                Image.frombytes(self._mode, (self.width, rows), above)
+            ).tobytes()
+            row_filter = _FILTER_UP
+        else:
+            data = samples
+            row_filter = _FILTER_NONE
+        view = memoryview(data)
+        scanlines = bytearray()
+        for offset in range(0, len(data), self._stride):
+            scanlines += row_filter
+            scanlines += view[offset:offset + self._stride]
+
+        compressed = self._compressor.compress(bytes(scanlines))
+        if compressed:
+            self._chunk(b"IDAT", compressed)
+        self._previous_row = samples[-self._stride:]
+        self.rows_written += rows
+
+    def close(self) -> None:
+        """Finish the image; every row must have been written."""
+        if self.rows_written != self.height:
+            raise ValueError(f"PNG has {self.rows_written} of {self.height} rows")
+        self._chunk(b"IDAT", self._compressor.flush())
+        self._chunk(b"IEND", b"")
+
+
+def encode_png(pixmap: fitz.Pixmap, profile: str = PNG_PROFILE_BALANCED) -> bytes:
+    """
+    Encode an RGB or grayscale pixmap as PNG with an encoder profile.
+
+    Args:
+        pixmap: Pixmap to encode
+        profile: One of PNG_PROFILES
+
+    Returns:
+        PNG bytes
+    """
+    if profile == PNG_PROFILE_BALANCED or pixmap.alpha or pixmap.n not in (1, 3):
+        return pixmap.tobytes("png")
+
+    buffer = BytesIO()
+    writer = StreamingPNGWriter(
+        buffer, pixmap.width, pixmap.height, png_level(profile), grayscale=pixmap.n == 1
+    )
+    samples = pixmap.samples
+    if pixmap.stride != pixmap.width * pixmap.n:
+        samples = b"".join(
+            samples[row * pixmap.stride:row * pixmap.stride + pixmap.width * pixmap.n]
+            for row in range(pixmap.height)
+        )
+    writer.write_rows(samples)
+    writer.close()
+    return buffer.getvalue()
+
+
+def _save_png(image: Image.Image, level: int, optimize: bool = False) -> bytes:
+    buffer = BytesIO()
+    image.save(buffer, format="PNG", compress_level=level, optimize=optimize)
+    return buffer.getvalue()
+
+
+def reoptimize_png(data: bytes) -> bytes:
+    """
+    Losslessly recompress a PNG as small as Pillow can make it.
+
+    Tries maximum compression with Pillow's optimizer and, where they are
+    exact, grayscale and palette (at most 256 colors) conversions; keeps the
+    smallest result, which may be the input itself. Meant to run off the
+    rendering path.
+
+    Args:
+        data: PNG bytes
+
+    Returns:
+        PNG bytes with the same pixels, never larger than the input
+    """
+    with Image.open(BytesIO(data)) as image:
+        image.load()
+    if image.mode not in ("RGB", "L", "P"):
+        return data
+
+    candidates = [data, _save_png(image, 9, optimize=True)]
+    if image.mode == "RGB":
+        reduced = []
+        colors = image.getcolors(maxcolors=_PALETTE_MAX_COLORS)
+        if colors is not None:
+            reduced.append(image.quantize(colors=len(colors), method=Image.Quantize.MEDIANCUT))
+        reduced.append(image.convert("L"))
+        for candidate in reduced:
+            # Only conversions that reproduce every pixel qualify
+            if ImageChops.difference(candidate.convert("RGB"), image).getbbox() is None:
+                candidates.append(_save_png(candidate, 9, optimize=True))
+    return min(candidates, key=len)
+
+
+def detect_image_format(data: bytes) -> str:
+    """Detect the format of encoded image bytes from their signature."""
+    if data.startswith(_PNG_SIGNATURE):
+        return "png"
+    if data.startswith(b"\xff\xd8"):
+        return "jpeg"
+    raise ValueError("Unknown image format")
@@ -0,0 +1,474 @@
+"""
+Conversion job service for long-lived processes.
+Runs conversion jobs on a warm, pre-started worker pool shared by all jobs,
+so each job skips interpreter startup, imports and worker spawn. Jobs are
+queued, tracked and observable through progress events.
+"""
+
+from __future__ import annotations
+
+import itertools
+import os
+import threading
+import time
+import uuid
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field, replace
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from .batch_scheduler import FileResult
+from .fault_isolation import RenderWorkerPool
+from .image_converter import ImageConversionService
+from .metadata_index import MetadataIndex
+from .pdf_processor import ConversionConfig, PDFProcessingError, PDFProcessor
+from .powerpoint_converter import PowerPointConversionService
+
+# Job states
+JOB_QUEUED = "queued"
+JOB_RUNNING = "running"
+JOB_SUCCEEDED = "succeeded"
+JOB_FAILED = "failed"
+JOB_CANCELLED = "cancelled"
+
+FINISHED_STATES = frozenset({JOB_SUCCEEDED, JOB_FAILED, JOB_CANCELLED})
+
+# Conversion settings a job may override; the pool size, worker memory limit,
+# cache and index belong to the service
+JOB_OPTIONS = frozenset({
+    "scale_factor", "auto_rotate", "slide_width_mm", "slide_height_mm", "target_dpi",
+    "prefetch_pages", "image_encoding", "jpeg_quality", "render_mode", "streaming_output",
+    "deduplicate_pages", "scan_passthrough", "svg_pages", "checkpoint", "resume", "page_timeout",
+    "tile_megapixels", "durable_writes", "png_profile", "png_reoptimize",
+    "trim_margins", "trim_margin_pt", "blank_pages"
+})
+
+OUTPUT_FORMATS = ("png", "pptx", "png,pptx")  # png,pptx: both from one render per page
+
+# Minimum seconds between progress events of one job
+PROGRESS_EVENT_INTERVAL = 0.5
+
+# Finished jobs kept for status queries before the oldest are forgotten
+DEFAULT_JOB_RETENTION = 256
+
+
+class JobCancelled(Exception):
+    """Raised inside a running job once it has been cancelled."""
+
+
+@dataclass
+class JobSpec:
+    """What a job converts and how."""
+    output_format: str
+    pdf_files: List[Path]
+    output_dir: Optional[Path] = None
+    output_name: Optional[str] = None  # PPTX file name
+    options: Dict[str, Any] = field(default_factory=dict)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "JobSpec":
+        """
+        Build a job spec from a request document.
+
+        Args:
+            data: Mapping with "format", "files" and optionally "output_dir",
+                "output" and "options" (ConversionConfig field overrides)
+
+        Returns:
+            Validated job spec
+
+        Raises:
+            ValueError: If the document is malformed or names unknown options
+        """
+        if not isinstance(data, dict):
+            raise ValueError("Job must be a JSON object")
+        output_format = data.get("format")
+        if output_format not in OUTPUT_FORMATS:
+            raise ValueError(f"format must be one of {', '.join(OUTPUT_FORMATS)}")
+
+        files = data.get("files")
+        if not isinstance(files, list) or not files or not all(isinstance(f, str) for f in files):
+            raise ValueError("files must be a non-empty list of paths")
+        pdf_files = [Path(f) for f in files]
+        for pdf_path in pdf_files:
+            if pdf_path.suffix.lower() != ".pdf":
+                raise ValueError(f"Not a PDF file: {pdf_path}")
+            if not pdf_path.is_file():
+                raise ValueError(f"File not found: {pdf_path}")
+
+        options = data.get("options") or {}
+        if not isinstance(options, dict):
+            raise ValueError("options must be a JSON object")
+        unknown = sorted(set(options) - JOB_OPTIONS)
+        if unknown:
+            raise ValueError(f"Unknown options: {', '.join(unknown)}")
+
+        output_name = data.get("output")
+        if output_name is not None and (
+            not isinstance(output_name, str) or Path(output_name).name != output_name
+        ):
+            raise ValueError("output must be a plain file name")
+
+        output_dir = data.get("output_dir")
+        return cls(
+            output_format=output_format,
+            pdf_files=pdf_files,
+            output_dir=Path(output_dir) if output_dir else None,
+            output_name=output_name,
+            options=dict(options)
+        )
+
+
+@dataclass
+class Job:
+    """A conversion job and its observable state."""
+    job_id: str
+    spec: JobSpec
+    config: ConversionConfig
+    output_dir: Path
+    status: str = JOB_QUEUED
+    submitted_at: float = field(default_factory=time.time)
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
+    total_pages: int = 0
+    pages_done: int = 0
+    bytes_written: int = 0
+    outputs: List[Path] = field(default_factory=list)
+    failed_files: Dict[str, str] = field(default_factory=dict)
+    error: Optional[str] = None
+    events: List[Dict[str, Any]] = field(default_factory=list, repr=False)
+    cancel_requested: bool = False
+
+    def __post_init__(self) -> None:
+        self._condition = threading.Condition()
+        self._last_progress = 0.0
+
+    @property
+    def finished(self) -> bool:
+        """Whether the job has reached a final state."""
+        return self.status in FINISHED_STATES
+
+    def emit(self, event: str, **fields: Any) -> None:
+        """Append an event and wake up waiting readers."""
+        with self._condition:
+            self.events.append(dict(fields, event=event, job=self.job_id, time=time.time()))
+            self._condition.notify_all()
+
+    def set_status(self, status: str, **fields: Any) -> None:
+        """Move to a new state, emitting a status event."""
+        with self._condition:
+            self.status = status
+            now = time.time()
+            if status == JOB_RUNNING:
+                self.started_at = now
+            elif status in FINISHED_STATES:
+                self.finished_at = now
+            # Under the same lock, so readers see the final event with the final state
+            self.emit("status", status=status, **fields)
+
+    def add_progress(self, count: int, bytes_written: int) -> None:
+        """Count finished pages; progress events are throttled."""
+        if self.cancel_requested:
+            raise JobCancelled()
+        self.pages_done += count
+        self.bytes_written += bytes_written
+        now = time.monotonic()
+        if now - self._last_progress >= PROGRESS_EVENT_INTERVAL or self.pages_done == self.total_pages:
+            self._last_progress = now
+            self.emit("progress", pages_done=self.pages_done, total_pages=self.total_pages,
+                      bytes=self.bytes_written)
+
+    def wait_events(self, since: int, timeout: float) -> Tuple[List[Dict[str, Any]], bool]:
+        """
+        Wait for events after the first ``since`` ones.
+
+        Args:
+            since: Number of events the reader has already seen
+            timeout: Maximum seconds to wait for a new event
+
+        Returns:
+            New events and whether the job has finished
+        """
+        with self._condition:
+            if len(self.events) <= since and not self.finished:
+                self._condition.wait(timeout)
+            return self.events[since:], self.finished
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Status document of the job."""
+        return {
+            "id": self.job_id,
+            "status": self.status,
+            "format": self.spec.output_format,
+            "files": [str(path) for path in self.spec.pdf_files],
+            "output_dir": str(self.output_dir),
+            "submitted_at": self.submitted_at,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+            "total_pages": self.total_pages,
+            "pages_done": self.pages_done,
+            "bytes": self.bytes_written,
+            "outputs": [path.name for path in self.outputs],
+            "failed_files": dict(self.failed_files),
+            "error": self.error
+        }
+
+
+def _warm_worker() -> None:
+    """Worker initializer: import the rendering code before the first job."""
+    from . import render_pipeline  # noqa: F401 (imports PyMuPDF)
+
+
+def _worker_pid() -> int:
+    return os.getpid()
+
+
+def _count_pages(pdf_files: List[Path], config: ConversionConfig) -> int:
+    """Total pages of a job, from the metadata index when one is configured."""
+    if config.metadata_index is not None:
+        try:
+            with MetadataIndex.from_config(config) as index:
+                return sum(index.page_counts(pdf_files))
+        except Exception:
+            pass  # count pages without the index
+    processor = PDFProcessor()
+    total = 0
+    for pdf_path in pdf_files:
+        try:
+            total += processor.count_pages(pdf_path)
+        except PDFProcessingError:
+            pass  # reported when the file is converted
+    return total
+
+
+class ConversionJobService:
+    """
+    Queue of conversion jobs sharing one warm worker pool.
+
+    Rendering runs on a process pool started (and warmed) once by start().
+    Up to ``job_slots`` jobs run at a time, each assembling its output on a
+    thread of this process while submitting pages to the shared pool; further
+    jobs wait in submission order.
+    """
+
+    def __init__(
+        self,
+        base_config: ConversionConfig,
+        output_root: Path,
+        job_slots: int = 1,
+        retention: int = DEFAULT_JOB_RETENTION
+    ):
+        """
+        Initialize the service.
+
+        Args:
+            base_config: Settings of every job; max_workers sizes the pool and
+                memory_budget_mb is split between the job slots
+            output_root: Parent of per-job output directories for jobs that
+                do not name one
+            job_slots: Jobs running concurrently
+            retention: Finished jobs kept for status queries
+        """
+        if job_slots < 1:
+            raise ValueError("Job slots must be at least 1")
+        self.base_config = base_config
+        self.output_root = Path(output_root)
+        self.job_slots = job_slots
+        self.retention = retention
+        self.started_at: Optional[float] = None
+        self._jobs: Dict[str, Job] = {}
+        self._futures: Dict[str, Future] = {}
+        self._lock = threading.Lock()
+        self._sequence = itertools.count(1)
+        self._pool: Optional[RenderWorkerPool] = None
+        self._runner: Optional[ThreadPoolExecutor] = None
+        self._totals = {"ran": 0, "pages": 0, "bytes": 0, "queue_seconds": 0.0, "run_seconds": 0.0}
+
+    def start(self) -> None:
+        """Start the worker pool and wait until every worker is up."""
+        if self._pool is not None:
+            return
+        workers = self.base_config.max_workers
+        self._pool = RenderWorkerPool(workers, self.base_config.page_memory_mb, initializer=_warm_worker)
+        # One task per worker makes the pool spawn (and initialize) all of them now
+        for future in [self._pool.submit(_worker_pid) for _ in range(workers)]:
+            future.result()
+        self._runner = ThreadPoolExecutor(max_workers=self.job_slots, thread_name_prefix="pdf2pptx-job")
+        self.started_at = time.time()
+
+    def submit(self, spec: JobSpec) -> Job:
+        """
+        Queue a conversion job.
+
+        Args:
+            spec: Job to run
+
+        Returns:
+            The queued job
+
+        Raises:
+            ValueError: If the job options are invalid
+            RuntimeError: If the service is not running
+        """
+        if self._runner is None:
+            raise RuntimeError("Job service is not running")
+        config = replace(self.base_config, **spec.options)
+        if config.memory_budget_mb:
+            # Jobs running side by side share the memory budget
+            config = replace(config, memory_budget_mb=max(1, config.memory_budget_mb // self.job_slots))
+        job_id = f"{next(self._sequence):06d}-{uuid.uuid4().hex[:8]}"
+        output_dir = spec.output_dir or self.output_root / job_id
+        job = Job(job_id, spec, config, output_dir)
+        job.emit("status", status=JOB_QUEUED)
+
+        with self._lock:
+            self._jobs[job_id] = job
+            self._futures[job_id] = self._runner.submit(self._run, job)
+            self._forget_finished()
+        return job
+
+    def get(self, job_id: str) -> Optional[Job]:
+        """Look up a job by id."""
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def jobs(self) -> List[Job]:
+        """All known jobs in submission order."""
+        with self._lock:
+            return list(self._jobs.values())
+
+    def cancel(self, job_id: str) -> Optional[Job]:
+        """
+        Cancel a job.
+
+        A queued job never starts; a running job stops at its next finished
+        page. Finished jobs are left as they are.
+
+        Args:
+            job_id: Job to cancel
+
+        Returns:
+            The job, or None if it is unknown
+        """
+        with self._lock:
+            job = self._jobs.get(job_id)
+            future = self._futures.get(job_id)
+        if job is None or job.finished:
+            return job
+        job.cancel_requested = True
+        if future is not None and future.cancel():
+            job.set_status(JOB_CANCELLED)
+        return job
+
+    def metrics(self) -> Dict[str, Any]:
+        """Queue, throughput and timing counters of the service."""
+        jobs = self.jobs()
+        counts = {state: 0 for state in (JOB_QUEUED, JOB_RUNNING, *sorted(FINISHED_STATES))}
+        for job in jobs:
+            counts[job.status] += 1
+        with self._lock:
+            totals = dict(self._totals)
+        ran = totals["ran"]
+        uptime = time.time() - self.started_at if self.started_at else 0.0
+        return {
+            "workers": self.base_config.max_workers,
+            "job_slots": self.job_slots,
+            "uptime_seconds": uptime,
+            "jobs": counts,
+            "pages": totals["pages"],
+            "bytes": totals["bytes"],
+            "pages_per_second": totals["pages"] / uptime if uptime > 0 else 0.0,
+            "mean_queue_seconds": totals["queue_seconds"] / ran if ran else 0.0,
+            "mean_run_seconds": totals["run_seconds"] / ran if ran else 0.0
+        }
+
+    def shutdown(self, cancel_jobs: bool = True) -> None:
+        """
+        Stop the service.
+
+        Args:
+            cancel_jobs: Cancel queued and running jobs instead of finishing them
+        """
+        if cancel_jobs:
+            for job in self.jobs():
+                self.cancel(job.job_id)
+        if self._runner is not None:
+            self._runner.shutdown(wait=True)
+            self._runner = None
+        if self._pool is not None:
+            self._pool.shutdown(wait=True)
+            self._pool = None
+
+    def __enter__(self) -> "ConversionJobService":
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.shutdown()
+
+    def _forget_finished(self) -> None:
+        """Drop the oldest finished jobs beyond the retention limit (lock held)."""
+        finished = [job_id for job_id, job in self._jobs.items() if job.finished]
+        for job_id in finished[:max(0, len(finished) - self.retention)]:
+            del self._jobs[job_id]
+            self._futures.pop(job_id, None)
+
+    def _run(self, job: Job) -> None:
+        """Job slot thread: run one job to completion."""
+        if job.cancel_requested:
+            job.set_status(JOB_CANCELLED)
+            return
+        job.set_status(JOB_RUNNING)
+        try:
+            job.output_dir.mkdir(parents=True, exist_ok=True)
+            job.total_pages = _count_pages(job.spec.pdf_files, job.config)
+            if job.spec.output_format == "png":
+                self._run_images(job)
+            else:
+                self._run_pptx(job)
+        except Exception as e:
+            if job.cancel_requested:
+                job.set_status(JOB_CANCELLED)
+            else:
+                job.error = str(e)
+                job.set_status(JOB_FAILED, error=job.error)
+        else:
+            if job.failed_files:
+                job.error = f"{len(job.failed_files)} of {len(job.spec.pdf_files)} files failed"
+                job.set_status(JOB_FAILED, error=job.error)
+            else:
+                job.set_status(JOB_SUCCEEDED)
+        finally:
+            with self._lock:
+                self._totals["ran"] += 1
+                self._totals["pages"] += job.pages_done
+                self._totals["bytes"] += job.bytes_written
+                self._totals["queue_seconds"] += job.started_at - job.submitted_at
+                self._totals["run_seconds"] += job.finished_at - job.started_at
+
+    def _run_images(self, job: Job) -> None:
+        service = ImageConversionService(job.config, executor=self._pool)
+        service.set_progress_callback(job.add_progress)
+
+        def file_done(result: FileResult) -> None:
+            if result.succeeded:
+                job.outputs.extend(result.output_files)
+                job.emit("output", file=str(result.pdf_path),
+                         outputs=[path.name for path in result.output_files])
+            else:
+                job.failed_files[str(result.pdf_path)] = result.error
+                job.emit("file_failed", file=str(result.pdf_path), error=result.error)
+
+        service.convert_batch(job.spec.pdf_files, job.output_dir, file_done)
+
+    def _run_pptx(self, job: Job) -> None:
+        service = PowerPointConversionService(job.config, executor=self._pool)
+        service.set_progress_callback(job.add_progress)
+        output_name = job.spec.output_name or f"{job.spec.pdf_files[0].stem}.pptx"
+        image_dir = job.output_dir if job.spec.output_format == "png,pptx" else None
+        output_path = service.convert_multiple_pdfs_to_single_presentation(
+            job.spec.pdf_files, job.output_dir / output_name, image_dir
+        )
+        job.outputs.extend(service.last_image_files)
+        job.outputs.append(output_path)
+        job.emit("output", outputs=[path.name for path in service.last_image_files] + [output_path.name])
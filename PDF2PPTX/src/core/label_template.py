@@ -0,0 +1,85 @@
+"""
+Precompiled filename label shape.
+The label style is resolved once per conversion into an XML fragment; each
+slide then only substitutes its own text.
+"""
+
+from __future__ import annotations
+
+import copy
+from xml.sax.saxutils import escape
+
+from lxml import etree
+
+# Text the label is compiled with, replaced by each slide's label text
+LABEL_TEXT_PLACEHOLDER = "{{pdf2pptx-label}}"
+
+_NS_A = "http://schemas.openxmlformats.org/drawingml/2006/main"
+
+
+class LabelTemplate:
+    """
+    A label shape (``p:sp``) compiled once and stamped onto many slides.
+
+    Built from a shape whose text is LABEL_TEXT_PLACEHOLDER, so the styling
+    comes from the regular python-pptx label code and is identical on every
+    slide.
+    """
+
+    def __init__(self, shape_element, shape_id: int = 3):
+        """
+        Compile a label template.
+
+        Args:
+            shape_element: ``p:sp`` element carrying LABEL_TEXT_PLACEHOLDER as text
+            shape_id: Shape id used in serialized fragments (the picture is shape 2)
+
+        Raises:
+            ValueError: If the shape does not contain the placeholder text
+        """
+        self._element = copy.deepcopy(shape_element)
+        self._text_element = self._find_placeholder_run(self._element)
+
+        serialized = copy.deepcopy(self._element)
+        serialized.nvSpPr.cNvPr.id = shape_id
+        serialized.nvSpPr.cNvPr.name = f"Rectangle {shape_id - 1}"
+        xml = etree.tostring(serialized, encoding=str)
+        self._xml_head, self._xml_tail = xml.split(LABEL_TEXT_PLACEHOLDER, 1)
+
+    @staticmethod
+    def _find_placeholder_run(element):
+        for text_element in element.iter(f"{{{_NS_A}}}t"):
+            if text_element.text == LABEL_TEXT_PLACEHOLDER:
+                return text_element
+        raise ValueError("Label shape does not contain the placeholder text")
+
+    def to_xml(self, label_text: str) -> str:
+        """
+        Serialize the label for one slide.
+
+        Args:
+            label_text: Label text
+
+        Returns:
+            ``p:sp`` XML fragment
+        """
+        return self._xml_head + escape(label_text) + self._xml_tail
+
+    def add_to(self, slide, label_text: str) -> None:
+        """
+        Append the label to a python-pptx slide.
+
+        Args:
+            slide: Target slide
+            label_text: Label text
+        """
+        self._text_element.text = label_text
+        try:
+            shape = copy.deepcopy(self._element)
+        finally:
+            self._text_element.text = LABEL_TEXT_PLACEHOLDER
+
+        shape_id = slide.shapes._next_shape_id
+        shape.nvSpPr.cNvPr.id = shape_id
+        shape.nvSpPr.cNvPr.name = f"Rectangle {shape_id - 1}"
+        slide.shapes._spTree.insert_element_before(shape, "p:extLst")
@@ -0,0 +1,160 @@
+"""
+Memory budget for page rendering.
+Estimates how much memory rendering a page takes before it is rasterized,
+so the pipeline and the batch scheduler only keep as many pages in flight
+as fit into the configured budget.
+"""
+
+from __future__ import annotations
+
+import math
+import threading
+from typing import Iterable, List, Optional, Tuple
+
+import fitz
+
+from .content_trim import describe_content
+from .image_encoding import ENCODING_PNG
+from .pdf_processor import ConversionConfig, PageInfo, calculate_render_scale
+from .tiled_render import band_rows
+
+# RGB pixmaps, as rendered by process_page_to_pixmap()
+_BYTES_PER_PIXEL = 3
+
+# Rendering holds the pixmap while the encoder builds its output and working
+# buffers next to it; count a page as twice its pixmap
+_ENCODE_OVERHEAD = 2.0
+
+_MB = 1024 * 1024
+
+
+def estimate_page_bytes(
+    width: float,
+    height: float,
+    config: ConversionConfig,
+    encoding: str = ENCODING_PNG
+) -> int:
+    """
+    Estimate the peak memory of rendering and encoding one page.
+
+    Args:
+        width: Width in points of the rendered area (page.rect, or the
+            content clip of a trimmed page)
+        height: Height in points of the rendered area
+        config: Conversion configuration
+        encoding: Encoding policy the page is rendered for; only PNG pages
+            are rendered in bands
+
+    Returns:
+        Estimated bytes
+    """
+    is_portrait = width < height
+    was_rotated = config.auto_rotate and is_portrait
+    page_info = PageInfo(
+        page_number=0,
+        original_size=(width, height),
+        is_portrait=is_portrait,
+        was_rotated=was_rotated,
+        final_size=(height, width) if was_rotated else (width, height)
+    )
+    scale = calculate_render_scale(page_info, config)
+    pixel_width = math.ceil(width * scale)
+    pixels = pixel_width * math.ceil(height * scale)
+    if encoding == ENCODING_PNG and config.tile_megapixels and pixels > config.tile_megapixels * 1024 * 1024:
+        # Rendered band by band; the encoded image is far smaller
+        pixels = band_rows(pixel_width) * pixel_width
+    return int(pixels * _BYTES_PER_PIXEL * _ENCODE_OVERHEAD)
+
+
+def estimate_rendered_page(page: fitz.Page, config: ConversionConfig, encoding: str = ENCODING_PNG) -> int:
+    """Estimated render memory of an open page, trimmed to its content when trim_margins is set."""
+    width, height = page.rect.width, page.rect.height
+    if config.trim_margins:
+        clip = describe_content(page, config).clip
+        if clip is not None:
+            width, height = clip[2] - clip[0], clip[3] - clip[1]
+    return estimate_page_bytes(width, height, config, encoding)
+
+
+def estimate_document_pages(
+    doc: fitz.Document,
+    config: ConversionConfig,
+    encoding: str = ENCODING_PNG
+) -> List[int]:
+    """Estimated render memory of every page of an open document, in page order."""
+    return [estimate_rendered_page(page, config, encoding) for page in doc]
+
+
+def estimate_pages(
+    sizes: Iterable[Tuple[float, float]],
+    config: ConversionConfig,
+    encoding: str = ENCODING_PNG
+) -> List[int]:
+    """
+    Estimated render memory of pages given as (width, height) in points.
+
+    Without the pages themselves trimming is not known; the full page size
+    is an upper bound for a trimmed page.
+    """
+    return [estimate_page_bytes(width, height, config, encoding) for width, height in sizes]
+
+
+def shrink_document_store() -> None:
+    """Drop MuPDF's cached fonts, images and display lists (between documents)."""
+    fitz.TOOLS.store_shrink(100)
+
+
+class MemoryBudget:
+    """
+    Admission control for pages held in memory at once.
+
+    Work is reserved before it is submitted and released once its result
+    has been consumed. A reservation is admitted while the total stays
+    within the limit; when nothing is reserved, one item is always
+    admitted, so a page larger than the whole budget still renders (alone).
+    Tracks the peak of reserved bytes for reporting.
+    """
+
+    def __init__(self, limit_mb: int):
+        """
+        Initialize the budget.
+
+        Args:
+            limit_mb: Budget in MB
+        """
+        self.limit_bytes = limit_mb * _MB
+        self.in_use = 0
+        self.peak_bytes = 0
+        self.deferrals = 0  # times work waited for memory
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls, config: ConversionConfig) -> Optional["MemoryBudget"]:
+        """Create the budget configured by memory_budget_mb (None when unlimited)."""
+        if config.memory_budget_mb <= 0:
+            return None
+        return cls(config.memory_budget_mb)
+
+    def try_reserve(self, nbytes: int) -> bool:
+        """
+        Reserve memory for one item if the budget admits it.
+
+        Args:
+            nbytes: Estimated bytes of the item
+
+        Returns:
+            Whether the reservation was made; if not, the caller should
+            consume finished work and try again
+        """
+        with self._lock:
+            if self.in_use and self.in_use + nbytes > self.limit_bytes:
+                self.deferrals += 1
+                return False
+            self.in_use += nbytes
+            self.peak_bytes = max(self.peak_bytes, self.in_use)
+            return True
+
+    def release(self, nbytes: int) -> None:
+        """Return the reservation of a consumed item."""
+        with self._lock:
+            self.in_use = max(0, self.in_use - nbytes)
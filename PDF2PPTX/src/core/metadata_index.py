@@ -0,0 +1,257 @@
+"""
+Persistent index of PDF metadata for info and batch planning.
+Scans each file once with cheap resource checks instead of text extraction,
+and answers repeat queries from a SQLite database keyed by path, size,
+modification time and content hash.
+"""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple
+
+# PyMuPDF is only imported to scan files missing from the index, so answering
+# from the index does not pay its import cost
+if TYPE_CHECKING:
+    from .pdf_processor import ConversionConfig
+
+# Bump when the stored metadata layout changes; older indexes are rebuilt
+INDEX_FORMAT_VERSION = 1
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS files (
+    path TEXT PRIMARY KEY,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    content_hash TEXT NOT NULL,
+    metadata TEXT NOT NULL
+)
+"""
+
+
+@dataclass
+class IndexStats:
+    """Lookup accounting for an index instance."""
+    hits: int = 0  # size and mtime unchanged
+    revalidated: int = 0  # mtime changed, content hash unchanged
+    scanned: int = 0
+    errors: int = 0
+
+
+@dataclass
+class IndexedFile:
+    """Metadata of one PDF file, from the index or a fresh scan."""
+    pdf_path: Path
+    metadata: Optional[Dict[str, Any]] = None
+    content_hash: Optional[str] = None
+    error: Optional[str] = None
+
+    @property
+    def page_count(self) -> int:
+        """Pages in the document, 0 if it could not be read."""
+        return self.metadata['page_count'] if self.metadata else 0
+
+
+def _run_jobs(function: Callable, jobs: List[tuple], max_workers: int) -> List[Tuple[Any, Optional[str]]]:
+    """Call function(*job) for every job, in worker processes when max_workers > 1."""
+    def outcome(call: Callable) -> Tuple[Any, Optional[str]]:
+        try:
+            return call(), None
+        except Exception as e:
+            return None, str(e)
+
+    if max_workers > 1 and len(jobs) > 1:
+        with ProcessPoolExecutor(max_workers=min(max_workers, len(jobs))) as executor:
+            futures = [executor.submit(function, *job) for job in jobs]
+            return [outcome(future.result) for future in futures]
+    return [outcome(lambda job=job: function(*job)) for job in jobs]
+
+
+def _index_file(pdf_path: str, previous_hash: Optional[str]) -> Tuple[str, Optional[Dict[str, Any]]]:
+    """
+    Hash a file and scan its metadata unless the content is unchanged
+    (runs in a worker process or inline).
+
+    Returns:
+        Tuple of (content hash, metadata or None when the hash matches previous_hash)
+    """
+    from .pdf_processor import extract_pdf_metadata
+    from .render_cache import hash_pdf_file
+
+    path = Path(pdf_path)
+    content_hash = hash_pdf_file(path)
+    if content_hash == previous_hash:
+        return content_hash, None
+    return content_hash, extract_pdf_metadata(path)
+
+
+def scan_metadata(pdf_files: List[Path], max_workers: int = 1) -> List[IndexedFile]:
+    """
+    Scan metadata of files without an index.
+
+    Args:
+        pdf_files: PDF files to scan
+        max_workers: Processes scanning files in parallel
+
+    Returns:
+        One entry per input file, in input order
+    """
+    from .pdf_processor import extract_pdf_metadata
+
+    paths = [Path(pdf_path) for pdf_path in pdf_files]
+    outcomes = _run_jobs(extract_pdf_metadata, [(path,) for path in paths], max_workers)
+    return [
+        IndexedFile(pdf_path=path, metadata=metadata, error=error)
+        for path, (metadata, error) in zip(paths, outcomes)
+    ]
+
+
+class MetadataIndex:
+    """
+    SQLite index of PDF metadata.
+
+    A file whose size and modification time match its row is answered from
+    the index without being opened. Otherwise it is hashed: if the content
+    is unchanged (e.g. the file was copied over itself or touched) only the
+    row is refreshed, and real changes are rescanned. Files that fail to
+    scan are not stored, so they are retried on the next query.
+    """
+
+    def __init__(self, index_path: Path):
+        """
+        Open or create the index.
+
+        Args:
+            index_path: SQLite database file
+        """
+        self.index_path = Path(index_path)
+        self.stats = IndexStats()
+        self._connection = self._connect()
+
+    @classmethod
+    def from_config(cls, config: ConversionConfig) -> Optional["MetadataIndex"]:
+        """Open the index configured on a ConversionConfig, if any."""
+        if not config.metadata_index:
+            return None
+        return cls(Path(config.metadata_index))
+
+    def _connect(self) -> sqlite3.Connection:
+        self.index_path.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            return self._open_database()
+        except sqlite3.DatabaseError:
+            # Not a database or damaged: the index only holds derived data
+            self.index_path.unlink()
+            return self._open_database()
+
+    def _open_database(self) -> sqlite3.Connection:
+        connection = sqlite3.connect(str(self.index_path))
+        try:
+            version = connection.execute("PRAGMA user_version").fetchone()[0]
+            if version != INDEX_FORMAT_VERSION:
+                connection.execute("DROP TABLE IF EXISTS files")
+                connection.execute(f"PRAGMA user_version = {INDEX_FORMAT_VERSION}")
+            connection.execute(_SCHEMA)
+            connection.commit()
+        except sqlite3.DatabaseError:
+            connection.close()
+            raise
+        return connection
+
+    def close(self) -> None:
+        """Close the database connection."""
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+
+    def __enter__(self) -> "MetadataIndex":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return self._connection.execute("SELECT COUNT(*) FROM files").fetchone()[0]
+
+    def get_metadata(self, pdf_files: List[Path], max_workers: int = 1) -> List[IndexedFile]:
+        """
+        Get metadata for files, scanning only those that changed.
+
+        Args:
+            pdf_files: PDF files to look up
+            max_workers: Processes for hashing and scanning changed files
+
+        Returns:
+            One entry per input file, in input order
+        """
+        results = [IndexedFile(pdf_path=Path(pdf_path)) for pdf_path in pdf_files]
+        pending = []  # (result, key, stat, previous row)
+
+        for result in results:
+            try:
+                stat = result.pdf_path.stat()
+                key = str(result.pdf_path.resolve())
+            except OSError as e:
+                result.error = f"Failed to read {result.pdf_path}: {e}"
+                self.stats.errors += 1
+                continue
+
+            row = self._connection.execute(
+                "SELECT size, mtime_ns, content_hash, metadata FROM files WHERE path = ?", (key,)
+            ).fetchone()
+            if row is not None and row[0] == stat.st_size and row[1] == stat.st_mtime_ns:
+                result.content_hash = row[2]
+                result.metadata = json.loads(row[3])
+                self.stats.hits += 1
+            else:
+                pending.append((result, key, stat, row))
+
+        if pending:
+            self._index_pending(pending, max_workers)
+
+        return results
+
+    def _index_pending(self, pending: list, max_workers: int) -> None:
+        """Hash and scan files missing from the index and store the results."""
+        jobs = [(str(result.pdf_path), row[2] if row else None) for result, _, _, row in pending]
+
+        outcomes = _run_jobs(_index_file, jobs, max_workers)
+
+        for (result, key, stat, row), (outcome, error) in zip(pending, outcomes):
+            if error is not None:
+                result.error = error
+                self.stats.errors += 1
+                continue
+
+            result.content_hash, metadata = outcome
+            if metadata is None:
+                metadata = json.loads(row[3])
+                self.stats.revalidated += 1
+            else:
+                self.stats.scanned += 1
+            result.metadata = metadata
+
+            self._connection.execute(
+                "INSERT OR REPLACE INTO files (path, size, mtime_ns, content_hash, metadata) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (key, stat.st_size, stat.st_mtime_ns, result.content_hash, json.dumps(metadata))
+            )
+
+        self._connection.commit()
+
+    def page_counts(self, pdf_files: List[Path], max_workers: int = 1) -> List[int]:
+        """
+        Get page counts for files (0 for unreadable files).
+
+        Args:
+            pdf_files: PDF files to count
+            max_workers: Processes for scanning changed files
+
+        Returns:
+            Page count per input file
+        """
+        return [entry.page_count for entry in self.get_metadata(pdf_files, max_workers)]
@@ -0,0 +1,202 @@
+"""
+Output file writing off the rendering path.
+Hands encoded page images to a small pool of writer threads, so slow
+storage (network shares, cold disks) does not stall rendering, with an
+optional durable mode that fsyncs and atomically renames every file.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import List, Optional
+
+from .image_encoding import reoptimize_png
+from .pdf_processor import ConversionConfig, PDFProcessingError
+
+
+def write_output_file(path: Path, data: bytes, durable: bool = False) -> None:
+    """
+    Write an output file.
+
+    In durable mode the data goes to a temporary file next to the target,
+    is fsynced and renamed over the target, and the directory entry is
+    synced, so after a crash the file is either complete or absent.
+
+    Args:
+        path: Output file
+        data: File content
+        durable: Whether to fsync and atomically rename
+    """
+    if not durable:
+        path.write_bytes(data)
+        return
+
+    temp_path = path.with_name(f".{path.name}.tmp")
+    with open(temp_path, "wb") as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(temp_path, path)
+    _sync_directory(path.parent)
+
+
+def _sync_directory(directory: Path) -> None:
+    """Persist a rename in a directory (not supported on Windows)."""
+    try:
+        fd = os.open(directory, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+@dataclass
+class WriterStats:
+    """Accounting of an output writer."""
+    files: int = 0
+    bytes_written: int = 0
+    write_seconds: float = 0.0  # time spent writing, summed over writer threads
+    wait_seconds: float = 0.0  # time the producer was blocked by back-pressure
+    bytes_saved: int = 0  # removed by recompressing PNG files
+
+
+class OutputWriterPool:
+    """
+    Bounded pool of threads writing output files.
+
+    At most ``max_pending`` files are queued or being written; submit()
+    blocks beyond that, which bounds the memory held by encoded images
+    waiting for slow storage. With ``workers`` = 0 files are written inline.
+    Write errors are raised by the next submit() or by flush().
+
+    With ``reoptimize`` set, PNG files are losslessly recompressed before
+    they are written, which keeps that slow pass off the rendering path.
+    """
+
+    def __init__(
+        self,
+        workers: int = 2,
+        durable: bool = False,
+        max_pending: int = 0,
+        reoptimize: bool = False
+    ):
+        """
+        Initialize the pool.
+
+        Args:
+            workers: Writer threads (0 = write inline)
+            durable: fsync and atomically rename every file
+            max_pending: Files queued or in progress at most (0 = 2 x workers)
+            reoptimize: Recompress PNG files as small as possible before writing
+        """
+        self.workers = workers
+        self.durable = durable
+        self.reoptimize = reoptimize
+        self.max_pending = max_pending or 2 * max(1, workers)
+        self.stats = WriterStats()
+        self._slots = threading.BoundedSemaphore(self.max_pending)
+        self._lock = threading.Lock()
+        self._errors: List[BaseException] = []
+        self._futures: List[Future] = []
+        self._executor: Optional[ThreadPoolExecutor] = None
+        if workers > 0:
+            self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="pdf2pptx-writer")
+
+    @classmethod
+    def from_config(cls, config: ConversionConfig) -> "OutputWriterPool":
+        """Create the writer configured by output_writers, durable_writes and png_reoptimize."""
+        return cls(config.output_writers, config.durable_writes, reoptimize=config.png_reoptimize)
+
+    def submit(self, path: Path, data: bytes) -> None:
+        """
+        Queue a file for writing, waiting while the queue is full.
+
+        Args:
+            path: Output file
+            data: File content
+
+        Raises:
+            PDFProcessingError: If an earlier write failed
+        """
+        self._raise_errors()
+        if self._executor is None:
+            start = time.perf_counter()
+            self._write(path, data)
+            self.stats.wait_seconds += time.perf_counter() - start  # the producer did the write
+            self._raise_errors()
+            return
+
+        start = time.perf_counter()
+        self._slots.acquire()
+        waited = time.perf_counter() - start
+        with self._lock:
+            self.stats.wait_seconds += waited
+        try:
+            future = self._executor.submit(self._write, path, data)
+        except BaseException:
+            self._slots.release()
+            raise
+        future.add_done_callback(lambda _: self._slots.release())
+        self._futures = [f for f in self._futures if not f.done()]
+        self._futures.append(future)
+
+    def _write(self, path: Path, data: bytes) -> None:
+        start = time.perf_counter()
+        saved = 0
+        try:
+            if self.reoptimize and path.suffix.lower() == ".png":
+                optimized = reoptimize_png(data)
+                saved = len(data) - len(optimized)
+                data = optimized
+            write_output_file(path, data, self.durable)
+        except OSError as e:
+            with self._lock:
+                self._errors.append(PDFProcessingError(f"Failed to write {path}: {e}"))
+            return
+        elapsed = time.perf_counter() - start
+        with self._lock:
+            self.stats.files += 1
+            self.stats.bytes_written += len(data)
+            self.stats.write_seconds += elapsed
+            self.stats.bytes_saved += saved
+
+    def _raise_errors(self) -> None:
+        with self._lock:
+            if self._errors:
+                raise self._errors[0]
+
+    def flush(self) -> None:
+        """
+        Wait until every queued file is written.
+
+        Raises:
+            PDFProcessingError: If any write failed
+        """
+        start = time.perf_counter()
+        for future in list(self._futures):
+            future.result()
+        self._futures.clear()
+        with self._lock:
+            self.stats.wait_seconds += time.perf_counter() - start
+        self._raise_errors()
+
+    def close(self) -> None:
+        """Finish queued writes and stop the writer threads."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    def __enter__(self) -> "OutputWriterPool":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
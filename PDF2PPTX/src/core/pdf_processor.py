@@ -5,14 +5,19 @@ Eliminates code duplication across GUI and standalone scripts.
 
 from __future__ import annotations
 
+import inspect
+import re
+
 import fitz
 from contextlib import contextmanager
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Generator, Iterator, Optional, Tuple, List, Dict, Any
+from typing import Generator, Iterator, Optional, Tuple, List, Dict, Any, Callable
 from io import BytesIO
 from abc import ABC, abstractmethod
 
+from . import tracing
+
 
 @dataclass
 class ConversionConfig:
@@ -22,6 +27,31 @@ class ConversionConfig:
     slide_width_mm: float = 420.0
     slide_height_mm: float = 297.0
     target_dpi: int = 150
+    max_workers: int = 1  # rendering worker processes (1 = render inline)
+    prefetch_pages: int = 0  # pages rendered ahead of assembly (0 = 2 x workers)
+    cache_dir: Optional[Path] = None  # persistent render cache (None = disabled)
+    cache_max_mb: int = 1024
+    metadata_index: Optional[Path] = None  # persistent PDF metadata index (None = disabled)
+    image_encoding: str = "png"  # png, auto, jpeg, palette or grayscale
+    jpeg_quality: int = 85
+    render_mode: str = "scale"  # scale (scale_factor) or fitted (slide size at target_dpi)
+    streaming_output: bool = False  # write PPTX slides to disk as they are rendered
+    deduplicate_pages: bool = True  # render identical pages of a document once
+    scan_passthrough: bool = True  # embed scanned page images as-is in PPTX output
+    svg_pages: bool = False  # embed vector pages as SVG in PPTX output
+    checkpoint: bool = False  # journal finished pages in the output directory
+    resume: bool = False  # continue from the checkpoint journal of an interrupted run
+    page_timeout: float = 0.0  # seconds per page in an isolated worker (0 = no limit)
+    page_memory_mb: int = 0  # memory headroom per rendering worker in MB (0 = no limit)
+    memory_budget_mb: int = 0  # estimated render memory of pages in flight (0 = unlimited)
+    tile_megapixels: int = 64  # PNG pages larger than this render in bands (0 = never)
+    output_writers: int = 2  # threads writing PNG files behind rendering (0 = write inline)
+    durable_writes: bool = False  # fsync and atomically rename every output file
+    png_profile: str = "balanced"  # PNG encoder: fastest, balanced or smallest
+    png_reoptimize: bool = False  # recompress written PNG files on the writer threads
+    trim_margins: bool = False  # render only the content area of each page
+    trim_margin_pt: float = 12.0  # margin kept around trimmed content in points
+    blank_pages: str = "keep"  # keep, collapse (tiny white image) or skip pages that draw nothing
 
     def __post_init__(self) -> None:
         """Validate configuration parameters."""
@@ -29,6 +59,28 @@ class ConversionConfig:
             raise ValueError("Scale factor must be positive")
         if self.target_dpi < 72:
             raise ValueError("DPI must be at least 72")
+        if self.max_workers < 1:
+            raise ValueError("Worker count must be at least 1")
+        if self.prefetch_pages < 0:
+            raise ValueError("Prefetch depth must not be negative")
+        if self.cache_max_mb < 1:
+            raise ValueError("Cache size must be at least 1 MB")
+        if not (1 <= self.jpeg_quality <= 100):
+            raise ValueError("JPEG quality must be between 1 and 100")
+        if self.render_mode not in ("scale", "fitted"):
+            raise ValueError("Render mode must be 'scale' or 'fitted'")
+        if self.page_timeout < 0:
+            raise ValueError("Page timeout must not be negative")
+        if self.page_memory_mb < 0:
+            raise ValueError("Page memory limit must not be negative")
+        if self.memory_budget_mb < 0:
+            raise ValueError("Memory budget must not be negative")
+        if self.tile_megapixels < 0:
+            raise ValueError("Tiling threshold must not be negative")
+        if self.output_writers < 0:
+            raise ValueError("Output writer count must not be negative")
+        if self.trim_margin_pt < 0:
+            raise ValueError("Trim margin must not be negative")
 
 
 @dataclass
@@ -39,6 +91,10 @@ class PageInfo:
     is_portrait: bool
     was_rotated: bool
     final_size: Tuple[float, float]  # after rotation
+    # Part of the page that is rendered, in page coordinates (None = whole
+    # page); the sizes above are those of the clip
+    clip: Optional[Tuple[float, float, float, float]] = None
+    blank: bool = False  # the page draws nothing
 
 
 class PDFProcessingError(Exception):
@@ -160,7 +216,8 @@ def open_pdf_document(file_path: Path) -> Generator[fitz.Document, None, None]:
         raise PDFProcessingError(f"Not a PDF file: {file_path}")
 
     try:
-        doc = fitz.open(str(file_path))
+        with tracing.span("open", file=str(file_path)):
+            doc = fitz.open(str(file_path))
         yield doc
     except Exception as e:
         raise PDFProcessingError(f"Failed to open PDF {file_path}: {e}")
@@ -185,9 +242,133 @@ def analyze_page_orientation(page: fitz.Page) -> Tuple[bool, Tuple[float, float]
     return is_portrait, (width, height)
 
 
+def describe_page(page: fitz.Page, config: ConversionConfig) -> PageInfo:
+    """
+    Describe how a page will be rendered without rasterizing it.
+
+    Args:
+        page: PyMuPDF page to analyze
+        config: Conversion configuration
+
+    Returns:
+        Page info including the rotation that rendering will apply
+    """
+    is_portrait, original_size = analyze_page_orientation(page)
+    was_rotated = config.auto_rotate and is_portrait
+
+    # Calculate final size after rotation
+    if was_rotated:
+        final_size = (original_size[1], original_size[0])  # Swap width/height
+    else:
+        final_size = original_size
+
+    return PageInfo(
+        page_number=page.number + 1,
+        original_size=original_size,
+        is_portrait=is_portrait,
+        was_rotated=was_rotated,
+        final_size=final_size
+    )
+
+
+def calculate_fitted_dimensions(
+    image_width: int,
+    image_height: int,
+    slide_width: int,
+    slide_height: int,
+    enlarge: bool = False
+) -> Tuple[int, int]:
+    """
+    Calculate dimensions to fit image within slide while maintaining aspect ratio.
+
+    Args:
+        image_width: Original image width in EMU
+        image_height: Original image height in EMU
+        slide_width: Slide width in EMU
+        slide_height: Slide height in EMU
+        enlarge: Also scale images smaller than the slide up to fill it
+
+    Returns:
+        Tuple of (fitted_width, fitted_height) in EMU
+    """
+    # Leave some margin (10% on each side)
+    margin_ratio = 0.9
+    available_width = int(slide_width * margin_ratio)
+    available_height = int(slide_height * margin_ratio)
+
+    # If image fits within available space, use original size
+    if not enlarge and image_width <= available_width and image_height <= available_height:
+        return image_width, image_height
+
+    # Calculate scaling ratios
+    width_ratio = available_width / image_width
+    height_ratio = available_height / image_height
+
+    # Use the smaller ratio to ensure image fits
+    scale_ratio = min(width_ratio, height_ratio)
+
+    fitted_width = int(image_width * scale_ratio)
+    fitted_height = int(image_height * scale_ratio)
+
+    return fitted_width, fitted_height
+
+
+def calculate_render_scale(page_info: PageInfo, config: ConversionConfig) -> float:
+    """
+    Determine the rasterization scale for a page.
+
+    In ``scale`` mode this is simply ``scale_factor``. In ``fitted`` mode the
+    page is rendered at exactly ``target_dpi`` for the size it will occupy
+    once fitted onto the configured slide (pages trimmed to their content
+    are enlarged to fill it).
+
+    Args:
+        page_info: Page description from describe_page()
+        config: Conversion configuration
+
+    Returns:
+        Scale factor relative to 72 dpi
+    """
+    if config.render_mode != "fitted":
+        return config.scale_factor
+
+    final_width_pt, final_height_pt = page_info.final_size
+    if final_width_pt <= 0 or final_height_pt <= 0:
+        return config.scale_factor
+
+    fitted_width, _ = calculate_fitted_dimensions(
+        points_to_emu(final_width_pt),
+        points_to_emu(final_height_pt),
+        mm_to_emu(config.slide_width_mm),
+        mm_to_emu(config.slide_height_mm),
+        enlarge=page_info.clip is not None
+    )
+    display_pixels = emu_to_inches(fitted_width) * config.target_dpi
+    return display_pixels / final_width_pt
+
+
+def render_matrix(page_info: PageInfo, config: ConversionConfig) -> fitz.Matrix:
+    """
+    Transformation from page space to pixels, including auto-rotation.
+
+    Args:
+        page_info: Page description from describe_page()
+        config: Conversion configuration
+
+    Returns:
+        Matrix to render the page with
+    """
+    scale = calculate_render_scale(page_info, config)
+    if page_info.was_rotated:
+        # Rotate 90 degrees: apply rotation to matrix
+        return fitz.Matrix(scale, scale) * fitz.Matrix(90)
+    return fitz.Matrix(scale, scale)
+
+
 def process_page_to_pixmap(
     page: fitz.Page,
-    config: ConversionConfig
+    config: ConversionConfig,
+    page_info: Optional[PageInfo] = None
 ) -> Tuple[fitz.Pixmap, PageInfo]:
     """
     Process a PDF page to pixmap with optional rotation.
@@ -195,6 +376,8 @@ def process_page_to_pixmap(
     Args:
         page: PyMuPDF page to process
         config: Conversion configuration
+        page_info: Page description to render by (describe_page() if omitted);
+            a clip in it limits rendering to that part of the page
 
     Returns:
         Tuple of (processed pixmap, page info)
@@ -203,34 +386,14 @@ def process_page_to_pixmap(
         PDFProcessingError: If page processing fails
     """
     try:
-        is_portrait, original_size = analyze_page_orientation(page)
-
-        # Determine rotation
-        rotation = 90 if (config.auto_rotate and is_portrait) else 0
-
-        # Create transformation matrix with rotation
-        if rotation == 90:
-            # Rotate 90 degrees: apply rotation to matrix
-            matrix = fitz.Matrix(config.scale_factor, config.scale_factor) * fitz.Matrix(90)
-        else:
-            matrix = fitz.Matrix(config.scale_factor, config.scale_factor)
+        if page_info is None:
+            with tracing.span("analyze", file=page.parent.name, page=page.number + 1):
+                page_info = describe_page(page, config)
+        matrix = render_matrix(page_info, config)
 
         # Generate pixmap with scaling and rotation
-        pixmap = page.get_pixmap(matrix=matrix)
-
-        # Calculate final size after rotation
-        if rotation == 90:
-            final_size = (original_size[1], original_size[0])  # Swap width/height
-        else:
-            final_size = original_size
-
-        page_info = PageInfo(
-            page_number=page.number + 1,
-            original_size=original_size,
-            is_portrait=is_portrait,
-            was_rotated=(rotation == 90),
-            final_size=final_size
-        )
+        with tracing.span("render", file=page.parent.name, page=page.number + 1):
+            pixmap = page.get_pixmap(matrix=matrix, clip=page_info.clip)
 
         return pixmap, page_info
 
@@ -279,6 +442,31 @@ def get_pdf_pages(pdf_path: Path) -> Iterator[fitz.Page]:
             yield doc[page_num]
 
 
+# Begin-text operator as a whole token in a content stream
+_TEXT_OBJECT_PATTERN = re.compile(rb"(?<![A-Za-z0-9_])BT(?![A-Za-z0-9_])")
+
+
+def page_has_text(doc: fitz.Document, page_index: int, page: Optional[fitz.Page] = None) -> bool:
+    """
+    Check whether a page draws text, without extracting it.
+
+    Looks for text objects in the page content stream, falling back to the
+    font resources for pages that draw through form XObjects.
+
+    Args:
+        doc: Open PDF document
+        page_index: Zero-based page index
+        page: Already loaded page, if any
+
+    Returns:
+        True if the page contains text
+    """
+    page = page if page is not None else doc[page_index]
+    if _TEXT_OBJECT_PATTERN.search(page.read_contents()):
+        return True
+    return bool(doc.get_page_xobjects(page_index)) and bool(doc.get_page_fonts(page_index))
+
+
 def extract_pdf_metadata(pdf_path: Path) -> Dict[str, Any]:
     """
     Extract comprehensive metadata from PDF file.
@@ -321,8 +509,8 @@ def extract_pdf_metadata(pdf_path: Path) -> Dict[str, Any]:
                     'width': rect.width,
                     'height': rect.height,
                     'rotation': page.rotation,
-                    'has_images': bool(page.get_images()),
-                    'has_text': bool(page.get_text().strip()),
+                    'has_images': bool(doc.get_page_images(page_num)),
+                    'has_text': page_has_text(doc, page_num, page),
                     'mediabox': [rect.x0, rect.y0, rect.x1, rect.y1]
                 })
 
@@ -393,6 +581,45 @@ def validate_conversion_config(config: ConversionConfig) -> None:
     if config.target_dpi < 72 or config.target_dpi > 600:
         raise ValueError("DPI must be between 72 and 600")
 
+    if config.max_workers > 64:
+        raise ValueError("Worker count must be between 1 and 64")
+
+    from .image_encoding import ENCODING_POLICIES, PNG_PROFILES
+    if config.image_encoding not in ENCODING_POLICIES:
+        raise ValueError(f"Image encoding must be one of: {', '.join(ENCODING_POLICIES)}")
+    if config.png_profile not in PNG_PROFILES:
+        raise ValueError(f"PNG profile must be one of: {', '.join(PNG_PROFILES)}")
+
+    from .content_trim import BLANK_POLICIES
+    if config.blank_pages not in BLANK_POLICIES:
+        raise ValueError(f"Blank page policy must be one of: {', '.join(BLANK_POLICIES)}")
+
+
+def adapt_progress_callback(callback: Callable[..., None]) -> Callable[[int, int], None]:
+    """
+    Accept progress callbacks written for the older one-argument form.
+
+    Converters report (pages, bytes_written) increments. A callback that
+    cannot take two positional arguments is wrapped to receive only the
+    number of pages finished.
+
+    Args:
+        callback: Progress callback taking (pages, bytes_written) or (pages)
+
+    Returns:
+        Callback taking (pages, bytes_written)
+    """
+    try:
+        signature = inspect.signature(callback)
+    except (TypeError, ValueError):
+        return callback
+    try:
+        signature.bind(0, 0)
+    except TypeError:
+        signature.bind(0)  # raises TypeError for callbacks taking neither form
+        return lambda pages, bytes_written: callback(pages)
+    return callback
+
 
 class ConversionService(ABC):
     """
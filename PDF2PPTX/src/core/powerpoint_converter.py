@@ -5,11 +5,18 @@ Provides modular, reusable PowerPoint generation functionality.
 
 from __future__ import annotations
 
+import hashlib
+from concurrent.futures import Executor
+from contextlib import contextmanager
 from pathlib import Path
-from typing import List, Optional, Callable
+from typing import Callable, Dict, Iterator, List, Optional
 from io import BytesIO
 
+from lxml import etree
 from pptx import Presentation
+from pptx.opc.constants import RELATIONSHIP_TYPE as RT
+from pptx.opc.package import Part
+from pptx.oxml.ns import qn
 from pptx.util import Pt
 from pptx.dml.color import RGBColor
 from pptx.enum.shapes import MSO_AUTO_SHAPE_TYPE
@@ -18,12 +25,20 @@ from pptx.enum.text import PP_ALIGN
 from .pdf_processor import (
     ConversionConfig,
     ConversionService,
-    open_pdf_document,
-    process_page_to_bytes,
+    adapt_progress_callback,
+    calculate_fitted_dimensions,
     mm_to_emu,
     points_to_emu,
     PDFProcessingError
 )
+from .checkpoint import ConversionJournal
+from .image_encoding import PNG_ENCODINGS
+from .output_writer import OutputWriterPool
+from .render_pipeline import PageRenderPipeline, PipelineStats, RenderedPage
+from .svg_export import NS_SVG_BLIP, SVG_BLIP_EXTENSION_URI, SVG_CONTENT_TYPE
+from . import tracing
+from .label_template import LABEL_TEXT_PLACEHOLDER, LabelTemplate
+from .pptx_stream_writer import StreamingPresentationWriter
 
 
 class PowerPointConversionService(ConversionService):
@@ -32,15 +47,41 @@ class PowerPointConversionService(ConversionService):
     Provides high-quality PPTX generation with configurable layout and styling.
     """
 
-    def __init__(self, config: ConversionConfig):
+    def __init__(self, config: ConversionConfig, executor: Optional[Executor] = None):
+        """
+        Initialize the service.
+
+        Args:
+            config: Conversion configuration
+            executor: Optional externally managed process pool to render on
+        """
         super().__init__(config)
-        self.progress_callback: Optional[Callable[[int], None]] = None
+        self.executor = executor
+        self.progress_callback: Optional[Callable[[int, int], None]] = None
+        self.last_pipeline_stats: Optional[PipelineStats] = None
+        self.last_image_files: List[Path] = []
+        self._label_template: Optional[LabelTemplate] = None
+        self._label_template_size: Optional[tuple[int, int]] = None
+        self._media_digests: set = set()
+        self._svg_parts: Dict[str, Part] = {}
+        self._image_dir: Optional[Path] = None
+        self._image_writer: Optional[OutputWriterPool] = None
+
+    def set_progress_callback(self, callback: Callable[..., None]) -> None:
+        """
+        Set callback called with the pages finished and bytes written since the last call.
 
-    def set_progress_callback(self, callback: Callable[[int], None]) -> None:
-        """Set callback function for progress updates."""
-        self.progress_callback = callback
+        A one-argument callback (the older form) receives just the pages finished.
+        """
+        self.progress_callback = adapt_progress_callback(callback)
 
-    def convert_pdf_to_powerpoint(self, pdf_path: Path, output_dir: Path, output_filename: str = None) -> Path:
+    def convert_pdf_to_powerpoint(
+        self,
+        pdf_path: Path,
+        output_dir: Path,
+        output_filename: str = None,
+        image_dir: Optional[Path] = None
+    ) -> Path:
         """
         Convert a single PDF file to PowerPoint presentation.
 
@@ -48,6 +89,8 @@ class PowerPointConversionService(ConversionService):
             pdf_path: Path to PDF file
             output_dir: Directory to save PPTX file
             output_filename: Optional custom filename for output
+            image_dir: Also write every slide image as a PNG file into this
+                directory, from the same render (see last_image_files)
 
         Returns:
             Path to generated PPTX file
@@ -60,28 +103,39 @@ class PowerPointConversionService(ConversionService):
 
         output_dir.mkdir(parents=True, exist_ok=True)
 
-        try:
-            # Create presentation with A3 landscape dimensions
-            presentation = self._create_presentation()
+        if output_filename is None:
+            output_filename = f"{pdf_path.stem}.pptx"
+        output_path = output_dir / output_filename
 
-            # Process PDF pages
-            self._add_pdf_to_presentation(pdf_path, presentation)
+        self._begin_conversion(image_dir)
 
-            # Save presentation with custom filename if provided
-            if output_filename is None:
-                output_filename = f"{pdf_path.stem}.pptx"
-            output_path = output_dir / output_filename
-            presentation.save(str(output_path))
+        with self._checkpointed([pdf_path], output_path, image_dir) as journal, self._image_output(image_dir):
+            if self.config.streaming_output:
+                return self._convert_streaming([pdf_path], output_path, journal)
 
-            return output_path
+            try:
+                # Create presentation with A3 landscape dimensions
+                presentation = self._create_presentation()
 
-        except Exception as e:
-            raise PDFProcessingError(f"Failed to convert {pdf_path} to PowerPoint: {e}")
+                # Process PDF pages
+                with self._create_pipeline(journal) as pipeline:
+                    self._add_pdf_to_presentation(pdf_path, presentation, pipeline)
+                    self.last_pipeline_stats = pipeline.stats
+
+                # Save presentation with custom filename if provided
+                with tracing.span("save", file=str(output_path)):
+                    presentation.save(str(output_path))
+
+                return output_path
+
+            except Exception as e:
+                raise PDFProcessingError(f"Failed to convert {pdf_path} to PowerPoint: {e}")
 
     def convert_multiple_pdfs_to_single_presentation(
         self,
         pdf_files: List[Path],
-        output_path: Path
+        output_path: Path,
+        image_dir: Optional[Path] = None
     ) -> Path:
         """
         Convert multiple PDF files to a single PowerPoint presentation.
@@ -89,6 +143,8 @@ class PowerPointConversionService(ConversionService):
         Args:
             pdf_files: List of PDF file paths
             output_path: Path for output PPTX file
+            image_dir: Also write every slide image as a PNG file into this
+                directory, from the same render (see last_image_files)
 
         Returns:
             Path to generated PPTX file
@@ -99,23 +155,235 @@ class PowerPointConversionService(ConversionService):
         if not pdf_files:
             raise PDFProcessingError("No PDF files provided for conversion")
 
+        self._begin_conversion(image_dir)
+
+        with self._checkpointed(pdf_files, output_path, image_dir) as journal, self._image_output(image_dir):
+            if self.config.streaming_output:
+                return self._convert_streaming(pdf_files, output_path, journal)
+
+            try:
+                # Create presentation
+                presentation = self._create_presentation()
+
+                # Process each PDF file, sharing one worker pool across files
+                with self._create_pipeline(journal) as pipeline:
+                    for pdf_file in pdf_files:
+                        self._add_pdf_to_presentation(pdf_file, presentation, pipeline)
+                    self.last_pipeline_stats = pipeline.stats
+
+                # Save presentation
+                output_path.parent.mkdir(parents=True, exist_ok=True)
+                with tracing.span("save", file=str(output_path)):
+                    presentation.save(str(output_path))
+
+                return output_path
+
+            except Exception as e:
+                raise PDFProcessingError(f"Failed to convert PDFs to PowerPoint: {e}")
+
+    @contextmanager
+    def _checkpointed(
+        self,
+        pdf_files: List[Path],
+        output_path: Path,
+        image_dir: Optional[Path] = None
+    ) -> Iterator[Optional[ConversionJournal]]:
+        """
+        Open the checkpoint journal of a conversion when the config asks for one.
+
+        The journal is removed once the body completes and kept for a later
+        resume when it raises.
+
+        Args:
+            pdf_files: PDF files in slide order
+            output_path: Path for output PPTX file
+            image_dir: PNG output directory of the conversion, if any
+
+        Yields:
+            Open journal, or None without checkpointing
+        """
+        # Pages journaled for PNG files too are never passed through or SVG
+        output_kind = "pptx+png" if image_dir is not None else "pptx"
         try:
-            # Create presentation
-            presentation = self._create_presentation()
+            journal = ConversionJournal.from_config(
+                self.config, output_path.parent, output_path.name, pdf_files, output_kind
+            )
+        except OSError as e:
+            raise PDFProcessingError(f"Failed to open checkpoint journal for {output_path}: {e}")
+
+        try:
+            yield journal
+            if journal is not None:
+                journal.complete()
+        finally:
+            if journal is not None:
+                journal.close()
+
+    @contextmanager
+    def _image_output(self, image_dir: Optional[Path]) -> Iterator[None]:
+        """
+        Write slide images as PNG files while the body runs, if image_dir is set.
+
+        Pages are written by an output writer pool as they are placed on
+        slides; the body completes only once every file is written.
+
+        Args:
+            image_dir: Directory for the PNG files, or None for none
+
+        Raises:
+            PDFProcessingError: If a file cannot be written
+        """
+        if image_dir is None:
+            yield
+            return
+
+        image_dir.mkdir(parents=True, exist_ok=True)
+        writer = OutputWriterPool.from_config(self.config)
+        self._image_dir = image_dir
+        self._image_writer = writer
+        try:
+            yield
+            writer.flush()
+        finally:
+            writer.close()
+            self._image_dir = None
+            self._image_writer = None
+            if self.last_pipeline_stats is not None:
+                self.last_pipeline_stats.record_writes(writer)
+
+    def _write_page_image(self, rendered: RenderedPage, base_name: str) -> None:
+        """Queue the PNG file of a rendered page when writing images alongside the presentation."""
+        if self._image_writer is None:
+            return
+        output_path = self._image_dir / f"{base_name}_page_{rendered.page_number:03d}.png"
+        with tracing.span("save", file=base_name, page=rendered.page_number):
+            self._image_writer.submit(output_path, rendered.image_bytes)
+        self.last_image_files.append(output_path)
+
+    def _create_pipeline(self, journal: Optional[ConversionJournal] = None) -> PageRenderPipeline:
+        """
+        Create the rendering pipeline for slide images.
+
+        While PNG files are written alongside the presentation, every page
+        is rasterized: scanned page images are not passed through and no SVG
+        is exported, so each slide image is also a complete PNG page.
+        """
+        images = self._image_writer is not None
+        return PageRenderPipeline(
+            self.config,
+            self.config.image_encoding,
+            passthrough=self.config.scan_passthrough and not images,
+            svg=self.config.svg_pages and not images,
+            journal=journal,
+            executor=self.executor
+        )
+
+    def _begin_conversion(self, image_dir: Optional[Path] = None) -> None:
+        """
+        Reset per-conversion state (compiled label, media seen so far, statistics).
+
+        Args:
+            image_dir: PNG output directory of the conversion, if any
+
+        Raises:
+            PDFProcessingError: If PNG files are requested with an image
+                encoding that does not always produce PNG images
+        """
+        if image_dir is not None and self.config.image_encoding not in PNG_ENCODINGS:
+            raise PDFProcessingError(
+                f"PNG and PowerPoint output from one render needs a PNG image encoding "
+                f"({', '.join(PNG_ENCODINGS)}), not '{self.config.image_encoding}'"
+            )
+        self.last_pipeline_stats = None
+        self.last_image_files = []
+        self._label_template = None
+        self._media_digests = set()
+        self._svg_parts = {}
+
+    def _convert_streaming(
+        self,
+        pdf_files: List[Path],
+        output_path: Path,
+        journal: Optional[ConversionJournal] = None
+    ) -> Path:
+        """
+        Convert PDF files into one presentation with the streaming writer.
+
+        Each slide is written to the output package as soon as its page is
+        rendered, so memory stays bounded by the pages in flight rather than
+        by the size of the deck.
+
+        Args:
+            pdf_files: PDF files in slide order
+            output_path: Path for output PPTX file
+            journal: Checkpoint journal of the conversion, if any
+
+        Returns:
+            Path to generated PPTX file
 
-            # Process each PDF file
-            for pdf_file in pdf_files:
-                self._add_pdf_to_presentation(pdf_file, presentation)
+        Raises:
+            PDFProcessingError: If conversion fails
+        """
+        slide_width = mm_to_emu(self.config.slide_width_mm)
+        slide_height = mm_to_emu(self.config.slide_height_mm)
 
-            # Save presentation
-            output_path.parent.mkdir(parents=True, exist_ok=True)
-            presentation.save(str(output_path))
+        try:
+            writer = StreamingPresentationWriter(
+                output_path, slide_width, slide_height,
+                self._get_label_template(slide_width, slide_height)
+            )
+            with writer, self._create_pipeline(journal) as pipeline:
+                for pdf_file in pdf_files:
+                    base_name = pdf_file.stem
+                    for rendered in pipeline.iter_pages(pdf_file):
+                        self._write_page_image(rendered, base_name)
+                        with tracing.span("slide", file=str(pdf_file), page=rendered.page_number):
+                            writer.add_slide(
+                                rendered.image_bytes,
+                                rendered.image_format,
+                                self._calculate_picture_placement(rendered, slide_width, slide_height),
+                                f"{base_name}_page_{rendered.page_number:03d}",
+                                rendered.image_rotation,
+                                rendered.svg_bytes
+                            )
+
+                        if self.progress_callback:
+                            self.progress_callback(1, rendered.encoded_size)
+
+                pipeline.stats.deduplicated_pages += writer.deduplicated_pages
+                pipeline.stats.deduplicated_svgs += writer.deduplicated_svgs
+                pipeline.stats.deduplicated_bytes += writer.deduplicated_bytes
+                self.last_pipeline_stats = pipeline.stats
 
             return output_path
 
         except Exception as e:
             raise PDFProcessingError(f"Failed to convert PDFs to PowerPoint: {e}")
 
+    def _get_label_template(self, slide_width: int, slide_height: int) -> LabelTemplate:
+        """
+        Get the filename label compiled for the current conversion.
+
+        The label is built once with _add_filename_label() on a scratch slide
+        of the same size; slides then only substitute their own text.
+
+        Args:
+            slide_width: Slide width in EMU
+            slide_height: Slide height in EMU
+
+        Returns:
+            Compiled label template
+        """
+        if self._label_template is None or self._label_template_size != (slide_width, slide_height):
+            presentation = Presentation()
+            presentation.slide_width = slide_width
+            presentation.slide_height = slide_height
+            slide = presentation.slides.add_slide(presentation.slide_layouts[6])
+            self._add_filename_label(slide, LABEL_TEXT_PLACEHOLDER, presentation)
+            self._label_template = LabelTemplate(slide.shapes[-1]._element)
+            self._label_template_size = (slide_width, slide_height)
+        return self._label_template
+
     def _create_presentation(self) -> Presentation:
         """
         Create a new PowerPoint presentation with A3 landscape dimensions.
@@ -131,13 +399,22 @@ class PowerPointConversionService(ConversionService):
 
         return presentation
 
-    def _add_pdf_to_presentation(self, pdf_path: Path, presentation: Presentation) -> int:
+    def _add_pdf_to_presentation(
+        self,
+        pdf_path: Path,
+        presentation: Presentation,
+        pipeline: PageRenderPipeline
+    ) -> int:
         """
         Add all pages from a PDF file to the presentation.
 
+        Pages are rendered by the pipeline (ahead of time when it has a worker
+        pool) and added as slides on the calling thread in page order.
+
         Args:
             pdf_path: PDF file to add
             presentation: Target presentation
+            pipeline: Rendering pipeline; the caller closes it
 
         Returns:
             Number of slides added
@@ -149,18 +426,24 @@ class PowerPointConversionService(ConversionService):
         base_name = pdf_path.stem
 
         try:
-            with open_pdf_document(pdf_path) as doc:
-                total_pages = len(doc)
-
-                for page_num, page in enumerate(doc, start=1):
-                    self._add_page_to_presentation(
-                        page, presentation, base_name, page_num
-                    )
-                    slides_added += 1
-
-                    # Update progress if callback is set
-                    if self.progress_callback:
-                        self.progress_callback(page_num)
+            for rendered in pipeline.iter_pages(pdf_path):
+                # python-pptx stores identical images as one shared media part
+                digest = hashlib.sha1(rendered.image_bytes).hexdigest()
+                if digest in self._media_digests:
+                    pipeline.stats.record_deduplicated(len(rendered.image_bytes))
+                self._media_digests.add(digest)
+                # _attach_svg() shares identical SVGs the same way
+                if rendered.svg_bytes and hashlib.sha1(rendered.svg_bytes).hexdigest() in self._svg_parts:
+                    pipeline.stats.record_deduplicated(len(rendered.svg_bytes), svg=True)
+
+                self._write_page_image(rendered, base_name)
+                with tracing.span("slide", file=str(pdf_path), page=rendered.page_number):
+                    self._add_page_to_presentation(rendered, presentation, base_name)
+                slides_added += 1
+
+                # Update progress if callback is set
+                if self.progress_callback:
+                    self.progress_callback(1, rendered.encoded_size)
 
         except Exception as e:
             raise PDFProcessingError(f"Failed to process PDF {pdf_path}: {e}")
@@ -169,65 +452,139 @@ class PowerPointConversionService(ConversionService):
 
     def _add_page_to_presentation(
         self,
-        page,
+        rendered: RenderedPage,
         presentation: Presentation,
-        base_name: str,
-        page_num: int
+        base_name: str
     ) -> None:
         """
-        Add a single PDF page to the presentation.
+        Add a single rendered PDF page to the presentation.
 
         Args:
-            page: PyMuPDF page object
+            rendered: Rendered page image and page information
             presentation: Target presentation
             base_name: Base filename for labeling
-            page_num: Page number for labeling
         """
-        # Get page dimensions and determine rotation
-        rect = page.rect
-        is_portrait = rect.width < rect.height
-        rotation = 90 if (self.config.auto_rotate and is_portrait) else 0
-
-        # Calculate image dimensions after rotation
-        if rotation == 90:
-            width_emu = points_to_emu(rect.height)
-            height_emu = points_to_emu(rect.width)
-        else:
-            width_emu = points_to_emu(rect.width)
-            height_emu = points_to_emu(rect.height)
-
-        # Generate high-quality image
-        image_bytes, _ = process_page_to_bytes(page, self.config, "png")
-        image_stream = BytesIO(image_bytes)
+        image_stream = BytesIO(rendered.image_bytes)
 
         # Add slide with blank layout
         slide = presentation.slides.add_slide(presentation.slide_layouts[6])
 
-        # Calculate positioning to center image on slide
-        slide_width = presentation.slide_width
-        slide_height = presentation.slide_height
+        left, top, final_width, final_height = self._calculate_picture_placement(
+            rendered, presentation.slide_width, presentation.slide_height
+        )
+
+        # Add image to slide
+        picture = slide.shapes.add_picture(
+            image_stream, left, top, width=final_width, height=final_height
+        )
+        if rendered.image_rotation:
+            picture.rotation = rendered.image_rotation
+        if rendered.svg_bytes:
+            self._attach_svg(picture, slide, rendered.svg_bytes)
+
+        # Add filename label from the precompiled template
+        label_template = self._get_label_template(presentation.slide_width, presentation.slide_height)
+        with tracing.span("label", file=base_name, page=rendered.page_number):
+            label_template.add_to(slide, f"{base_name}_page_{rendered.page_number:03d}")
+
+    def _attach_svg(self, picture, slide, svg_bytes: bytes) -> None:
+        """
+        Attach an SVG version to a picture, keeping its image as the fallback.
 
+        Identical SVGs within a conversion share one media part.
+
+        Args:
+            picture: Picture shape holding the fallback image
+            slide: Slide the picture is on
+            svg_bytes: Sanitized SVG document
+        """
+        digest = hashlib.sha1(svg_bytes).hexdigest()
+        part = self._svg_parts.get(digest)
+        if part is None:
+            package = slide.part.package
+            part = Part(
+                package.next_partname("/ppt/media/image%d.svg"),
+                SVG_CONTENT_TYPE,
+                package,
+                svg_bytes
+            )
+            self._svg_parts[digest] = part
+        rel_id = slide.part.relate_to(part, RT.IMAGE)
+
+        blip = picture._element.blipFill.find(qn("a:blip"))
+        ext = etree.SubElement(
+            etree.SubElement(blip, qn("a:extLst")), qn("a:ext"), uri=SVG_BLIP_EXTENSION_URI
+        )
+        svg_blip = etree.SubElement(ext, f"{{{NS_SVG_BLIP}}}svgBlip", nsmap={"asvg": NS_SVG_BLIP})
+        svg_blip.set(qn("r:embed"), rel_id)
+
+    def _calculate_picture_placement(
+        self,
+        rendered: RenderedPage,
+        slide_width: int,
+        slide_height: int
+    ) -> tuple[int, int, int, int]:
+        """
+        Calculate the position and size of a page image centered on a slide.
+
+        The page is fitted and centered on the slide. Passthrough images are
+        placed at their position on the page; for images shown rotated the
+        returned box is the unrotated one, centered where the rotated image
+        must appear.
+
+        Args:
+            rendered: Rendered page image and page information
+            slide_width: Slide width in EMU
+            slide_height: Slide height in EMU
+
+        Returns:
+            Tuple of (left, top, width, height) in EMU
+        """
+        # Page dimensions after rotation
+        final_width_pt, final_height_pt = rendered.page_info.final_size
+        width_emu = points_to_emu(final_width_pt)
+        height_emu = points_to_emu(final_height_pt)
+
+        # Pages trimmed to their content are enlarged to fill the slide
         final_width, final_height = self._calculate_fitted_dimensions(
-            width_emu, height_emu, slide_width, slide_height
+            width_emu, height_emu, slide_width, slide_height,
+            enlarge=rendered.page_info.clip is not None
         )
 
         left = int((slide_width - final_width) / 2)
         top = int((slide_height - final_height) / 2)
-
-        # Add image to slide
-        slide.shapes.add_picture(
-            image_stream, left, top, width=final_width, height=final_height
+        if rendered.image_rect is None:
+            return left, top, final_width, final_height
+
+        # EMU per point of the fitted page
+        scale = final_width / final_width_pt
+        x0, y0, x1, y1 = rendered.image_rect
+        image_width = (x1 - x0) * scale
+        image_height = (y1 - y0) * scale
+
+        if rendered.image_rotation == 90:
+            # Turning the page clockwise maps (x, y) to (page_height - y, x)
+            page_height_pt = rendered.page_info.original_size[1]
+            center_x = left + (page_height_pt - (y0 + y1) / 2) * scale
+            center_y = top + (x0 + x1) / 2 * scale
+        else:
+            center_x = left + (x0 + x1) / 2 * scale
+            center_y = top + (y0 + y1) / 2 * scale
+
+        return (
+            int(round(center_x - image_width / 2)),
+            int(round(center_y - image_height / 2)),
+            int(round(image_width)),
+            int(round(image_height))
         )
 
-        # Add filename label
-        self._add_filename_label(slide, f"{base_name}_page_{page_num:03d}", presentation)
-
     def _calculate_fitted_dimensions(
         self,
         image_width: int,
         image_height: int,
         slide_width: int,
-        slide_height: int
+        slide_height: int,
+        enlarge: bool = False
     ) -> tuple[int, int]:
         """
         Calculate dimensions to fit image within slide while maintaining aspect ratio.
@@ -237,30 +594,12 @@ class PowerPointConversionService(ConversionService):
             image_height: Original image height in EMU
             slide_width: Slide width in EMU
             slide_height: Slide height in EMU
+            enlarge: Also scale images smaller than the slide up to fill it
 
         Returns:
             Tuple of (fitted_width, fitted_height) in EMU
         """
-        # Leave some margin (10% on each side)
-        margin_ratio = 0.9
-        available_width = int(slide_width * margin_ratio)
-        available_height = int(slide_height * margin_ratio)
-
-        # If image fits within available space, use original size
-        if image_width <= available_width and image_height <= available_height:
-            return image_width, image_height
-
-        # Calculate scaling ratios
-        width_ratio = available_width / image_width
-        height_ratio = available_height / image_height
-
-        # Use the smaller ratio to ensure image fits
-        scale_ratio = min(width_ratio, height_ratio)
-
-        fitted_width = int(image_width * scale_ratio)
-        fitted_height = int(image_height * scale_ratio)
-
-        return fitted_width, fitted_height
+        return calculate_fitted_dimensions(image_width, image_height, slide_width, slide_height, enlarge)
 
     def _add_filename_label(
         self,
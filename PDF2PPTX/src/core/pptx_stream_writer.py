@@ -0,0 +1,338 @@
+"""
+Streaming OOXML package writer for very large PowerPoint decks.
+Writes each slide, its relationships and its image straight into the output
+zip as soon as the page is rendered, so memory stays bounded by one page
+instead of growing with the whole deck as python-pptx does.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import posixpath
+import zipfile
+from io import BytesIO
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+from xml.sax.saxutils import escape
+
+from lxml import etree
+from pptx import Presentation
+
+from . import tracing
+from .label_template import LabelTemplate
+from .svg_export import NS_SVG_BLIP, SVG_BLIP_EXTENSION_URI, SVG_CONTENT_TYPE
+
+# Package namespaces
+_NS_P = "http://schemas.openxmlformats.org/presentationml/2006/main"
+_NS_R = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+_NS_RELS = "http://schemas.openxmlformats.org/package/2006/relationships"
+_NS_CT = "http://schemas.openxmlformats.org/package/2006/content-types"
+
+_RT_SLIDE = "http://schemas.openxmlformats.org/officeDocument/2006/relationships/slide"
+_RT_SLIDE_LAYOUT = "http://schemas.openxmlformats.org/officeDocument/2006/relationships/slideLayout"
+_RT_IMAGE = "http://schemas.openxmlformats.org/officeDocument/2006/relationships/image"
+_CT_SLIDE = "application/vnd.openxmlformats-officedocument.presentationml.slide+xml"
+
+_IMAGE_CONTENT_TYPES = {
+    "png": "image/png",
+    "jpeg": "image/jpeg",
+    "svg": SVG_CONTENT_TYPE,
+}
+
+# Parts regenerated at finalization instead of copied from the skeleton
+_FINALIZED_PARTS = (
+    "[Content_Types].xml",
+    "ppt/presentation.xml",
+    "ppt/_rels/presentation.xml.rels",
+)
+
+_XML_DECLARATION = "<?xml version='1.0' encoding='UTF-8' standalone='yes'?>\n"
+
+_SLIDE_XML = (
+    _XML_DECLARATION
+    + '<p:sld xmlns:a="http://schemas.openxmlformats.org/drawingml/2006/main"'
+    ' xmlns:p="' + _NS_P + '" xmlns:r="' + _NS_R + '">'
+    '<p:cSld><p:spTree>'
+    '<p:nvGrpSpPr><p:cNvPr id="1" name=""/><p:cNvGrpSpPr/><p:nvPr/></p:nvGrpSpPr>'
+    '<p:grpSpPr/>'
+    '{picture}{label}'
+    '</p:spTree></p:cSld>'
+    '<p:clrMapOvr><a:masterClrMapping/></p:clrMapOvr>'
+    '</p:sld>'
+)
+
+_PICTURE_XML = (
+    '<p:pic>'
+    '<p:nvPicPr><p:cNvPr id="2" name="Picture 1" descr="{descr}"/>'
+    '<p:cNvPicPr><a:picLocks noChangeAspect="1"/></p:cNvPicPr><p:nvPr/></p:nvPicPr>'
+    '<p:blipFill><a:blip r:embed="rId2">{svg_blip}</a:blip><a:stretch><a:fillRect/></a:stretch></p:blipFill>'
+    '<p:spPr><a:xfrm{rotation}><a:off x="{left}" y="{top}"/><a:ext cx="{width}" cy="{height}"/></a:xfrm>'
+    '<a:prstGeom prst="rect"><a:avLst/></a:prstGeom></p:spPr>'
+    '</p:pic>'
+)
+
+_SVG_BLIP_XML = (
+    '<a:extLst><a:ext uri="' + SVG_BLIP_EXTENSION_URI + '">'
+    '<asvg:svgBlip xmlns:asvg="' + NS_SVG_BLIP + '" r:embed="rId3"/>'
+    '</a:ext></a:extLst>'
+)
+
+_SLIDE_RELS_XML = (
+    _XML_DECLARATION
+    + '<Relationships xmlns="' + _NS_RELS + '">'
+    '<Relationship Id="rId1" Type="' + _RT_SLIDE_LAYOUT + '" Target="{layout}"/>'
+    '<Relationship Id="rId2" Type="' + _RT_IMAGE + '" Target="../media/{media}"/>'
+    '{svg_relationship}'
+    '</Relationships>'
+)
+
+_SVG_RELATIONSHIP_XML = (
+    '<Relationship Id="rId3" Type="' + _RT_IMAGE + '" Target="../media/{media}"/>'
+)
+
+
+class StreamingPresentationWriter:
+    """
+    Write a PPTX package incrementally.
+
+    The package skeleton (masters, layouts, theme) comes from python-pptx's
+    default template; slides are appended with add_slide() and identical
+    images are stored once and shared between slides. The
+    presentation part, its relationships and the content types are written
+    by close(). Output goes to a temporary file that replaces ``output_path``
+    only when the deck is complete.
+    """
+
+    def __init__(
+        self,
+        output_path: Path,
+        slide_width: int,
+        slide_height: int,
+        label_template: Optional[LabelTemplate] = None,
+        layout_index: int = 6
+    ):
+        """
+        Initialize the writer and write the package skeleton.
+
+        Args:
+            output_path: Destination PPTX file
+            slide_width: Slide width in EMU
+            slide_height: Slide height in EMU
+            label_template: Optional label added to every slide
+            layout_index: Slide layout used for every slide (6 = blank)
+        """
+        self.output_path = Path(output_path)
+        self.label_template = label_template
+        self.slide_count = 0
+        self.deduplicated_pages = 0  # slides whose image reuses an earlier media part
+        self.deduplicated_svgs = 0   # slides whose SVG reuses an earlier media part
+        self.deduplicated_bytes = 0
+        self._media_formats: set = set()
+        self._media_by_digest: Dict[str, str] = {}
+        self._closed = False
+
+        presentation = Presentation()
+        presentation.slide_width = slide_width
+        presentation.slide_height = slide_height
+        layout_partname = presentation.slide_layouts[layout_index].part.partname
+        self._layout_target = posixpath.relpath(layout_partname, "/ppt/slides")
+
+        skeleton_buffer = BytesIO()
+        presentation.save(skeleton_buffer)
+        skeleton = zipfile.ZipFile(skeleton_buffer)
+        self._finalized_parts = {name: skeleton.read(name) for name in _FINALIZED_PARTS}
+
+        self.output_path.parent.mkdir(parents=True, exist_ok=True)
+        self._temp_path = self.output_path.with_name(self.output_path.name + ".partial")
+        self._zip = zipfile.ZipFile(self._temp_path, "w", zipfile.ZIP_DEFLATED)
+        for info in skeleton.infolist():
+            if info.filename not in _FINALIZED_PARTS:
+                self._zip.writestr(info.filename, skeleton.read(info.filename))
+
+    def add_slide(
+        self,
+        image_bytes: bytes,
+        image_format: str,
+        placement: Tuple[int, int, int, int],
+        label_text: Optional[str] = None,
+        rotation: int = 0,
+        svg_bytes: Optional[bytes] = None
+    ) -> int:
+        """
+        Append a slide holding one picture and an optional label.
+
+        An image identical to one already in the package reuses its media part.
+
+        Args:
+            image_bytes: Encoded PNG or JPEG image
+            image_format: "png" or "jpeg"
+            placement: (left, top, width, height) of the picture in EMU
+            label_text: Label text (only used with a label template)
+            rotation: Clockwise picture rotation in degrees
+            svg_bytes: Optional SVG shown instead of the image by viewers
+                that support it (the image is the fallback)
+
+        Returns:
+            1-based number of the slide written
+        """
+        if image_format not in ("png", "jpeg"):
+            raise ValueError(f"Unsupported image format for PPTX: {image_format}")
+
+        self.slide_count += 1
+        number = self.slide_count
+        left, top, width, height = placement
+
+        media_name, reused = self._store_media(image_bytes, image_format)
+        if reused:
+            self.deduplicated_pages += 1
+        svg_name = None
+        if svg_bytes:
+            svg_name, reused = self._store_media(svg_bytes, "svg")
+            if reused:
+                self.deduplicated_svgs += 1
+
+        label_xml = ""
+        if self.label_template is not None and label_text is not None:
+            label_xml = self.label_template.to_xml(label_text)
+
+        picture_xml = _PICTURE_XML.format(
+            descr=escape(media_name, {'"': "&quot;"}),
+            rotation=f' rot="{int(rotation * 60000)}"' if rotation else "",
+            svg_blip=_SVG_BLIP_XML if svg_name else "",
+            left=int(left), top=int(top), width=int(width), height=int(height)
+        )
+        self._zip.writestr(
+            f"ppt/slides/slide{number}.xml",
+            _SLIDE_XML.format(picture=picture_xml, label=label_xml)
+        )
+        self._zip.writestr(
+            f"ppt/slides/_rels/slide{number}.xml.rels",
+            _SLIDE_RELS_XML.format(
+                layout=self._layout_target,
+                media=media_name,
+                svg_relationship=_SVG_RELATIONSHIP_XML.format(media=svg_name) if svg_name else ""
+            )
+        )
+        return number
+
+    def _store_media(self, data: bytes, extension: str) -> Tuple[str, bool]:
+        """Write a media part, or reuse an identical one already written; returns (name, reused)."""
+        digest = hashlib.sha1(data).hexdigest()
+        media_name = self._media_by_digest.get(digest)
+        if media_name is not None:
+            self.deduplicated_bytes += len(data)
+            return media_name, True
+
+        media_name = f"image{len(self._media_by_digest) + 1}.{extension}"
+        self._media_by_digest[digest] = media_name
+        self._media_formats.add(extension)
+        # Already-compressed images gain nothing from deflate
+        compression = zipfile.ZIP_DEFLATED if extension == "svg" else zipfile.ZIP_STORED
+        self._zip.writestr(f"ppt/media/{media_name}", data, compression)
+        return media_name, False
+
+    def close(self) -> Path:
+        """
+        Write the presentation part, relationships and content types.
+
+        Returns:
+            Path of the finished PPTX file
+        """
+        if self._closed:
+            return self.output_path
+
+        with tracing.span("save", file=str(self.output_path), slides=self.slide_count):
+            slide_rel_ids = self._write_presentation_rels()
+            self._write_presentation(slide_rel_ids)
+            self._write_content_types()
+            self._zip.close()
+        self._closed = True
+
+        self._temp_path.replace(self.output_path)
+        return self.output_path
+
+    def abort(self) -> None:
+        """Discard a partially written package."""
+        if self._closed:
+            return
+        self._closed = True
+        try:
+            self._zip.close()
+        finally:
+            try:
+                self._temp_path.unlink()
+            except OSError:
+                pass
+
+    def _write_presentation_rels(self) -> List[str]:
+        rels = etree.fromstring(self._finalized_parts["ppt/_rels/presentation.xml.rels"])
+        used_ids = {rel.get("Id") for rel in rels}
+        next_id = 1
+        slide_rel_ids = []
+
+        for number in range(1, self.slide_count + 1):
+            while f"rId{next_id}" in used_ids:
+                next_id += 1
+            rel_id = f"rId{next_id}"
+            used_ids.add(rel_id)
+            etree.SubElement(rels, f"{{{_NS_RELS}}}Relationship", {
+                "Id": rel_id,
+                "Type": _RT_SLIDE,
+                "Target": f"slides/slide{number}.xml",
+            })
+            slide_rel_ids.append(rel_id)
+
+        self._zip.writestr("ppt/_rels/presentation.xml.rels", self._serialize(rels))
+        return slide_rel_ids
+
+    def _write_presentation(self, slide_rel_ids: List[str]) -> None:
+        presentation = etree.fromstring(self._finalized_parts["ppt/presentation.xml"])
+        sld_id_lst = presentation.find(f"{{{_NS_P}}}sldIdLst")
+        if sld_id_lst is None:
+            sld_id_lst = etree.Element(f"{{{_NS_P}}}sldIdLst")
+            master_id_lst = presentation.find(f"{{{_NS_P}}}sldMasterIdLst")
+            master_id_lst.addnext(sld_id_lst)
+
+        for offset, rel_id in enumerate(slide_rel_ids):
+            etree.SubElement(sld_id_lst, f"{{{_NS_P}}}sldId", {
+                "id": str(256 + offset),
+                f"{{{_NS_R}}}id": rel_id,
+            })
+
+        self._zip.writestr("ppt/presentation.xml", self._serialize(presentation))
+
+    def _write_content_types(self) -> None:
+        types = etree.fromstring(self._finalized_parts["[Content_Types].xml"])
+        defaults = {
+            element.get("Extension").lower()
+            for element in types.findall(f"{{{_NS_CT}}}Default")
+        }
+
+        for image_format in sorted(self._media_formats):
+            if image_format not in defaults:
+                default = etree.Element(f"{{{_NS_CT}}}Default", {
+                    "Extension": image_format,
+                    "ContentType": _IMAGE_CONTENT_TYPES[image_format],
+                })
+                types.insert(0, default)
+
+        for number in range(1, self.slide_count + 1):
+            etree.SubElement(types, f"{{{_NS_CT}}}Override", {
+                "PartName": f"/ppt/slides/slide{number}.xml",
+                "ContentType": _CT_SLIDE,
+            })
+
+        self._zip.writestr("[Content_Types].xml", self._serialize(types))
+
+    @staticmethod
+    def _serialize(element) -> bytes:
+        return etree.tostring(element, xml_declaration=True, encoding="UTF-8", standalone=True)
+
+    def __enter__(self) -> "StreamingPresentationWriter":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
@@ -0,0 +1,281 @@
+"""
+Persistent content-addressed cache of encoded page images.
+Lets repeated conversions of the same PDF with the same render settings skip
+rasterization entirely.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+from dataclasses import dataclass
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+from .pdf_processor import ConversionConfig
+
+# Bump when the entry layout or key composition changes
+CACHE_FORMAT_VERSION = 1
+
+_DIGEST_SIZE = hashlib.sha256().digest_size
+_ENTRY_SUFFIX = ".bin"
+
+
+@dataclass
+class CacheStats:
+    """Hit/miss accounting for a cache instance."""
+    hits: int = 0
+    misses: int = 0
+    writes: int = 0
+    corrupt_entries: int = 0
+    evictions: int = 0
+    bytes_written: int = 0
+
+
+def hash_pdf_file(pdf_path: Path, chunk_size: int = 1024 * 1024) -> str:
+    """
+    Compute the content hash of a PDF file.
+
+    Args:
+        pdf_path: File to hash
+        chunk_size: Read size in bytes
+
+    Returns:
+        Hex SHA-256 digest of the file contents
+    """
+    digest = hashlib.sha256()
+    with open(pdf_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class RenderCache:
+    """
+    On-disk cache of encoded page images keyed by content and render settings.
+
+    Entries are stored as ``<digest><payload>`` where digest is the SHA-256 of
+    the payload, so truncated or corrupted entries are detected and dropped.
+    Reads refresh the entry mtime, which drives least-recently-used eviction
+    once the cache grows past ``max_size_mb``.
+
+    Only the process owning the cache tracks its size and evicts. Copies
+    pickled into worker processes write entries without size accounting;
+    their statistics come back through drain_stats() and merge_stats(), and
+    the owner applies the size limit with enforce_limit().
+    """
+
+    def __init__(self, cache_dir: Path, max_size_mb: int = 1024):
+        """
+        Initialize the cache.
+
+        Args:
+            cache_dir: Directory holding cache entries
+            max_size_mb: Size limit before least recently used entries are evicted
+        """
+        self.cache_dir = Path(cache_dir)
+        self.max_size_bytes = max_size_mb * 1024 * 1024
+        self.stats = CacheStats()
+        self.track_size = True
+        self._size_bytes: Optional[int] = None
+
+    def __getstate__(self) -> dict:
+        # Worker copies start with empty statistics and leave the size to the owner
+        state = dict(self.__dict__)
+        state.update(stats=CacheStats(), track_size=False, _size_bytes=None)
+        return state
+
+    @classmethod
+    def from_config(cls, config: ConversionConfig) -> Optional["RenderCache"]:
+        """Create the cache configured on a ConversionConfig, if any."""
+        if not config.cache_dir:
+            return None
+        return cls(Path(config.cache_dir), config.cache_max_mb)
+
+    @staticmethod
+    def make_key(
+        pdf_hash: str,
+        page_index: int,
+        scale_factor: float,
+        rotation: int,
+        image_format: str
+    ) -> str:
+        """
+        Build the cache key for one rendered page.
+
+        Args:
+            pdf_hash: Content hash of the PDF file
+            page_index: Zero-based page index
+            scale_factor: Render scale
+            rotation: Rotation applied while rendering (0 or 90)
+            image_format: Encoded image format
+
+        Returns:
+            Hex key string
+        """
+        material = f"v{CACHE_FORMAT_VERSION}|{pdf_hash}|{page_index}|{scale_factor!r}|{rotation}|{image_format}"
+        return hashlib.sha256(material.encode('utf-8')).hexdigest()
+
+    def _entry_path(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / f"{key}{_ENTRY_SUFFIX}"
+
+    def get(self, key: str) -> Optional[bytes]:
+        """
+        Look up an entry, verifying its integrity.
+
+        Args:
+            key: Cache key from make_key()
+
+        Returns:
+            Cached bytes, or None on miss or corrupted entry
+        """
+        path = self._entry_path(key)
+        try:
+            data = path.read_bytes()
+        except OSError:
+            self.stats.misses += 1
+            return None
+
+        digest, payload = data[:_DIGEST_SIZE], data[_DIGEST_SIZE:]
+        if len(digest) != _DIGEST_SIZE or hashlib.sha256(payload).digest() != digest:
+            self.stats.corrupt_entries += 1
+            self.stats.misses += 1
+            self._remove(path)
+            return None
+
+        try:
+            os.utime(path)  # Mark as recently used
+        except OSError:
+            pass
+
+        self.stats.hits += 1
+        return payload
+
+    def put(self, key: str, payload: bytes) -> None:
+        """
+        Store an entry atomically and evict old entries if over the size limit.
+
+        Cache write failures are never fatal to a conversion.
+
+        Args:
+            key: Cache key from make_key()
+            payload: Encoded image bytes
+        """
+        path = self._entry_path(key)
+        temp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with open(temp_path, 'wb') as f:
+                f.write(hashlib.sha256(payload).digest())
+                f.write(payload)
+            temp_path.replace(path)
+        except OSError:
+            self._remove(temp_path)
+            return
+
+        self.stats.writes += 1
+        self.stats.bytes_written += _DIGEST_SIZE + len(payload)
+        if not self.track_size:
+            return
+        if self._size_bytes is None:
+            self._size_bytes = self.size_bytes()
+        else:
+            self._size_bytes += _DIGEST_SIZE + len(payload)
+
+        if self._size_bytes > self.max_size_bytes:
+            self.evict()
+
+    def drain_stats(self) -> Optional[CacheStats]:
+        """
+        Hand over the statistics of a worker copy and start counting afresh.
+
+        Returns:
+            Statistics gathered since the last call, or None for the owning
+            cache, which keeps its own
+        """
+        if self.track_size:
+            return None
+        stats, self.stats = self.stats, CacheStats()
+        return stats
+
+    def merge_stats(self, other: Optional[CacheStats]) -> None:
+        """
+        Add the statistics of a worker copy, including the size it wrote.
+
+        Args:
+            other: Statistics from the worker's drain_stats(), if any
+        """
+        if other is None:
+            return
+        self.stats.hits += other.hits
+        self.stats.misses += other.misses
+        self.stats.writes += other.writes
+        self.stats.corrupt_entries += other.corrupt_entries
+        self.stats.evictions += other.evictions
+        self.stats.bytes_written += other.bytes_written
+        if self._size_bytes is not None:
+            self._size_bytes += other.bytes_written
+
+    def enforce_limit(self) -> None:
+        """Evict entries if the cache is over its size limit, scanning it at most once."""
+        if self._size_bytes is None:
+            self._size_bytes = self.size_bytes()
+        if self._size_bytes > self.max_size_bytes:
+            self.evict()
+
+    def _entries(self) -> List[Tuple[float, int, Path]]:
+        """List (mtime, size, path) for all entries."""
+        entries = []
+        if not self.cache_dir.exists():
+            return entries
+        for path in self.cache_dir.glob(f"*/*{_ENTRY_SUFFIX}"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        return entries
+
+    def size_bytes(self) -> int:
+        """Total size of all cache entries in bytes."""
+        return sum(size for _, size, _ in self._entries())
+
+    def evict(self, target_ratio: float = 0.9) -> int:
+        """
+        Remove least recently used entries until under the size limit.
+
+        Args:
+            target_ratio: Fraction of max size to shrink to, leaving headroom
+
+        Returns:
+            Number of entries removed
+        """
+        entries = sorted(self._entries())
+        total = sum(size for _, size, _ in entries)
+        target = int(self.max_size_bytes * target_ratio)
+        removed = 0
+
+        for _, size, path in entries:
+            if total <= target:
+                break
+            if self._remove(path):
+                total -= size
+                removed += 1
+
+        self._size_bytes = total
+        self.stats.evictions += removed
+        return removed
+
+    def clear(self) -> int:
+        """Remove all entries, returning the number removed."""
+        removed = sum(1 for _, _, path in self._entries() if self._remove(path))
+        self._size_bytes = 0
+        return removed
+
+    @staticmethod
+    def _remove(path: Path) -> bool:
+        try:
+            path.unlink()
+            return True
+        except OSError:
+            return False
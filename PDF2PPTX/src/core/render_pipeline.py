@@ -0,0 +1,958 @@
+"""
+Overlapped page rendering pipeline.
+Renders and encodes pages ahead of time on a worker pool while the caller
+consumes them strictly in page order.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import time
+from collections import Counter, deque
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from dataclasses import dataclass, field, replace
+from pathlib import Path
+from typing import TYPE_CHECKING, Deque, Dict, Iterator, List, Optional, Tuple
+
+import fitz
+
+from .pdf_processor import (
+    ConversionConfig,
+    PageInfo,
+    PDFProcessingError,
+    calculate_render_scale,
+    describe_page,
+    open_pdf_document,
+    process_page_to_pixmap
+)
+from .image_encoding import (
+    ENCODING_JPEG,
+    ENCODING_PNG,
+    PNG_ENCODINGS,
+    PNG_PROFILE_BALANCED,
+    detect_image_format,
+    encode_pixmap
+)
+from . import tracing
+from .fault_isolation import (
+    IsolatedRenderer,
+    IsolatedTask,
+    PageIncident,
+    PageRenderError,
+    RenderWorkerPool,
+    classify_failure,
+    degraded_config,
+    isolation_enabled
+)
+from .memory_budget import (
+    MemoryBudget,
+    estimate_document_pages,
+    estimate_rendered_page,
+    shrink_document_store
+)
+from .render_cache import CacheStats, RenderCache, hash_pdf_file
+from .scan_passthrough import find_full_page_image
+from .svg_export import export_page_svg
+from .content_trim import BLANK_SKIP, blank_image, describe_content
+from .tiled_render import needs_tiling, render_page_banded
+
+if TYPE_CHECKING:
+    from .checkpoint import ConversionJournal
+    from .output_writer import OutputWriterPool
+
+# Encoding labels of pages not rasterized at full resolution
+ENCODING_PASSTHROUGH = "passthrough"  # original image stream of a scanned page
+ENCODING_SVG = "svg"                  # vector SVG with a small PNG fallback
+ENCODING_RESUMED = "resumed"          # restored from a checkpoint journal
+ENCODING_PLACEHOLDER = "placeholder"  # stand-in for a page that could not be rendered
+ENCODING_BLANK = "blank"              # page drawing nothing, collapsed to a tiny image
+
+
+@dataclass
+class RenderedPage:
+    """A rendered and encoded PDF page ready to be written or placed on a slide."""
+    page_number: int
+    image_bytes: bytes
+    image_format: str
+    page_info: PageInfo
+    render_seconds: float = 0.0
+    encode_seconds: float = 0.0
+    from_cache: bool = False
+    encoding: str = ENCODING_PNG  # concrete encoding chosen for this page
+    raw_bytes: int = 0  # uncompressed pixmap size (0 when served from cache)
+    duplicate_of: Optional[int] = None  # page number whose render was reused
+    # Passthrough images sit at image_rect on the unrotated page (None = whole
+    # page) and are turned clockwise by image_rotation degrees when placed
+    image_rect: Optional[Tuple[float, float, float, float]] = None
+    image_rotation: int = 0
+    svg_bytes: Optional[bytes] = None  # vector version; image_bytes is its fallback
+    trace_events: Optional[list] = None  # spans recorded by a worker process
+    cache_stats: Optional[CacheStats] = None  # render cache use of a worker process
+    incident: Optional[PageIncident] = None  # set when degraded or a placeholder
+
+    @property
+    def encoded_size(self) -> int:
+        """Size of all encoded image data of the page in bytes."""
+        return len(self.image_bytes) + len(self.svg_bytes or b"")
+
+
+@dataclass
+class PipelineStats:
+    """Throughput, queue and encoding statistics for a rendering pipeline run."""
+    pages: int = 0
+    elapsed_seconds: float = 0.0
+    render_seconds: float = 0.0
+    encode_seconds: float = 0.0
+    max_queue_depth: int = 0
+    queue_depth_total: int = 0
+    cache_hits: int = 0
+    encoded_bytes: int = 0
+    fresh_encoded_bytes: int = 0
+    raw_bytes: int = 0
+    encoding_counts: Dict[str, int] = field(default_factory=dict)
+    reused_renders: int = 0
+    deduplicated_pages: int = 0  # pages whose image is shared with an earlier page
+    deduplicated_svgs: int = 0  # pages whose SVG is shared with an earlier page
+    deduplicated_bytes: int = 0
+    resumed_pages: int = 0
+    incidents: List[PageIncident] = field(default_factory=list)
+    memory_budget_bytes: int = 0  # 0 = no budget
+    peak_memory_bytes: int = 0  # estimated render memory of pages in flight at most
+    memory_deferrals: int = 0  # times a page waited for memory to be released
+    # Where the output side spent its time: waiting for rendered pages versus
+    # being held up by writing files (blocked on a full writer queue or
+    # writing inline)
+    render_wait_seconds: float = 0.0
+    write_wait_seconds: float = 0.0
+    write_seconds: float = 0.0  # total time writing output files
+    trimmed_pages: int = 0  # rendered trimmed to their content
+    blank_pages: int = 0  # detected as drawing nothing
+    skipped_pages: int = 0  # blank pages left out of the output
+
+    @property
+    def pages_per_second(self) -> float:
+        """Pages delivered to the consumer per wall-clock second."""
+        if self.elapsed_seconds <= 0:
+            return 0.0
+        return self.pages / self.elapsed_seconds
+
+    @property
+    def average_queue_depth(self) -> float:
+        """Average number of finished pages waiting when the consumer asked for one."""
+        if self.pages == 0:
+            return 0.0
+        return self.queue_depth_total / self.pages
+
+    @property
+    def compression_ratio(self) -> float:
+        """Encoded size as a fraction of the raw pixel data of freshly rendered pages."""
+        if self.raw_bytes == 0:
+            return 0.0
+        return self.fresh_encoded_bytes / self.raw_bytes
+
+    def record(self, page: RenderedPage, queue_depth: int) -> None:
+        """Record a page handed to the consumer."""
+        self.pages += 1
+        if page.incident is not None and page.duplicate_of is None:
+            self.incidents.append(page.incident)
+        if page.duplicate_of is not None:
+            self.reused_renders += 1
+        elif page.encoding == ENCODING_RESUMED:
+            self.resumed_pages += 1
+        elif page.from_cache:
+            self.cache_hits += 1
+        else:
+            self.encoding_counts[page.encoding] = self.encoding_counts.get(page.encoding, 0) + 1
+            self.raw_bytes += page.raw_bytes
+            self.fresh_encoded_bytes += page.encoded_size
+        if page.page_info is not None and page.page_info.clip is not None:
+            self.trimmed_pages += 1
+        if page.encoding == ENCODING_BLANK:
+            self.blank_pages += 1
+        self.encoded_bytes += page.encoded_size
+        self.render_seconds += page.render_seconds
+        self.encode_seconds += page.encode_seconds
+        self.queue_depth_total += queue_depth
+        self.max_queue_depth = max(self.max_queue_depth, queue_depth)
+
+    def merge(self, other: "PipelineStats") -> None:
+        """Add the page, timing and encoding counters of another run (not elapsed time)."""
+        self.pages += other.pages
+        self.render_seconds += other.render_seconds
+        self.encode_seconds += other.encode_seconds
+        self.max_queue_depth = max(self.max_queue_depth, other.max_queue_depth)
+        self.queue_depth_total += other.queue_depth_total
+        self.cache_hits += other.cache_hits
+        self.encoded_bytes += other.encoded_bytes
+        self.fresh_encoded_bytes += other.fresh_encoded_bytes
+        self.raw_bytes += other.raw_bytes
+        for name, count in other.encoding_counts.items():
+            self.encoding_counts[name] = self.encoding_counts.get(name, 0) + count
+        self.reused_renders += other.reused_renders
+        self.deduplicated_pages += other.deduplicated_pages
+        self.deduplicated_svgs += other.deduplicated_svgs
+        self.deduplicated_bytes += other.deduplicated_bytes
+        self.resumed_pages += other.resumed_pages
+        self.incidents.extend(other.incidents)
+        self.memory_budget_bytes = max(self.memory_budget_bytes, other.memory_budget_bytes)
+        self.peak_memory_bytes = max(self.peak_memory_bytes, other.peak_memory_bytes)
+        self.memory_deferrals += other.memory_deferrals
+        self.render_wait_seconds += other.render_wait_seconds
+        self.write_wait_seconds += other.write_wait_seconds
+        self.write_seconds += other.write_seconds
+        self.trimmed_pages += other.trimmed_pages
+        self.blank_pages += other.blank_pages
+        self.skipped_pages += other.skipped_pages
+
+    def record_deduplicated(self, image_bytes: int, svg: bool = False) -> None:
+        """Record a page whose image (or SVG) was shared with an earlier identical one."""
+        if svg:
+            self.deduplicated_svgs += 1
+        else:
+            self.deduplicated_pages += 1
+        self.deduplicated_bytes += image_bytes
+
+    def summary(self) -> str:
+        """Human-readable one line summary."""
+        text = (
+            f"{self.pages} pages in {self.elapsed_seconds:.2f}s "
+            f"({self.pages_per_second:.1f} pages/s, "
+            f"queue depth avg {self.average_queue_depth:.1f} / max {self.max_queue_depth})"
+        )
+        if self.resumed_pages:
+            text += f", {self.resumed_pages} resumed from checkpoint"
+        if self.cache_hits:
+            text += f", {self.cache_hits} from cache"
+        if self.reused_renders:
+            text += f", {self.reused_renders} duplicate pages not re-rendered"
+        if self.incidents:
+            text += f", {len(self.incidents)} page incident(s)"
+        if self.trimmed_pages:
+            text += f", {self.trimmed_pages} trimmed to content"
+        if self.skipped_pages:
+            text += f", {self.skipped_pages} blank skipped"
+        elif self.blank_pages:
+            text += f", {self.blank_pages} blank collapsed"
+        if self.memory_budget_bytes:
+            text += f", {self.memory_summary()}"
+        if self.write_seconds:
+            text += f", {self.bound_summary()}"
+        return text
+
+    @property
+    def io_bound(self) -> bool:
+        """Whether output writes held up rendering more than rendering held up writes."""
+        return self.write_wait_seconds > self.render_wait_seconds
+
+    def bound_summary(self) -> str:
+        """Human-readable split between render-bound and I/O-bound time."""
+        return (
+            f"{'I/O' if self.io_bound else 'render'}-bound "
+            f"(waited {self.render_wait_seconds:.2f}s on rendering, "
+            f"{self.write_wait_seconds:.2f}s on writes of {self.write_seconds:.2f}s)"
+        )
+
+    def record_memory(self, budget: MemoryBudget) -> None:
+        """Take over the peak and deferrals of a memory budget."""
+        self.memory_budget_bytes = budget.limit_bytes
+        self.peak_memory_bytes = max(self.peak_memory_bytes, budget.peak_bytes)
+        self.memory_deferrals = budget.deferrals
+
+    def record_write(self, render_wait: float, write_seconds: float) -> None:
+        """Account a page written inline after waiting render_wait seconds for it."""
+        self.render_wait_seconds += render_wait
+        self.write_seconds += write_seconds
+        self.write_wait_seconds += write_seconds
+
+    def record_writes(self, writer: OutputWriterPool) -> None:
+        """Take over the write time and back-pressure waits of an output writer."""
+        self.write_seconds += writer.stats.write_seconds
+        self.write_wait_seconds += writer.stats.wait_seconds
+
+    def memory_summary(self) -> str:
+        """Human-readable peak render memory against the budget."""
+        text = (
+            f"peak memory est. {self.peak_memory_bytes / (1024 * 1024):.0f} MB "
+            f"of {self.memory_budget_bytes / (1024 * 1024):.0f} MB budget"
+        )
+        if self.memory_deferrals:
+            text += f", throttled {self.memory_deferrals}x"
+        return text
+
+    def encoding_summary(self) -> str:
+        """Human-readable summary of encoder choices, output size and encode time."""
+        counts = ", ".join(f"{name} x{count}" for name, count in sorted(self.encoding_counts.items()))
+        text = (
+            f"{counts or 'no pages encoded'}; "
+            f"{self.encoded_bytes / (1024 * 1024):.1f} MB written, "
+            f"encode {self.encode_seconds:.2f}s"
+        )
+        if self.raw_bytes:
+            text += f", {self.compression_ratio:.1%} of raw pixels"
+        if self.deduplicated_pages or self.deduplicated_svgs:
+            shared = f"{self.deduplicated_pages} duplicate pages"
+            if self.deduplicated_svgs:
+                shared += f" and {self.deduplicated_svgs} duplicate SVGs"
+            text += f"; {shared} share media ({self.deduplicated_bytes / (1024 * 1024):.1f} MB saved)"
+
+        return text
+
+
+def render_page(
+    page: fitz.Page,
+    config: ConversionConfig,
+    encoding: str = ENCODING_PNG,
+    cache: Optional[RenderCache] = None,
+    pdf_hash: Optional[str] = None,
+    passthrough: bool = False,
+    svg: bool = False
+) -> RenderedPage:
+    """
+    Render a single page and encode it to image bytes.
+
+    When a render cache and the document content hash are given, a cached
+    encoding is returned without rasterizing, and fresh renders are stored.
+    With passthrough enabled, scanned pages (a single full-page image) return
+    the original image stream together with its placement on the page. With
+    svg enabled, vector pages are exported as SVG when that beats a raster.
+    Plain PNG pages over ``tile_megapixels`` are rendered and encoded in
+    bands (see tiled_render) to the same pixels. Other pages are rendered
+    trimmed to their content with trim_margins, and pages drawing nothing
+    come back as tiny ENCODING_BLANK images under a blank page policy (see
+    content_trim).
+
+    Args:
+        page: PyMuPDF page to render
+        config: Conversion configuration
+        encoding: Encoding policy (see image_encoding.ENCODING_POLICIES)
+        cache: Optional render cache
+        pdf_hash: Content hash of the document the page belongs to
+        passthrough: Whether scanned page images may be returned as-is
+        svg: Whether pages may be returned as SVG with a PNG fallback
+
+    Returns:
+        Rendered page with timing information
+    """
+    if passthrough:
+        start = time.perf_counter()
+        with tracing.span("analyze", file=page.parent.name, page=page.number + 1, check="scan"):
+            page_image = find_full_page_image(page)
+        if page_image is not None:
+            page_info = describe_page(page, config)
+            return RenderedPage(
+                page_number=page_info.page_number,
+                image_bytes=page_image.image_bytes,
+                image_format=page_image.image_format,
+                page_info=page_info,
+                render_seconds=time.perf_counter() - start,
+                encoding=ENCODING_PASSTHROUGH,
+                raw_bytes=page_image.raw_bytes,
+                image_rect=page_image.rect,
+                image_rotation=90 if page_info.was_rotated else 0
+            )
+
+    if svg:
+        page_info = describe_page(page, config)
+        with tracing.span("render", file=page.parent.name, page=page.number + 1, encoding=ENCODING_SVG):
+            svg_page = export_page_svg(page, page_info, calculate_render_scale(page_info, config))
+        if svg_page is not None:
+            return RenderedPage(
+                page_number=page_info.page_number,
+                image_bytes=svg_page.fallback_png,
+                image_format="png",
+                page_info=page_info,
+                render_seconds=svg_page.export_seconds,
+                encoding=ENCODING_SVG,
+                svg_bytes=svg_page.svg_bytes
+            )
+
+    with tracing.span("analyze", file=page.parent.name, page=page.number + 1):
+        page_info = describe_content(page, config)
+    if page_info.blank:
+        return RenderedPage(
+            page_number=page_info.page_number,
+            image_bytes=blank_image(page_info),
+            image_format="png",
+            page_info=page_info,
+            encoding=ENCODING_BLANK
+        )
+
+    cache_key = None
+    if cache is not None and pdf_hash:
+        cache_key = RenderCache.make_key(
+            pdf_hash, page.number, calculate_render_scale(page_info, config),
+            90 if page_info.was_rotated else 0, _cache_format(encoding, config)
+        )
+        cached = cache.get(cache_key)
+        if cached is not None:
+            return RenderedPage(
+                page_number=page_info.page_number,
+                image_bytes=cached,
+                image_format=detect_image_format(cached),
+                page_info=page_info,
+                from_cache=True,
+                encoding="cached"
+            )
+
+    if encoding == ENCODING_PNG and needs_tiling(page, config, page_info):
+        banded = render_page_banded(page, config, page_info)
+        if banded is not None:
+            if cache_key is not None:
+                cache.put(cache_key, banded.image_bytes)
+            return RenderedPage(
+                page_number=banded.page_info.page_number,
+                image_bytes=banded.image_bytes,
+                image_format="png",
+                page_info=banded.page_info,
+                render_seconds=banded.render_seconds,
+                encode_seconds=banded.encode_seconds,
+                raw_bytes=banded.raw_bytes
+            )
+
+    start = time.perf_counter()
+    pixmap, page_info = process_page_to_pixmap(page, config, page_info)
+    rendered = time.perf_counter()
+
+    try:
+        raw_bytes = pixmap.width * pixmap.height * pixmap.n
+        with tracing.span("encode", file=page.parent.name, page=page.number + 1, encoding=encoding):
+            image_bytes, image_format, used_encoding = encode_pixmap(
+                pixmap, encoding, config.jpeg_quality, config.png_profile
+            )
+    finally:
+        pixmap = None
+
+    if cache_key is not None:
+        cache.put(cache_key, image_bytes)
+
+    return RenderedPage(
+        page_number=page_info.page_number,
+        image_bytes=image_bytes,
+        image_format=image_format,
+        page_info=page_info,
+        render_seconds=rendered - start,
+        encode_seconds=time.perf_counter() - rendered,
+        encoding=used_encoding,
+        raw_bytes=raw_bytes
+    )
+
+
+def page_fingerprint(page: fitz.Page) -> Optional[str]:
+    """
+    Fingerprint everything that determines how a page renders.
+
+    Two pages of the same document with equal fingerprints draw the same
+    content stream with the same resource objects on the same page box, so
+    they rasterize identically. Pages with annotations or form fields are not
+    fingerprinted.
+
+    Args:
+        page: PyMuPDF page
+
+    Returns:
+        Hex digest, or None if the page cannot be safely fingerprinted
+    """
+    if page.first_annot is not None or page.first_widget is not None:
+        return None
+
+    contents = page.read_contents()
+    doc = page.parent
+    xref = page.xref if contents.strip() else 0  # blank pages use no resources
+    resources = ("null", "null")
+    # Resources may be inherited from the page tree
+    while xref:
+        resources = doc.xref_get_key(xref, "Resources")
+        if resources[0] != "null":
+            break
+        parent_type, parent = doc.xref_get_key(xref, "Parent")
+        xref = int(parent.split()[0]) if parent_type == "xref" else 0
+
+    digest = hashlib.sha256(contents)
+    digest.update(repr((
+        resources,
+        tuple(page.mediabox),
+        tuple(page.cropbox),
+        page.rotation
+    )).encode('utf-8'))
+    return digest.hexdigest()
+
+
+class DuplicatePages:
+    """
+    Tracks pages of one document whose render can be reused from an earlier page.
+
+    Only renders that a later page will reuse are kept, and each is released
+    after its last duplicate has been served. ``pages`` restricts tracking to
+    a page range of the document.
+    """
+
+    def __init__(self, doc: fitz.Document, enabled: bool = True, pages: Optional[range] = None):
+        self.sources: Dict[int, int] = {}
+        if enabled:
+            first_seen: Dict[str, int] = {}
+            for page_index in pages if pages is not None else range(len(doc)):
+                page = doc[page_index]
+                fingerprint = page_fingerprint(page)
+                if fingerprint is None:
+                    continue
+                source = first_seen.setdefault(fingerprint, page.number)
+                if source != page.number:
+                    self.sources[page.number] = source
+        self._remaining = Counter(self.sources.values())
+        self._kept: Dict[int, RenderedPage] = {}
+
+    def source_of(self, page_index: int) -> Optional[int]:
+        """Index of the earlier identical page, if any."""
+        return self.sources.get(page_index)
+
+    def keep(self, page_index: int, rendered: RenderedPage) -> None:
+        """Remember a render if later pages duplicate it."""
+        if self._remaining.get(page_index):
+            self._kept[page_index] = rendered
+
+    def reuse(self, page_index: int) -> RenderedPage:
+        """Build the rendered page for a duplicate from its source render."""
+        source_index = self.sources[page_index]
+        source = self._kept[source_index]
+        self._remaining[source_index] -= 1
+        if self._remaining[source_index] == 0:
+            del self._kept[source_index]
+
+        return replace(
+            source,
+            page_number=page_index + 1,
+            page_info=replace(source.page_info, page_number=page_index + 1),
+            render_seconds=0.0,
+            encode_seconds=0.0,
+            raw_bytes=0,
+            duplicate_of=source.page_number
+        )
+
+
+def _cache_format(encoding: str, config: ConversionConfig) -> str:
+    """Cache key component describing the encoding policy."""
+    if encoding in PNG_ENCODINGS:
+        variant = encoding
+    else:
+        variant = f"{encoding}:q{config.jpeg_quality}"
+    if encoding != ENCODING_JPEG and config.png_profile != PNG_PROFILE_BALANCED:
+        variant += f":{config.png_profile}"
+    if config.trim_margins:
+        variant += f":trim{config.trim_margin_pt:g}"
+    return variant
+
+
+# Documents opened by the current worker process, keyed by path, with the
+# (size, mtime) they were opened at
+_worker_documents: Dict[str, Tuple[Tuple[int, int], fitz.Document]] = {}
+
+
+def _file_signature(pdf_path: str) -> Tuple[int, int]:
+    try:
+        stat = os.stat(pdf_path)
+    except OSError:
+        return (-1, -1)  # let fitz.open() report the error
+    return (stat.st_size, stat.st_mtime_ns)
+
+
+def worker_document(pdf_path: str) -> fitz.Document:
+    """
+    Open a document in a worker process, reusing it across tasks.
+
+    Long-lived workers (e.g. the serve pool) may see a file rewritten
+    between jobs, so a cached document is only reused while the file's
+    size and modification time are unchanged.
+    """
+    signature = _file_signature(pdf_path)
+    entry = _worker_documents.get(pdf_path)
+    if entry is not None and entry[0] == signature:
+        return entry[1]
+    # Keep only the most recent document open to bound worker memory
+    close_worker_documents()
+    with tracing.span("open", file=pdf_path):
+        doc = fitz.open(pdf_path)
+    _worker_documents[pdf_path] = (signature, doc)
+    return doc
+
+
+def close_worker_documents() -> None:
+    """Close documents kept open by worker_document() in this process."""
+    for _, doc in _worker_documents.values():
+        doc.close()
+    _worker_documents.clear()
+    shrink_document_store()
+
+
+def _render_page_task(
+    pdf_path: str,
+    page_index: int,
+    config: ConversionConfig,
+    encoding: str,
+    cache: Optional[RenderCache],
+    pdf_hash: Optional[str],
+    passthrough: bool,
+    svg: bool,
+    trace: bool = False
+) -> RenderedPage:
+    """Worker process entry point: render one page of a PDF file."""
+    tracing.begin_worker_task(trace)
+    doc = worker_document(pdf_path)
+    failure = None
+    try:
+        rendered = render_page(doc[page_index], config, encoding, cache, pdf_hash, passthrough, svg)
+    except Exception as e:
+        failure = PageRenderError(
+            f"Failed to render page {page_index + 1} of {pdf_path}: {e}", classify_failure(e)
+        )
+    if failure is not None:
+        # Raised outside the handler: the pool worker keeps its last exception
+        # alive, and a chained traceback would pin the failed page's buffers
+        raise failure
+    rendered.trace_events = tracing.drain_worker_events(trace)
+    rendered.cache_stats = cache.drain_stats() if cache is not None else None
+    return rendered
+
+
+def skip_page(rendered: RenderedPage, config: ConversionConfig) -> bool:
+    """Whether a rendered page is left out of the output (blank, with blank_pages = skip)."""
+    return rendered.encoding == ENCODING_BLANK and config.blank_pages == BLANK_SKIP
+
+
+def placeholder_page(
+    pdf_path: Path,
+    page_index: int,
+    config: ConversionConfig,
+    incident: PageIncident
+) -> RenderedPage:
+    """
+    Build a stand-in image for a page that could not be rendered.
+
+    The placeholder has the page's final size (after auto-rotation) at
+    72 dpi and names the page and the reason it is missing.
+
+    Args:
+        pdf_path: Source PDF file
+        page_index: Zero-based page index
+        config: Conversion configuration
+        incident: Incident replacing the page
+
+    Returns:
+        Rendered page carrying the incident
+    """
+    with open_pdf_document(pdf_path) as doc:
+        page_info = describe_page(doc[page_index], config)
+    width, height = page_info.final_size
+
+    with fitz.open() as doc:
+        page = doc.new_page(width=width, height=height)
+        page.draw_rect(page.rect, color=None, fill=(0.93, 0.93, 0.93))
+        page.insert_textbox(
+            fitz.Rect(36, height / 2 - 20, width - 36, height / 2 + 40),
+            f"Page {page_info.page_number} could not be rendered ({incident.reason})",
+            fontsize=14,
+            color=(0.4, 0.4, 0.4),
+            align=fitz.TEXT_ALIGN_CENTER
+        )
+        image_bytes = page.get_pixmap().tobytes("png")
+
+    return RenderedPage(
+        page_number=page_info.page_number,
+        image_bytes=image_bytes,
+        image_format="png",
+        page_info=page_info,
+        encoding=ENCODING_PLACEHOLDER,
+        incident=incident
+    )
+
+
+def _with_incident(rendered: RenderedPage, incident: PageIncident) -> RenderedPage:
+    rendered.incident = incident
+    return rendered
+
+
+class PageRenderPipeline:
+    """
+    Producer/consumer pipeline for page rendering.
+
+    A process pool renders and encodes up to ``prefetch`` pages ahead of the
+    consumer; pages are yielded in page order. The prefetch window is the
+    queue bound and therefore caps the memory held by finished pages.
+    With a memory budget configured, pages also wait outside the window
+    until their estimated render memory fits into the budget, which
+    throttles both worker concurrency and prefetch depth.
+
+    With a page time or memory limit configured, pages always render in
+    worker processes (see fault_isolation): failing pages are retried at a
+    lower resolution or replaced by a placeholder instead of failing the
+    conversion. This needs a pool the pipeline owns or a RenderWorkerPool.
+    """
+
+    def __init__(
+        self,
+        config: ConversionConfig,
+        encoding: str = ENCODING_PNG,
+        executor: Optional[Executor] = None,
+        passthrough: bool = False,
+        svg: bool = False,
+        journal: Optional[ConversionJournal] = None
+    ):
+        """
+        Initialize the pipeline.
+
+        Args:
+            config: Conversion configuration (max_workers, prefetch_pages)
+            encoding: Encoding policy pages are encoded with
+            executor: Optional externally managed executor to render on
+            passthrough: Return scanned page images as-is (consumer must
+                honour RenderedPage.image_rect and image_rotation)
+            svg: Return vector pages as SVG where it beats a raster (consumer
+                must embed RenderedPage.svg_bytes)
+            journal: Checkpoint journal restoring finished pages and
+                recording newly rendered ones
+        """
+        self.config = config
+        self.encoding = encoding
+        self.passthrough = passthrough
+        self.svg = svg
+        self.stats = PipelineStats()
+        self.cache = RenderCache.from_config(config)
+        self.journal = journal
+        self._executor = executor
+        self._owns_executor = False
+        self._isolated: Optional[IsolatedRenderer] = None
+        self.budget = MemoryBudget.from_config(config)
+
+    @property
+    def prefetch(self) -> int:
+        """Maximum number of pages rendered ahead of the consumer."""
+        if self.config.prefetch_pages > 0:
+            return self.config.prefetch_pages
+        return 2 * self.config.max_workers
+
+    @property
+    def is_parallel(self) -> bool:
+        """Whether pages are rendered on a worker pool."""
+        return (
+            self._executor is not None
+            or self.config.max_workers > 1
+            or isolation_enabled(self.config)
+        )
+
+    def _get_executor(self) -> Executor:
+        if self._executor is None:
+            if isolation_enabled(self.config):
+                self._executor = RenderWorkerPool(self.config.max_workers, self.config.page_memory_mb)
+            else:
+                self._executor = ProcessPoolExecutor(max_workers=self.config.max_workers)
+            self._owns_executor = True
+        return self._executor
+
+    def _get_isolated(self) -> Optional[IsolatedRenderer]:
+        """Fault-isolating renderer, when limits are configured and the pool supports it."""
+        executor = self._get_executor()
+        if self._isolated is None and isolation_enabled(self.config) and isinstance(executor, RenderWorkerPool):
+            self._isolated = IsolatedRenderer(executor, self.config.page_timeout)
+        return self._isolated
+
+    def _isolated_task(self, pdf_path: Path, page_index: int, pdf_hash: Optional[str], trace: bool) -> IsolatedTask:
+        def call(level: int) -> tuple:
+            if level == 0:
+                return (
+                    _render_page_task, str(pdf_path), page_index, self.config, self.encoding,
+                    self.cache, pdf_hash, self.passthrough, self.svg, trace
+                )
+            # Lower resolution plain raster; SVG export or passthrough may be what failed
+            return (
+                _render_page_task, str(pdf_path), page_index, degraded_config(self.config),
+                self.encoding, self.cache, pdf_hash, False, False, trace
+            )
+
+        return IsolatedTask(
+            str(pdf_path), page_index + 1, call, _with_incident,
+            lambda incident: placeholder_page(pdf_path, page_index, self.config, incident)
+        )
+
+    def iter_pages(self, pdf_path: Path) -> Iterator[RenderedPage]:
+        """
+        Render all pages of a PDF file, yielding them in page order.
+
+        Args:
+            pdf_path: PDF file to render
+
+        Yields:
+            Rendered pages
+
+        Raises:
+            PDFProcessingError: If the document or any page fails to render
+        """
+        start = time.perf_counter()
+        try:
+            pdf_hash = self._hash_document(pdf_path)
+            if self.is_parallel:
+                pages = self._iter_parallel(pdf_path, pdf_hash)
+            else:
+                pages = self._iter_inline(pdf_path, pdf_hash)
+            try:
+                for rendered in pages:
+                    if skip_page(rendered, self.config):
+                        self.stats.skipped_pages += 1
+                        continue
+                    yield rendered
+            finally:
+                pages.close()  # cancels pages rendered ahead when the consumer stops early
+        finally:
+            self.stats.elapsed_seconds += time.perf_counter() - start
+            if self.budget is not None:
+                self.stats.record_memory(self.budget)
+            if self.cache is not None and self.is_parallel:
+                # Workers write without size accounting; apply the limit once per file
+                self.cache.enforce_limit()
+            shrink_document_store()
+
+    def _hash_document(self, pdf_path: Path) -> Optional[str]:
+        """Content hash used for cache keys (only computed when caching)."""
+        if self.cache is None:
+            return None
+        try:
+            return hash_pdf_file(pdf_path)
+        except OSError as e:
+            raise PDFProcessingError(f"Failed to read {pdf_path}: {e}")
+
+    def _iter_inline(self, pdf_path: Path, pdf_hash: Optional[str]) -> Iterator[RenderedPage]:
+        with open_pdf_document(pdf_path) as doc:
+            duplicates = DuplicatePages(doc, self.config.deduplicate_pages)
+            for page in doc:
+                if duplicates.source_of(page.number) is not None:
+                    rendered = duplicates.reuse(page.number)
+                else:
+                    rendered = self._restore(pdf_path, page.number)
+                    if rendered is None:
+                        # One page at a time: the budget only records the peak
+                        footprint = self._reserve(page)
+                        start = time.perf_counter()
+                        try:
+                            rendered = render_page(
+                                page, self.config, self.encoding, self.cache, pdf_hash,
+                                self.passthrough, self.svg
+                            )
+                        finally:
+                            self.stats.render_wait_seconds += time.perf_counter() - start
+                            if self.budget is not None:
+                                self.budget.release(footprint)
+                        self._checkpoint(pdf_path, page.number, rendered)
+                    duplicates.keep(page.number, rendered)
+                self.stats.record(rendered, 0)
+                yield rendered
+
+    def _reserve(self, page: fitz.Page) -> int:
+        """Reserve the budget for rendering a page inline."""
+        if self.budget is None:
+            return 0
+        footprint = estimate_rendered_page(page, self.config, self.encoding)
+        self.budget.try_reserve(footprint)  # admitted: nothing else is in flight
+        return footprint
+
+    def _iter_parallel(self, pdf_path: Path, pdf_hash: Optional[str]) -> Iterator[RenderedPage]:
+        with open_pdf_document(pdf_path) as doc:
+            page_count = len(doc)
+            duplicates = DuplicatePages(doc, self.config.deduplicate_pages)
+            footprints = (
+                estimate_document_pages(doc, self.config, self.encoding) if self.budget is not None else None
+            )
+
+        executor = self._get_executor()
+        isolated = self._get_isolated()
+        trace = tracing.active_tracer() is not None
+        # Duplicate pages occupy a window slot without a future
+        pending: Deque[Tuple[int, Optional[Future]]] = deque()
+        reserved: Dict[int, int] = {}  # page index -> budget held until consumed
+        next_page = 0
+
+        try:
+            while next_page < page_count or pending:
+                # Keep the bounded window full, as far as the memory budget admits
+                while next_page < page_count and len(pending) < self.prefetch:
+                    future = None
+                    if duplicates.source_of(next_page) is None:
+                        if footprints is not None:
+                            if not self.budget.try_reserve(footprints[next_page]):
+                                break
+                            reserved[next_page] = footprints[next_page]
+                        restored = self._restore(pdf_path, next_page)
+                        if restored is not None:
+                            future = Future()
+                            future.set_result(restored)
+                        elif isolated is not None:
+                            future = isolated.submit(
+                                self._isolated_task(pdf_path, next_page, pdf_hash, trace)
+                            )
+                        else:
+                            future = executor.submit(
+                                _render_page_task, str(pdf_path), next_page,
+                                self.config, self.encoding, self.cache, pdf_hash,
+                                self.passthrough, self.svg, trace
+                            )
+                    pending.append((next_page, future))
+                    next_page += 1
+
+                queue_depth = sum(1 for _, future in pending if future is not None and future.done())
+                page_index, future = pending.popleft()
+                if future is None:
+                    rendered = duplicates.reuse(page_index)
+                else:
+                    start = time.perf_counter()
+                    try:
+                        rendered = isolated.result(future) if isolated is not None else future.result()
+                    finally:
+                        self.stats.render_wait_seconds += time.perf_counter() - start
+                        if page_index in reserved:
+                            self.budget.release(reserved.pop(page_index))
+                    tracing.merge_events(rendered.trace_events)
+                    rendered.trace_events = None
+                    if self.cache is not None:
+                        self.cache.merge_stats(rendered.cache_stats)
+                    rendered.cache_stats = None
+                    if rendered.encoding not in (ENCODING_RESUMED, ENCODING_PLACEHOLDER):
+                        self._checkpoint(pdf_path, page_index, rendered)
+                    duplicates.keep(page_index, rendered)
+                self.stats.record(rendered, queue_depth)
+                yield rendered
+        except PDFProcessingError:
+            raise
+        except Exception as e:
+            raise PDFProcessingError(f"Failed to render {pdf_path}: {e}")
+        finally:
+            for _, future in pending:
+                if future is not None:
+                    future.cancel()
+            if isolated is not None:
+                isolated.cancel_pending()
+            for footprint in reserved.values():
+                self.budget.release(footprint)
+
+    def _restore(self, pdf_path: Path, page_index: int) -> Optional[RenderedPage]:
+        """Page finished by an earlier run of the job, if journaled."""
+        if self.journal is None:
+            return None
+        return self.journal.restore_page(pdf_path, page_index)
+
+    def _checkpoint(self, pdf_path: Path, page_index: int, rendered: RenderedPage) -> None:
+        """Journal a freshly rendered page (blank pages are cheap to detect again)."""
+        if self.journal is not None and rendered.encoding != ENCODING_BLANK:
+            with tracing.span("checkpoint", file=str(pdf_path), page=page_index + 1):
+                self.journal.record_page(pdf_path, page_index, rendered)
+
+    def close(self) -> None:
+        """Shut down the worker pool if this pipeline created it."""
+        if self._owns_executor and self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+            self._owns_executor = False
+        self._isolated = None
+
+    def __enter__(self) -> "PageRenderPipeline":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
@@ -0,0 +1,117 @@
+"""
+Scanned page passthrough.
+Detects pages that consist of a single full-page image (typical scanner
+output) so the original image stream can be embedded as-is instead of being
+decoded, rasterized again and re-encoded.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from io import BytesIO
+from typing import Optional, Tuple
+
+import fitz
+from PIL import Image
+
+# Minimum fraction of the page the image must cover
+MIN_PAGE_COVERAGE = 0.95
+
+# Points an image may extend past the page edge (rounding in scanner output);
+# the image is placed whole, so anything more would squash it
+_EDGE_TOLERANCE = 1.0
+
+# Formats PowerPoint embeds natively
+_PASSTHROUGH_FORMATS = ("jpeg", "png")
+
+# Image dictionary keys whose presence changes how the stored image is drawn
+_DRAWING_KEYS = ("ImageMask", "Mask", "SMask", "Decode")
+
+_EXIF_ORIENTATION = 0x0112
+
+
+@dataclass
+class PageImage:
+    """Original image stream of a scanned page."""
+    image_bytes: bytes
+    image_format: str
+    rect: Tuple[float, float, float, float]  # position on the page in points
+    raw_bytes: int  # size of the decoded samples
+
+
+def find_full_page_image(page: fitz.Page) -> Optional[PageImage]:
+    """
+    Extract the image of a page that is nothing but one full-page image.
+
+    The page must draw exactly one image, axis-aligned and unflipped, lying
+    within the page and covering at least MIN_PAGE_COVERAGE of it, with no visible text,
+    vector graphics, annotations or page rotation. The image must be stored as a
+    JPEG or PNG-compatible stream without masks or decode arrays, so the
+    extracted bytes look exactly as the page renders them.
+
+    Args:
+        page: PyMuPDF page to inspect
+
+    Returns:
+        The page image, or None if the page must be rasterized
+    """
+    if page.rotation != 0 or page.first_annot is not None or page.first_widget is not None:
+        return None
+
+    # Everything drawn on the page must be the single image; invisible text
+    # (an OCR layer) does not render and is allowed
+    drawn = [kind for kind, _ in page.get_bboxlog() if kind != "ignore-text"]
+    if drawn != ["fill-image"]:
+        return None
+
+    infos = page.get_image_info(xrefs=True)
+    if len(infos) != 1 or infos[0]["xref"] <= 0:
+        return None
+    info = infos[0]
+
+    a, b, c, d, _, _ = info["transform"]
+    if b != 0 or c != 0 or a <= 0 or d <= 0:
+        return None  # rotated, skewed or mirrored
+
+    bbox = fitz.Rect(info["bbox"])
+    tolerance = (-_EDGE_TOLERANCE, -_EDGE_TOLERANCE, _EDGE_TOLERANCE, _EDGE_TOLERANCE)
+    if bbox not in page.rect + tolerance:
+        return None  # cropped by the page edge; the whole image would be squashed into view
+    rect = bbox & page.rect
+    page_area = page.rect.get_area()
+    if page_area <= 0 or rect.get_area() < MIN_PAGE_COVERAGE * page_area:
+        return None
+
+    doc = page.parent
+    xref = info["xref"]
+    if any(doc.xref_get_key(xref, key)[0] != "null" for key in _DRAWING_KEYS):
+        return None
+
+    extracted = doc.extract_image(xref)
+    if (
+        not extracted
+        or extracted["ext"] not in _PASSTHROUGH_FORMATS
+        or extracted["smask"]
+        or extracted["colorspace"] not in (1, 3)
+    ):
+        return None
+
+    image_bytes = extracted["image"]
+    if extracted["ext"] == "jpeg" and _has_exif_rotation(image_bytes):
+        return None  # PDF viewers ignore EXIF orientation, PowerPoint does not
+
+    return PageImage(
+        image_bytes=image_bytes,
+        image_format=extracted["ext"],
+        rect=tuple(rect),
+        raw_bytes=extracted["width"] * extracted["height"] * extracted["colorspace"]
+    )
+
+
+def _has_exif_rotation(image_bytes: bytes) -> bool:
+    """Whether a JPEG carries an EXIF orientation other than upright."""
+    try:
+        with Image.open(BytesIO(image_bytes)) as image:
+            return image.getexif().get(_EXIF_ORIENTATION, 1) != 1
+    except Exception:
+        return True
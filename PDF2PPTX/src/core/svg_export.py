@@ -0,0 +1,135 @@
+"""
+Vector page export as sanitized SVG.
+Converts vector pages to SVG with MuPDF's SVG device for embedding as SVG
+pictures (with a small PNG fallback), and decides per page whether the SVG
+is worth it compared with a raster render.
+"""
+
+from __future__ import annotations
+
+import time
+import zlib
+from dataclasses import dataclass
+from typing import Optional
+
+import fitz
+from lxml import etree
+
+from .pdf_processor import PageInfo
+
+# Office 2016 extension that attaches an SVG to a picture's PNG blip
+SVG_BLIP_EXTENSION_URI = "{96DAC541-7B7A-43D3-8B79-37D633B846F1}"
+NS_SVG_BLIP = "http://schemas.microsoft.com/office/drawing/2016/SVG/main"
+SVG_CONTENT_TYPE = "image/svg+xml"
+
+# Longest edge of the PNG shown by viewers without SVG support
+FALLBACK_MAX_EDGE = 800
+
+# Pages drawing more elements than this are slow to display as SVG
+MAX_SVG_ELEMENTS = 20000
+
+_NS_XLINK = "http://www.w3.org/1999/xlink"
+
+# Elements that can execute code or pull in foreign content
+_UNSAFE_ELEMENTS = ("script", "foreignObject", "iframe", "embed", "object")
+_HREF_ATTRIBUTES = ("href", f"{{{_NS_XLINK}}}href")
+
+
+@dataclass
+class SvgPage:
+    """A page exported as SVG with its raster fallback."""
+    svg_bytes: bytes
+    fallback_png: bytes
+    export_seconds: float
+
+
+def sanitize_svg(svg: str) -> bytes:
+    """
+    Strip active and external content from an SVG document.
+
+    Removes script-like elements, event handler attributes and references
+    to anything but fragments within the document or embedded data images.
+
+    Args:
+        svg: SVG document text
+
+    Returns:
+        Sanitized SVG as UTF-8 bytes
+    """
+    parser = etree.XMLParser(resolve_entities=False, no_network=True, huge_tree=True)
+    root = etree.fromstring(svg.encode('utf-8'), parser)
+
+    for element in list(root.iter()):
+        if not isinstance(element.tag, str):
+            # Comments and processing instructions
+            element.getparent().remove(element)
+            continue
+        if etree.QName(element).localname in _UNSAFE_ELEMENTS:
+            element.getparent().remove(element)
+            continue
+        for name in list(element.attrib):
+            if etree.QName(name).localname.lower().startswith("on"):
+                del element.attrib[name]
+            elif name in _HREF_ATTRIBUTES:
+                target = element.attrib[name].strip()
+                if not (target.startswith("#") or target.startswith("data:image/")):
+                    del element.attrib[name]
+
+    return etree.tostring(root, xml_declaration=True, encoding="UTF-8")
+
+
+def export_page_svg(
+    page: fitz.Page,
+    page_info: PageInfo,
+    raster_scale: float
+) -> Optional[SvgPage]:
+    """
+    Export a page as SVG if that beats rasterizing it.
+
+    Pages containing images are always rasterized (the SVG would carry them
+    base64-encoded), as are pages with annotations (not part of the SVG
+    export) and pages drawing more than MAX_SVG_ELEMENTS elements.
+    Otherwise the SVG is exported and a small PNG fallback is rendered; raster
+    size and time are extrapolated from the fallback to the full render
+    scale, and the SVG is kept only if its compressed size and export time
+    are not larger.
+
+    Args:
+        page: PyMuPDF page
+        page_info: Page description (rotation)
+        raster_scale: Scale the page would be rasterized at
+
+    Returns:
+        SVG page, or None if the page should be rasterized
+    """
+    if page.get_images(full=False):
+        return None
+    if page.first_annot is not None or page.first_widget is not None:
+        return None
+    if len(page.get_bboxlog()) > MAX_SVG_ELEMENTS:
+        return None
+
+    rotation = fitz.Matrix(90) if page_info.was_rotated else fitz.Identity
+
+    start = time.perf_counter()
+    svg_bytes = sanitize_svg(page.get_svg_image(matrix=rotation))
+    exported = time.perf_counter()
+
+    width, height = page_info.final_size
+    fallback_scale = min(raster_scale, FALLBACK_MAX_EDGE / max(width, height))
+    fallback = page.get_pixmap(matrix=fitz.Matrix(fallback_scale, fallback_scale) * rotation)
+    fallback_png = fallback.tobytes("png")
+    fallback_seconds = time.perf_counter() - exported
+
+    # Raster cost grows with the pixel count
+    pixel_ratio = (raster_scale / fallback_scale) ** 2
+    if len(zlib.compress(svg_bytes, 1)) > len(fallback_png) * pixel_ratio:
+        return None
+    if exported - start > fallback_seconds * pixel_ratio:
+        return None
+
+    return SvgPage(
+        svg_bytes=svg_bytes,
+        fallback_png=fallback_png,
+        export_seconds=time.perf_counter() - start
+    )
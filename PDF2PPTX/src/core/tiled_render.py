@@ -0,0 +1,121 @@
+"""
+Banded rendering for oversized pages.
+Rasterizes a page as horizontal bands clipped from its display list and
+streams them through a PNG encoder, so peak memory follows the band size
+instead of the page size.
+
+Bands are clipped on whole device pixel rows and rendered with a few rows
+of overlap, so fills, text and images come out as in a full-page pixmap.
+MuPDF clips stroke edges to the band it draws, though, so anti-aliasing
+along strokes may differ by a step from a whole-page render.
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+from dataclasses import dataclass
+from io import BytesIO
+from typing import Optional
+
+import fitz
+
+from . import tracing
+from .image_encoding import StreamingPNGWriter, png_level
+from .pdf_processor import ConversionConfig, PageInfo, describe_page, render_matrix
+
+# Pixels rendered per band (12 MB of RGB samples)
+BAND_PIXELS = 4 * 1024 * 1024
+
+# Extra rows rendered above and below each band and cropped off, so
+# anti-aliasing at band edges sees the same neighbourhood as a full render
+BAND_OVERLAP = 8
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class BandedPage:
+    """A page rendered band by band into PNG bytes."""
+    image_bytes: bytes
+    page_info: PageInfo
+    raw_bytes: int
+    render_seconds: float
+    encode_seconds: float
+    bands: int
+
+
+def band_rows(width: int) -> int:
+    """Rows per band for a pixmap of the given width."""
+    return max(1, BAND_PIXELS // max(1, width))
+
+
+def _render_area(page: fitz.Page, page_info: PageInfo) -> fitz.Rect:
+    """Part of the page that is rendered."""
+    return fitz.Rect(page_info.clip) if page_info.clip else page.rect
+
+
+def needs_tiling(page: fitz.Page, config: ConversionConfig, page_info: Optional[PageInfo] = None) -> bool:
+    """Whether the page's pixmap exceeds the tile_megapixels threshold."""
+    if config.tile_megapixels <= 0:
+        return False
+    page_info = page_info or describe_page(page, config)
+    irect = (_render_area(page, page_info) * render_matrix(page_info, config)).irect
+    return irect.width * irect.height > config.tile_megapixels * 1024 * 1024
+
+
+def render_page_banded(
+    page: fitz.Page,
+    config: ConversionConfig,
+    page_info: Optional[PageInfo] = None
+) -> Optional[BandedPage]:
+    """
+    Render a page to PNG band by band.
+
+    Args:
+        page: PyMuPDF page
+        config: Conversion configuration
+        page_info: Page description to render by (describe_page() if omitted)
+
+    Returns:
+        The encoded page, or None if a band did not line up with the pixel
+        grid of a whole-page render (the caller then renders it whole)
+    """
+    page_info = page_info or describe_page(page, config)
+    matrix = render_matrix(page_info, config)
+    irect = (_render_area(page, page_info) * matrix).irect
+    inverse = ~matrix
+    rows_per_band = band_rows(irect.width)
+    render_seconds = 0.0
+    encode_seconds = 0.0
+    bands = 0
+    buffer = BytesIO()
+
+    with tracing.span("render", file=page.parent.name, page=page.number + 1, tiled=True):
+        display_list = page.get_displaylist()
+        writer = StreamingPNGWriter(buffer, irect.width, irect.height, png_level(config.png_profile))
+        for y0 in range(irect.y0, irect.y1, rows_per_band):
+            y1 = min(y0 + rows_per_band, irect.y1)
+            band = fitz.IRect(irect.x0, max(irect.y0, y0 - BAND_OVERLAP), irect.x1, min(irect.y1, y1 + BAND_OVERLAP))
+            start = time.perf_counter()
+            pixmap = display_list.get_pixmap(matrix=matrix, clip=fitz.Rect(band) * inverse)
+            rendered = time.perf_counter()
+            if fitz.IRect(pixmap.irect) != band or pixmap.n != 3:
+                logger.debug("Band %s of page %d rendered as %s; rendering whole", band, page.number + 1, pixmap.irect)
+                return None
+            stride = pixmap.stride
+            writer.write_rows(pixmap.samples[(y0 - band.y0) * stride:(y1 - band.y0) * stride])
+            pixmap = None
+            render_seconds += rendered - start
+            encode_seconds += time.perf_counter() - rendered
+            bands += 1
+        writer.close()
+
+    return BandedPage(
+        image_bytes=buffer.getvalue(),
+        page_info=page_info,
+        raw_bytes=irect.width * irect.height * 3,
+        render_seconds=render_seconds,
+        encode_seconds=encode_seconds,
+        bands=bands
+    )
@@ -0,0 +1,226 @@
+"""
+Lightweight stage tracing.
+Records timed spans around conversion stages (open, analyze, render, encode,
+slide, label, save) into an in-memory buffer and exports them in the Chrome
+Trace Event format, viewable in chrome://tracing or Perfetto.
+
+Tracing is off unless enable_tracing() is called; span() then costs a single
+global lookup. Worker processes buffer their own spans and hand them back
+with their results (see begin_worker_task(), drain_worker_events() and
+merge_events()).
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+# Buffered span: (name, start_ns, duration_ns, pid, tid, attributes)
+TraceEvent = Tuple[str, int, int, int, int, Dict[str, Any]]
+
+
+class _NullSpan:
+    """Span stand-in used while tracing is disabled."""
+
+    __slots__ = ()
+
+    def __enter__(self) -> "_NullSpan":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        return None
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class _Span:
+    """Context manager timing one span of a tracer."""
+
+    __slots__ = ("_tracer", "_name", "_attributes", "_start")
+
+    def __init__(self, tracer: "Tracer", name: str, attributes: Dict[str, Any]):
+        self._tracer = tracer
+        self._name = name
+        self._attributes = attributes
+        self._start = 0
+
+    def __enter__(self) -> "_Span":
+        self._start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        if exc_type is not None:
+            self._attributes["error"] = exc_type.__name__
+        self._tracer.record(self._name, self._start, time.perf_counter_ns(), self._attributes)
+
+
+class Tracer:
+    """
+    Buffer of finished spans.
+
+    Timestamps come from time.perf_counter_ns(), a system-wide monotonic
+    clock, so spans recorded by worker processes line up with the spans of
+    the main process.
+    """
+
+    def __init__(self, worker: bool = False):
+        self.events: List[TraceEvent] = []
+        self.pid = os.getpid()
+        self.worker = worker  # started by begin_worker_task()
+
+    def span(self, name: str, **attributes: Any) -> _Span:
+        """
+        Time a block of code.
+
+        Args:
+            name: Stage name
+            **attributes: Span attributes (file, page, ...)
+
+        Returns:
+            Context manager recording the span on exit
+        """
+        return _Span(self, name, attributes)
+
+    def record(self, name: str, start_ns: int, end_ns: int, attributes: Dict[str, Any]) -> None:
+        """Add a finished span."""
+        self.events.append(
+            (name, start_ns, end_ns - start_ns, self.pid, threading.get_ident(), attributes)
+        )
+
+    def drain(self) -> List[TraceEvent]:
+        """Remove and return all buffered spans."""
+        events, self.events = self.events, []
+        return events
+
+    def chrome_trace(self) -> Dict[str, Any]:
+        """
+        Convert the buffered spans to a Chrome Trace Event document.
+
+        Returns:
+            Dictionary with complete ("X") events and process name metadata
+        """
+        if not self.events:
+            return {"traceEvents": [], "displayTimeUnit": "ms"}
+
+        origin = min(event[1] for event in self.events)
+        trace_events = []
+        for pid in sorted({event[3] for event in self.events}):
+            trace_events.append({
+                "name": "process_name", "ph": "M", "pid": pid, "tid": 0,
+                "args": {"name": "main" if pid == self.pid else f"worker {pid}"}
+            })
+        for name, start_ns, duration_ns, pid, tid, attributes in self.events:
+            trace_events.append({
+                "name": name,
+                "cat": "pdf2pptx",
+                "ph": "X",
+                "ts": (start_ns - origin) / 1000.0,
+                "dur": duration_ns / 1000.0,
+                "pid": pid,
+                "tid": tid,
+                "args": attributes
+            })
+        return {"traceEvents": trace_events, "displayTimeUnit": "ms"}
+
+    def write_chrome_trace(self, path: Path) -> None:
+        """
+        Write the buffered spans as a Chrome Trace Event JSON file.
+
+        Args:
+            path: Output file path
+        """
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.chrome_trace(), f, default=str)
+
+
+# Tracer of the current process (None while tracing is disabled)
+_active: Optional[Tracer] = None
+
+
+def enable_tracing() -> Tracer:
+    """Start buffering spans in this process, keeping an already active tracer."""
+    global _active
+    # A forked worker inherits the parent's tracer and its buffered spans
+    if _active is None or _active.pid != os.getpid():
+        _active = Tracer()
+    return _active
+
+
+def disable_tracing() -> Optional[Tracer]:
+    """Stop tracing and return the tracer holding the recorded spans."""
+    global _active
+    tracer, _active = _active, None
+    return tracer
+
+
+def active_tracer() -> Optional[Tracer]:
+    """The tracer of this process, or None if tracing is disabled."""
+    return _active
+
+
+def span(name: str, **attributes: Any):
+    """
+    Time a block of code with the active tracer.
+
+    Args:
+        name: Stage name
+        **attributes: Span attributes (file, page, ...)
+
+    Returns:
+        Context manager; does nothing while tracing is disabled
+    """
+    if _active is None:
+        return _NULL_SPAN
+    return _active.span(name, **attributes)
+
+
+def begin_worker_task(trace: bool) -> None:
+    """
+    Set up tracing for a task about to run in a worker process.
+
+    Pool workers are reused, so a worker that once ran a traced task must
+    not keep recording spans for later untraced ones. A tracer the process
+    enabled itself (a task run inline by a tracing parent) is left alone.
+
+    Args:
+        trace: Whether the submitting process is tracing
+    """
+    global _active
+    if _active is not None and (_active.worker or _active.pid != os.getpid()):
+        if trace and _active.pid == os.getpid():
+            # Spans of an earlier task that failed before handing them back
+            _active.events = []
+        else:
+            _active = None
+    if trace and _active is None:
+        _active = Tracer(worker=True)
+
+
+def drain_worker_events(trace: bool) -> Optional[List[TraceEvent]]:
+    """
+    Collect the spans a worker task recorded, to be returned with its result.
+
+    The worker's buffer is always emptied, so it cannot grow across tasks.
+
+    Args:
+        trace: Whether the submitting process is tracing
+
+    Returns:
+        The spans recorded since begin_worker_task(), or None if not tracing
+    """
+    if _active is None or not _active.worker:
+        return None
+    events = _active.drain()
+    return events if trace else None
+
+
+def merge_events(events: Optional[List[TraceEvent]]) -> None:
+    """Add spans returned by a worker process to the active tracer."""
+    if events and _active is not None:
+        _active.events.extend(events)
@@ -279,7 +279,8 @@ class QtMainWindow(QMainWindow):
 
         return ConversionConfig(
             scale_factor=scale_factor,
-            auto_rotate=self.auto_rotate_check.isChecked()
+            auto_rotate=self.auto_rotate_check.isChecked(),
+            memory_budget_mb=get_app_config().max_memory_mb
         )
 
     def _convert_to_png(self):
@@ -0,0 +1,69 @@
+"""
+Shared pytest fixtures for PDF2PPTX tests.
+"""
+
+import pytest
+import fitz
+from pathlib import Path
+
+
+def build_sample_pdf(path: Path, page_count: int = 4) -> Path:
+    """Write a small PDF mixing portrait and landscape pages with text and vectors."""
+    doc = fitz.open()
+    for index in range(page_count):
+        if index % 2 == 0:
+            page = doc.new_page(width=595, height=842)  # A4 portrait
+        else:
+            page = doc.new_page(width=842, height=595)  # A4 landscape
+        page.insert_text((72, 72), f"Sample page {index + 1}", fontsize=18)
+        page.draw_rect(fitz.Rect(100, 120, 260, 280), color=(1, 0, 0), fill=(0, 0, 1))
+    doc.save(str(path))
+    doc.close()
+    return path
+
+
+@pytest.fixture
+def sample_pdf(tmp_path: Path) -> Path:
+    """A four page sample PDF on disk."""
+    return build_sample_pdf(tmp_path / "sample.pdf")
+
+
+def build_repeated_pages_pdf(path: Path) -> Path:
+    """Write a PDF whose third page repeats the first and whose second and fourth are blank."""
+    doc = fitz.open()
+    for _ in range(4):
+        doc.new_page(width=595, height=842)
+    cover = doc[0]
+    cover.insert_text((72, 72), "Cover sheet", fontsize=20)
+    cover.draw_rect(fitz.Rect(100, 120, 260, 280), color=(1, 0, 0), fill=(0, 0, 1))
+    # Page 3 shares the cover's content stream and resources
+    for key in ("Contents", "Resources"):
+        doc.xref_set_key(doc[2].xref, key, doc.xref_get_key(cover.xref, key)[1])
+    doc.save(str(path))
+    doc.close()
+    return path
+
+
+def make_scan_jpeg(width: int = 400, height: int = 560) -> bytes:
+    """Encode a small noisy JPEG standing in for a scanned page."""
+    from io import BytesIO
+    from PIL import Image
+
+    image = Image.effect_noise((width, height), 40).convert("RGB")
+    buffer = BytesIO()
+    image.save(buffer, format="JPEG", quality=80)
+    return buffer.getvalue()
+
+
+def build_scanned_pdf(path: Path, jpeg: bytes, page_count: int = 2) -> Path:
+    """Write a PDF whose pages are a full-page JPEG each, alternating portrait and landscape."""
+    doc = fitz.open()
+    for index in range(page_count):
+        if index % 2 == 0:
+            page = doc.new_page(width=595, height=842)
+        else:
+            page = doc.new_page(width=842, height=595)
+        page.insert_image(page.rect, stream=jpeg, keep_proportion=False)
+    doc.save(str(path))
+    doc.close()
+    return path
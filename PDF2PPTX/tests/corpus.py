@@ -0,0 +1,122 @@
+"""
+Deterministic synthetic PDF corpus for performance tests.
+
+Every generator writes the same document for the same arguments, so
+throughput measured on one run can be compared with a stored baseline.
+"""
+
+import random
+from io import BytesIO
+from pathlib import Path
+from typing import Callable, Dict
+
+import fitz
+from PIL import Image
+
+A4_PORTRAIT = (595, 842)
+A4_LANDSCAPE = (842, 595)
+
+_WORDS = (
+    "render encode slide label page scale vector raster document image "
+    "presentation converter pipeline worker cache stream"
+).split()
+
+
+def _paragraph(rng: random.Random, words: int) -> str:
+    return " ".join(rng.choice(_WORDS) for _ in range(words))
+
+
+def build_text_heavy_pdf(path: Path, page_count: int = 20) -> Path:
+    """Pages filled with small body text, like reports and contracts."""
+    rng = random.Random(1)
+    doc = fitz.open()
+    for _ in range(page_count):
+        page = doc.new_page(width=A4_PORTRAIT[0], height=A4_PORTRAIT[1])
+        body = "\n".join(_paragraph(rng, 12) for _ in range(60))
+        if page.insert_textbox(fitz.Rect(40, 40, 555, 802), body, fontsize=8) < 0:
+            raise ValueError("text does not fit the page")
+    doc.save(str(path), deflate=True)
+    doc.close()
+    return path
+
+
+def build_vector_heavy_pdf(path: Path, page_count: int = 10) -> Path:
+    """Pages with thousands of lines and filled shapes, like CAD drawings and charts."""
+    rng = random.Random(2)
+    doc = fitz.open()
+    for _ in range(page_count):
+        page = doc.new_page(width=A4_LANDSCAPE[0], height=A4_LANDSCAPE[1])
+        shape = page.new_shape()
+        for _ in range(1500):
+            start = fitz.Point(rng.uniform(20, 822), rng.uniform(20, 575))
+            end = start + (rng.uniform(-60, 60), rng.uniform(-60, 60))
+            shape.draw_line(start, end)
+        shape.finish(color=(0, 0, 0), width=0.3)
+        for _ in range(300):
+            x, y = rng.uniform(20, 800), rng.uniform(20, 555)
+            shape.draw_rect(fitz.Rect(x, y, x + rng.uniform(2, 20), y + rng.uniform(2, 20)))
+            shape.finish(color=None, fill=(rng.random(), rng.random(), rng.random()))
+        shape.commit()
+    doc.save(str(path), deflate=True)
+    doc.close()
+    return path
+
+
+def make_scan_image(width: int, height: int, seed: int) -> bytes:
+    """Encode a deterministic grainy JPEG standing in for a scanned page."""
+    size = width * height
+    noise = random.Random(seed).getrandbits(8 * size).to_bytes(size, "little")
+    # Light paper grain rather than full-range noise
+    image = Image.frombytes("L", (width, height), noise).point(lambda v: 200 + v // 5).convert("RGB")
+    buffer = BytesIO()
+    image.save(buffer, format="JPEG", quality=80)
+    return buffer.getvalue()
+
+
+def build_scanned_pdf(path: Path, page_count: int = 10) -> Path:
+    """Pages consisting of one full-page JPEG each, like scanner output."""
+    doc = fitz.open()
+    for index in range(page_count):
+        page = doc.new_page(width=A4_PORTRAIT[0], height=A4_PORTRAIT[1])
+        page.insert_image(page.rect, stream=make_scan_image(827, 1170, index), keep_proportion=False)
+    doc.save(str(path))
+    doc.close()
+    return path
+
+
+def build_mixed_orientation_pdf(path: Path, page_count: int = 20) -> Path:
+    """Alternating portrait and landscape pages with text and graphics."""
+    rng = random.Random(3)
+    doc = fitz.open()
+    for index in range(page_count):
+        width, height = A4_PORTRAIT if index % 2 == 0 else A4_LANDSCAPE
+        page = doc.new_page(width=width, height=height)
+        if page.insert_textbox(fitz.Rect(40, 40, width - 40, 220), _paragraph(rng, 120), fontsize=11) < 0:
+            raise ValueError("text does not fit the page")
+        for column in range(6):
+            bar = fitz.Rect(60 + column * 60, height - 60 - rng.uniform(50, 250), 100 + column * 60, height - 60)
+            page.draw_rect(bar, color=(0, 0, 0), fill=(0.2, 0.4, 0.8))
+    doc.save(str(path), deflate=True)
+    doc.close()
+    return path
+
+
+def build_thousand_page_pdf(path: Path, page_count: int = 1000) -> Path:
+    """Many small, light pages, exposing per-page and per-slide overhead."""
+    doc = fitz.open()
+    for index in range(page_count):
+        page = doc.new_page(width=298, height=420)  # A6
+        page.insert_text((30, 50), f"Page {index + 1}", fontsize=16)
+        page.draw_rect(fitz.Rect(30, 80, 268, 380), color=(0, 0, 0), width=0.5)
+    doc.save(str(path), deflate=True)
+    doc.close()
+    return path
+
+
+CORPUS: Dict[str, Callable[[Path], Path]] = {
+    "text_heavy": build_text_heavy_pdf,
+    "vector_heavy": build_vector_heavy_pdf,
+    "scanned": build_scanned_pdf,
+    "mixed_orientation": build_mixed_orientation_pdf,
+    "thousand_pages": build_thousand_page_pdf
+}
@@ -0,0 +1,88 @@
+"""
+Unit tests for the cross-file batch scheduler.
+"""
+
+import pytest
+
+from src.core.batch_scheduler import BatchImageScheduler, estimate_cost, plan_batch
+from src.core.image_converter import ImageConversionService
+from src.core.pdf_processor import ConversionConfig, PDFProcessingError
+
+from tests.conftest import build_sample_pdf
+
+
+@pytest.fixture
+def batch_files(tmp_path):
+    return [
+        build_sample_pdf(tmp_path / "small.pdf", page_count=2),
+        build_sample_pdf(tmp_path / "large.pdf", page_count=9),
+        build_sample_pdf(tmp_path / "medium.pdf", page_count=5),
+    ]
+
+
+class TestPlanBatch:
+    """Test task splitting and ordering."""
+
+    def test_longest_tasks_first(self, batch_files):
+        """Files are split into page ranges ordered by estimated cost."""
+        tasks, results = plan_batch(batch_files, ConversionConfig(), chunk_pages=4)
+
+        assert [r.page_count for r in results] == [2, 9, 5]
+        assert sorted((t.pdf_path.stem, t.start, t.stop) for t in tasks) == [
+            ("large", 0, 4), ("large", 4, 8), ("large", 8, 9),
+            ("medium", 0, 4), ("medium", 4, 5),
+            ("small", 0, 2),
+        ]
+        costs = [t.cost for t in tasks]
+        assert costs == sorted(costs, reverse=True)
+
+    def test_invalid_file_fails_without_tasks(self, tmp_path):
+        """Unreadable inputs are reported as failed results."""
+        broken = tmp_path / "broken.pdf"
+        broken.write_bytes(b"not a pdf")
+
+        tasks, results = plan_batch([broken, tmp_path / "missing.pdf"], ConversionConfig())
+
+        assert tasks == []
+        assert all(not r.succeeded for r in results)
+
+    def test_cost_grows_with_content_density(self):
+        """Denser files cost more per page."""
+        assert estimate_cost(10, 10 * 1024 * 1024) > estimate_cost(10, 10 * 1024)
+
+
+class TestBatchImageScheduler:
+    """Test batch execution and per-file accounting."""
+
+    @pytest.mark.parametrize("workers", [1, 3])
+    def test_all_pages_written_in_order(self, tmp_path, batch_files, workers):
+        """Every file gets all of its pages, listed in page order."""
+        scheduler = BatchImageScheduler(ConversionConfig(max_workers=workers), chunk_pages=4)
+        done = []
+
+        batch = scheduler.run(batch_files, tmp_path / "out", on_file_done=lambda r: done.append(r.pdf_path.stem))
+
+        assert sorted(done) == ["large", "medium", "small"]
+        large = batch.files[1]
+        assert large.succeeded
+        assert [p.name for p in large.output_files] == [f"large_page_{n:03d}.png" for n in range(1, 10)]
+        assert batch.stats.pages == 16
+        assert all(p.read_bytes().startswith(b"\x89PNG") for r in batch.files for p in r.output_files)
+
+    def test_failed_file_does_not_stop_batch(self, tmp_path, batch_files):
+        """A broken input is reported while the other files convert."""
+        broken = tmp_path / "broken.pdf"
+        broken.write_bytes(b"not a pdf")
+
+        batch = BatchImageScheduler(ConversionConfig(max_workers=2)).run(
+            [broken] + batch_files, tmp_path / "out"
+        )
+
+        assert [r.succeeded for r in batch.files] == [False, True, True, True]
+
+    def test_convert_multiple_pdfs_raises_for_failures(self, tmp_path, batch_files):
+        """The library entry point keeps raising on the first failed file."""
+        service = ImageConversionService(ConversionConfig())
+
+        with pytest.raises(PDFProcessingError, match="missing.pdf"):
+            service.convert_multiple_pdfs(batch_files + [tmp_path / "missing.pdf"], tmp_path / "out")
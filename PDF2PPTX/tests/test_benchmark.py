@@ -0,0 +1,110 @@
+"""
+Unit tests for conversion benchmarking.
+"""
+
+import fitz
+import pytest
+
+from src.core.benchmark import (
+    BenchmarkCase,
+    BenchmarkResult,
+    build_page_sample,
+    recommend,
+    run_case,
+    run_case_isolated
+)
+from src.core.pdf_processor import ConversionConfig, PDFProcessingError
+
+from tests.conftest import build_sample_pdf
+
+
+def _result(name, pages_per_second, bytes_per_page, scale=1.5):
+    case = BenchmarkCase(name, ConversionConfig(scale_factor=scale))
+    return BenchmarkResult(
+        case=case, pages=10, wall_seconds=10 / pages_per_second,
+        output_bytes=int(bytes_per_page * 10)
+    )
+
+
+class TestPageSample:
+    """Test sampling pages across documents."""
+
+    def test_sample_spreads_over_files(self, tmp_path):
+        """Pages are taken evenly from all files up to the limit."""
+        first = build_sample_pdf(tmp_path / "a.pdf", page_count=4)
+        second = build_sample_pdf(tmp_path / "b.pdf", page_count=4)
+
+        count = build_page_sample([first, second], tmp_path / "sample.pdf", 4)
+
+        with fitz.open(str(tmp_path / "sample.pdf")) as sample:
+            texts = [page.get_text().strip() for page in sample]
+        assert count == 4
+        assert texts == ["Sample page 1", "Sample page 3", "Sample page 1", "Sample page 3"]
+
+    def test_small_documents_are_used_whole(self, tmp_path, sample_pdf):
+        """A limit above the page count samples every page."""
+        assert build_page_sample([sample_pdf], tmp_path / "sample.pdf", 50) == 4
+
+    def test_no_pages_raises(self, tmp_path, sample_pdf):
+        """A zero page limit is rejected."""
+        with pytest.raises(PDFProcessingError):
+            build_page_sample([sample_pdf], tmp_path / "sample.pdf", 0)
+
+
+class TestRunCase:
+    """Test measuring a single configuration."""
+
+    @pytest.mark.parametrize("output_format", ["pptx", "png"])
+    def test_measures_stages_and_size(self, tmp_path, sample_pdf, output_format):
+        """A case reports pages, stage times and output size and cleans up."""
+        case = BenchmarkCase("default", ConversionConfig(), output_format)
+
+        result = run_case(case, sample_pdf, tmp_path / "work")
+
+        assert result.succeeded, result.error
+        assert result.pages == 4
+        assert result.render_seconds > 0 and result.encode_seconds > 0
+        assert result.assemble_seconds > 0
+        assert result.output_bytes > 0
+        assert not (tmp_path / "work" / "output").exists()
+
+    def test_isolated_case_reports_peak_rss(self, tmp_path, sample_pdf):
+        """Cases run in a child process report its peak memory."""
+        result = run_case_isolated(BenchmarkCase("default", ConversionConfig()), sample_pdf, tmp_path)
+
+        assert result.succeeded, result.error
+        assert result.pages == 4
+        if result.peak_rss_mb is not None:
+            assert result.peak_rss_mb > 0
+
+    def test_failure_is_reported(self, tmp_path):
+        """A failing conversion becomes an error result."""
+        case = BenchmarkCase("default", ConversionConfig())
+
+        result = run_case(case, tmp_path / "missing.pdf", tmp_path / "work")
+
+        assert not result.succeeded
+
+
+class TestRecommend:
+    """Test picking a configuration."""
+
+    def test_fastest_within_size_target(self):
+        """The fastest result meeting the size target wins."""
+        results = [
+            _result("big-fast", 40, 500_000),
+            _result("small-slow", 10, 100_000),
+            _result("small-fast", 20, 150_000)
+        ]
+
+        assert recommend(results, max_bytes_per_page=200_000).case.name == "small-fast"
+        assert recommend(results).case.name == "big-fast"
+
+    def test_quality_target_and_failures(self):
+        """Low-resolution and failed results are never recommended."""
+        failed = _result("failed", 100, 1000, scale=3.0)
+        failed.error = "boom"
+        results = [_result("low", 50, 1000, scale=1.0), _result("high", 5, 1000, scale=3.0), failed]
+
+        assert recommend(results, min_dpi=150).case.name == "high"
+        assert recommend(results, max_bytes_per_page=10) is None
@@ -0,0 +1,191 @@
+"""
+Unit tests for checkpoint journals and resumed conversions.
+"""
+
+import pytest
+from pptx import Presentation
+
+from src.core.checkpoint import CHECKPOINT_DIRNAME, ConversionJournal, checkpoint_dir, job_key
+from src.core.image_converter import ImageConversionService
+from src.core.pdf_processor import ConversionConfig
+from src.core.powerpoint_converter import PowerPointConversionService
+from src.core.render_pipeline import PageRenderPipeline
+
+from tests.conftest import build_sample_pdf
+
+
+class Interrupted(Exception):
+    """Stands in for a crash or Ctrl-C in the middle of a conversion."""
+
+
+def interrupt_after(pages: int):
+    """Progress callback failing once the given number of pages is done."""
+    done = []
+
+    def callback(count: int, bytes_written: int) -> None:
+        done.append(count)
+        if sum(done) >= pages:
+            raise Interrupted()
+
+    return callback
+
+
+@pytest.fixture
+def long_pdf(tmp_path):
+    return build_sample_pdf(tmp_path / "long.pdf", page_count=6)
+
+
+def _slide_labels(pptx_path):
+    presentation = Presentation(str(pptx_path))
+    return [slide.shapes[-1].text_frame.text for slide in presentation.slides]
+
+
+class TestConversionJournal:
+    """Test journal records, recovery and job matching."""
+
+    @pytest.fixture
+    def rendered_pages(self, sample_pdf):
+        with PageRenderPipeline(ConversionConfig(scale_factor=0.5)) as pipeline:
+            return list(pipeline.iter_pages(sample_pdf))
+
+    def test_pages_restored_after_reopen(self, tmp_path, sample_pdf, rendered_pages):
+        """Recorded pages come back with identical image data and placement."""
+        journal = ConversionJournal(tmp_path / "journal", "job")
+        for index, rendered in enumerate(rendered_pages[:2]):
+            journal.record_page(sample_pdf, index, rendered)
+        journal.close()
+
+        resumed = ConversionJournal(tmp_path / "journal", "job", resume=True)
+        restored = resumed.restore_page(sample_pdf, 1)
+
+        assert resumed.resumed
+        assert restored.image_bytes == rendered_pages[1].image_bytes
+        assert restored.page_info == rendered_pages[1].page_info
+        assert resumed.restore_page(sample_pdf, 2) is None
+
+    def test_torn_last_line_is_dropped(self, tmp_path, sample_pdf, rendered_pages):
+        """A partially written record does not break the journal."""
+        journal = ConversionJournal(tmp_path / "journal", "job")
+        journal.record_page(sample_pdf, 0, rendered_pages[0])
+        journal.close()
+        with open(tmp_path / "journal" / "journal.jsonl", "ab") as f:
+            f.write(b'{"type":"page","key":')
+
+        resumed = ConversionJournal(tmp_path / "journal", "job", resume=True)
+        resumed.record_page(sample_pdf, 1, rendered_pages[1])
+        resumed.close()
+
+        reopened = ConversionJournal(tmp_path / "journal", "job", resume=True)
+        assert reopened.finished_pages == 2
+
+    def test_damaged_artifact_is_rendered_again(self, tmp_path, sample_pdf, rendered_pages):
+        """Pages whose stored image fails its checksum are not restored."""
+        journal = ConversionJournal(tmp_path / "journal", "job")
+        journal.record_page(sample_pdf, 0, rendered_pages[0])
+        journal.close()
+        for artifact in (tmp_path / "journal").glob("*.img"):
+            artifact.write_bytes(b"\x00" * artifact.stat().st_size)
+
+        resumed = ConversionJournal(tmp_path / "journal", "job", resume=True)
+        assert resumed.restore_page(sample_pdf, 0) is None
+
+    def test_other_job_is_discarded(self, tmp_path, sample_pdf, rendered_pages):
+        """A journal written for different inputs or settings is not resumed."""
+        journal = ConversionJournal(tmp_path / "journal", "job-a")
+        journal.record_page(sample_pdf, 0, rendered_pages[0])
+        journal.close()
+
+        other = ConversionJournal(tmp_path / "journal", "job-b", resume=True)
+        assert not other.resumed
+        assert other.restore_page(sample_pdf, 0) is None
+
+    def test_job_key_ignores_runtime_settings(self, sample_pdf):
+        """Worker count does not change the job, render scale does."""
+        base = job_key([sample_pdf], ConversionConfig(), "pptx")
+        assert job_key([sample_pdf], ConversionConfig(max_workers=4), "pptx") == base
+        assert job_key([sample_pdf], ConversionConfig(scale_factor=2.0), "pptx") != base
+        assert job_key([sample_pdf], ConversionConfig(), "png") != base
+
+
+class TestResumePowerPoint:
+    """Test resuming interrupted PPTX conversions."""
+
+    @pytest.mark.parametrize("options", [{}, {"max_workers": 2}, {"streaming_output": True}])
+    def test_resume_skips_rendered_pages(self, tmp_path, long_pdf, options):
+        """An interrupted deck resumes with finished pages restored, not re-rendered."""
+        config = ConversionConfig(scale_factor=0.5, checkpoint=True, **options)
+        service = PowerPointConversionService(config)
+        service.set_progress_callback(interrupt_after(4))
+        with pytest.raises(Exception):
+            service.convert_pdf_to_powerpoint(long_pdf, tmp_path / "out")
+        assert (tmp_path / "out" / CHECKPOINT_DIRNAME).exists()
+
+        resumed = PowerPointConversionService(ConversionConfig(scale_factor=0.5, resume=True, **options))
+        output = resumed.convert_pdf_to_powerpoint(long_pdf, tmp_path / "out")
+
+        assert resumed.last_pipeline_stats.resumed_pages >= 4
+        assert resumed.last_pipeline_stats.pages == 6
+        assert _slide_labels(output) == [f"long_page_{n:03d}" for n in range(1, 7)]
+        assert not (tmp_path / "out" / CHECKPOINT_DIRNAME).exists()
+
+    def test_without_resume_starts_over(self, tmp_path, long_pdf):
+        """A checkpointed run without --resume discards the old journal."""
+        service = PowerPointConversionService(ConversionConfig(scale_factor=0.5, checkpoint=True))
+        service.set_progress_callback(interrupt_after(3))
+        with pytest.raises(Exception):
+            service.convert_pdf_to_powerpoint(long_pdf, tmp_path / "out")
+
+        fresh = PowerPointConversionService(ConversionConfig(scale_factor=0.5, checkpoint=True))
+        fresh.convert_pdf_to_powerpoint(long_pdf, tmp_path / "out")
+
+        assert fresh.last_pipeline_stats.resumed_pages == 0
+
+
+class TestResumeImages:
+    """Test resuming interrupted PNG batches."""
+
+    @pytest.mark.parametrize("workers", [1, 2])
+    def test_resume_skips_written_pages(self, tmp_path, long_pdf, workers):
+        """Pages already written are kept and only the rest is converted."""
+        other = build_sample_pdf(tmp_path / "other.pdf", page_count=3)
+        files = [long_pdf, other]
+        output_dir = tmp_path / "png"
+        config = ConversionConfig(scale_factor=0.5, checkpoint=True, max_workers=workers)
+
+        service = ImageConversionService(config)
+        service.set_progress_callback(interrupt_after(1))
+        with pytest.raises(Interrupted):
+            service.convert_batch(files, output_dir)
+        journal_dir = checkpoint_dir(output_dir, "png")
+        assert journal_dir.exists()
+        written = {path: path.stat().st_mtime_ns for path in output_dir.glob("*.png")}
+
+        resumed = ImageConversionService(
+            ConversionConfig(scale_factor=0.5, resume=True, max_workers=workers)
+        )
+        batch = resumed.convert_batch(files, output_dir)
+
+        assert all(result.succeeded for result in batch.files)
+        assert [len(result.output_files) for result in batch.files] == [6, 3]
+        assert batch.stats.resumed_pages > 0
+        assert batch.stats.pages == 9
+        # Resumed pages are not written again
+        unchanged = sum(1 for path, mtime in written.items() if path.stat().st_mtime_ns == mtime)
+        assert unchanged >= batch.stats.resumed_pages
+        assert not journal_dir.exists()
+
+    def test_deleted_output_is_converted_again(self, tmp_path, long_pdf):
+        """A recorded page whose file is gone is rendered again."""
+        output_dir = tmp_path / "png"
+        service = ImageConversionService(ConversionConfig(scale_factor=0.5, checkpoint=True))
+        service.set_progress_callback(interrupt_after(6))
+        with pytest.raises(Interrupted):
+            service.convert_batch([long_pdf], output_dir)
+        (output_dir / "long_page_002.png").unlink()
+
+        resumed = ImageConversionService(ConversionConfig(scale_factor=0.5, resume=True))
+        batch = resumed.convert_batch([long_pdf], output_dir)
+
+        assert batch.files[0].succeeded
+        assert (output_dir / "long_page_002.png").exists()
+        assert batch.stats.resumed_pages == 5
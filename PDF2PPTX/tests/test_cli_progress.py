@@ -0,0 +1,111 @@
+"""
+Unit tests for page-based CLI progress reporting.
+"""
+
+import io
+import json
+
+import pytest
+
+from src.cli.utils import CLIFormatter, CLIProgressTracker
+from src.core.image_converter import ImageConversionService
+from src.core.pdf_processor import ConversionConfig
+from src.core.powerpoint_converter import PowerPointConversionService
+
+from tests.conftest import build_sample_pdf
+
+
+def _events(stream):
+    return [json.loads(line) for line in stream.getvalue().splitlines()]
+
+
+class TestCLIProgressTracker:
+    """Test progress totals, rates and JSON events."""
+
+    def test_json_events(self):
+        """JSON mode writes one parseable event per line and nothing to the formatter."""
+        events = io.StringIO()
+        console = io.StringIO()
+        tracker = CLIProgressTracker(
+            CLIFormatter(use_colors=False, output=console), 10, mode="json", output=events, interval=0
+        )
+
+        tracker.start(files=2)
+        tracker.update(4, 4096)
+        tracker.file_done("a.pdf", True, 4)
+        tracker.update(6, 2048)
+        tracker.complete()
+
+        kinds = [event["event"] for event in _events(events)]
+        assert kinds == ["start", "progress", "file_done", "progress", "end"]
+        last = _events(events)[-2]
+        assert last["pages"] == 10 and last["total_pages"] == 10
+        assert last["bytes_written"] == 6144
+        assert last["eta_seconds"] is None
+        assert console.getvalue() == ""
+
+    def test_eta_from_page_rate(self):
+        """The ETA extrapolates the page rate over the remaining pages."""
+        tracker = CLIProgressTracker(CLIFormatter(output=io.StringIO()), 100, mode="none")
+        tracker.start_time -= 10.0
+        tracker.update(25, 5 * 1024 * 1024)
+
+        pages_per_second, mb_per_second, eta = tracker.rates()
+
+        assert pages_per_second == pytest.approx(2.5, rel=0.05)
+        assert mb_per_second == pytest.approx(0.5, rel=0.05)
+        assert eta == pytest.approx(30.0, rel=0.05)
+
+    def test_unknown_mode_rejected(self):
+        """Only bar, json and none are accepted."""
+        with pytest.raises(ValueError):
+            CLIProgressTracker(CLIFormatter(), 1, mode="xml")
+
+
+class TestConverterProgress:
+    """Test that converters report page and byte increments."""
+
+    def test_batch_png_reports_all_pages(self, tmp_path):
+        """Batch PNG conversion reports every page and the bytes written."""
+        files = [
+            build_sample_pdf(tmp_path / "a.pdf", page_count=3),
+            build_sample_pdf(tmp_path / "b.pdf", page_count=2)
+        ]
+        updates = []
+        service = ImageConversionService(ConversionConfig())
+        service.set_progress_callback(lambda pages, written: updates.append((pages, written)))
+
+        batch = service.convert_batch(files, tmp_path / "out")
+
+        assert sum(pages for pages, _ in updates) == 5
+        written = sum(path.stat().st_size for result in batch.files for path in result.output_files)
+        assert sum(size for _, size in updates) == written
+
+    def test_pptx_reports_one_page_per_slide(self, tmp_path, sample_pdf):
+        """PowerPoint conversion reports each slide with its image size."""
+        updates = []
+        service = PowerPointConversionService(ConversionConfig())
+        service.set_progress_callback(lambda pages, written: updates.append((pages, written)))
+
+        service.convert_pdf_to_powerpoint(sample_pdf, tmp_path / "out")
+
+        assert [pages for pages, _ in updates] == [1, 1, 1, 1]
+        assert all(size > 0 for _, size in updates)
+
+    @pytest.mark.parametrize("streaming", [False, True])
+    def test_one_argument_callback_still_works(self, tmp_path, sample_pdf, streaming):
+        """Callbacks written for the older one-argument form receive the pages finished."""
+        updates = []
+        service = PowerPointConversionService(ConversionConfig(streaming_output=streaming))
+        service.set_progress_callback(updates.append)
+
+        service.convert_pdf_to_powerpoint(sample_pdf, tmp_path / "out")
+
+        assert updates == [1, 1, 1, 1]
+
+    def test_callback_without_arguments_rejected(self):
+        """A callback taking no page count fails when it is set, not mid-conversion."""
+        service = ImageConversionService(ConversionConfig())
+
+        with pytest.raises(TypeError):
+            service.set_progress_callback(lambda: None)
@@ -0,0 +1,153 @@
+"""
+Unit tests for content trimming and blank page handling.
+"""
+
+from io import BytesIO
+
+import fitz
+import pytest
+from PIL import Image
+from pptx import Presentation
+
+from src.core.batch_scheduler import BatchImageScheduler
+from src.core.content_trim import content_rect, describe_content
+from src.core.pdf_processor import ConversionConfig, mm_to_emu, validate_conversion_config
+from src.core.powerpoint_converter import PowerPointConversionService
+from src.core.render_pipeline import ENCODING_BLANK, PageRenderPipeline, render_page
+
+
+def _pixels(data: bytes) -> Image.Image:
+    return Image.open(BytesIO(data)).convert("RGB")
+
+
+def _build_pdf(path, blank_pages=(), rotation=0):
+    """Four A4 pages with a small block of content each, except the blank ones."""
+    doc = fitz.open()
+    for index in range(4):
+        page = doc.new_page(width=595, height=842)
+        if index not in blank_pages:
+            page.draw_rect(fitz.Rect(100, 150, 300, 250), color=None, fill=(0.2, 0.4, 0.8))
+            page.insert_text((110, 200), f"Page {index + 1}", fontsize=18)
+        page.set_rotation(rotation)
+    doc.save(str(path))
+    doc.close()
+    return path
+
+
+class TestContentRect:
+    """Test content bounding boxes."""
+
+    @pytest.mark.parametrize("rotation", [0, 90, 180, 270])
+    def test_matches_rendered_content(self, tmp_path, rotation):
+        """The content box is where the rendered page has non-white pixels."""
+        with fitz.open(_build_pdf(tmp_path / "doc.pdf", rotation=rotation)) as doc:
+            page = doc[0]
+            image = _pixels(page.get_pixmap().tobytes("png"))
+            inked = Image.eval(image, lambda value: 255 - value).getbbox()
+
+            assert fitz.Rect(inked) in content_rect(page) + (-1, -1, 1, 1)
+            assert content_rect(page) in fitz.Rect(inked) + (-1, -1, 1, 1)
+
+    def test_blank_and_invisible_text(self):
+        doc = fitz.open()
+        assert content_rect(doc.new_page()) is None
+
+        ocr_only = doc.new_page()
+        ocr_only.insert_text((100, 100), "invisible OCR layer", render_mode=3)
+        assert content_rect(ocr_only) is None
+
+
+class TestDescribeContent:
+    """Test page descriptions of trimmed pages."""
+
+    def test_trimmed_size_and_rotation(self, tmp_path):
+        with fitz.open(_build_pdf(tmp_path / "doc.pdf")) as doc:
+            info = describe_content(doc[0], ConversionConfig(trim_margins=True, trim_margin_pt=10))
+
+        assert info.clip == (90.0, 140.0, 310.0, 260.0)
+        assert info.original_size == (220.0, 120.0)
+        # Wide content on a portrait page is no longer rotated
+        assert not info.was_rotated
+        assert info.final_size == (220.0, 120.0)
+
+    def test_full_page_content_is_not_trimmed(self):
+        doc = fitz.open()
+        page = doc.new_page(width=595, height=842)
+        page.draw_rect(fitz.Rect(5, 5, 590, 837), color=(0, 0, 0))
+
+        assert describe_content(page, ConversionConfig(trim_margins=True)).clip is None
+
+    def test_disabled_by_default(self, tmp_path):
+        with fitz.open(_build_pdf(tmp_path / "doc.pdf", blank_pages=[0])) as doc:
+            info = describe_content(doc[0], ConversionConfig())
+
+        assert (info.clip, info.blank) == (None, False)
+
+    def test_unknown_blank_policy_rejected(self):
+        with pytest.raises(ValueError, match="Blank page policy must be one of"):
+            validate_conversion_config(ConversionConfig(blank_pages="drop"))
+
+
+class TestTrimmedRendering:
+    """Test rendering of trimmed and blank pages."""
+
+    def test_trimmed_render_is_crop_of_full_render(self, tmp_path):
+        config = ConversionConfig(scale_factor=2.0, auto_rotate=False)
+        trimmed_config = ConversionConfig(scale_factor=2.0, auto_rotate=False, trim_margins=True, trim_margin_pt=10)
+        with fitz.open(_build_pdf(tmp_path / "doc.pdf")) as doc:
+            full = render_page(doc[0], config)
+            trimmed = render_page(doc[0], trimmed_config)
+
+        assert trimmed.page_info.clip is not None
+        assert _pixels(trimmed.image_bytes).tobytes() == _pixels(full.image_bytes).crop((180, 280, 620, 520)).tobytes()
+        assert trimmed.raw_bytes < full.raw_bytes / 10
+
+    def test_collapsed_blank_pages(self, tmp_path):
+        pdf_path = _build_pdf(tmp_path / "doc.pdf", blank_pages=[1, 3])
+        config = ConversionConfig(blank_pages="collapse")
+
+        with PageRenderPipeline(config) as pipeline:
+            pages = list(pipeline.iter_pages(pdf_path))
+
+        assert [page.encoding for page in pages] == ["png", ENCODING_BLANK, "png", ENCODING_BLANK]
+        assert _pixels(pages[1].image_bytes).size == (16, 11)  # landscape after auto-rotation
+        assert "2 blank collapsed" in pipeline.stats.summary()
+
+    def test_skipped_blank_pages(self, tmp_path):
+        pdf_path = _build_pdf(tmp_path / "doc.pdf", blank_pages=[1, 3])
+        config = ConversionConfig(blank_pages="skip", trim_margins=True, max_workers=2)
+
+        with PageRenderPipeline(config) as pipeline:
+            pages = list(pipeline.iter_pages(pdf_path))
+
+        assert [page.page_number for page in pages] == [1, 3]
+        assert pipeline.stats.skipped_pages == 2
+        assert pipeline.stats.trimmed_pages == 2
+        assert "2 trimmed to content, 2 blank skipped" in pipeline.stats.summary()
+
+    def test_batch_skips_blank_pages(self, tmp_path):
+        pdf_path = _build_pdf(tmp_path / "doc.pdf", blank_pages=[2])
+        config = ConversionConfig(blank_pages="skip", scale_factor=1.0)
+
+        batch = BatchImageScheduler(config, chunk_pages=2).run([pdf_path], tmp_path / "png")
+
+        assert [path.name for path in batch.files[0].output_files] == [
+            "doc_page_001.png", "doc_page_002.png", "doc_page_004.png"
+        ]
+        assert batch.stats.skipped_pages == 1
+
+
+class TestTrimmedSlides:
+    """Test slides built from trimmed pages."""
+
+    def test_trimmed_content_fills_slide(self, tmp_path):
+        pdf_path = _build_pdf(tmp_path / "doc.pdf", blank_pages=[3])
+        config = ConversionConfig(trim_margins=True, blank_pages="skip", render_mode="fitted")
+
+        output = PowerPointConversionService(config).convert_pdf_to_powerpoint(pdf_path, tmp_path / "out")
+
+        presentation = Presentation(str(output))
+        assert len(presentation.slides) == 3
+        picture = presentation.slides[0].shapes[0]
+        # Content is 220 x 120 pt; fitted to 90% of the 420 mm slide width
+        assert abs(picture.width - int(mm_to_emu(420) * 0.9)) <= 1
@@ -0,0 +1,159 @@
+"""
+Unit tests for fault-isolated page rendering.
+"""
+
+import os
+import sys
+import time
+
+import pytest
+from pptx import Presentation
+
+from src.core.fault_isolation import (
+    ACTION_DEGRADED,
+    ACTION_PLACEHOLDER,
+    REASON_CRASH,
+    REASON_ERROR,
+    REASON_MEMORY,
+    REASON_TIMEOUT,
+    IsolatedRenderer,
+    IsolatedTask,
+    PageRenderError,
+    RenderWorkerPool
+)
+from src.core.image_converter import ImageConversionService
+from src.core.pdf_processor import ConversionConfig
+from src.core.powerpoint_converter import PowerPointConversionService
+from src.core.render_pipeline import ENCODING_PLACEHOLDER, PageRenderPipeline
+
+from tests.conftest import build_sample_pdf
+
+linux_only = pytest.mark.skipif(not sys.platform.startswith("linux"), reason="needs RLIMIT_AS and /proc")
+
+
+def _page_job(page_number: int, behaviour: str) -> str:
+    """Worker stand-in for rendering one page."""
+    if behaviour == "fail":
+        raise PageRenderError(f"page {page_number} is broken")
+    if behaviour == "hang":
+        time.sleep(60)
+    if behaviour == "crash":
+        os._exit(1)
+    if behaviour == "bug":
+        raise ValueError("not a page problem")
+    return f"page {page_number}"
+
+
+def _task(page_number: int, behaviour: str, degraded: str = "ok") -> IsolatedTask:
+    return IsolatedTask(
+        "doc.pdf", page_number,
+        call=lambda level: (_page_job, page_number, behaviour if level == 0 else degraded),
+        annotate=lambda result, incident: (result, incident),
+        fallback=lambda incident: ("placeholder", incident)
+    )
+
+
+def _run(tasks, workers: int = 2, page_timeout: float = 0.0):
+    with RenderWorkerPool(workers) as pool:
+        renderer = IsolatedRenderer(pool, page_timeout)
+        futures = [renderer.submit(task) for task in tasks]
+        return [renderer.result(future) for future in futures], pool.generation
+
+
+class TestIsolatedRenderer:
+    """Test retry, timeout and crash handling on the worker pool."""
+
+    def test_healthy_pages_pass_through(self):
+        results, generation = _run([_task(n, "ok") for n in range(1, 6)])
+        assert results == [f"page {n}" for n in range(1, 6)]
+        assert generation == 0
+
+    def test_failed_page_is_degraded(self):
+        results, _ = _run([_task(1, "ok"), _task(2, "fail"), _task(3, "ok")])
+
+        assert results[0] == "page 1" and results[2] == "page 3"
+        value, incident = results[1]
+        assert value == "page 2"
+        assert (incident.page_number, incident.reason, incident.action) == (2, REASON_ERROR, ACTION_DEGRADED)
+
+    def test_page_failing_twice_gets_placeholder(self):
+        results, _ = _run([_task(1, "fail", degraded="fail")])
+        value, incident = results[0]
+        assert value == "placeholder"
+        assert incident.action == ACTION_PLACEHOLDER
+
+    def test_hanging_page_times_out(self):
+        """A hung page is abandoned; pages running beside it are redone, not degraded."""
+        start = time.monotonic()
+        results, generation = _run(
+            [_task(1, "hang"), _task(2, "ok"), _task(3, "ok")], page_timeout=0.5
+        )
+
+        assert time.monotonic() - start < 30
+        assert results[1:] == ["page 2", "page 3"]
+        assert results[0][1].reason == REASON_TIMEOUT
+        assert generation >= 1
+
+    def test_crashing_page_is_identified(self):
+        """Only the page that kills its worker is degraded."""
+        tasks = [_task(1, "ok"), _task(2, "crash"), _task(3, "ok"), _task(4, "ok")]
+        results, _ = _run(tasks)
+
+        assert [r for r in results if isinstance(r, str)] == ["page 1", "page 3", "page 4"]
+        value, incident = results[1]
+        assert value == "page 2"
+        assert incident.reason == REASON_CRASH
+
+    def test_other_errors_are_not_retried(self):
+        with RenderWorkerPool(1) as pool:
+            renderer = IsolatedRenderer(pool)
+            future = renderer.submit(_task(1, "bug"))
+            with pytest.raises(ValueError):
+                renderer.result(future)
+
+
+@linux_only
+class TestMemoryLimit:
+    """Test pages exceeding the worker memory limit."""
+
+    def test_page_over_budget_is_rendered_smaller(self, tmp_path):
+        """A page whose pixmap exceeds the limit is retried at half scale."""
+        pdf_path = build_sample_pdf(tmp_path / "big.pdf", page_count=2)
+        # Rendering and encoding an A4 page peaks near 575 MB at scale 10, 145 MB at 5
+        config = ConversionConfig(scale_factor=10, page_memory_mb=300)
+
+        with PageRenderPipeline(config) as pipeline:
+            pages = list(pipeline.iter_pages(pdf_path))
+
+        assert [page.page_number for page in pages] == [1, 2]
+        assert all(page.incident.reason == REASON_MEMORY for page in pages)
+        assert all(page.incident.action == ACTION_DEGRADED for page in pages)
+        assert len(pipeline.stats.incidents) == 2
+        assert "2 page incident(s)" in pipeline.stats.summary()
+
+    def test_pptx_gets_placeholder_slides(self, tmp_path):
+        """Pages that cannot be rendered at all become placeholder slides."""
+        pdf_path = build_sample_pdf(tmp_path / "big.pdf", page_count=3)
+        config = ConversionConfig(scale_factor=10, page_memory_mb=20)
+        service = PowerPointConversionService(config)
+
+        output = service.convert_pdf_to_powerpoint(pdf_path, tmp_path / "out")
+
+        assert len(Presentation(str(output)).slides) == 3
+        stats = service.last_pipeline_stats
+        assert stats.encoding_counts == {ENCODING_PLACEHOLDER: 3}
+        assert [incident.action for incident in stats.incidents] == [ACTION_PLACEHOLDER] * 3
+
+    def test_png_batch_keeps_going(self, tmp_path):
+        """Failed pages do not fail their file; every page gets an image."""
+        files = [
+            build_sample_pdf(tmp_path / "a.pdf", page_count=2),
+            build_sample_pdf(tmp_path / "b.pdf", page_count=1),
+        ]
+        config = ConversionConfig(scale_factor=10, page_memory_mb=20, checkpoint=True)
+
+        batch = ImageConversionService(config).convert_batch(files, tmp_path / "png")
+
+        assert all(result.succeeded for result in batch.files)
+        assert [len(result.output_files) for result in batch.files] == [2, 1]
+        assert len(batch.stats.incidents) == 3
@@ -0,0 +1,156 @@
+"""
+Unit tests for adaptive page image encoding.
+"""
+
+import io
+import pytest
+import fitz
+from PIL import Image
+
+from src.config import ConfigManager
+from src.core.pdf_processor import ConversionConfig, validate_conversion_config
+from src.core.image_encoding import (
+    PNG_PROFILES,
+    PixmapAnalysis,
+    analyze_pixmap,
+    choose_encoding,
+    detect_image_format,
+    encode_pixmap,
+    encode_png,
+    reoptimize_png
+)
+from src.core.render_pipeline import _cache_format
+
+
+def _pixmap_from_image(image: Image.Image) -> fitz.Pixmap:
+    image = image.convert("RGB")
+    return fitz.Pixmap(fitz.csRGB, image.width, image.height, image.tobytes(), False)
+
+
+@pytest.fixture
+def photo_pixmap() -> fitz.Pixmap:
+    """A noisy, colorful pixmap standing in for photographic content."""
+    gradient = Image.linear_gradient("L").resize((400, 300))
+    noise = Image.effect_noise((400, 300), 40)
+    return _pixmap_from_image(Image.merge("RGB", [gradient, noise, Image.blend(gradient, noise, 0.5)]))
+
+
+@pytest.fixture
+def text_pixmap() -> fitz.Pixmap:
+    """A rendered black-on-white text page."""
+    doc = fitz.open()
+    page = doc.new_page(width=300, height=200)
+    page.insert_text((20, 50), "Grayscale text", fontsize=20)
+    return page.get_pixmap()
+
+
+class TestEncodingChoice:
+    """Test encoding selection rules."""
+
+    def test_grayscale_wins(self):
+        """Grayscale pages use grayscale PNG."""
+        assert choose_encoding(PixmapAnalysis(257, True, 7.5)) == "grayscale"
+
+    def test_few_colors_use_palette(self):
+        """Pages with at most 256 colors use a palette PNG."""
+        assert choose_encoding(PixmapAnalysis(12, False, 1.0)) == "palette"
+
+    def test_high_entropy_uses_jpeg(self):
+        """Photographic pages use JPEG."""
+        assert choose_encoding(PixmapAnalysis(257, False, 7.0)) == "jpeg"
+
+    def test_moderate_entropy_keeps_png(self):
+        """Rich but non-photographic pages stay lossless."""
+        assert choose_encoding(PixmapAnalysis(257, False, 4.5)) == "png"
+
+
+class TestEncodePixmap:
+    """Test pixmap encoders."""
+
+    def test_text_page_is_grayscale(self, text_pixmap):
+        """Black text on white is detected as grayscale."""
+        assert analyze_pixmap(text_pixmap).is_grayscale is True
+
+        data, image_format, encoding = encode_pixmap(text_pixmap, "auto")
+
+        assert (image_format, encoding) == ("png", "grayscale")
+        assert Image.open(io.BytesIO(data)).mode == "L"
+
+    def test_photo_page_is_jpeg(self, photo_pixmap):
+        """Noisy color content is encoded as JPEG and is smaller than PNG."""
+        data, image_format, encoding = encode_pixmap(photo_pixmap, "auto", jpeg_quality=80)
+
+        assert (image_format, encoding) == ("jpeg", "jpeg")
+        assert detect_image_format(data) == "jpeg"
+        assert len(data) < len(photo_pixmap.tobytes("png"))
+
+    def test_png_policy_matches_mupdf_output(self, photo_pixmap):
+        """The default policy keeps the previous lossless output byte for byte."""
+        data, image_format, encoding = encode_pixmap(photo_pixmap, "png")
+
+        assert data == photo_pixmap.tobytes("png")
+        assert (image_format, encoding) == ("png", "png")
+
+    def test_palette_is_lossless_for_few_colors(self):
+        """Palette encoding keeps every pixel when there are few colors."""
+        image = Image.new("RGB", (64, 64), (255, 255, 255))
+        image.paste((200, 30, 30), (10, 10, 40, 40))
+        pixmap = _pixmap_from_image(image)
+
+        data, image_format, encoding = encode_pixmap(pixmap, "palette")
+
+        decoded = Image.open(io.BytesIO(data)).convert("RGB")
+        assert encoding == "palette"
+        assert decoded.tobytes() == image.tobytes()
+
+
+class TestPNGProfiles:
+    """Test the PNG encoder profiles."""
+
+    @pytest.mark.parametrize("profile", PNG_PROFILES)
+    @pytest.mark.parametrize("policy", ["png", "grayscale", "palette"])
+    def test_profiles_keep_pixels(self, text_pixmap, profile, policy):
+        """A profile changes the file size, never the decoded image."""
+        reference, _, _ = encode_pixmap(text_pixmap, policy)
+        data, image_format, _ = encode_pixmap(text_pixmap, policy, png_profile=profile)
+
+        assert image_format == "png"
+        assert Image.open(io.BytesIO(data)).tobytes() == Image.open(io.BytesIO(reference)).tobytes()
+
+    def test_size_tradeoff(self, photo_pixmap):
+        sizes = {profile: len(encode_png(photo_pixmap, profile)) for profile in PNG_PROFILES}
+        assert sizes["fastest"] > sizes["balanced"] >= sizes["smallest"]
+
+    def test_reoptimize_is_lossless_and_never_larger(self, text_pixmap, photo_pixmap):
+        for pixmap in (text_pixmap, photo_pixmap):
+            data = encode_png(pixmap, "fastest")
+            optimized = reoptimize_png(data)
+            assert len(optimized) <= len(data)
+            decoded = Image.open(io.BytesIO(optimized)).convert("RGB")
+            assert decoded.tobytes() == Image.open(io.BytesIO(data)).tobytes()
+        # A few shades of gray fit an exact palette
+        assert len(reoptimize_png(encode_png(text_pixmap, "fastest"))) < len(encode_png(text_pixmap, "smallest"))
+
+    def test_profile_is_part_of_cache_key(self):
+        assert _cache_format("png", ConversionConfig()) == "png"
+        assert _cache_format("png", ConversionConfig(png_profile="fastest")) == "png:fastest"
+        assert _cache_format("jpeg", ConversionConfig(png_profile="fastest")) == "jpeg:q85"
+
+    def test_unknown_profile_is_rejected(self):
+        with pytest.raises(ValueError, match="PNG profile must be one of"):
+            validate_conversion_config(ConversionConfig(png_profile="tiny"))
+
+
+class TestEncodingConfiguration:
+    """Test encoding configuration and presets."""
+
+    def test_unknown_policy_is_rejected(self):
+        """Unknown encoding policies fail validation."""
+        with pytest.raises(ValueError, match="Image encoding must be one of"):
+            validate_conversion_config(ConversionConfig(image_encoding="webp"))
+
+    @pytest.mark.parametrize("preset", ["high_quality", "balanced", "fast", "presentation", "compact"])
+    def test_presets_build_valid_configs(self, preset, tmp_path):
+        """Every preset maps onto a valid ConversionConfig."""
+        config = ConversionConfig(**ConfigManager(tmp_path).get_preset_config(preset))
+        validate_conversion_config(config)
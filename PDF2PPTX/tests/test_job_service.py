@@ -0,0 +1,210 @@
+"""
+Unit tests for the conversion job service and its HTTP API.
+"""
+
+import json
+import threading
+import time
+import urllib.error
+import urllib.request
+
+import pytest
+from pptx import Presentation
+
+from src.cli.server import JobServer
+from src.core.job_service import ConversionJobService, JobSpec
+from src.core.pdf_processor import ConversionConfig
+
+from tests.conftest import build_sample_pdf
+
+
+def wait_for(job, timeout: float = 60.0):
+    """Block until a job has finished and return its events."""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        events, finished = job.wait_events(len(job.events), 0.5)
+        if finished:
+            return job.events
+    raise AssertionError(f"job {job.job_id} did not finish: {job.status}")
+
+
+@pytest.fixture
+def service(tmp_path):
+    config = ConversionConfig(scale_factor=0.5, max_workers=2)
+    with ConversionJobService(config, tmp_path / "jobs") as service:
+        yield service
+
+
+def _spec(fmt, files, **extra):
+    return JobSpec.from_dict(dict({"format": fmt, "files": [str(f) for f in files]}, **extra))
+
+
+class TestJobSpec:
+    """Test job request validation."""
+
+    def test_valid_request(self, sample_pdf):
+        spec = _spec("pptx", [sample_pdf], output="deck.pptx", options={"image_encoding": "auto"})
+        assert spec.pdf_files == [sample_pdf]
+        assert spec.options == {"image_encoding": "auto"}
+
+    @pytest.mark.parametrize("document", [
+        {"format": "gif", "files": []},
+        {"format": "png", "files": []},
+        {"format": "png", "files": ["missing.pdf"]},
+        {"format": "pptx", "files": None, "options": {"max_workers": 8}},
+    ])
+    def test_invalid_requests_rejected(self, document):
+        with pytest.raises(ValueError):
+            JobSpec.from_dict(document)
+
+    def test_service_owned_options_rejected(self, sample_pdf):
+        """Jobs cannot resize the shared pool or redirect the cache."""
+        for option in ("max_workers", "cache_dir", "metadata_index"):
+            with pytest.raises(ValueError, match="Unknown options"):
+                _spec("png", [sample_pdf], options={option: 1})
+
+    def test_output_name_must_be_plain(self, sample_pdf):
+        with pytest.raises(ValueError):
+            _spec("pptx", [sample_pdf], output="../escape.pptx")
+
+
+class TestConversionJobService:
+    """Test jobs on the shared warm pool."""
+
+    def test_png_job(self, service, tmp_path):
+        """A PNG job writes every page and reports progress events in order."""
+        files = [build_sample_pdf(tmp_path / "a.pdf", 3), build_sample_pdf(tmp_path / "b.pdf", 2)]
+        job = service.submit(_spec("png", files))
+        events = wait_for(job)
+
+        assert job.status == "succeeded"
+        assert len(job.outputs) == 5 and all(path.exists() for path in job.outputs)
+        assert (job.total_pages, job.pages_done) == (5, 5)
+        statuses = [event["status"] for event in events if event["event"] == "status"]
+        assert statuses == ["queued", "running", "succeeded"]
+        assert [event for event in events if event["event"] == "progress"][-1]["pages_done"] == 5
+
+    def test_pptx_job_with_options(self, service, tmp_path, sample_pdf):
+        """Job options override the service settings for that job only."""
+        job = service.submit(_spec(
+            "pptx", [sample_pdf], output_dir=str(tmp_path / "decks"), output="deck.pptx",
+            options={"streaming_output": True}
+        ))
+        wait_for(job)
+
+        assert job.status == "succeeded"
+        assert job.outputs == [tmp_path / "decks" / "deck.pptx"]
+        assert job.config.streaming_output and not service.base_config.streaming_output
+        assert len(Presentation(str(job.outputs[0])).slides) == 4
+
+    def test_png_and_pptx_job(self, service, tmp_path, sample_pdf):
+        """A png,pptx job writes the page images and the deck from one render."""
+        job = service.submit(_spec("png,pptx", [sample_pdf], output_dir=str(tmp_path / "both")))
+        wait_for(job)
+
+        assert job.status == "succeeded"
+        assert [path.name for path in job.outputs] == [
+            "sample_page_001.png", "sample_page_002.png", "sample_page_003.png", "sample_page_004.png",
+            "sample.pptx"
+        ]
+        assert all(path.exists() for path in job.outputs)
+        assert job.pages_done == 4
+
+    def test_rewritten_file_is_reopened(self, service, tmp_path):
+        """Warm workers do not serve pages of a file replaced between jobs."""
+        pdf_path = build_sample_pdf(tmp_path / "doc.pdf", 2)
+        wait_for(service.submit(_spec("png", [pdf_path], output_dir=str(tmp_path / "first"))))
+        build_sample_pdf(pdf_path, 5)
+
+        job = service.submit(_spec("png", [pdf_path], output_dir=str(tmp_path / "second")))
+        wait_for(job)
+
+        assert job.status == "succeeded"
+        assert len(job.outputs) == 5
+
+    def test_failed_file_fails_job(self, service, tmp_path, sample_pdf):
+        broken = tmp_path / "broken.pdf"
+        broken.write_bytes(b"not a pdf")
+        job = service.submit(_spec("png", [sample_pdf, broken]))
+        wait_for(job)
+
+        assert job.status == "failed"
+        assert list(job.failed_files) == [str(broken)]
+        assert len(job.outputs) == 4
+
+    def test_cancel_queued_job(self, service, tmp_path):
+        """A queued job behind a running one is cancelled without running."""
+        long_pdf = build_sample_pdf(tmp_path / "long.pdf", 12)
+        first = service.submit(_spec("png", [long_pdf]))
+        second = service.submit(_spec("png", [long_pdf]))
+        service.cancel(second.job_id)
+
+        wait_for(first)
+        wait_for(second)
+        assert first.status == "succeeded"
+        assert second.status == "cancelled"
+        assert second.started_at is None
+
+    def test_metrics(self, service, sample_pdf):
+        wait_for(service.submit(_spec("png", [sample_pdf])))
+        metrics = service.metrics()
+
+        assert metrics["workers"] == 2
+        assert metrics["jobs"]["succeeded"] == 1
+        assert metrics["jobs"]["queued"] == metrics["jobs"]["running"] == 0
+        assert metrics["pages"] == 4
+
+
+class TestJobServer:
+    """Test the HTTP API end to end on localhost."""
+
+    @pytest.fixture
+    def server(self, service):
+        server = JobServer(service, port=0)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        yield server
+        server.shutdown()
+        server.server_close()
+
+    def _request(self, server, path, document=None, method=None):
+        data = json.dumps(document).encode("utf-8") if document is not None else None
+        request = urllib.request.Request(server.url + path, data=data, method=method)
+        with urllib.request.urlopen(request, timeout=60) as response:
+            return response.status, response.read()
+
+    def test_submit_stream_and_download(self, server, sample_pdf):
+        """A job is queued, followed to completion and its output downloaded."""
+        status, body = self._request(server, "/jobs", {"format": "pptx", "files": [str(sample_pdf)]})
+        assert status == 202
+        job_id = json.loads(body)["id"]
+
+        _, stream = self._request(server, f"/jobs/{job_id}/events")
+        events = [json.loads(line) for line in stream.splitlines()]
+        assert events[-1] == dict(events[-1], event="status", status="succeeded")
+
+        _, body = self._request(server, f"/jobs/{job_id}")
+        document = json.loads(body)
+        assert document["outputs"] == ["sample.pptx"]
+
+        _, data = self._request(server, f"/jobs/{job_id}/files/sample.pptx")
+        assert data[:2] == b"PK"
+
+        _, body = self._request(server, "/metrics")
+        assert json.loads(body)["jobs"]["succeeded"] == 1
+
+    def test_errors(self, server):
+        with pytest.raises(urllib.error.HTTPError) as error:
+            self._request(server, "/jobs", {"format": "png", "files": ["missing.pdf"]})
+        assert error.value.code == 400
+
+        with pytest.raises(urllib.error.HTTPError) as error:
+            self._request(server, "/jobs/nope")
+        assert error.value.code == 404
+
+        with pytest.raises(urllib.error.HTTPError) as error:
+            self._request(server, "/jobs/nope", method="DELETE")
+        assert error.value.code == 404
+
+    def test_binds_loopback_only(self, server):
+        assert server.server_address[0] == "127.0.0.1"
@@ -0,0 +1,79 @@
+"""
+Unit tests for the precompiled label template.
+"""
+
+import pytest
+from lxml import etree
+from pptx import Presentation
+
+from src.core.label_template import LABEL_TEXT_PLACEHOLDER, LabelTemplate
+from src.core.pdf_processor import ConversionConfig, mm_to_emu
+from src.core.powerpoint_converter import PowerPointConversionService
+
+
+def _new_slide(presentation):
+    return presentation.slides.add_slide(presentation.slide_layouts[6])
+
+
+@pytest.fixture
+def service():
+    return PowerPointConversionService(ConversionConfig())
+
+
+@pytest.fixture
+def presentation():
+    presentation = Presentation()
+    presentation.slide_width = mm_to_emu(420.0)
+    presentation.slide_height = mm_to_emu(297.0)
+    return presentation
+
+
+class TestLabelTemplate:
+    """Test that compiled labels match labels built shape by shape."""
+
+    def test_template_matches_direct_label(self, service, presentation):
+        """Stamped labels serialize exactly like _add_filename_label output."""
+        direct = _new_slide(presentation)
+        direct.shapes.add_textbox(0, 0, 10, 10)  # stands in for the page picture
+        service._add_filename_label(direct, "doc_page_001", presentation)
+
+        stamped = _new_slide(presentation)
+        stamped.shapes.add_textbox(0, 0, 10, 10)
+        template = service._get_label_template(presentation.slide_width, presentation.slide_height)
+        template.add_to(stamped, "doc_page_001")
+
+        assert etree.tostring(stamped.shapes[-1]._element) == etree.tostring(direct.shapes[-1]._element)
+
+    def test_template_is_reusable(self, service, presentation):
+        """Each slide gets its own text and the template keeps its placeholder."""
+        template = service._get_label_template(presentation.slide_width, presentation.slide_height)
+        for number in (1, 2):
+            template.add_to(_new_slide(presentation), f"doc_page_{number:03d}")
+
+        texts = [slide.shapes[-1].text_frame.text for slide in presentation.slides]
+        assert texts == ["doc_page_001", "doc_page_002"]
+        assert LABEL_TEXT_PLACEHOLDER in template.to_xml(LABEL_TEXT_PLACEHOLDER)
+
+    def test_to_xml_escapes_text(self, service, presentation):
+        """Serialized fragments escape XML special characters."""
+        template = service._get_label_template(presentation.slide_width, presentation.slide_height)
+
+        xml = template.to_xml("a<b>&c")
+
+        assert "a&lt;b&gt;&amp;c" in xml
+        assert 'id="3"' in xml
+
+    def test_compiled_once_per_slide_size(self, service):
+        """The template is cached until the slide size changes."""
+        first = service._get_label_template(9144000, 6858000)
+
+        assert service._get_label_template(9144000, 6858000) is first
+        assert service._get_label_template(12192000, 6858000) is not first
+
+    def test_shape_without_placeholder_rejected(self, presentation):
+        """Compiling a shape that lacks the placeholder text fails."""
+        shape = _new_slide(presentation).shapes.add_textbox(0, 0, 10, 10)
+        shape.text_frame.text = "fixed"
+
+        with pytest.raises(ValueError):
+            LabelTemplate(shape._element)
@@ -0,0 +1,128 @@
+"""
+Unit tests for memory-budgeted rendering.
+"""
+
+import pytest
+
+from src.core.batch_scheduler import BatchImageScheduler, plan_batch
+import fitz
+
+from src.core.memory_budget import MemoryBudget, estimate_page_bytes, estimate_rendered_page
+from src.core.pdf_processor import ConversionConfig
+from src.core.render_pipeline import PageRenderPipeline
+
+from tests.conftest import build_sample_pdf
+
+# Estimate of one A4 page of the sample PDF at scale 1 (RGB, encoder overhead)
+A4_BYTES = 595 * 842 * 3 * 2
+
+
+class TestEstimate:
+    """Test page footprint estimates."""
+
+    def test_scale_mode(self):
+        assert estimate_page_bytes(595, 842, ConversionConfig(scale_factor=1.0)) == A4_BYTES
+        assert estimate_page_bytes(595, 842, ConversionConfig(scale_factor=2.0)) == 4 * A4_BYTES
+
+    def test_fitted_mode_ignores_scale_factor(self):
+        """Pages larger than the slide are rendered at the slide size, whatever their own size."""
+        small = ConversionConfig(render_mode="fitted", scale_factor=0.5)
+        large = ConversionConfig(render_mode="fitted", scale_factor=5.0)
+        assert estimate_page_bytes(595, 842, small) == estimate_page_bytes(595, 842, large)
+        assert estimate_page_bytes(1190, 1684, small) == estimate_page_bytes(2380, 3368, small)
+
+    @pytest.mark.parametrize("encoding", ["auto", "jpeg", "palette", "grayscale"])
+    def test_only_png_pages_count_as_banded(self, encoding):
+        """Pages over the tiling threshold are only rendered in bands for PNG encoding."""
+        config = ConversionConfig(scale_factor=3.0, tile_megapixels=1)
+        whole = estimate_page_bytes(2384, 3370, ConversionConfig(scale_factor=3.0, tile_megapixels=0))
+
+        assert estimate_page_bytes(2384, 3370, config, "png") < whole
+        assert estimate_page_bytes(2384, 3370, config, encoding) == whole
+
+    def test_trimmed_page_counts_its_clip(self):
+        page = fitz.open().new_page(width=595, height=842)
+        page.draw_rect(fitz.Rect(100, 100, 200, 150), color=None, fill=(0, 0, 0))
+        config = ConversionConfig(scale_factor=1.0, trim_margins=True, trim_margin_pt=0)
+
+        assert estimate_rendered_page(page, config) == estimate_page_bytes(100, 50, config)
+        assert estimate_rendered_page(page, ConversionConfig(scale_factor=1.0)) == A4_BYTES
+
+    def test_negative_budget_rejected(self):
+        with pytest.raises(ValueError):
+            ConversionConfig(memory_budget_mb=-1)
+
+
+class TestMemoryBudget:
+    """Test admission and peak tracking."""
+
+    def test_admits_within_limit(self):
+        budget = MemoryBudget(1)
+        assert budget.try_reserve(600 * 1024)
+        assert not budget.try_reserve(600 * 1024)
+        budget.release(600 * 1024)
+        assert budget.try_reserve(600 * 1024)
+        assert (budget.peak_bytes, budget.deferrals) == (600 * 1024, 1)
+
+    def test_oversized_item_runs_alone(self):
+        """An item larger than the whole budget is still admitted when nothing else runs."""
+        budget = MemoryBudget(1)
+        assert budget.try_reserve(5 * 1024 * 1024)
+        assert not budget.try_reserve(1)
+        assert budget.peak_bytes == 5 * 1024 * 1024
+
+    def test_unlimited_config(self):
+        assert MemoryBudget.from_config(ConversionConfig()) is None
+
+
+class TestBudgetedPipeline:
+    """Test throttling of the prefetch window."""
+
+    def test_pages_render_one_at_a_time(self, tmp_path):
+        """A budget smaller than one page keeps a single page in flight."""
+        pdf_path = build_sample_pdf(tmp_path / "doc.pdf", page_count=5)
+        config = ConversionConfig(scale_factor=1.0, max_workers=2, memory_budget_mb=1, deduplicate_pages=False)
+
+        with PageRenderPipeline(config) as pipeline:
+            pages = list(pipeline.iter_pages(pdf_path))
+
+        assert [page.page_number for page in pages] == [1, 2, 3, 4, 5]
+        stats = pipeline.stats
+        assert stats.peak_memory_bytes == A4_BYTES
+        assert stats.memory_deferrals > 0
+        assert stats.max_queue_depth <= 1
+        assert "peak memory est. 3 MB of 1 MB budget" in stats.summary()
+
+    def test_ample_budget_does_not_throttle(self, tmp_path):
+        pdf_path = build_sample_pdf(tmp_path / "doc.pdf", page_count=5)
+        config = ConversionConfig(scale_factor=1.0, max_workers=2, memory_budget_mb=512, deduplicate_pages=False)
+
+        with PageRenderPipeline(config) as pipeline:
+            list(pipeline.iter_pages(pdf_path))
+
+        assert pipeline.stats.memory_deferrals == 0
+        assert pipeline.stats.peak_memory_bytes == pipeline.prefetch * A4_BYTES
+
+
+class TestBudgetedBatch:
+    """Test budgeted task submission in PNG batches."""
+
+    def test_tasks_carry_largest_page(self, tmp_path):
+        files = [build_sample_pdf(tmp_path / "a.pdf", page_count=3)]
+        config = ConversionConfig(scale_factor=1.0, memory_budget_mb=64)
+
+        tasks, _ = plan_batch(files, config, chunk_pages=2)
+
+        assert [task.footprint for task in tasks] == [A4_BYTES, A4_BYTES]
+        assert plan_batch(files, ConversionConfig(), chunk_pages=2)[0][0].footprint == 0
+
+    def test_batch_within_budget(self, tmp_path):
+        files = [build_sample_pdf(tmp_path / f"{name}.pdf", page_count=2) for name in "abc"]
+        config = ConversionConfig(scale_factor=1.0, max_workers=2, memory_budget_mb=1)
+
+        batch = BatchImageScheduler(config, chunk_pages=1).run(files, tmp_path / "png")
+
+        assert all(result.succeeded for result in batch.files)
+        assert sum(len(result.output_files) for result in batch.files) == 6
+        assert batch.stats.peak_memory_bytes == A4_BYTES
+        assert batch.stats.memory_budget_bytes == 1024 * 1024
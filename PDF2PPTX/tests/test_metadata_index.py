@@ -0,0 +1,166 @@
+"""
+Unit tests for the persistent PDF metadata index.
+"""
+
+import argparse
+import logging
+import os
+
+import fitz
+import pytest
+
+from src.core.batch_scheduler import plan_batch
+from src.core.metadata_index import MetadataIndex, scan_metadata
+from src.core.pdf_processor import ConversionConfig, extract_pdf_metadata
+
+from tests.conftest import build_repeated_pages_pdf, build_sample_pdf, build_scanned_pdf, make_scan_jpeg
+
+
+@pytest.fixture
+def index(tmp_path):
+    with MetadataIndex(tmp_path / "index" / "metadata.sqlite") as index:
+        yield index
+
+
+class TestContentFlags:
+    """Test the cheap has_text / has_images checks."""
+
+    def test_flags_match_full_extraction(self, tmp_path):
+        """Resource and content stream checks agree with text extraction."""
+        pdfs = [
+            build_sample_pdf(tmp_path / "sample.pdf"),
+            build_repeated_pages_pdf(tmp_path / "repeated.pdf"),
+            build_scanned_pdf(tmp_path / "scanned.pdf", make_scan_jpeg()),
+        ]
+        for pdf_path in pdfs:
+            pages = extract_pdf_metadata(pdf_path)['pages']
+            with fitz.open(pdf_path) as doc:
+                expected = [(bool(page.get_text().strip()), bool(page.get_images())) for page in doc]
+            assert [(p['has_text'], p['has_images']) for p in pages] == expected
+
+
+class TestMetadataIndex:
+    """Test index lookups and invalidation."""
+
+    def test_second_lookup_served_from_index(self, index, sample_pdf):
+        """Unchanged files are answered without scanning."""
+        first = index.get_metadata([sample_pdf])[0]
+        second = index.get_metadata([sample_pdf])[0]
+
+        assert first.page_count == second.page_count == 4
+        assert second.metadata == first.metadata
+        assert (index.stats.scanned, index.stats.hits) == (1, 1)
+        assert len(index) == 1
+
+    def test_persists_across_instances(self, tmp_path, sample_pdf):
+        """Results survive closing and reopening the database."""
+        with MetadataIndex(tmp_path / "metadata.sqlite") as index:
+            index.get_metadata([sample_pdf])
+        with MetadataIndex(tmp_path / "metadata.sqlite") as index:
+            assert index.page_counts([sample_pdf]) == [4]
+            assert index.stats.hits == 1
+
+    def test_touched_file_is_revalidated_by_hash(self, index, sample_pdf):
+        """A new mtime with unchanged content refreshes the row without rescanning."""
+        index.get_metadata([sample_pdf])
+        stat = sample_pdf.stat()
+        os.utime(sample_pdf, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+        entry = index.get_metadata([sample_pdf])[0]
+
+        assert entry.page_count == 4
+        assert (index.stats.scanned, index.stats.revalidated) == (1, 1)
+        index.get_metadata([sample_pdf])
+        assert index.stats.hits == 1
+
+    def test_changed_file_is_rescanned(self, index, tmp_path):
+        """Rewritten files are scanned again."""
+        pdf_path = build_sample_pdf(tmp_path / "doc.pdf", page_count=2)
+        index.get_metadata([pdf_path])
+        build_sample_pdf(pdf_path, page_count=5)
+
+        assert index.page_counts([pdf_path]) == [5]
+        assert index.stats.scanned == 2
+
+    @pytest.mark.parametrize("workers", [1, 2])
+    def test_errors_reported_per_file(self, index, tmp_path, sample_pdf, workers):
+        """Unreadable files fail individually and are not stored."""
+        broken = tmp_path / "broken.pdf"
+        broken.write_bytes(b"not a pdf")
+
+        entries = index.get_metadata([broken, sample_pdf, tmp_path / "missing.pdf"], workers)
+
+        assert [entry.error is None for entry in entries] == [False, True, False]
+        assert entries[1].page_count == 4
+        assert len(index) == 1
+
+    def test_corrupt_database_is_rebuilt(self, tmp_path, sample_pdf):
+        """A damaged index file is replaced instead of failing."""
+        index_path = tmp_path / "metadata.sqlite"
+        index_path.write_bytes(b"garbage" * 1000)
+
+        with MetadataIndex(index_path) as index:
+            assert index.page_counts([sample_pdf]) == [4]
+
+    def test_scan_without_index(self, tmp_path, sample_pdf):
+        """scan_metadata returns the same metadata as the index."""
+        entry = scan_metadata([sample_pdf], max_workers=2)[0]
+        with MetadataIndex(tmp_path / "metadata.sqlite") as index:
+            assert index.get_metadata([sample_pdf])[0].metadata == entry.metadata
+
+
+class TestPlanBatchWithIndex:
+    """Test batch planning from the index."""
+
+    def test_plan_matches_without_index(self, tmp_path):
+        """Planning with an index produces the same tasks and fills it."""
+        files = [
+            build_sample_pdf(tmp_path / "a.pdf", page_count=3),
+            build_sample_pdf(tmp_path / "b.pdf", page_count=7),
+        ]
+        index_path = tmp_path / "metadata.sqlite"
+        config = ConversionConfig(metadata_index=index_path, cache_dir=tmp_path / "cache")
+
+        plain_tasks, _ = plan_batch(files, ConversionConfig(cache_dir=tmp_path / "cache"), chunk_pages=4)
+        indexed_tasks, results = plan_batch(files, config, chunk_pages=4)
+
+        assert indexed_tasks == plain_tasks
+        assert [r.page_count for r in results] == [3, 7]
+        with MetadataIndex(index_path) as index:
+            assert index.page_counts(files) == [3, 7]
+            assert index.stats.hits == 2
+
+
+class TestCommandIndexOption:
+    """Test that commands only use a metadata index when asked to."""
+
+    @pytest.fixture
+    def app_config(self, monkeypatch):
+        from src.cli import commands
+        from src.config import ApplicationConfig
+
+        config = ApplicationConfig()
+        monkeypatch.setattr(commands, "get_app_config", lambda: config)
+        return config
+
+    def test_off_by_default(self, app_config):
+        from src.cli.commands import DEFAULT_METADATA_INDEX, InfoCommand
+
+        command = InfoCommand()
+        assert command._metadata_index_path(argparse.Namespace()) is None
+
+        app_config.metadata_index_enabled = True
+        assert command._metadata_index_path(argparse.Namespace()) == DEFAULT_METADATA_INDEX
+        assert command._metadata_index_path(argparse.Namespace(no_index=True)) is None
+
+    def test_unwritable_index_is_skipped_with_warning(self, app_config, tmp_path, sample_pdf, capsys):
+        from src.cli.commands import InfoCommand
+        from src.cli.utils import CLIFormatter
+
+        blocker = tmp_path / "not-a-directory"
+        blocker.write_text("")
+        args = argparse.Namespace(files=[sample_pdf], index=blocker / "index.sqlite", threads=1)
+
+        assert InfoCommand().execute(args, CLIFormatter(), logging.getLogger("test")) == 0
+        assert "is not usable" in capsys.readouterr().out
+        assert args.no_index
@@ -0,0 +1,85 @@
+"""
+Unit tests for PNG and PowerPoint output from a single render.
+"""
+
+import pytest
+from pptx import Presentation
+
+from src.core import render_pipeline
+from src.core.image_converter import ImageConversionService
+from src.core.pdf_processor import ConversionConfig, PDFProcessingError
+from src.core.powerpoint_converter import PowerPointConversionService
+
+from tests.conftest import build_sample_pdf, build_scanned_pdf, make_scan_jpeg
+
+
+def _slide_images(pptx_path):
+    """Image blobs of the slide pictures, in slide order."""
+    presentation = Presentation(str(pptx_path))
+    return [slide.shapes[0].image.blob for slide in presentation.slides]
+
+
+@pytest.fixture
+def counted_renders(monkeypatch):
+    """Count page renders of the (inline) rendering pipeline."""
+    calls = []
+    render_page = render_pipeline.render_page
+
+    def counting_render_page(page, *args, **kwargs):
+        calls.append(page.number)
+        return render_page(page, *args, **kwargs)
+
+    monkeypatch.setattr(render_pipeline, "render_page", counting_render_page)
+    return calls
+
+
+class TestSingleRenderOutput:
+    """Test that one render feeds both the PNG files and the slides."""
+
+    @pytest.mark.parametrize("streaming", [False, True])
+    def test_png_files_match_slide_images(self, tmp_path, counted_renders, streaming):
+        files = [build_sample_pdf(tmp_path / "a.pdf", 3), build_sample_pdf(tmp_path / "b.pdf", 2)]
+        config = ConversionConfig(scale_factor=1.0, streaming_output=streaming, deduplicate_pages=False)
+        service = PowerPointConversionService(config)
+
+        pptx_path = service.convert_multiple_pdfs_to_single_presentation(
+            files, tmp_path / "out" / "deck.pptx", image_dir=tmp_path / "out"
+        )
+
+        assert len(counted_renders) == 5
+        assert [path.name for path in service.last_image_files] == [
+            "a_page_001.png", "a_page_002.png", "a_page_003.png", "b_page_001.png", "b_page_002.png"
+        ]
+        assert [path.read_bytes() for path in service.last_image_files] == _slide_images(pptx_path)
+        assert service.last_pipeline_stats.write_seconds > 0
+
+    def test_png_files_match_image_conversion(self, tmp_path):
+        pdf_path = build_sample_pdf(tmp_path / "doc.pdf", 3)
+        config = ConversionConfig(scale_factor=1.0)
+
+        expected = ImageConversionService(config).convert_pdf_to_images(pdf_path, tmp_path / "png")
+        service = PowerPointConversionService(config)
+        service.convert_pdf_to_powerpoint(pdf_path, tmp_path / "both", image_dir=tmp_path / "both")
+
+        assert [path.read_bytes() for path in service.last_image_files] == [
+            path.read_bytes() for path in expected
+        ]
+
+    def test_scanned_pages_are_rasterized(self, tmp_path):
+        """Passthrough would put the scan's JPEG on the slide; both outputs get the PNG render."""
+        pdf_path = build_scanned_pdf(tmp_path / "scan.pdf", make_scan_jpeg())
+        service = PowerPointConversionService(ConversionConfig(scan_passthrough=True, svg_pages=True))
+
+        pptx_path = service.convert_pdf_to_powerpoint(pdf_path, tmp_path, image_dir=tmp_path)
+
+        images = _slide_images(pptx_path)
+        assert len(images) == 2
+        assert all(image.startswith(b"\x89PNG") for image in images)
+        assert images == [path.read_bytes() for path in service.last_image_files]
+
+    def test_lossy_encoding_rejected(self, tmp_path, sample_pdf):
+        service = PowerPointConversionService(ConversionConfig(image_encoding="jpeg"))
+
+        with pytest.raises(PDFProcessingError, match="needs a PNG image encoding"):
+            service.convert_pdf_to_powerpoint(sample_pdf, tmp_path, image_dir=tmp_path)
+        assert not list(tmp_path.glob("*.png"))
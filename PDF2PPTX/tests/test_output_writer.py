@@ -0,0 +1,145 @@
+"""
+Unit tests for the output writer pool.
+"""
+
+import threading
+import time
+
+import fitz
+import pytest
+from PIL import Image
+
+from src.core import output_writer
+from src.core.batch_scheduler import BatchImageScheduler
+from src.core.image_converter import ImageConversionService
+from src.core.image_encoding import encode_png
+from src.core.output_writer import OutputWriterPool, write_output_file
+from src.core.pdf_processor import ConversionConfig, PDFProcessingError
+
+from tests.conftest import build_sample_pdf
+
+
+class TestWriteOutputFile:
+    """Test plain and durable file writes."""
+
+    def test_durable_write_leaves_no_temporary_file(self, tmp_path):
+        target = tmp_path / "page.png"
+        target.write_bytes(b"old")
+
+        write_output_file(target, b"new content", durable=True)
+
+        assert target.read_bytes() == b"new content"
+        assert [path.name for path in tmp_path.iterdir()] == ["page.png"]
+
+
+class TestOutputWriterPool:
+    """Test queueing, back-pressure and error reporting."""
+
+    def test_writes_every_file(self, tmp_path):
+        with OutputWriterPool(workers=2) as writer:
+            for index in range(10):
+                writer.submit(tmp_path / f"{index}.bin", bytes([index]) * 100)
+            writer.flush()
+
+        assert sorted(path.read_bytes()[0] for path in tmp_path.iterdir()) == list(range(10))
+        assert (writer.stats.files, writer.stats.bytes_written) == (10, 1000)
+
+    def test_full_queue_blocks_submit(self, tmp_path, monkeypatch):
+        """With one slot taken by a stalled write, the next submit waits for it."""
+        release = threading.Event()
+
+        def stalled_write(path, data, durable=False):
+            release.wait(5)
+            path.write_bytes(data)
+
+        monkeypatch.setattr(output_writer, "write_output_file", stalled_write)
+        writer = OutputWriterPool(workers=1, max_pending=1)
+        writer.submit(tmp_path / "a.bin", b"a")
+
+        second = threading.Thread(target=writer.submit, args=(tmp_path / "b.bin", b"b"))
+        second.start()
+        second.join(0.2)
+        assert second.is_alive()
+
+        release.set()
+        second.join(5)
+        writer.flush()
+        writer.close()
+        assert (tmp_path / "b.bin").read_bytes() == b"b"
+        assert writer.stats.wait_seconds >= 0.2
+
+    def test_write_error_raised_by_flush(self, tmp_path):
+        writer = OutputWriterPool(workers=1)
+        writer.submit(tmp_path / "missing" / "page.png", b"data")
+
+        with pytest.raises(PDFProcessingError, match="Failed to write"):
+            writer.flush()
+        writer.close()
+
+    def test_reoptimize_shrinks_png_files(self, tmp_path):
+        data = Image.new("RGB", (200, 100), "white").tobytes()
+        png = encode_png(fitz.Pixmap(fitz.csRGB, 200, 100, data, False), "fastest")
+
+        with OutputWriterPool(workers=1, reoptimize=True) as writer:
+            writer.submit(tmp_path / "page.png", png)
+            writer.flush()
+
+        written = (tmp_path / "page.png").read_bytes()
+        assert len(written) < len(png)
+        assert writer.stats.bytes_saved == len(png) - len(written)
+        assert Image.open(tmp_path / "page.png").convert("RGB").tobytes() == data
+
+    def test_inline_writer_counts_writes_as_waiting(self, tmp_path):
+        writer = OutputWriterPool(workers=0)
+        writer.submit(tmp_path / "page.png", b"data")
+
+        assert (tmp_path / "page.png").read_bytes() == b"data"
+        assert writer.stats.files == 1
+        assert writer.stats.wait_seconds >= writer.stats.write_seconds > 0
+
+
+class TestImageConversion:
+    """Test PNG export through the writer pool."""
+
+    def test_output_matches_inline_writes(self, tmp_path):
+        pdf_path = build_sample_pdf(tmp_path / "doc.pdf", page_count=4)
+        outputs = {}
+        for writers in (0, 2):
+            config = ConversionConfig(scale_factor=1.0, output_writers=writers, durable_writes=bool(writers))
+            service = ImageConversionService(config)
+            files = service.convert_pdf_to_images(pdf_path, tmp_path / f"out{writers}")
+            outputs[writers] = [path.read_bytes() for path in files]
+
+            stats = service.last_pipeline_stats
+            assert stats.write_seconds > 0
+            assert "-bound (waited" in stats.summary()
+
+        assert len(outputs[0]) == 4
+        assert outputs[0] == outputs[2]
+
+    def test_slow_storage_is_reported_io_bound(self, tmp_path, monkeypatch):
+        def slow_write(path, data, durable=False):
+            time.sleep(0.3)
+            path.write_bytes(data)
+
+        monkeypatch.setattr(output_writer, "write_output_file", slow_write)
+        pdf_path = build_sample_pdf(tmp_path / "doc.pdf", page_count=6)
+        service = ImageConversionService(ConversionConfig(scale_factor=0.5, output_writers=1))
+
+        service.convert_pdf_to_images(pdf_path, tmp_path / "out")
+
+        assert service.last_pipeline_stats.io_bound
+
+    def test_batch_records_write_time(self, tmp_path):
+        files = [build_sample_pdf(tmp_path / "a.pdf", page_count=2)]
+        config = ConversionConfig(scale_factor=1.0, durable_writes=True)
+
+        batch = BatchImageScheduler(config, chunk_pages=1).run(files, tmp_path / "png")
+
+        assert len(batch.files[0].output_files) == 2
+        assert batch.stats.write_seconds > 0
+        assert not list((tmp_path / "png").glob(".*.tmp"))
+
+    def test_negative_writer_count_rejected(self):
+        with pytest.raises(ValueError):
+            ConversionConfig(output_writers=-1)
@@ -9,8 +9,11 @@ import fitz
 
 from src.core.pdf_processor import (
     ConversionConfig,
+    PageInfo,
     PDFProcessingError,
     analyze_page_orientation,
+    calculate_fitted_dimensions,
+    calculate_render_scale,
     process_page_to_pixmap,
     validate_conversion_config,
     mm_to_emu,
@@ -77,6 +80,48 @@ class TestUtilityFunctions:
             validate_conversion_config(invalid_config)
 
 
+class TestRenderScale:
+    """Test slide-fitted render scale calculation."""
+
+    @staticmethod
+    def _page_info(width: float, height: float) -> PageInfo:
+        return PageInfo(
+            page_number=1,
+            original_size=(width, height),
+            is_portrait=width < height,
+            was_rotated=False,
+            final_size=(width, height)
+        )
+
+    def test_scale_mode_uses_scale_factor(self):
+        """Scale mode keeps the configured scale factor."""
+        config = ConversionConfig(scale_factor=2.5)
+        assert calculate_render_scale(self._page_info(3370, 2384), config) == 2.5
+
+    def test_fitted_mode_renders_at_display_density(self):
+        """An A0 page fitted onto an A3 slide is rendered at target_dpi for its fitted width."""
+        config = ConversionConfig(render_mode="fitted", target_dpi=150)
+        page_info = self._page_info(3370, 2384)
+
+        scale = calculate_render_scale(page_info, config)
+
+        fitted_width, _ = calculate_fitted_dimensions(
+            points_to_emu(3370), points_to_emu(2384), mm_to_emu(420.0), mm_to_emu(297.0)
+        )
+        assert scale * 3370 == pytest.approx(fitted_width / 914400 * 150)
+        assert scale < 1.0
+
+    def test_fitted_mode_small_page_keeps_natural_size(self):
+        """Pages that fit unscaled are rendered at target_dpi for their natural size."""
+        config = ConversionConfig(render_mode="fitted", target_dpi=144)
+        assert calculate_render_scale(self._page_info(300, 200), config) == pytest.approx(2.0, rel=1e-3)
+
+    def test_invalid_render_mode(self):
+        """Unknown render modes are rejected."""
+        with pytest.raises(ValueError, match="Render mode"):
+            ConversionConfig(render_mode="exact")
+
+
 class TestPageAnalysis:
     """Test page analysis functions."""
 
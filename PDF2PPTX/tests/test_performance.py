@@ -0,0 +1,106 @@
+"""
+Performance regression tests over the synthetic corpus.
+
+Opt-in, because timings only mean something on a quiet reference machine:
+
+    PDF2PPTX_PERF=1 pytest -m performance        # compare with baselines
+    PDF2PPTX_PERF=update pytest -m performance   # record new baselines
+
+Each case converts one corpus document end to end in a fresh process and
+fails when its throughput drops, or its peak memory grows, by more than the
+tolerance (PDF2PPTX_PERF_TOLERANCE, default 0.25) relative to the baseline
+stored in perf_baselines.json (PDF2PPTX_PERF_BASELINES to use another file).
+Cases without a baseline record one.
+"""
+
+import json
+import os
+from pathlib import Path
+
+import pytest
+
+from src.core.benchmark import BenchmarkCase, run_case_isolated
+from src.core.pdf_processor import ConversionConfig
+
+from tests.corpus import CORPUS
+
+PERF_MODE = os.environ.get("PDF2PPTX_PERF", "")
+TOLERANCE = float(os.environ.get("PDF2PPTX_PERF_TOLERANCE", "0.25"))
+BASELINES = Path(os.environ.get(
+    "PDF2PPTX_PERF_BASELINES", Path(__file__).parent / "perf_baselines.json"
+))
+
+pytestmark = [
+    pytest.mark.performance,
+    pytest.mark.skipif(not PERF_MODE, reason="set PDF2PPTX_PERF=1 to run performance tests")
+]
+
+
+def _load_baselines() -> dict:
+    if not BASELINES.exists():
+        return {}
+    return json.loads(BASELINES.read_text(encoding="utf-8"))
+
+
+def _store_baseline(key: str, measurement: dict) -> None:
+    baselines = _load_baselines()
+    baselines[key] = measurement
+    BASELINES.write_text(json.dumps(baselines, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+
+
+@pytest.fixture(scope="module")
+def corpus_dir(tmp_path_factory):
+    """Directory with every corpus document, generated once per run."""
+    directory = tmp_path_factory.mktemp("corpus")
+    for name, build in CORPUS.items():
+        build(directory / f"{name}.pdf")
+    return directory
+
+
+@pytest.mark.parametrize("output_format", ["png", "pptx"])
+@pytest.mark.parametrize("document", sorted(CORPUS))
+def test_conversion_performance(corpus_dir, tmp_path, document, output_format):
+    """End-to-end throughput and peak memory stay within tolerance of the baseline."""
+    case = BenchmarkCase(f"{document}/{output_format}", ConversionConfig(), output_format)
+
+    result = run_case_isolated(case, corpus_dir / f"{document}.pdf", tmp_path)
+
+    assert result.succeeded, result.error
+    measurement = {
+        "pages_per_second": round(result.pages_per_second, 2),
+        "peak_rss_mb": round(result.peak_rss_mb, 1) if result.peak_rss_mb is not None else None
+    }
+
+    baseline = _load_baselines().get(case.name)
+    if PERF_MODE == "update" or baseline is None:
+        _store_baseline(case.name, measurement)
+        pytest.skip(f"baseline recorded for {case.name}: {measurement}")
+
+    min_throughput = baseline["pages_per_second"] * (1 - TOLERANCE)
+    assert result.pages_per_second >= min_throughput, (
+        f"{case.name}: {result.pages_per_second:.1f} pages/s, "
+        f"baseline {baseline['pages_per_second']:.1f} pages/s"
+    )
+
+    if baseline.get("peak_rss_mb") and result.peak_rss_mb is not None:
+        max_memory = baseline["peak_rss_mb"] * (1 + TOLERANCE)
+        assert result.peak_rss_mb <= max_memory, (
+            f"{case.name}: peak RSS {result.peak_rss_mb:.0f} MB, "
+            f"baseline {baseline['peak_rss_mb']:.0f} MB"
+        )
+
+
+@pytest.mark.parametrize("document", sorted(CORPUS))
+def test_png_profile_tradeoff(corpus_dir, tmp_path, document):
+    """The fastest PNG profile is not slower, and the smallest not larger, than balanced."""
+    results = {}
+    for profile in ("fastest", "balanced", "smallest"):
+        case = BenchmarkCase(f"{document}/png/{profile}", ConversionConfig(png_profile=profile), "png")
+        result = run_case_isolated(case, corpus_dir / f"{document}.pdf", tmp_path / profile)
+        assert result.succeeded, result.error
+        results[profile] = result
+
+    assert results["smallest"].bytes_per_page <= results["balanced"].bytes_per_page
+    assert results["fastest"].encode_pages_per_second >= (
+        results["balanced"].encode_pages_per_second * (1 - TOLERANCE)
+    )
@@ -0,0 +1,147 @@
+"""
+Unit tests for the streaming PPTX package writer.
+"""
+
+import zipfile
+
+import pytest
+from pptx import Presentation
+
+from src.core.pdf_processor import ConversionConfig, PDFProcessingError
+from src.core.powerpoint_converter import PowerPointConversionService
+from src.core.pptx_stream_writer import StreamingPresentationWriter
+
+from tests.conftest import build_repeated_pages_pdf, build_sample_pdf
+
+
+def _picture_images(presentation):
+    return [
+        shape.image.blob
+        for slide in presentation.slides
+        for shape in slide.shapes
+        if shape.shape_type == 13  # MSO_SHAPE_TYPE.PICTURE
+    ]
+
+
+def _slide_texts(presentation):
+    return [
+        shape.text_frame.text
+        for slide in presentation.slides
+        for shape in slide.shapes
+        if shape.has_text_frame
+    ]
+
+
+class TestStreamingPresentationWriter:
+    """Test the package produced by StreamingPresentationWriter."""
+
+    def test_output_opens_with_python_pptx(self, tmp_path, sample_pdf):
+        """A streamed deck has the same slides, images and labels as the regular writer."""
+        config = ConversionConfig(streaming_output=True)
+        output = PowerPointConversionService(config).convert_pdf_to_powerpoint(
+            sample_pdf, tmp_path / "streamed"
+        )
+        regular = PowerPointConversionService(ConversionConfig()).convert_pdf_to_powerpoint(
+            sample_pdf, tmp_path / "regular"
+        )
+
+        streamed_deck = Presentation(str(output))
+        regular_deck = Presentation(str(regular))
+
+        assert len(streamed_deck.slides) == 4
+        assert streamed_deck.slide_width == regular_deck.slide_width
+        assert _picture_images(streamed_deck) == _picture_images(regular_deck)
+        assert _slide_texts(streamed_deck) == _slide_texts(regular_deck)
+        assert not (tmp_path / "streamed" / "sample.pptx.partial").exists()
+
+    def test_multiple_pdfs_and_escaped_labels(self, tmp_path):
+        """Slides from several files are appended in order with XML-escaped labels."""
+        first = build_sample_pdf(tmp_path / "a&b.pdf", page_count=2)
+        second = build_sample_pdf(tmp_path / "<c>.pdf", page_count=3)
+        output = tmp_path / "out" / "deck.pptx"
+
+        service = PowerPointConversionService(ConversionConfig(streaming_output=True))
+        service.convert_multiple_pdfs_to_single_presentation([first, second], output)
+
+        deck = Presentation(str(output))
+        assert len(deck.slides) == 5
+        assert _slide_texts(deck)[0] == "a&b_page_001"
+        assert _slide_texts(deck)[-1] == "<c>_page_003"
+
+    def test_content_types_cover_media(self, tmp_path):
+        """PNG and JPEG media get content type defaults; slides get overrides."""
+        output = tmp_path / "deck.pptx"
+        with StreamingPresentationWriter(output, 9144000, 6858000) as writer:
+            writer.add_slide(b"\x89PNG\r\n\x1a\n", "png", (0, 0, 10, 10))
+            writer.add_slide(b"\xff\xd8\xff", "jpeg", (0, 0, 10, 10))
+
+        with zipfile.ZipFile(output) as package:
+            content_types = package.read("[Content_Types].xml").decode("utf-8")
+            names = package.namelist()
+
+        assert 'Extension="png"' in content_types
+        assert 'Extension="jpeg"' in content_types
+        assert content_types.count("presentationml.slide+xml") == 2
+        assert "ppt/media/image2.jpeg" in names
+
+    @pytest.mark.parametrize("streaming", [True, False])
+    def test_identical_pages_share_media(self, tmp_path, streaming):
+        """Duplicate pages reference a single media part and are reported."""
+        pdf = build_repeated_pages_pdf(tmp_path / "repeated.pdf")
+        service = PowerPointConversionService(ConversionConfig(streaming_output=streaming))
+
+        output = service.convert_pdf_to_powerpoint(pdf, tmp_path / "out")
+
+        with zipfile.ZipFile(output) as package:
+            media = [name for name in package.namelist() if name.startswith("ppt/media/")]
+        assert len(media) == 2
+        assert len(Presentation(str(output)).slides) == 4
+        assert service.last_pipeline_stats.deduplicated_pages == 2
+        assert service.last_pipeline_stats.deduplicated_bytes > 0
+
+    def test_repeated_image_with_new_svg_counts_as_duplicate(self, tmp_path, sample_pdf):
+        """Image and SVG reuse are counted separately, whatever else the slide brings."""
+        image = _picture_images(Presentation(str(
+            PowerPointConversionService(ConversionConfig()).convert_pdf_to_powerpoint(sample_pdf, tmp_path)
+        )))[0]
+        writer = StreamingPresentationWriter(tmp_path / "svg.pptx", 9144000, 6858000)
+        with writer:
+            writer.add_slide(image, "png", (0, 0, 100, 100), svg_bytes=b"<svg>first</svg>")
+            writer.add_slide(image, "png", (0, 0, 100, 100), svg_bytes=b"<svg>second</svg>")
+            writer.add_slide(image, "png", (0, 0, 100, 100), svg_bytes=b"<svg>first</svg>")
+
+        assert (writer.deduplicated_pages, writer.deduplicated_svgs) == (2, 1)
+        assert writer.deduplicated_bytes == 2 * len(image) + len(b"<svg>first</svg>")
+
+    def test_svg_deduplication_matches_in_memory_path(self, tmp_path):
+        pdf = build_repeated_pages_pdf(tmp_path / "repeated.pdf")
+        stats = {}
+        for streaming in (True, False):
+            service = PowerPointConversionService(ConversionConfig(streaming_output=streaming, svg_pages=True))
+            service.convert_pdf_to_powerpoint(pdf, tmp_path / str(streaming))
+            result = service.last_pipeline_stats
+            stats[streaming] = (result.deduplicated_pages, result.deduplicated_svgs, result.deduplicated_bytes)
+
+        assert stats[True] == stats[False]
+        assert stats[True][:2] == (2, 2)
+
+    def test_failure_discards_partial_output(self, tmp_path):
+        """An error while streaming leaves no output file behind."""
+        output = tmp_path / "deck.pptx"
+
+        with pytest.raises(ValueError):
+            with StreamingPresentationWriter(output, 9144000, 6858000) as writer:
+                writer.add_slide(b"GIF89a", "gif", (0, 0, 10, 10))
+
+        assert not output.exists()
+        assert not (tmp_path / "deck.pptx.partial").exists()
+
+    def test_missing_pdf_raises(self, tmp_path):
+        """Streaming conversion errors surface as PDFProcessingError."""
+        service = PowerPointConversionService(ConversionConfig(streaming_output=True))
+
+        with pytest.raises(PDFProcessingError):
+            service.convert_multiple_pdfs_to_single_presentation(
+                [tmp_path / "missing.pdf"], tmp_path / "deck.pptx"
+            )
+        assert not (tmp_path / "deck.pptx").exists()
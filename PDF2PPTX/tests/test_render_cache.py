@@ -0,0 +1,133 @@
+"""
+Unit tests for the persistent render cache.
+"""
+
+import os
+import pickle
+
+from src.core.pdf_processor import ConversionConfig
+from src.core.render_cache import RenderCache, hash_pdf_file
+from src.core.render_pipeline import PageRenderPipeline
+
+from tests.conftest import build_sample_pdf
+
+
+class TestRenderCache:
+    """Test RenderCache storage, integrity checks and eviction."""
+
+    def test_put_and_get_roundtrip(self, tmp_path):
+        """Stored payloads are returned unchanged."""
+        cache = RenderCache(tmp_path)
+        key = RenderCache.make_key("abc", 0, 1.5, 90, "png")
+
+        assert cache.get(key) is None
+        cache.put(key, b"payload")
+
+        assert cache.get(key) == b"payload"
+        assert cache.stats.hits == 1
+        assert cache.stats.misses == 1
+
+    def test_key_covers_render_settings(self):
+        """Changing any render setting changes the key."""
+        base = RenderCache.make_key("abc", 0, 1.5, 0, "png")
+
+        assert base != RenderCache.make_key("abd", 0, 1.5, 0, "png")
+        assert base != RenderCache.make_key("abc", 1, 1.5, 0, "png")
+        assert base != RenderCache.make_key("abc", 0, 2.0, 0, "png")
+        assert base != RenderCache.make_key("abc", 0, 1.5, 90, "png")
+        assert base != RenderCache.make_key("abc", 0, 1.5, 0, "jpeg")
+
+    def test_corrupted_entry_is_discarded(self, tmp_path):
+        """Entries failing the integrity check count as misses and are removed."""
+        cache = RenderCache(tmp_path)
+        key = RenderCache.make_key("abc", 0, 1.5, 0, "png")
+        cache.put(key, b"payload")
+
+        entry = next(tmp_path.glob("*/*.bin"))
+        entry.write_bytes(entry.read_bytes()[:-1] + b"X")
+
+        assert cache.get(key) is None
+        assert cache.stats.corrupt_entries == 1
+        assert not entry.exists()
+
+    def test_least_recently_used_entries_are_evicted(self, tmp_path):
+        """Eviction removes the oldest entries first."""
+        cache = RenderCache(tmp_path, max_size_mb=1)
+        payload = b"x" * (400 * 1024)
+        keys = [RenderCache.make_key("abc", i, 1.5, 0, "png") for i in range(3)]
+
+        cache.put(keys[0], payload)
+        cache.put(keys[1], payload)
+        # Age the first two entries, then touch the first one again
+        for age, key in ((300, keys[0]), (200, keys[1])):
+            path = next(tmp_path.glob(f"*/{key}.bin"))
+            os.utime(path, (path.stat().st_atime - age, path.stat().st_mtime - age))
+        assert cache.get(keys[0]) == payload
+
+        cache.put(keys[2], payload)
+
+        assert cache.get(keys[1]) is None
+        assert cache.get(keys[0]) == payload
+        assert cache.get(keys[2]) == payload
+
+    def test_worker_copy_leaves_size_to_owner(self, tmp_path, monkeypatch):
+        """Pickled copies write without scanning the cache; the owner evicts once."""
+        cache = RenderCache(tmp_path, max_size_mb=1)
+        worker = pickle.loads(pickle.dumps(cache))
+        scans = []
+        monkeypatch.setattr(RenderCache, "_entries", lambda self: scans.append(1) or [])
+
+        for index in range(3):
+            worker.put(RenderCache.make_key("abc", index, 1.5, 0, "png"), b"x" * (400 * 1024))
+
+        assert scans == []
+        monkeypatch.undo()
+        cache.merge_stats(worker.drain_stats())
+        assert cache.stats.writes == 3
+        cache.enforce_limit()
+        assert cache.stats.evictions == 1
+        assert cache.size_bytes() <= cache.max_size_bytes
+
+
+class TestPipelineCaching:
+    """Test render cache integration with the rendering pipeline."""
+
+    def test_second_run_is_served_from_cache(self, sample_pdf, tmp_path):
+        """A repeated conversion renders nothing and returns identical bytes."""
+        config = ConversionConfig(cache_dir=tmp_path / "cache")
+
+        first = [p.image_bytes for p in PageRenderPipeline(config).iter_pages(sample_pdf)]
+        pipeline = PageRenderPipeline(config)
+        second = [p.image_bytes for p in pipeline.iter_pages(sample_pdf)]
+
+        assert second == first
+        assert pipeline.stats.cache_hits == len(first)
+
+    def test_pooled_render_scans_cache_once(self, tmp_path, monkeypatch):
+        """Worker processes do not scan the cache directory for every page they store."""
+        scans = tmp_path / "scans"
+        size_bytes = RenderCache.size_bytes
+
+        def counting_size_bytes(self):
+            with open(scans, "a") as f:  # appended from worker processes too
+                f.write("x")
+            return size_bytes(self)
+
+        monkeypatch.setattr(RenderCache, "size_bytes", counting_size_bytes)
+        pdf_path = build_sample_pdf(tmp_path / "doc.pdf", page_count=6)
+        config = ConversionConfig(cache_dir=tmp_path / "cache", max_workers=2, deduplicate_pages=False)
+
+        with PageRenderPipeline(config) as pipeline:
+            assert len(list(pipeline.iter_pages(pdf_path))) == 6
+
+        assert scans.read_text() == "x"
+        assert pipeline.cache.stats.writes == 6
+        assert pipeline.cache.stats.misses == 6
+
+    def test_hash_pdf_file_tracks_content(self, sample_pdf):
+        """The document hash changes when the file content changes."""
+        before = hash_pdf_file(sample_pdf)
+        with open(sample_pdf, 'ab') as f:
+            f.write(b"\n% trailing comment\n")
+
+        assert hash_pdf_file(sample_pdf) != before
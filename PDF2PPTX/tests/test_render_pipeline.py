@@ -0,0 +1,104 @@
+"""
+Unit tests for the overlapped page rendering pipeline.
+"""
+
+import pytest
+
+from src.core.pdf_processor import ConversionConfig, PDFProcessingError
+from src.core.render_pipeline import PageRenderPipeline, PipelineStats, RenderedPage
+
+from tests.conftest import build_repeated_pages_pdf
+
+
+class TestPageRenderPipeline:
+    """Test PageRenderPipeline ordering and statistics."""
+
+    def test_inline_pipeline_yields_pages_in_order(self, sample_pdf):
+        """Sequential rendering yields every page in order."""
+        pipeline = PageRenderPipeline(ConversionConfig(max_workers=1))
+
+        pages = list(pipeline.iter_pages(sample_pdf))
+
+        assert [p.page_number for p in pages] == [1, 2, 3, 4]
+        assert all(p.image_bytes.startswith(b"\x89PNG") for p in pages)
+        assert pipeline.stats.pages == 4
+        assert pipeline.stats.max_queue_depth == 0
+
+    def test_parallel_pipeline_matches_inline_output(self, sample_pdf):
+        """Pool rendering produces the same bytes in the same order."""
+        inline = [p.image_bytes for p in PageRenderPipeline(ConversionConfig()).iter_pages(sample_pdf)]
+
+        config = ConversionConfig(max_workers=2, prefetch_pages=2)
+        with PageRenderPipeline(config) as pipeline:
+            pages = list(pipeline.iter_pages(sample_pdf))
+
+        assert [p.page_number for p in pages] == [1, 2, 3, 4]
+        assert [p.image_bytes for p in pages] == inline
+        assert pipeline.stats.max_queue_depth <= 2
+
+    def test_rotated_page_info(self, sample_pdf):
+        """Portrait pages are rotated to landscape when auto_rotate is set."""
+        first = next(PageRenderPipeline(ConversionConfig()).iter_pages(sample_pdf))
+
+        assert first.page_info.was_rotated is True
+        assert first.page_info.final_size == (842, 595)
+
+    def test_missing_file_raises(self, tmp_path):
+        """A missing PDF surfaces as a PDFProcessingError."""
+        pipeline = PageRenderPipeline(ConversionConfig(max_workers=2))
+
+        with pytest.raises(PDFProcessingError):
+            list(pipeline.iter_pages(tmp_path / "missing.pdf"))
+        pipeline.close()
+
+
+class TestDuplicatePages:
+    """Test reuse of renders for pages identical to an earlier page."""
+
+    @pytest.mark.parametrize("workers", [1, 2])
+    def test_duplicates_reuse_earlier_render(self, tmp_path, workers):
+        """Repeated and blank pages are rendered once and keep their own page numbers."""
+        pdf = build_repeated_pages_pdf(tmp_path / "repeated.pdf")
+
+        with PageRenderPipeline(ConversionConfig(max_workers=workers)) as pipeline:
+            pages = list(pipeline.iter_pages(pdf))
+
+        assert [p.page_number for p in pages] == [1, 2, 3, 4]
+        assert [p.page_info.page_number for p in pages] == [1, 2, 3, 4]
+        assert [p.duplicate_of for p in pages] == [None, None, 1, 2]
+        assert pages[2].image_bytes == pages[0].image_bytes
+        assert pipeline.stats.reused_renders == 2
+
+    def test_deduplication_can_be_disabled(self, tmp_path):
+        """With deduplicate_pages off every page is rendered."""
+        pdf = build_repeated_pages_pdf(tmp_path / "repeated.pdf")
+
+        pipeline = PageRenderPipeline(ConversionConfig(deduplicate_pages=False))
+        pages = list(pipeline.iter_pages(pdf))
+
+        assert all(p.duplicate_of is None for p in pages)
+        assert pipeline.stats.reused_renders == 0
+
+
+class TestPipelineStats:
+    """Test PipelineStats calculations."""
+
+    def test_throughput_and_queue_depth(self):
+        """Pages per second and queue depth averages are derived from records."""
+        stats = PipelineStats(elapsed_seconds=2.0)
+        page = RenderedPage(page_number=1, image_bytes=b"", image_format="png", page_info=None)
+
+        stats.record(page, 3)
+        stats.record(page, 1)
+
+        assert stats.pages_per_second == 1.0
+        assert stats.average_queue_depth == 2.0
+        assert stats.max_queue_depth == 3
+
+    def test_deduplication_summary(self):
+        """Shared media is reported in the encoding summary."""
+        stats = PipelineStats()
+        stats.record_deduplicated(2 * 1024 * 1024)
+
+        assert stats.deduplicated_pages == 1
+        assert "1 duplicate pages share media (2.0 MB saved)" in stats.encoding_summary()
@@ -0,0 +1,131 @@
+"""
+Unit tests for scanned page passthrough.
+"""
+
+import fitz
+import pytest
+from pptx import Presentation
+
+from src.core.image_converter import ImageConversionService
+from src.core.pdf_processor import ConversionConfig, mm_to_emu
+from src.core.powerpoint_converter import PowerPointConversionService
+from src.core.scan_passthrough import find_full_page_image
+
+from tests.conftest import build_scanned_pdf, make_scan_jpeg
+
+
+@pytest.fixture
+def scan_jpeg():
+    return make_scan_jpeg()
+
+
+def _single_page(jpeg, rect=None, rotate=0, text=None, page_rotation=0):
+    doc = fitz.open()
+    page = doc.new_page(width=595, height=842)
+    page.insert_image(rect or page.rect, stream=jpeg, keep_proportion=False, rotate=rotate)
+    if text:
+        page.insert_text((72, 72), text)
+    page.set_rotation(page_rotation)
+    return doc
+
+
+class TestFindFullPageImage:
+    """Test detection of single full-page image pages."""
+
+    def test_scanned_page_detected(self, scan_jpeg):
+        """The original JPEG stream is returned byte for byte."""
+        doc = _single_page(scan_jpeg)
+
+        page_image = find_full_page_image(doc[0])
+
+        assert page_image is not None
+        assert page_image.image_format == "jpeg"
+        assert page_image.image_bytes == scan_jpeg
+        assert page_image.rect == (0.0, 0.0, 595.0, 842.0)
+
+    def test_invisible_ocr_text_allowed(self, scan_jpeg):
+        """An invisible OCR text layer does not prevent passthrough."""
+        doc = _single_page(scan_jpeg)
+        doc[0].insert_text((72, 72), "OCR layer", render_mode=3)
+
+        assert find_full_page_image(doc[0]) is not None
+
+    @pytest.mark.parametrize("kwargs", [
+        {"text": "OCR layer"},
+        {"rotate": 90},
+        {"rect": fitz.Rect(0, 0, 400, 600)},
+        {"page_rotation": 90},
+    ])
+    def test_other_pages_rasterized(self, scan_jpeg, kwargs):
+        """Text, rotated images, partial coverage and page rotation disable passthrough."""
+        doc = _single_page(scan_jpeg, **kwargs)
+
+        assert find_full_page_image(doc[0]) is None
+
+    def test_image_overhanging_page_rasterized(self, scan_jpeg):
+        """A scan cropped by the page edge would be squashed into the page if passed through."""
+        doc = _single_page(scan_jpeg, rect=fitz.Rect(-30, -20, 625, 862))
+
+        assert find_full_page_image(doc[0]) is None
+
+    def test_rounding_overhang_allowed(self, scan_jpeg):
+        doc = _single_page(scan_jpeg, rect=fitz.Rect(-0.5, 0, 595.5, 842))
+
+        page_image = find_full_page_image(doc[0])
+
+        assert page_image is not None
+        assert page_image.rect == (0.0, 0.0, 595.0, 842.0)
+
+
+class TestPassthroughConversion:
+    """Test passthrough pages in generated decks."""
+
+    def test_pptx_embeds_original_images(self, tmp_path, scan_jpeg):
+        """Portrait scans are embedded unchanged and turned by the picture rotation."""
+        pdf = build_scanned_pdf(tmp_path / "scan.pdf", scan_jpeg)
+        service = PowerPointConversionService(ConversionConfig())
+
+        output = service.convert_pdf_to_powerpoint(pdf, tmp_path / "out")
+
+        deck = Presentation(str(output))
+        pictures = [slide.shapes[0] for slide in deck.slides]
+        assert [p.image.blob for p in pictures] == [scan_jpeg, scan_jpeg]
+        assert [p.rotation for p in pictures] == [90.0, 0.0]
+        assert service.last_pipeline_stats.encoding_counts == {"passthrough": 2}
+
+        # Both pages appear as the same landscape box centered on the slide
+        rotated, upright = pictures
+        assert (rotated.width, rotated.height) == (upright.height, upright.width)
+        for picture in pictures:
+            assert abs(picture.left + picture.width / 2 - mm_to_emu(420.0) / 2) <= 1
+            assert abs(picture.top + picture.height / 2 - mm_to_emu(297.0) / 2) <= 1
+
+    def test_streaming_writer_rotates_picture(self, tmp_path, scan_jpeg):
+        """The streaming writer writes the same picture rotation."""
+        pdf = build_scanned_pdf(tmp_path / "scan.pdf", scan_jpeg)
+        config = ConversionConfig(streaming_output=True)
+
+        output = PowerPointConversionService(config).convert_pdf_to_powerpoint(pdf, tmp_path / "out")
+
+        pictures = [slide.shapes[0] for slide in Presentation(str(output)).slides]
+        assert [p.rotation for p in pictures] == [90.0, 0.0]
+        assert pictures[0].image.blob == scan_jpeg
+
+    def test_passthrough_can_be_disabled(self, tmp_path, scan_jpeg):
+        """With scan_passthrough off the page is rasterized."""
+        pdf = build_scanned_pdf(tmp_path / "scan.pdf", scan_jpeg, page_count=1)
+        service = PowerPointConversionService(ConversionConfig(scan_passthrough=False))
+
+        output = service.convert_pdf_to_powerpoint(pdf, tmp_path / "out")
+
+        picture = Presentation(str(output)).slides[0].shapes[0]
+        assert picture.image.content_type == "image/png"
+        assert picture.rotation == 0.0
+
+    def test_png_export_unaffected(self, tmp_path, scan_jpeg):
+        """PNG export always rasterizes."""
+        pdf = build_scanned_pdf(tmp_path / "scan.pdf", scan_jpeg, page_count=1)
+
+        files = ImageConversionService(ConversionConfig()).convert_pdf_to_images(pdf, tmp_path / "png")
+
+        assert files[0].read_bytes().startswith(b"\x89PNG")
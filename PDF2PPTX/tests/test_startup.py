@@ -0,0 +1,101 @@
+"""
+Startup cost tests: non-rendering CLI commands must not import the
+conversion libraries.
+"""
+
+import json
+import re
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).parent.parent
+
+HEAVY_MODULES = ("fitz", "pymupdf", "pptx", "lxml", "PIL")
+
+# Importing the CLI may cost at most this fraction of importing the
+# PowerPoint converter with its dependencies
+IMPORT_BUDGET_FRACTION = 0.5
+
+_IMPORTTIME_LINE = re.compile(r"import time:\s+\d+ \|\s+(\d+) \| (\S+)")
+
+
+def _run_python(code: str, *options: str) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [sys.executable, *options, "-c", code],
+        cwd=PROJECT_ROOT, capture_output=True, text=True, timeout=120
+    )
+
+
+def _loaded_heavy_modules(code: str) -> list:
+    probe = (
+        f"import sys, json\n{code}\n"
+        f"sys.stderr.write('LOADED=' + json.dumps([m for m in {HEAVY_MODULES!r} if m in sys.modules]))"
+    )
+    result = _run_python(probe)
+    marker = result.stderr.rsplit("LOADED=", 1)
+    assert len(marker) == 2, result.stderr
+    return json.loads(marker[1])
+
+
+class TestLazyImports:
+    """Test that package imports defer the conversion libraries."""
+
+    def test_package_import_is_lazy(self):
+        """Importing src, src.core and the CLI loads none of the conversion libraries."""
+        assert _loaded_heavy_modules("import src, src.core, src.cli.main") == []
+
+    def test_lazy_attributes_resolve(self):
+        """Public names still resolve on first access."""
+        import src
+        import src.core
+
+        assert src.ConversionConfig is src.core.ConversionConfig
+        assert src.PowerPointConversionService.__name__ == "PowerPointConversionService"
+        assert "RenderCache" in dir(src.core)
+        with pytest.raises(AttributeError):
+            src.core.missing_name
+
+    def test_config_and_version_commands_stay_light(self):
+        """The config and --version commands run without the conversion libraries."""
+        code = (
+            "from src.cli.main import main\n"
+            "try:\n    main(['--version'])\nexcept SystemExit:\n    pass\n"
+            "main(['config', 'show'])"
+        )
+        assert _loaded_heavy_modules(code) == []
+
+    def test_info_command_needs_only_pymupdf(self, sample_pdf):
+        """The info command reads PDFs without loading python-pptx, lxml or Pillow."""
+        code = f"from src.cli.main import main\nmain(['info', {str(sample_pdf)!r}, '--no-index'])"
+        assert set(_loaded_heavy_modules(code)) <= {"fitz", "pymupdf"}
+
+    def test_indexed_info_skips_pymupdf(self, sample_pdf, tmp_path):
+        """Answering info from the metadata index does not load PyMuPDF at all."""
+        command = f"['info', {str(sample_pdf)!r}, '--index', {str(tmp_path / 'index.sqlite')!r}]"
+        code = f"from src.cli.main import main\nmain({command})"
+        _loaded_heavy_modules(code)  # first run fills the index
+        assert _loaded_heavy_modules(code) == []
+
+
+class TestImportTimeBudget:
+    """Test CLI import time against the cost of the conversion stack."""
+
+    def test_cli_import_within_budget(self):
+        """-X importtime: the CLI imports in a fraction of the converter's import time."""
+        result = _run_python(
+            "import src.cli.main; import src.core.powerpoint_converter", "-X", "importtime"
+        )
+        assert result.returncode == 0, result.stderr
+
+        cumulative = {}
+        for match in _IMPORTTIME_LINE.finditer(result.stderr):
+            cumulative[match.group(2)] = max(cumulative.get(match.group(2), 0), int(match.group(1)))
+
+        cli_us = cumulative["src.cli.main"]
+        converter_us = cumulative["src.core.powerpoint_converter"]
+        assert cli_us <= converter_us * IMPORT_BUDGET_FRACTION, (
+            f"CLI import {cli_us / 1000:.0f} ms, converter import {converter_us / 1000:.0f} ms"
+        )
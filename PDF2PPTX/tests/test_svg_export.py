@@ -0,0 +1,85 @@
+"""
+Unit tests for SVG page export.
+"""
+
+import zipfile
+
+import fitz
+import pytest
+
+from src.core.pdf_processor import ConversionConfig, describe_page
+from src.core.powerpoint_converter import PowerPointConversionService
+from src.core.svg_export import NS_SVG_BLIP, export_page_svg, sanitize_svg
+
+from tests.conftest import make_scan_jpeg
+
+
+class TestSanitizeSvg:
+    """Test removal of active and external SVG content."""
+
+    def test_strips_scripts_handlers_and_external_links(self):
+        """Scripts, event handlers and external references are removed."""
+        svg = (
+            '<svg xmlns="http://www.w3.org/2000/svg" xmlns:xlink="http://www.w3.org/1999/xlink" onload="x()">'
+            '<script>alert(1)</script>'
+            '<foreignObject><div/></foreignObject>'
+            '<use xlink:href="#glyph"/>'
+            '<image href="https://example.com/a.png"/>'
+            '<image xlink:href="data:image/png;base64,AAAA"/>'
+            '</svg>'
+        )
+
+        cleaned = sanitize_svg(svg).decode("utf-8")
+
+        assert "script" not in cleaned
+        assert "onload" not in cleaned
+        assert "foreignObject" not in cleaned
+        assert "example.com" not in cleaned
+        assert 'xlink:href="#glyph"' in cleaned
+        assert "data:image/png" in cleaned
+
+
+class TestExportPageSvg:
+    """Test the per-page SVG or raster decision."""
+
+    def test_vector_page_exported(self, sample_pdf):
+        """Text and vector pages become SVG with a small PNG fallback."""
+        with fitz.open(sample_pdf) as doc:
+            page = doc[0]
+            svg_page = export_page_svg(page, describe_page(page, ConversionConfig()), 1.5)
+
+        assert svg_page is not None
+        assert svg_page.svg_bytes.startswith(b"<?xml")
+        assert b'width="842"' in svg_page.svg_bytes  # rotated to landscape
+        assert svg_page.fallback_png.startswith(b"\x89PNG")
+
+    def test_image_page_stays_raster(self):
+        """Pages containing images are rasterized."""
+        doc = fitz.open()
+        page = doc.new_page()
+        page.insert_image(fitz.Rect(0, 0, 200, 200), stream=make_scan_jpeg(100, 100))
+
+        assert export_page_svg(page, describe_page(page, ConversionConfig()), 1.5) is None
+
+
+class TestSvgSlides:
+    """Test SVG pictures in generated decks."""
+
+    @pytest.mark.parametrize("streaming", [False, True])
+    def test_pictures_carry_svg_blip(self, tmp_path, sample_pdf, streaming):
+        """Each slide picture references an SVG part next to its PNG fallback."""
+        config = ConversionConfig(svg_pages=True, streaming_output=streaming)
+        service = PowerPointConversionService(config)
+
+        output = service.convert_pdf_to_powerpoint(sample_pdf, tmp_path / "out")
+
+        with zipfile.ZipFile(output) as package:
+            names = package.namelist()
+            slide_xml = package.read("ppt/slides/slide1.xml").decode("utf-8")
+            content_types = package.read("[Content_Types].xml").decode("utf-8")
+
+        assert sum(name.endswith(".svg") for name in names) == 4
+        assert sum(name.endswith(".png") for name in names) == 4
+        assert NS_SVG_BLIP in slide_xml
+        assert "image/svg+xml" in content_types
+        assert service.last_pipeline_stats.encoding_counts == {"svg": 4}
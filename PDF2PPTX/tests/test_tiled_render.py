@@ -0,0 +1,135 @@
+"""
+Unit tests for banded rendering of oversized pages.
+"""
+
+from io import BytesIO
+
+import fitz
+import pytest
+from PIL import Image
+
+from src.core import tiled_render
+from src.core.image_converter import ImageConversionService
+from src.core.memory_budget import estimate_page_bytes
+from src.core.pdf_processor import ConversionConfig
+from src.core.render_pipeline import render_page
+from src.core.image_encoding import StreamingPNGWriter
+from src.core.tiled_render import needs_tiling, render_page_banded
+
+from tests.conftest import build_sample_pdf, make_scan_jpeg
+
+
+def _pixels(png: bytes) -> bytes:
+    with Image.open(BytesIO(png)) as image:
+        return image.convert("RGB").tobytes()
+
+
+@pytest.fixture
+def small_bands(monkeypatch):
+    """Bands of a few dozen rows, so small test pages are split into many."""
+    monkeypatch.setattr(tiled_render, "BAND_PIXELS", 40_000)
+
+
+@pytest.fixture
+def detailed_pdf(tmp_path):
+    """A page with text, curves, transparency and an image crossing band edges."""
+    doc = fitz.open()
+    page = doc.new_page(width=595, height=842)
+    page.insert_text((40, 60), "Tiled rendering " * 4, fontsize=13)
+    page.draw_circle((300, 400), 180, color=(0, 0.4, 0.8), width=3)
+    page.draw_line((0, 0), (595, 842), color=(0.8, 0, 0), width=0.7)
+    page.draw_rect(fitz.Rect(80, 500, 500, 700), fill=(0, 0.7, 0), fill_opacity=0.4)
+    page.insert_image(fitz.Rect(120, 150, 420, 330), stream=make_scan_jpeg(200, 120))
+    path = tmp_path / "detailed.pdf"
+    doc.save(str(path))
+    doc.close()
+    return path
+
+
+class TestStreamingPNGWriter:
+    """Test the incremental PNG encoder."""
+
+    @pytest.mark.parametrize("filtered", [False, True])
+    def test_round_trip(self, filtered):
+        image = Image.effect_noise((37, 23), 60).convert("RGB")
+        samples = image.tobytes()
+        stride = 37 * 3
+        buffer = BytesIO()
+        writer = StreamingPNGWriter(buffer, 37, 23, filtered=filtered)
+        for start in (0, 5, 6, 17):
+            stop = {0: 5, 5: 6, 6: 17, 17: 23}[start]
+            writer.write_rows(samples[start * stride:stop * stride])
+        writer.close()
+
+        assert _pixels(buffer.getvalue()) == samples
+
+    def test_grayscale_round_trip(self):
+        samples = Image.effect_noise((19, 7), 60).tobytes()
+        buffer = BytesIO()
+        writer = StreamingPNGWriter(buffer, 19, 7, level=1, grayscale=True)
+        writer.write_rows(samples)
+        writer.close()
+
+        assert Image.open(BytesIO(buffer.getvalue())).tobytes() == samples
+
+    def test_incomplete_image_rejected(self):
+        writer = StreamingPNGWriter(BytesIO(), 4, 4)
+        writer.write_rows(bytes(4 * 3 * 2))
+        with pytest.raises(ValueError):
+            writer.close()
+
+
+class TestBandedRendering:
+    """Test that banded pages match whole-page renders pixel for pixel."""
+
+    @pytest.mark.parametrize("scale", [1.0, 1.37, 2.5])
+    def test_fills_and_text_identical(self, tmp_path, small_bands, scale):
+        pdf_path = build_sample_pdf(tmp_path / "doc.pdf", page_count=2)
+        config = ConversionConfig(scale_factor=scale)
+        with fitz.open(pdf_path) as doc:
+            for page in doc:
+                expected = render_page(page, config)
+                banded = render_page_banded(page, config)
+
+                assert banded.bands > 1
+                assert banded.page_info == expected.page_info
+                assert _pixels(banded.image_bytes) == _pixels(expected.image_bytes)
+
+    def test_strokes_within_antialiasing(self, detailed_pdf, small_bands):
+        """Strokes may differ from a whole-page render by an anti-aliasing step, nothing more."""
+        config = ConversionConfig(scale_factor=1.37)
+        with fitz.open(detailed_pdf) as doc:
+            expected = _pixels(render_page(doc[0], config).image_bytes)
+            banded = _pixels(render_page_banded(doc[0], config).image_bytes)
+
+        assert len(banded) == len(expected)
+        differences = [abs(a - b) for a, b in zip(banded, expected) if a != b]
+        assert len(differences) < len(expected) // 100
+        assert max(differences, default=0) <= 32
+
+    def test_tiling_threshold(self, sample_pdf):
+        with fitz.open(sample_pdf) as doc:
+            assert not needs_tiling(doc[0], ConversionConfig())
+            assert needs_tiling(doc[0], ConversionConfig(scale_factor=10, tile_megapixels=32))
+            assert not needs_tiling(doc[0], ConversionConfig(scale_factor=10, tile_megapixels=0))
+
+    def test_png_conversion_output_identical(self, tmp_path, small_bands):
+        """ImageConversionService writes the same images whether or not pages are tiled."""
+        pdf_path = build_sample_pdf(tmp_path / "doc.pdf", page_count=3)
+        outputs = {}
+        for name, threshold in (("whole", 0), ("tiled", 1)):
+            config = ConversionConfig(scale_factor=1.5, tile_megapixels=threshold)
+            files = ImageConversionService(config).convert_pdf_to_images(pdf_path, tmp_path / name)
+            outputs[name] = [_pixels(path.read_bytes()) for path in files]
+
+        assert len(outputs["tiled"]) == 3
+        assert outputs["tiled"] == outputs["whole"]
+
+    def test_memory_estimate_follows_band_size(self):
+        config = ConversionConfig(scale_factor=3.0)
+        a0_width, a0_height = 2384, 3370  # points
+        tiled = estimate_page_bytes(a0_width, a0_height, config)
+        whole = estimate_page_bytes(a0_width, a0_height, ConversionConfig(scale_factor=3.0, tile_megapixels=0))
+
+        assert whole > 200 * 1024 * 1024
+        assert tiled < 32 * 1024 * 1024
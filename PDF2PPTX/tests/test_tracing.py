@@ -0,0 +1,145 @@
+"""
+Unit tests for stage tracing and Chrome trace export.
+"""
+
+import json
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+
+from src.core import tracing
+from src.core.image_converter import ImageConversionService
+from src.core.pdf_processor import ConversionConfig
+from src.core.powerpoint_converter import PowerPointConversionService
+
+from tests.conftest import build_sample_pdf
+
+
+@pytest.fixture
+def tracer():
+    tracer = tracing.enable_tracing()
+    yield tracer
+    tracing.disable_tracing()
+
+
+def _span_names(tracer):
+    return [event[0] for event in tracer.events]
+
+
+def _traced_task(trace):
+    """Pool task recording one span, as the render workers do."""
+    tracing.begin_worker_task(trace)
+    with tracing.span("render", page=1):
+        pass
+    events = tracing.drain_worker_events(trace)
+    return None if events is None else [event[0] for event in events]
+
+
+class TestTracer:
+    """Test span recording and export."""
+
+    def test_disabled_spans_are_not_recorded(self):
+        """Without an active tracer span() is a shared no-op."""
+        assert tracing.active_tracer() is None
+        with tracing.span("render", page=1) as span:
+            pass
+        assert span is tracing.span("encode")
+
+    def test_chrome_trace_export(self, tracer, tmp_path):
+        """Spans are exported as complete events with their attributes."""
+        with tracing.span("render", file="a.pdf", page=3):
+            pass
+        with pytest.raises(RuntimeError):
+            with tracing.span("encode", page=3):
+                raise RuntimeError("boom")
+
+        path = tmp_path / "trace.json"
+        tracer.write_chrome_trace(path)
+        events = json.loads(path.read_text(encoding="utf-8"))["traceEvents"]
+
+        spans = [event for event in events if event["ph"] == "X"]
+        assert [span["name"] for span in spans] == ["render", "encode"]
+        assert spans[0]["args"] == {"file": "a.pdf", "page": 3}
+        assert spans[1]["args"]["error"] == "RuntimeError"
+        assert spans[0]["ts"] == 0.0 and spans[0]["dur"] >= 0.0
+        assert any(event["ph"] == "M" for event in events)
+
+    def test_worker_events_merge(self, tracer):
+        """Spans drained in a worker are added to the collecting tracer."""
+        worker = tracing.Tracer()
+        worker.record("render", 10, 20, {"page": 1})
+
+        tracing.merge_events(worker.drain())
+
+        assert _span_names(tracer) == ["render"]
+        assert worker.events == []
+        assert tracing.drain_worker_events(False) is None
+
+    def test_untraced_task_resets_worker_tracer(self):
+        """A reused worker stops recording once it runs an untraced task."""
+        tracing.begin_worker_task(True)
+        with tracing.span("render", page=1):
+            pass
+        assert _span_names(tracing.active_tracer()) == ["render"]
+
+        tracing.begin_worker_task(False)
+        with tracing.span("render", page=2):
+            pass
+
+        assert tracing.active_tracer() is None
+        assert tracing.drain_worker_events(False) is None
+
+    def test_worker_buffer_always_cleared(self):
+        """Draining empties the worker buffer even if the spans are not wanted."""
+        tracing.begin_worker_task(True)
+        worker = tracing.active_tracer()
+        try:
+            with tracing.span("render", page=1):
+                pass
+            assert tracing.drain_worker_events(False) is None
+            assert worker.events == []
+        finally:
+            tracing.disable_tracing()
+
+    def test_inline_task_keeps_parent_tracer(self, tracer):
+        """A task run inline by a tracing process records into its tracer."""
+        tracing.begin_worker_task(False)
+        with tracing.span("save", page=1):
+            pass
+
+        assert tracing.active_tracer() is tracer
+        assert tracing.drain_worker_events(False) is None
+        assert _span_names(tracer) == ["save"]
+
+    def test_pool_worker_stops_tracing(self):
+        """An untraced task on a reused pool worker leaves it without a tracer."""
+        with ProcessPoolExecutor(max_workers=1) as executor:
+            assert executor.submit(_traced_task, True).result() == ["render"]
+            assert executor.submit(_traced_task, False).result() is None
+            assert executor.submit(tracing.active_tracer).result() is None
+
+
+class TestConversionSpans:
+    """Test that conversions record their stages."""
+
+    def test_pptx_stages(self, tracer, tmp_path, sample_pdf):
+        """A PowerPoint conversion records every stage with page attributes."""
+        PowerPointConversionService(ConversionConfig()).convert_pdf_to_powerpoint(
+            sample_pdf, tmp_path / "out"
+        )
+
+        names = set(_span_names(tracer))
+        assert {"open", "analyze", "render", "encode", "slide", "label", "save"} <= names
+        pages = sorted(event[5]["page"] for event in tracer.events if event[0] == "slide")
+        assert pages == [1, 2, 3, 4]
+
+    def test_parallel_batch_collects_worker_spans(self, tracer, tmp_path):
+        """Spans recorded in worker processes come back to the main tracer."""
+        files = [build_sample_pdf(tmp_path / f"{name}.pdf", page_count=2) for name in "ab"]
+
+        ImageConversionService(ConversionConfig(max_workers=2)).convert_batch(files, tmp_path / "out")
+
+        renders = [event for event in tracer.events if event[0] == "render"]
+        assert len(renders) == 4
+        assert all(event[3] != tracer.pid for event in renders)
+        assert len([name for name in _span_names(tracer) if name == "save"]) == 4